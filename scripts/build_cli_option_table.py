@@ -0,0 +1,167 @@
+"""Build the static CLI option table used by the fast command-line parser.
+
+Generates src/datamodel_code_generator/_cli_option_table.py from the argparse
+definitions in arguments.py, which remain the source of truth for CLI behavior.
+
+Usage:
+    python scripts/build_cli_option_table.py
+    python scripts/build_cli_option_table.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from datamodel_code_generator.arguments import arg_parser  # noqa: E402
+
+OUTPUT_PATH = ROOT / "src" / "datamodel_code_generator" / "_cli_option_table.py"
+MAX_LINE_LENGTH = 120
+INDENT = "    "
+
+_ACTION_KINDS: dict[type[argparse.Action], str] = {
+    argparse._StoreAction: "store",  # noqa: SLF001
+    argparse._StoreTrueAction: "store_true",  # noqa: SLF001
+    argparse._AppendAction: "append",  # noqa: SLF001
+    argparse.BooleanOptionalAction: "boolean_optional",
+}
+_VALUE_TYPES: dict[object, str] = {None: "str", str: "str", float: "float", int: "int", Path: "path"}
+
+
+def _value_type(action: argparse.Action) -> str:
+    return _VALUE_TYPES.get(action.type, "custom")
+
+
+def _literal(value: object) -> str:
+    if isinstance(value, list | tuple):
+        items = [_literal(item) for item in value]
+        if isinstance(value, tuple):
+            return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+        return f"[{', '.join(items)}]"
+    if isinstance(value, str):
+        return json.dumps(value)
+    if value is None or isinstance(value, bool | int | float):
+        return repr(value)
+    msg = f"Cannot snapshot non-literal CLI value: {value!r}"
+    raise TypeError(msg)
+
+
+def _format_entry(key: str, values: list[str]) -> list[str]:
+    """Format one ``key: (values...)`` mapping entry the way Ruff would."""
+    one_line = f"{INDENT}{key}: ({', '.join(values)}),"
+    if len(one_line) <= MAX_LINE_LENGTH:
+        return [one_line]
+    lines = [f"{INDENT}{key}: ("]
+    for value in values:
+        line = f"{INDENT * 2}{value},"
+        if len(line) > MAX_LINE_LENGTH and value.startswith("("):
+            lines.append(f"{INDENT * 2}(")
+            lines.extend(f"{INDENT * 3}{item.strip()}," for item in value[1:-1].split(", "))
+            lines.append(f"{INDENT * 2}),")
+        else:
+            lines.append(line)
+    lines.append(f"{INDENT}),")
+    return lines
+
+
+def _option_rows() -> list[tuple[str, list[str]]]:
+    rows: list[tuple[str, list[str]]] = []
+    for action in arg_parser._actions:  # noqa: SLF001
+        kind = _ACTION_KINDS.get(type(action))
+        if kind is None:
+            continue
+        choices = None if action.choices is None else tuple(action.choices)
+        if choices is not None and not all(isinstance(choice, str) for choice in choices):  # pragma: no cover
+            msg = f"Unsupported non-string choices for {action.dest}"
+            raise TypeError(msg)
+        nargs = action.nargs if kind in {"store", "append"} else None
+        const = action.const if nargs == "?" else None
+        values = [
+            _literal(action.dest),
+            _literal(kind),
+            _literal(nargs),
+            _literal(const),
+            _literal(_value_type(action) if kind in {"store", "append"} else None),
+            _literal(choices),
+        ]
+        rows.extend((_literal(option_string), values) for option_string in action.option_strings)
+    return sorted(rows)
+
+
+def _defaults() -> dict[str, object]:
+    defaults = vars(arg_parser.parse_args([]))
+    return dict(sorted(defaults.items()))
+
+
+def _mutually_exclusive_groups() -> list[list[str]]:
+    return [
+        sorted(action.dest for action in group._group_actions)  # noqa: SLF001
+        for group in arg_parser._mutually_exclusive_groups  # noqa: SLF001
+    ]
+
+
+def render() -> str:
+    """Render the option table module source."""
+    lines = [
+        '"""Auto-generated static CLI option table.',
+        "",
+        "DO NOT EDIT MANUALLY. Run: python scripts/build_cli_option_table.py",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "# Option string -> (dest, action kind, nargs, const, value type, choices)",
+        "OPTIONS: dict[str, tuple[str, str, int | str | None, object, str | None, tuple[str, ...] | None]] = {",
+    ]
+    for key, values in _option_rows():
+        lines.extend(_format_entry(key, values))
+    lines.extend((
+        "}",
+        "",
+        "# Namespace values argparse assigns when an option is absent",
+        "DEFAULTS: dict[str, object] = {",
+    ))
+    lines.extend(f"{INDENT}{_literal(dest)}: {_literal(value)}," for dest, value in _defaults().items())
+    lines.extend(("}", "", "MUTUALLY_EXCLUSIVE_DESTS: tuple[frozenset[str], ...] = ("))
+    lines.extend(
+        f"{INDENT}frozenset({{{', '.join(_literal(dest) for dest in group)}}}),"
+        for group in _mutually_exclusive_groups()
+    )
+    lines.extend((")", ""))
+    return "\n".join(lines)
+
+
+def build_cli_option_table(*, check: bool = False) -> int:
+    """Write or check the generated option table module."""
+    content = render()
+    if check:
+        if not OUTPUT_PATH.exists() or OUTPUT_PATH.read_text(encoding="utf-8") != content:
+            print(f"Content mismatch: {OUTPUT_PATH}", file=sys.stderr)
+            print("Run: python scripts/build_cli_option_table.py", file=sys.stderr)
+            return 1
+        print(f"OK: {OUTPUT_PATH}")
+        return 0
+    OUTPUT_PATH.write_text(content, encoding="utf-8")
+    print(f"Generated: {OUTPUT_PATH}")
+    return 0
+
+
+def main() -> int:
+    """Parse CLI arguments and build the option table."""
+    parser = argparse.ArgumentParser(description="Build the static CLI option table")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Check if the option table is up to date without modifying files",
+    )
+    args = parser.parse_args()
+    return build_cli_option_table(check=args.check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
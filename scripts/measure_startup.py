@@ -37,6 +37,11 @@ CASES = (
         ("-c", "from datamodel_code_generator.__main__ import main"),
         "from datamodel_code_generator.__main__ import main",
     ),
+    Case(
+        "import-cli-fast-parser",
+        ("-c", "import datamodel_code_generator._cli_fast_parser"),
+        "import datamodel_code_generator._cli_fast_parser",
+    ),
     Case("import-config", ("-c", "import datamodel_code_generator.config"), "import datamodel_code_generator.config"),
     Case("cli-version", ("-m", "datamodel_code_generator.__main__", "--version")),
     Case("cli-help", ("-m", "datamodel_code_generator.__main__", "--help")),
@@ -101,6 +101,7 @@ if TYPE_CHECKING:
     from datamodel_code_generator.model import DataModelSet
     from datamodel_code_generator.model_metadata import ModelMetadata
     from datamodel_code_generator.parser.base import Result
+    from datamodel_code_generator.ref_bundle import RemoteRefBundle
     from datamodel_code_generator.remote_lock import RemoteReferenceLock
 
 T = TypeVar("T")
@@ -194,7 +195,8 @@ def _apply_generate_config_preset(config: GenerateConfig) -> GenerateConfig:
 
 
 DEFAULT_BASE_CLASS: str = "pydantic.BaseModel"
-_IGNORED_TEXT_PREFIX_CHARS: frozenset[str] = frozenset({"\ufeff", " ", "\t", "\r", "\n"})
+_UTF8_BOM = "\ufeff"
+_IGNORED_TEXT_PREFIX_CHARS: frozenset[str] = frozenset({_UTF8_BOM, " ", "\t", "\r", "\n"})
 _PARSER_SOURCE_DATA_CACHE_MAX_SIZE = 128
 _ParserSourceDataCacheKey: TypeAlias = tuple[Path, str, str, str]
 _ParserSourceDataSeenKey: TypeAlias = tuple[Path, str]
@@ -255,6 +257,32 @@ def load_yaml(stream: str | TextIO) -> YamlValue:
     return yaml.load(text, Loader=SafeLoader)  # noqa: S506
 
 
+def load_json(text: str) -> YamlValue:
+    """Load JSON content using orjson or msgspec (if available) or the standard library.
+
+    The optional backends are only a fast path. Documents they reject (NaN, lone
+    surrogates, out-of-range floats) are re-parsed by ``json.loads``, so results and
+    errors always match the standard library.
+    """
+    from datamodel_code_generator.util import get_json_backend  # noqa: PLC0415
+
+    match get_json_backend():
+        case "orjson":
+            import orjson  # noqa: PLC0415  # ty: ignore[unresolved-import]
+
+            with contextlib.suppress(orjson.JSONDecodeError):
+                return orjson.loads(text)
+        case "msgspec":
+            import msgspec  # noqa: PLC0415
+
+            with contextlib.suppress(msgspec.DecodeError):
+                return msgspec.json.decode(text)
+
+    import json  # noqa: PLC0415
+
+    return json.loads(text)
+
+
 def load_yaml_dict(stream: str | TextIO) -> dict[str, YamlValue]:
     """Load YAML and return as dict. Raises TypeError if result is not a dict."""
     result = load_yaml(stream)
@@ -333,19 +361,19 @@ def load_data(text: str) -> dict[str, YamlValue]:
 
     if _is_json_text(text):
         with contextlib.suppress(json.JSONDecodeError):
-            result = json.loads(text)
+            result = load_json(text.removeprefix(_UTF8_BOM))
             if isinstance(result, dict):
                 return result
     return load_yaml_dict(text)
 
 
 def load_data_from_path(path: Path, encoding: str) -> dict[str, YamlValue]:
-    """Load file as JSON or YAML based on file extension.
+    """Load file as JSON or YAML based on file extension and content.
 
-    For file input: tries json.load() for .json files (more efficient than
-    read_text + json.loads), falls back to YAML if JSON parsing fails
-    (e.g., trailing commas), and requires the parsed content to be a dict.
-    Uses YAML for all other extensions.
+    Tries JSON first for .json files and for any file whose content starts with
+    '{' or '[' (JSON-compatible .yaml specs skip the much slower YAML parser),
+    falls back to YAML if JSON parsing fails (e.g., trailing commas or YAML flow
+    mappings), and requires the parsed content to be a dict.
     """
     result = _load_parser_source_data_from_path(path, encoding)
     if not isinstance(result, dict):
@@ -423,13 +451,13 @@ def _load_parser_source_data_from_bytes_with_cache(
     import json  # noqa: PLC0415
 
     text = data.decode(encoding)
-    if path.suffix.lower() == ".json":
+    if _should_try_json(path, text):
         cache_key = (path, digest, encoding, "json")
         if (cached_data := _load_cached_parser_source_data(cache_key)) is not None:
             return cached_data
 
         with contextlib.suppress(json.JSONDecodeError):
-            return _store_parser_source_data(cache_key, json.loads(text))
+            return _store_parser_source_data(cache_key, load_json(text.removeprefix(_UTF8_BOM)))
 
     from datamodel_code_generator.util import get_yaml_backend  # noqa: PLC0415
 
@@ -441,15 +469,35 @@ def _load_parser_source_data_from_bytes_with_cache(
     return _store_parser_source_data(cache_key, load_yaml(text))
 
 
-def _load_parser_source_data_from_bytes(path: Path, data: bytes, encoding: str) -> YamlValue:
+def _load_json_or_yaml(text: str) -> YamlValue:
+    """Parse JSON-shaped text with the JSON backend, falling back to YAML."""
+    import json  # noqa: PLC0415
+
+    if _is_json_text(text):
+        with contextlib.suppress(json.JSONDecodeError):
+            return load_json(text.removeprefix(_UTF8_BOM))
+    return load_yaml(text)
+
+
+def _should_try_json(path: Path, text: str) -> bool:
+    return path.suffix.lower() == ".json" or _is_json_text(text)
+
+
+def _load_parser_source_data_from_bytes(
+    path: Path,
+    data: bytes,
+    encoding: str,
+    *,
+    load_yaml_text: Callable[[str], YamlValue] = load_yaml,
+) -> YamlValue:
     import json  # noqa: PLC0415
 
     text = data.decode(encoding)
-    if path.suffix.lower() == ".json":
+    if _should_try_json(path, text):
         with contextlib.suppress(json.JSONDecodeError):
-            return json.loads(text)
+            return load_json(text.removeprefix(_UTF8_BOM))
 
-    return load_yaml(text)
+    return load_yaml_text(text)
 
 
 def _clear_parser_source_data_cache() -> None:
@@ -577,6 +625,13 @@ def is_asyncapi(data: Mapping[str, Any]) -> bool:
     return "asyncapi" in data
 
 
+def is_graphql_introspection(data: Mapping[str, Any]) -> bool:
+    """Check if the data dict is a GraphQL introspection result, bare or as a query response."""
+    if isinstance(response_data := data.get("data"), Mapping):
+        data = response_data
+    return isinstance(data.get("__schema"), Mapping)
+
+
 JSON_SCHEMA_URLS: tuple[str, ...] = (
     "http://json-schema.org/",
     "https://json-schema.org/",
@@ -1096,6 +1151,8 @@ def _generate_config_values(generate_config: GenerateConfig) -> dict[str, Any]:
     })
     if (remote_lock := generate_config.remote_lock) is not None:
         values["remote_lock"] = remote_lock
+    if (remote_ref_bundle := generate_config.remote_ref_bundle) is not None:
+        values["remote_ref_bundle"] = remote_ref_bundle
     return values
 
 
@@ -1197,11 +1254,15 @@ def _openapi_shared_options(config: GenerateConfig) -> OpenAPIParserConfigDict:
         "include_path_parameters": config.include_path_parameters,
         "use_status_code_in_response_name": config.use_status_code_in_response_name,
         "openapi_include_paths": config.openapi_include_paths,
+        "openapi_include_tags": config.openapi_include_tags,
+        "openapi_exclude_tags": config.openapi_exclude_tags,
+        "openapi_include_operation_ids": config.openapi_include_operation_ids,
+        "openapi_exclude_operation_ids": config.openapi_exclude_operation_ids,
         "openapi_include_info_version": config.openapi_include_info_version,
     }
 
 
-def _normalize_raw_input(  # noqa: PLR0912, PLR0915
+def _normalize_raw_input(  # noqa: PLR0912
     input_: _GenerationInput,
     input_text: str | None,
     input_file_type: InputFileType,
@@ -1216,41 +1277,42 @@ def _normalize_raw_input(  # noqa: PLR0912, PLR0915
         if isinstance(input_, Path) and input_.is_dir():  # pragma: no cover
             msg = f"Input must be a file for {input_file_type}"
             raise Error(msg)  # noqa: TRY301
-        obj: Any
-        if input_file_type == InputFileType.CSV:
-            import csv  # noqa: PLC0415
-
-            def get_header_and_first_line(csv_file: IO[str]) -> dict[str, Any]:
-                csv_reader = csv.DictReader(csv_file)
-                if csv_reader.fieldnames is None:
-                    msg = "CSV file has no header row"
-                    raise ValueError(msg)  # noqa: TRY301
-                try:
-                    first_row = next(csv_reader)
-                except StopIteration:
-                    msg = "CSV file has no data rows"
-                    raise ValueError(msg) from None
-                return {key: value for key, value in first_row.items() if key is not None}
+        from datamodel_code_generator._sample_inference import (  # noqa: PLC0415
+            infer_records_schema,
+            iter_csv_records,
+            iter_json_records,
+            start_inference_pool,
+        )
 
-            if isinstance(input_, Path):
-                with input_.open(encoding=config.encoding) as f:
-                    obj = get_header_and_first_line(f)
-            else:
-                import io  # noqa: PLC0415
+        if input_file_type in {InputFileType.CSV, InputFileType.Json}:
+            import io  # noqa: PLC0415
+
+            executor = None
+            with contextlib.ExitStack() as stack:
+                if isinstance(input_, Path):
+                    file: IO[str] = stack.enter_context(input_.open(encoding=config.encoding))
+                    executor = start_inference_pool(input_.stat().st_size, config.sample_size)
+                    if executor is not None:
+                        stack.callback(executor.shutdown, cancel_futures=True)
+                else:
+                    assert input_text is not None
+                    file = io.StringIO(input_text)
+                if input_file_type == InputFileType.CSV:
+                    records, is_array = iter_csv_records(file), False
+                else:
+                    records, is_array = iter_json_records(file)
+                schema = infer_records_schema(
+                    records, is_array=is_array, sample_size=config.sample_size, executor=executor
+                )
+            return json.dumps(schema)
 
-                obj = get_header_and_first_line(io.StringIO(input_text))
-        elif input_file_type == InputFileType.Yaml:
+        obj: Any
+        if input_file_type == InputFileType.Yaml:
             if isinstance(input_, Path):
                 obj = load_yaml(input_.read_text(encoding=config.encoding))
             else:  # pragma: no cover
                 assert input_text is not None
                 obj = load_yaml(input_text)
-        elif input_file_type == InputFileType.Json:
-            if isinstance(input_, Path):
-                obj = json.loads(input_.read_text(encoding=config.encoding))
-            else:
-                assert input_text is not None
-                obj = json.loads(input_text)
         elif input_file_type == InputFileType.Dict:
             import ast  # noqa: PLC0415
 
@@ -1265,11 +1327,9 @@ def _normalize_raw_input(  # noqa: PLR0912, PLR0915
             msg = f"Unsupported input file type: {input_file_type}"
             raise Error(msg)  # noqa: TRY301
 
-        from genson import SchemaBuilder  # noqa: PLC0415
-
-        builder = SchemaBuilder()
-        builder.add_object(obj)
-        return json.dumps(builder.to_schema())
+        if isinstance(obj, list):
+            return json.dumps(infer_records_schema(obj, is_array=True, sample_size=config.sample_size))
+        return json.dumps(infer_records_schema([obj], is_array=False))
     except Error:
         raise
     except Exception as exc:
@@ -1284,25 +1344,36 @@ def _convert_mcp_tools(
 ) -> tuple[Mapping[str, Any] | None, InputFileType, bool]:
     import json  # noqa: PLC0415
 
-    from datamodel_code_generator.parser.mcp import convert_mcp_tools_to_jsonschema  # noqa: PLC0415
+    from datamodel_code_generator.parser._avro_detection import JSON_LINES_SUFFIXES  # noqa: PLC0415
+    from datamodel_code_generator.parser.mcp import convert_mcp_tool_manifests_to_jsonschema  # noqa: PLC0415
 
-    def load_mcp_tools_text(text: str) -> Any:
-        if _is_json_text(text):
-            with contextlib.suppress(json.JSONDecodeError):
-                return json.loads(text)
-        return load_yaml(text)
+    manifest_suffixes = {".json", ".yaml", ".yml", *JSON_LINES_SUFFIXES}
+
+    def iter_manifest_file(path: Path) -> Iterator[Any]:
+        if path.suffix.lower() not in JSON_LINES_SUFFIXES:
+            yield _load_json_or_yaml(path.read_text(encoding=config.encoding))
+            return
+        from datamodel_code_generator._sample_inference import iter_json_records  # noqa: PLC0415
 
-    def load_mcp_tools_data() -> Any:
+        with path.open(encoding=config.encoding) as file:
+            yield from iter_json_records(file)[0]
+
+    def iter_mcp_manifests() -> Iterator[Any]:
         match input_:
             case Mapping() | list():
-                return input_
+                yield input_
+            case Path() if input_.is_dir():
+                for path in sorted(input_.rglob("*")):
+                    if path.is_file() and path.suffix.lower() in manifest_suffixes:
+                        yield from iter_manifest_file(path)
             case Path():
-                return load_mcp_tools_text(input_.read_text(encoding=config.encoding))
-        assert input_text is not None
-        return load_mcp_tools_text(input_text)
+                yield from iter_manifest_file(input_)
+            case _:
+                assert input_text is not None
+                yield _load_json_or_yaml(input_text)
 
     try:
-        mcp_tools_jsonschema = convert_mcp_tools_to_jsonschema(load_mcp_tools_data())
+        mcp_tools_jsonschema = convert_mcp_tool_manifests_to_jsonschema(iter_mcp_manifests())
     except Error:
         raise
     except Exception as exc:
@@ -1939,7 +2010,7 @@ def _prepare_generation_config(config: GenerateConfig, caller_cwd: Path) -> tupl
     """Resolve configuration paths before any process-relative generation work."""
     caller_path_updates = {
         field: absolute_path
-        for field in ("output", "emit_model_metadata", "custom_file_header_path")
+        for field in ("output", "emit_model_metadata", "custom_file_header_path", "cache_dir", "ref_bundle")
         if (absolute_path := _absolute_generation_path(getattr(config, field), caller_cwd))
         is not getattr(config, field)
     }
@@ -2072,9 +2143,28 @@ def _prepare_generation_input(  # noqa: PLR0912, PLR0913, PLR0914, PLR0915
             remote_lock = owned_remote_lock
             config.resolve_remote_lock(remote_lock)
     response_observer = remote_lock.record_response if remote_lock is not None else None
+    ref_bundle: RemoteRefBundle | None = None
+    if (ref_bundle_path := config.ref_bundle) is not None:
+        from datamodel_code_generator.ref_bundle import RemoteRefBundle  # noqa: PLC0415
+
+        config = config.model_copy()
+        ref_bundle = RemoteRefBundle.open(
+            ref_bundle_path,
+            update=config.update_ref_bundle,
+            response_observer=response_observer,
+        )
+        config.resolve_remote_ref_bundle(ref_bundle)
+        response_observer = ref_bundle.record_response
     match input_:
         case str():
             input_text: str | None = input_
+        case ParseResult() if ref_bundle is not None and not ref_bundle.update:
+            input_text = remote_text_cache.get_or_put(
+                input_.geturl(),
+                default_factory=lambda url: ref_bundle.get_text(
+                    url, config.http_headers, config.http_query_parameters, config.encoding
+                ),
+            )
         case ParseResult():
             from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, get_body  # noqa: PLC0415
 
@@ -2119,7 +2209,7 @@ def _prepare_generation_input(  # noqa: PLR0912, PLR0913, PLR0914, PLR0915
         try:
             with _warn_on_input_string_path_failure(input_):
                 assert isinstance(input_text_, str)
-                input_file_type = infer_input_type(input_text_)
+                input_file_type, inferred_data = _infer_input_type_and_data(input_text_)
         except Exception as exc:
             raise InvalidFileFormatError(exc) from exc
         else:
@@ -2132,6 +2222,14 @@ def _prepare_generation_input(  # noqa: PLR0912, PLR0913, PLR0914, PLR0915
             if isinstance(input_, Path) and input_.is_file() and input_file_type not in RAW_DATA_TYPES:
                 input_text = input_text_
                 diagnostic_source_path = Path(input_.name)
+            # Hand the document parsed during detection to the parser instead of loading it again.
+            if (
+                inferred_data is not None
+                and input_file_type in _PREPARSED_INPUT_TYPES
+                and not config.validation
+                and (diagnostic_source_path is not None or isinstance(input_, str))
+            ):
+                source_override = inferred_data
 
     with _warn_on_input_string_path_failure(input_):
         input_text = _normalize_raw_input(input_, input_text, input_file_type, config)
@@ -2333,7 +2431,7 @@ def _emit_generation(  # noqa: PLR0913
     settings_path: Path,
     owned_remote_lock: RemoteReferenceLock | None,
 ) -> str | GeneratedModules | None:
-    """Emit generated artifacts and commit a generation-owned remote lock."""
+    """Emit generated artifacts and commit the generation-owned reference bundle and remote lock."""
     generated = _emit_results(
         results,
         input_,
@@ -2346,6 +2444,8 @@ def _emit_generation(  # noqa: PLR0913
     )
     if config.emit_model_metadata is not None:
         _write_model_metadata(config.emit_model_metadata, model_metadata, config.encoding)
+    if (ref_bundle := config.remote_ref_bundle) is not None:
+        ref_bundle.commit()
     if owned_remote_lock is not None:
         owned_remote_lock.commit()
     return generated
@@ -2440,49 +2540,109 @@ def _generate(  # noqa: PLR0914
     )
 
 
-def infer_input_type(text: str) -> InputFileType:  # noqa: PLR0911, PLR0912
+_INPUT_TYPE_SNIFF_CHARS = 1 << 14
+_PREPARSED_INPUT_TYPES = frozenset({InputFileType.JsonSchema, InputFileType.OpenAPI, InputFileType.AsyncAPI})
+
+
+def _sniff_input_type(text: str) -> InputFileType | None:  # noqa: PLR0911
+    """Decide the input type from a bounded prefix when its leading content settles it."""
+    from datamodel_code_generator._input_sniffing import (  # noqa: PLC0415
+        has_protobuf_header,
+        line_prefix,
+        sniff_root_mapping,
+    )
+
+    match _first_significant_text_char(text[:_INPUT_TYPE_SNIFF_CHARS]):
+        case "<" | "[" | None:
+            return None
+        case "{":
+            keys, complete = sniff_root_mapping(text[:_INPUT_TYPE_SNIFF_CHARS], is_json=True)
+        case _:
+            prefix = line_prefix(text, _INPUT_TYPE_SNIFF_CHARS)
+            if has_protobuf_header(prefix) and _is_protobuf_text(prefix):
+                return InputFileType.Protobuf
+            keys, complete = sniff_root_mapping(prefix, is_json=False)
+            complete = complete and len(prefix) == len(text)
+            if not keys and _looks_like_csv_text(prefix):
+                return InputFileType.CSV
+    # GraphQL introspection results are recognized from nested data, so they need a full parse.
+    if "__schema" in keys or "data" in keys:
+        return None
+    if "asyncapi" in keys:
+        return InputFileType.AsyncAPI
+    if "openapi" in keys:
+        return InputFileType.OpenAPI
+    # Keys past the prefix, such as a later "openapi", could still change a "$schema" decision.
+    if complete and isinstance(schema := keys.get("$schema"), str) and schema.startswith(JSON_SCHEMA_URLS):
+        return InputFileType.JsonSchema
+    return None
+
+
+def infer_input_type(text: str) -> InputFileType:
     """Automatically detect the input file type from text content."""
+    return _infer_input_type_and_data(text)[0]
+
+
+def _infer_input_type_and_data(text: str) -> tuple[InputFileType, dict[str, YamlValue] | None]:  # noqa: PLR0911, PLR0912
+    """Detect the input type, returning the parsed document when it had to be loaded to decide.
+
+    A bounded prefix settles most inputs. Otherwise the whole text is parsed once, and
+    a root mapping is returned so the parser does not have to load the text again.
+    """
     from datamodel_code_generator.util import get_yaml_parse_errors  # noqa: PLC0415
 
+    if (sniffed_type := _sniff_input_type(text)) is not None:
+        return sniffed_type, None
+
     if _is_xml_text(text):
-        from datamodel_code_generator.parser._xmlschema_detection import is_xml_schema_text  # noqa: PLC0415
+        from datamodel_code_generator.parser._xmlschema_detection import XML_SCHEMA_TAG, xml_root_tag  # noqa: PLC0415
 
-        if is_xml_schema_text(text):
-            return InputFileType.XMLSchema
+        if xml_root_tag(text) == XML_SCHEMA_TAG:
+            return InputFileType.XMLSchema, None
 
     try:
-        data = load_yaml(text)
+        data = _load_json_or_yaml(text)
     except get_yaml_parse_errors() as exc:
         if not _is_json_text(text) and _looks_like_csv_text(text):
-            return InputFileType.CSV
+            return InputFileType.CSV, None
+        from datamodel_code_generator.parser._avro_detection import is_avro_json_lines_text  # noqa: PLC0415
+
+        if is_avro_json_lines_text(text):
+            return InputFileType.Avro, None
+        from datamodel_code_generator._sample_inference import is_json_lines_text  # noqa: PLC0415
+
+        if is_json_lines_text(text):
+            return InputFileType.Json, None
         msg = _infer_input_type_error_message(parse_error=exc)
         raise Error(msg) from exc
     if isinstance(data, dict):
+        if is_graphql_introspection(data):
+            return InputFileType.GraphQL, data
         if is_asyncapi(data):
-            return InputFileType.AsyncAPI
+            return InputFileType.AsyncAPI, data
         if is_openapi(data):
-            return InputFileType.OpenAPI
+            return InputFileType.OpenAPI, data
         from datamodel_code_generator.parser._avro_detection import is_avro_schema_data  # noqa: PLC0415
 
         if is_avro_schema_data(data):
-            return InputFileType.Avro
+            return InputFileType.Avro, data
         if is_schema(data):
-            return InputFileType.JsonSchema
-        return InputFileType.Json
+            return InputFileType.JsonSchema, data
+        return InputFileType.Json, data
     if _is_protobuf_text(text):
-        return InputFileType.Protobuf
+        return InputFileType.Protobuf, None
     if isinstance(data, list):
         from datamodel_code_generator.parser._avro_detection import is_avro_schema_data  # noqa: PLC0415
 
         if is_avro_schema_data(data):
-            return InputFileType.Avro
+            return InputFileType.Avro, None
     if isinstance(data, str):
         if _looks_like_csv_text(text):
-            return InputFileType.CSV
+            return InputFileType.CSV, None
         from datamodel_code_generator.parser._avro_detection import is_avro_schema_data  # noqa: PLC0415
 
         if is_avro_schema_data(data):
-            return InputFileType.Avro
+            return InputFileType.Avro, None
     msg = _infer_input_type_error_message()
     raise Error(msg)
 
@@ -2531,10 +2691,12 @@ def detect_xmlschema_version(source: Any) -> XMLSchemaVersion:
 
 
 _LAZY_IMPORTS = {
+    "bundle_schema": "datamodel_code_generator.schema_bundle",
     "clear_dynamic_models_cache": "datamodel_code_generator.dynamic",
     "detect_jsonschema_version": "datamodel_code_generator.parser.schema_version",
     "detect_openapi_version": "datamodel_code_generator.parser.schema_version",
     "generate_dynamic_models": "datamodel_code_generator.dynamic",
+    "generate_dynamic_models_batch": "datamodel_code_generator.dynamic",
     "GenerateConfig": "datamodel_code_generator.config",
     "UnionMode": "datamodel_code_generator.enums",
     "CodeFormatter": "datamodel_code_generator.format",
@@ -2603,6 +2765,7 @@ __all__ = [
     "TargetPydanticVersion",
     "VersionMode",
     "XMLSchemaVersion",
+    "bundle_schema",  # noqa: F822
     "clear_dynamic_models_cache",  # noqa: F822
     "detect_jsonschema_version",  # noqa: F822
     "detect_openapi_version",  # noqa: F822
@@ -2610,6 +2773,7 @@ __all__ = [
     "enable_parsed_source_cache",
     "generate",
     "generate_dynamic_models",  # noqa: F822
+    "generate_dynamic_models_batch",  # noqa: F822
 ]
 
 __all__ += ["GenerateConfig"]
@@ -133,8 +133,8 @@ from datamodel_code_generator import (
     enable_debug_message,
     generate,
 )
+from datamodel_code_generator._cli_fast_parser import namespace, parse_args_fast
 from datamodel_code_generator._format_types import Formatter, PythonVersion
-from datamodel_code_generator.arguments import arg_parser, namespace
 from datamodel_code_generator.deprecations import render_deprecations, warn_deprecated
 from datamodel_code_generator.enums import StrictTypes
 from datamodel_code_generator.util import load_toml
@@ -144,6 +144,8 @@ def __getattr__(name: str) -> Any:
     """Load the deferred config model without adding it to no-lock imports."""
     if name == "Config":
         return _get_config_class()
+    if name == "arg_parser":
+        return _get_arg_parser()
     msg = f"module {__name__!r} has no attribute {name!r}"
     raise AttributeError(msg)
 
@@ -166,6 +168,7 @@ if TYPE_CHECKING:
         CommandOutputKind,
         GeneratedFilePayload,
     )
+    from datamodel_code_generator.arguments import SuggestingArgumentParser
     from datamodel_code_generator.json_config import JsonConfigFieldName, JsonConfigSource
     from datamodel_code_generator.validators import ModelValidators
     from datamodel_code_generator.watch_dependencies import WatchDependencies
@@ -177,6 +180,7 @@ else:
 
 # Options that should be excluded from pyproject.toml config generation
 EXCLUDED_CONFIG_OPTIONS: frozenset[str] = frozenset({
+    "bundle_schema",
     "check",
     "diff_against",
     "generate_pyproject_config",
@@ -329,6 +333,13 @@ def _validate_http_key_value_options(
     raise Error(msg)  # pragma: no cover
 
 
+def _get_arg_parser() -> SuggestingArgumentParser:
+    """Build the full argparse parser only when the fast parser cannot be used."""
+    from datamodel_code_generator.arguments import arg_parser  # noqa: PLC0415
+
+    return arg_parser
+
+
 @lru_cache(maxsize=1)
 def _get_config_class() -> type[Config]:
     from pydantic import ConfigDict, Field, ValidationInfo, field_validator, model_validator  # noqa: PLC0415
@@ -408,6 +419,8 @@ def _get_config_class() -> type[Config]:
             "custom_template_dir",
             "custom_file_header_path",
             "http_local_ref_path",
+            "ref_bundle",
+            "cache_dir",
             mode="before",
         )
         @classmethod
@@ -633,6 +646,7 @@ def _get_config_class() -> type[Config]:
         output: Optional[Path] = None  # noqa: UP045
         check: bool = False
         diff_against: Optional[Path] = None  # noqa: UP045
+        bundle_schema: bool = False
         repair_invalid_dotted_stdout: bool = Field(default=False, exclude=True)
         forced_invalid_dotted_stdout_repair_modules: tuple[tuple[str, ...], ...] = Field(default=(), exclude=True)
         debug: bool = False
@@ -2651,6 +2665,42 @@ def _diff_against_validation_error(config: Config, namespace: Namespace) -> str
     return next((message for is_incompatible, message in incompatible_options if is_incompatible), None)
 
 
+def _bundle_schema_validation_error(config: Config) -> str | None:
+    """Return the first incompatible --bundle-schema configuration, if any."""
+    if not config.bundle_schema:
+        return None
+    incompatible_options = (
+        (config.url is not None, "Error: --bundle-schema cannot be used with --url; use a local --input path"),
+        (bool(config.input_model), "Error: --bundle-schema cannot be used with --input-model"),
+        (
+            not isinstance(config.input, Path),
+            "Error: --bundle-schema requires --input with the root schema path",
+        ),
+        (config.check, "Error: --bundle-schema and --check cannot be used together"),
+        (config.diff_against is not None, "Error: --bundle-schema and --diff-against cannot be used together"),
+        (config.watch, "Error: --bundle-schema and --watch cannot be used together"),
+    )
+    return next((message for is_incompatible, message in incompatible_options if is_incompatible), None)
+
+
+def _write_bundled_schema(config: Config) -> Exit:
+    """Write the --input schema with every file reference internalized to --output or stdout."""
+    from datamodel_code_generator.schema_bundle import bundle_schema  # noqa: PLC0415
+
+    try:
+        bundled = bundle_schema(cast("Path", config.input), encoding=config.encoding)
+    except Error as e:
+        print(str(e), file=sys.stderr)  # noqa: T201
+        return Exit.ERROR
+    content = json.dumps(bundled, ensure_ascii=False, indent=2) + "\n"
+    if config.output is None:
+        print(content, end="")  # noqa: T201
+        return Exit.OK
+    config.output.parent.mkdir(parents=True, exist_ok=True)
+    config.output.write_text(content, encoding=config.encoding)
+    return Exit.OK
+
+
 def _main(  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
     args: Sequence[str] | None = None,
     *,
@@ -2671,12 +2721,13 @@ def _main(  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
     if "_ARGCOMPLETE" in os.environ:  # pragma: no cover
         import argcomplete  # noqa: PLC0415
 
-        argcomplete.autocomplete(arg_parser)
+        argcomplete.autocomplete(_get_arg_parser())
 
     if args is None:  # pragma: no cover
         args = sys.argv[1:]
 
-    arg_parser.parse_args(args, namespace=namespace)
+    if not parse_args_fast(args, namespace):
+        _get_arg_parser().parse_args(args, namespace=namespace)
 
     if namespace.version:
         from datamodel_code_generator import get_version  # noqa: PLC0415
@@ -2722,6 +2773,7 @@ def _main(  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
     if namespace.generate_prompt is not None:
         from datamodel_code_generator.prompt import generate_prompt  # noqa: PLC0415
 
+        arg_parser = _get_arg_parser()
         help_text = arg_parser.format_help()
         prompt_output = generate_prompt(namespace, help_text, arg_parser)
         print(prompt_output)  # noqa: T201
@@ -2868,12 +2920,18 @@ def _main(  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
         print(diff_error, file=sys.stderr)  # noqa: T201
         return Exit.ERROR
 
+    if bundle_error := _bundle_schema_validation_error(config):
+        print(bundle_error, file=sys.stderr)  # noqa: T201
+        return Exit.ERROR
+    if config.bundle_schema:
+        return _write_bundled_schema(config)
+
     if not config.input and not config.url and not config.input_model and sys.stdin.isatty():
         print(  # noqa: T201
             "Not Found Input: require `stdin` or arguments `--input`, `--url`, or `--input-model`",
             file=sys.stderr,
         )
-        arg_parser.print_help()
+        _get_arg_parser().print_help()
         return Exit.ERROR
 
     if config.input_model and (config.input or config.url):
@@ -3153,6 +3211,7 @@ def _main(  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
                     config.input_file_type,
                     config.input_model_ref_strategy,
                     config.output_model_type,
+                    config.cache_dir,
                 )
             except InputModelError as e:
                 raise Error(str(e)) from e
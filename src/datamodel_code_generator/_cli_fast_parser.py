@@ -0,0 +1,117 @@
+"""Fast command-line parsing for the common ``--long-option`` invocation shapes.
+
+Building the argparse parser in ``arguments.py`` executes several hundred
+``add_argument`` calls on every CLI start. Most invocations only use exact long
+option names with plain string, path, integer, float, or choice values, which can
+be parsed from the static table in ``_cli_option_table.py``. Anything else (short
+options, abbreviations, custom value types, invalid values, conflicts) is left to
+argparse so error messages and edge-case behavior stay identical.
+"""
+
+from __future__ import annotations
+
+from argparse import Namespace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from datamodel_code_generator._cli_option_table import DEFAULTS, MUTUALLY_EXCLUSIVE_DESTS, OPTIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+namespace = Namespace(no_color=False)
+
+_VALUE_CONVERTERS: dict[str, Callable[[str], object]] = {"str": str, "int": int, "float": float, "path": Path}
+
+
+class _FallbackToArgparseError(Exception):
+    """Raised when an argument list needs the full argparse parser."""
+
+
+def _convert(value: str, value_type: str | None, choices: tuple[str, ...] | None) -> object:
+    converter = _VALUE_CONVERTERS.get(value_type) if value_type is not None else None
+    if converter is None:
+        raise _FallbackToArgparseError
+    try:
+        converted = converter(value)
+    except ValueError:
+        raise _FallbackToArgparseError from None
+    if choices is not None and converted not in choices:
+        raise _FallbackToArgparseError
+    return converted
+
+
+def _read_raw_values(args: Sequence[str], index: int, nargs: int | str | None) -> tuple[list[str], int]:
+    raw_values: list[str] = []
+    if nargs is None:
+        if index >= len(args) or args[index].startswith("-"):
+            raise _FallbackToArgparseError
+        return [args[index]], index + 1
+    if nargs not in {"?", "+"}:  # pragma: no cover
+        raise _FallbackToArgparseError
+    while index < len(args) and not args[index].startswith("-"):
+        raw_values.append(args[index])
+        index += 1
+        if nargs == "?":
+            break
+    return raw_values, index
+
+
+def _stored_value(converted: list[object], nargs: int | str | None, const: object) -> object:
+    if nargs == "+":
+        if not converted:
+            raise _FallbackToArgparseError
+        return converted
+    if nargs == "?" and not converted:
+        return const
+    return converted[0]
+
+
+def _parse(args: Sequence[str], target: Namespace) -> dict[str, object]:
+    values: dict[str, object] = {}
+    index = 0
+    while index < len(args):
+        option, has_inline_value, inline_value = args[index].partition("=")
+        entry = OPTIONS.get(option) if option.startswith("--") else None
+        index += 1
+        if entry is None:
+            raise _FallbackToArgparseError
+        dest, kind, nargs, const, value_type, choices = entry
+        if kind in {"store_true", "boolean_optional"}:
+            if has_inline_value:
+                raise _FallbackToArgparseError
+            values[dest] = kind == "store_true" or not option.startswith("--no-")
+            continue
+        if has_inline_value:
+            raw_values = [inline_value]
+        else:
+            raw_values, index = _read_raw_values(args, index, nargs)
+        converted = [_convert(raw_value, value_type, choices) for raw_value in raw_values]
+        if kind == "append":
+            current = values[dest] if dest in values else getattr(target, dest, DEFAULTS.get(dest))
+            if current is not None and not isinstance(current, (list, tuple)):
+                raise _FallbackToArgparseError
+            values[dest] = [*(current or ()), *converted]
+        else:
+            values[dest] = _stored_value(converted, nargs, const)
+    if any(len(group.intersection(values)) > 1 for group in MUTUALLY_EXCLUSIVE_DESTS):
+        raise _FallbackToArgparseError
+    return values
+
+
+def parse_args_fast(args: Sequence[str], target: Namespace) -> bool:
+    """Parse ``args`` into ``target`` without building the argparse parser.
+
+    Returns ``False`` and leaves ``target`` untouched when the arguments need the
+    full parser; the caller must then run ``arg_parser.parse_args`` instead.
+    """
+    try:
+        values = _parse(args, target)
+    except _FallbackToArgparseError:
+        return False
+    for dest, default in DEFAULTS.items():
+        if not hasattr(target, dest):
+            setattr(target, dest, default)
+    for dest, value in values.items():
+        setattr(target, dest, value)
+    return True
@@ -0,0 +1,578 @@
+"""Auto-generated static CLI option table.
+
+DO NOT EDIT MANUALLY. Run: python scripts/build_cli_option_table.py
+"""
+
+from __future__ import annotations
+
+# Option string -> (dest, action kind, nargs, const, value type, choices)
+OPTIONS: dict[str, tuple[str, str, int | str | None, object, str | None, tuple[str, ...] | None]] = {
+    "--additional-imports": ("additional_imports", "store", None, None, "str", None),
+    "--alias-generator": ("alias_generator", "store", None, None, "str", ("to_camel", "to_pascal", "to_snake")),
+    "--aliases": ("aliases", "store", None, None, "str", None),
+    "--all-exports-collision-strategy": (
+        "all_exports_collision_strategy",
+        "store",
+        None,
+        None,
+        "str",
+        ("error", "minimal-prefix", "full-prefix"),
+    ),
+    "--all-exports-scope": ("all_exports_scope", "store", None, None, "str", ("children", "recursive")),
+    "--all-jobs": ("all_jobs", "store_true", None, None, None, None),
+    "--allof-class-hierarchy": ("allof_class_hierarchy", "store", None, None, "str", ("if-no-conflict", "always")),
+    "--allof-merge-mode": ("allof_merge_mode", "store", None, None, "str", ("constraints", "all", "none")),
+    "--allow-extra-fields": ("allow_extra_fields", "store_true", None, None, None, None),
+    "--allow-leading-underscore-class-name": (
+        "allow_leading_underscore_class_name",
+        "store_true",
+        None,
+        None,
+        None,
+        None,
+    ),
+    "--allow-population-by-field-name": ("allow_population_by_field_name", "boolean_optional", None, None, None, None),
+    "--allow-private-network": ("allow_private_network", "boolean_optional", None, None, None, None),
+    "--allow-remote-refs": ("allow_remote_refs", "boolean_optional", None, None, None, None),
+    "--base-class": ("base_class", "store", None, None, "str", None),
+    "--base-class-map": ("base_class_map", "store", None, None, "custom", None),
+    "--bundle-schema": ("bundle_schema", "store_true", None, None, None, None),
+    "--cache-dir": ("cache_dir", "store", None, None, "path", None),
+    "--capitalise-enum-members": ("capitalise_enum_members", "store_true", None, None, None, None),
+    "--capitalize-enum-members": ("capitalise_enum_members", "store_true", None, None, None, None),
+    "--check": ("check", "store_true", None, None, None, None),
+    "--class-decorators": ("class_decorators", "store", None, None, "str", None),
+    "--class-name": ("class_name", "store", None, None, "str", None),
+    "--class-name-affix-scope": ("class_name_affix_scope", "store", None, None, "str", ("all", "models", "enums")),
+    "--class-name-prefix": ("class_name_prefix", "store", None, None, "str", None),
+    "--class-name-suffix": ("class_name_suffix", "store", None, None, "str", None),
+    "--collapse-reuse-models": ("collapse_reuse_models", "store_true", None, None, None, None),
+    "--collapse-root-models": ("collapse_root_models", "boolean_optional", None, None, None, None),
+    "--collapse-root-models-name-strategy": (
+        "collapse_root_models_name_strategy",
+        "store",
+        None,
+        None,
+        "str",
+        ("child", "parent"),
+    ),
+    "--custom-file-header": ("custom_file_header", "store", None, None, "str", None),
+    "--custom-file-header-mode": ("custom_file_header_mode", "store", None, None, "str", ("replace", "prepend")),
+    "--custom-file-header-path": ("custom_file_header_path", "store", None, None, "str", None),
+    "--custom-formatters": ("custom_formatters", "store", None, None, "str", None),
+    "--custom-formatters-kwargs": ("custom_formatters_kwargs", "store", None, None, "str", None),
+    "--custom-template-dir": ("custom_template_dir", "store", None, None, "str", None),
+    "--dataclass-arguments": ("dataclass_arguments", "store", None, None, "custom", None),
+    "--debug": ("debug", "store_true", None, None, None, None),
+    "--default-values": ("default_values", "store", None, None, "str", None),
+    "--diff-against": ("diff_against", "store", None, None, "str", None),
+    "--disable-appending-item-suffix": ("disable_appending_item_suffix", "store_true", None, None, None, None),
+    "--disable-future-imports": ("disable_future_imports", "store_true", None, None, None, None),
+    "--disable-timestamp": ("disable_timestamp", "store_true", None, None, None, None),
+    "--disable-warnings": ("disable_warnings", "store_true", None, None, None, None),
+    "--duplicate-name-suffix": ("duplicate_name_suffix", "store", None, None, "str", None),
+    "--emit-model-metadata": ("emit_model_metadata", "store", None, None, "path", None),
+    "--empty-enum-field-name": ("empty_enum_field_name", "store", None, None, "str", None),
+    "--enable-command-header": ("enable_command_header", "store_true", None, None, None, None),
+    "--enable-faux-immutability": ("enable_faux_immutability", "store_true", None, None, None, None),
+    "--enable-generated-header-marker": ("enable_generated_header_marker", "store_true", None, None, None, None),
+    "--enable-version-header": ("enable_version_header", "store_true", None, None, None, None),
+    "--encoding": ("encoding", "store", None, None, "str", None),
+    "--enum-field-as-literal": ("enum_field_as_literal", "store", None, None, "str", ("all", "one", "none")),
+    "--enum-field-as-literal-map": ("enum_field_as_literal_map", "store", None, None, "custom", None),
+    "--external-ref-mapping": ("external_ref_mapping", "store", "+", None, "custom", None),
+    "--extra-fields": ("extra_fields", "store", None, None, "str", ("allow", "ignore", "forbid")),
+    "--extra-template-data": ("extra_template_data", "store", None, None, "str", None),
+    "--fail-on-multi-module-stdout": ("fail_on_multi_module_stdout", "store_true", None, None, None, None),
+    "--field-constraints": ("field_constraints", "store_true", None, None, None, None),
+    "--field-extra-keys": ("field_extra_keys", "store", "+", None, "str", None),
+    "--field-extra-keys-without-x-prefix": ("field_extra_keys_without_x_prefix", "store", "+", None, "str", None),
+    "--field-include-all-keys": ("field_include_all_keys", "store_true", None, None, None, None),
+    "--field-type-collision-strategy": (
+        "field_type_collision_strategy",
+        "store",
+        None,
+        None,
+        "str",
+        ("rename-field", "rename-type"),
+    ),
+    "--force-optional": ("force_optional", "store_true", None, None, None, None),
+    "--formatters": (
+        "formatters",
+        "store",
+        "+",
+        None,
+        "str",
+        ("builtin", "black", "isort", "ruff-check", "ruff-format"),
+    ),
+    "--frozen-dataclasses": ("frozen_dataclasses", "store_true", None, None, None, None),
+    "--generate-cli-command": ("generate_cli_command", "store_true", None, None, None, None),
+    "--generate-prompt": ("generate_prompt", "store", "?", "", "str", None),
+    "--generate-pyproject-config": ("generate_pyproject_config", "store_true", None, None, None, None),
+    "--generate-schema-validators": ("generate_schema_validators", "store_true", None, None, None, None),
+    "--graphql-no-typename": ("graphql_no_typename", "store_true", None, None, None, None),
+    "--http-backend": ("http_backend", "store", None, None, "str", ("auto", "httpx", "httpx2")),
+    "--http-headers": ("http_headers", "store", "+", None, "str", None),
+    "--http-ignore-tls": ("http_ignore_tls", "store_true", None, None, None, None),
+    "--http-local-ref-path": ("http_local_ref_path", "store", None, None, "str", None),
+    "--http-query-parameters": ("http_query_parameters", "store", "+", None, "str", None),
+    "--http-timeout": ("http_timeout", "store", None, None, "float", None),
+    "--ignore-enum-constraints": ("ignore_enum_constraints", "store_true", None, None, None, None),
+    "--ignore-pyproject": ("ignore_pyproject", "store_true", None, None, None, None),
+    "--import-overrides": ("import_overrides", "store", None, None, "str", None),
+    "--include-path-parameters": ("include_path_parameters", "store_true", None, None, None, None),
+    "--infer-union-variant-names": ("infer_union_variant_names", "store_true", None, None, None, None),
+    "--input": ("input", "store", None, None, "str", None),
+    "--input-file-type": (
+        "input_file_type",
+        "store",
+        None,
+        None,
+        "str",
+        (
+            "auto",
+            "openapi",
+            "asyncapi",
+            "jsonschema",
+            "mcp-tools",
+            "xmlschema",
+            "protobuf",
+            "avro",
+            "json",
+            "yaml",
+            "dict",
+            "csv",
+            "graphql",
+        ),
+    ),
+    "--input-model": ("input_model", "append", None, None, "str", None),
+    "--input-model-ref-strategy": (
+        "input_model_ref_strategy",
+        "store",
+        None,
+        None,
+        "str",
+        ("regenerate-all", "reuse-foreign", "reuse-all"),
+    ),
+    "--job": ("job", "append", None, None, "str", None),
+    "--keep-model-order": ("keep_model_order", "store_true", None, None, None, None),
+    "--keyword-only": ("keyword_only", "store_true", None, None, None, None),
+    "--list-deprecations": ("list_deprecations", "store", "?", "table", "str", ("table", "json", "markdown")),
+    "--list-experimental": ("list_experimental", "store", "?", "table", "str", ("table", "json", "markdown")),
+    "--locked": ("locked", "store_true", None, None, None, None),
+    "--lockfile": ("lockfile", "store", None, None, "str", None),
+    "--model-extra-keys": ("model_extra_keys", "store", "+", None, "str", None),
+    "--model-extra-keys-without-x-prefix": ("model_extra_keys_without_x_prefix", "store", "+", None, "str", None),
+    "--model-name-map": ("model_name_map", "store", None, None, "custom", None),
+    "--module-split-mode": ("module_split_mode", "store", None, None, "str", ("single",)),
+    "--naming-strategy": (
+        "naming_strategy",
+        "store",
+        None,
+        None,
+        "str",
+        ("numbered", "parent-prefixed", "full-path", "primary-first"),
+    ),
+    "--no-alias": ("no_alias", "store_true", None, None, None, None),
+    "--no-allow-population-by-field-name": (
+        "allow_population_by_field_name",
+        "boolean_optional",
+        None,
+        None,
+        None,
+        None,
+    ),
+    "--no-allow-private-network": ("allow_private_network", "boolean_optional", None, None, None, None),
+    "--no-allow-remote-refs": ("allow_remote_refs", "boolean_optional", None, None, None, None),
+    "--no-collapse-root-models": ("collapse_root_models", "boolean_optional", None, None, None, None),
+    "--no-color": ("no_color", "store_true", None, None, None, None),
+    "--no-snake-case-field": ("snake_case_field", "boolean_optional", None, None, None, None),
+    "--no-strict-dotted-module-names": ("strict_dotted_module_names", "boolean_optional", None, None, None, None),
+    "--no-treat-dot-as-module": ("treat_dot_as_module", "boolean_optional", None, None, None, None),
+    "--no-use-annotated": ("use_annotated", "boolean_optional", None, None, None, None),
+    "--no-use-closed-typed-dict": ("use_closed_typed_dict", "boolean_optional", None, None, None, None),
+    "--no-use-frozen-field": ("use_frozen_field", "boolean_optional", None, None, None, None),
+    "--no-use-specialized-enum": ("use_specialized_enum", "boolean_optional", None, None, None, None),
+    "--no-use-standard-collections": ("use_standard_collections", "boolean_optional", None, None, None, None),
+    "--no-use-standard-primitive-types": ("use_standard_primitive_types", "boolean_optional", None, None, None, None),
+    "--no-use-type-checking-imports": ("use_type_checking_imports", "boolean_optional", None, None, None, None),
+    "--no-use-union-operator": ("use_union_operator", "boolean_optional", None, None, None, None),
+    "--openapi-exclude-operation-ids": ("openapi_exclude_operation_ids", "store", "+", None, "str", None),
+    "--openapi-exclude-tags": ("openapi_exclude_tags", "store", "+", None, "str", None),
+    "--openapi-include-info-version": ("openapi_include_info_version", "store_true", None, None, None, None),
+    "--openapi-include-operation-ids": ("openapi_include_operation_ids", "store", "+", None, "str", None),
+    "--openapi-include-paths": ("openapi_include_paths", "store", "+", None, "str", None),
+    "--openapi-include-tags": ("openapi_include_tags", "store", "+", None, "str", None),
+    "--openapi-scopes": (
+        "openapi_scopes",
+        "store",
+        "+",
+        None,
+        "str",
+        ("schemas", "paths", "tags", "parameters", "webhooks", "requestbodies"),
+    ),
+    "--original-field-name-delimiter": ("original_field_name_delimiter", "store", None, None, "str", None),
+    "--output": ("output", "store", None, None, "str", None),
+    "--output-date-class": ("output_date_class", "store", None, None, "str", ("date", "PastDate", "FutureDate")),
+    "--output-datetime-class": (
+        "output_datetime_class",
+        "store",
+        None,
+        None,
+        "str",
+        ("datetime", "AwareDatetime", "NaiveDatetime", "PastDatetime", "FutureDatetime"),
+    ),
+    "--output-format": ("output_format", "store", None, None, "str", ("text", "json")),
+    "--output-format-json-schema": (
+        "output_format_json_schema",
+        "store",
+        None,
+        None,
+        "str",
+        ("config", "generate-prompt", "generation", "model-metadata", "structured-output"),
+    ),
+    "--output-model-type": (
+        "output_model_type",
+        "store",
+        None,
+        None,
+        "str",
+        (
+            "pydantic_v2.BaseModel",
+            "pydantic_v2.dataclass",
+            "dataclasses.dataclass",
+            "typing.TypedDict",
+            "msgspec.Struct",
+        ),
+    ),
+    "--parent-scoped-naming": ("parent_scoped_naming", "store_true", None, None, None, None),
+    "--preset": (
+        "preset",
+        "store",
+        None,
+        None,
+        "str",
+        (
+            "standard-py310-20260619",
+            "standard-py311-20260619",
+            "standard-py312-20260619",
+            "standard-py313-20260619",
+            "standard-py314-20260619",
+            "practical-py310-20260619",
+            "practical-py311-20260619",
+            "practical-py312-20260619",
+            "practical-py313-20260619",
+            "practical-py314-20260619",
+        ),
+    ),
+    "--profile": ("profile", "store", None, None, "str", None),
+    "--read-only-write-only-model-type": (
+        "read_only_write_only_model_type",
+        "store",
+        None,
+        None,
+        "str",
+        ("request-response", "all"),
+    ),
+    "--ref-bundle": ("ref_bundle", "store", None, None, "str", None),
+    "--remove-special-field-name-prefix": ("remove_special_field_name_prefix", "store_true", None, None, None, None),
+    "--reuse-model": ("reuse_model", "store_true", None, None, None, None),
+    "--reuse-scope": ("reuse_scope", "store", None, None, "str", ("module", "tree")),
+    "--sample-size": ("sample_size", "store", None, None, "int", None),
+    "--schema-validator-base-class-name": ("schema_validator_base_class_name", "store", None, None, "str", None),
+    "--schema-validator-type": ("schema_validator_type", "store", None, None, "str", ("pydantic-v2",)),
+    "--schema-version": ("schema_version", "store", None, None, "str", None),
+    "--schema-version-mode": ("schema_version_mode", "store", None, None, "str", ("lenient", "strict")),
+    "--serialization-aliases": ("serialization_aliases", "store", None, None, "str", None),
+    "--set-default-enum-member": ("set_default_enum_member", "store_true", None, None, None, None),
+    "--shared-module-name": ("shared_module_name", "store", None, None, "str", None),
+    "--skip-root-model": ("skip_root_model", "store_true", None, None, None, None),
+    "--snake-case-field": ("snake_case_field", "boolean_optional", None, None, None, None),
+    "--special-field-name-prefix": ("special_field_name_prefix", "store", None, None, "str", None),
+    "--strict-dotted-module-names": ("strict_dotted_module_names", "boolean_optional", None, None, None, None),
+    "--strict-nullable": ("strict_nullable", "store_true", None, None, None, None),
+    "--strict-refs": ("strict_refs", "store_true", None, None, None, None),
+    "--strict-types": ("strict_types", "store", "+", None, "str", ("str", "bytes", "int", "float", "bool")),
+    "--strip-default-none": ("strip_default_none", "store_true", None, None, None, None),
+    "--target-pydantic-version": ("target_pydantic_version", "store", None, None, "str", ("2", "2.11", "2.12")),
+    "--target-python-version": (
+        "target_python_version",
+        "store",
+        None,
+        None,
+        "str",
+        ("3.10", "3.11", "3.12", "3.13", "3.14"),
+    ),
+    "--treat-dot-as-module": ("treat_dot_as_module", "boolean_optional", None, None, None, None),
+    "--type-mappings": ("type_mappings", "store", "+", None, "str", None),
+    "--type-overrides": ("type_overrides", "store", None, None, "str", None),
+    "--union-mode": ("union_mode", "store", None, None, "str", ("smart", "left_to_right")),
+    "--update-lock": ("update_lock", "store_true", None, None, None, None),
+    "--update-ref-bundle": ("update_ref_bundle", "store_true", None, None, None, None),
+    "--url": ("url", "store", None, None, "str", None),
+    "--use-annotated": ("use_annotated", "boolean_optional", None, None, None, None),
+    "--use-attribute-docstrings": ("use_attribute_docstrings", "store_true", None, None, None, None),
+    "--use-closed-typed-dict": ("use_closed_typed_dict", "boolean_optional", None, None, None, None),
+    "--use-decimal-for-multiple-of": ("use_decimal_for_multiple_of", "store_true", None, None, None, None),
+    "--use-default": ("use_default", "store_true", None, None, None, None),
+    "--use-default-factory-for-optional-nested-models": (
+        "use_default_factory_for_optional_nested_models",
+        "store_true",
+        None,
+        None,
+        None,
+        None,
+    ),
+    "--use-default-kwarg": ("use_default_kwarg", "store_true", None, None, None, None),
+    "--use-double-quotes": ("use_double_quotes", "store_true", None, None, None, None),
+    "--use-enum-values-in-discriminator": ("use_enum_values_in_discriminator", "store_true", None, None, None, None),
+    "--use-exact-imports": ("use_exact_imports", "store_true", None, None, None, None),
+    "--use-field-description": ("use_field_description", "store_true", None, None, None, None),
+    "--use-field-description-example": ("use_field_description_example", "store_true", None, None, None, None),
+    "--use-frozen-field": ("use_frozen_field", "boolean_optional", None, None, None, None),
+    "--use-generic-base-class": ("use_generic_base_class", "store_true", None, None, None, None),
+    "--use-generic-container-types": ("use_generic_container_types", "store_true", None, None, None, None),
+    "--use-inline-field-description": ("use_inline_field_description", "store_true", None, None, None, None),
+    "--use-missing-sentinel": ("use_missing_sentinel", "store_true", None, None, None, None),
+    "--use-non-positive-negative-number-constrained-types": (
+        "use_non_positive_negative_number_constrained_types",
+        "store_true",
+        None,
+        None,
+        None,
+        None,
+    ),
+    "--use-object-type": ("use_object_type", "store_true", None, None, None, None),
+    "--use-one-literal-as-default": ("use_one_literal_as_default", "store_true", None, None, None, None),
+    "--use-operation-id-as-name": ("use_operation_id_as_name", "store_true", None, None, None, None),
+    "--use-pendulum": ("use_pendulum", "store_true", None, None, None, None),
+    "--use-root-model-sequence-interface": ("use_root_model_sequence_interface", "store_true", None, None, None, None),
+    "--use-root-model-type-alias": ("use_root_model_type_alias", "store_true", None, None, None, None),
+    "--use-schema-description": ("use_schema_description", "store_true", None, None, None, None),
+    "--use-serialization-alias": ("use_serialization_alias", "store_true", None, None, None, None),
+    "--use-serialize-as-any": ("use_serialize_as_any", "store_true", None, None, None, None),
+    "--use-single-line-docstring": ("use_single_line_docstring", "store_true", None, None, None, None),
+    "--use-specialized-enum": ("use_specialized_enum", "boolean_optional", None, None, None, None),
+    "--use-standard-collections": ("use_standard_collections", "boolean_optional", None, None, None, None),
+    "--use-standard-primitive-types": ("use_standard_primitive_types", "boolean_optional", None, None, None, None),
+    "--use-status-code-in-response-name": ("use_status_code_in_response_name", "store_true", None, None, None, None),
+    "--use-subclass-enum": ("use_subclass_enum", "store_true", None, None, None, None),
+    "--use-title-as-name": ("use_title_as_name", "store_true", None, None, None, None),
+    "--use-total-false-for-typed-dict": ("use_total_false_for_typed_dict", "store_true", None, None, None, None),
+    "--use-tuple-for-fixed-items": ("use_tuple_for_fixed_items", "store_true", None, None, None, None),
+    "--use-tuple-for-fixed-length-arrays": ("use_tuple_for_fixed_length_arrays", "store_true", None, None, None, None),
+    "--use-type-alias": ("use_type_alias", "store_true", None, None, None, None),
+    "--use-type-alias-type": ("use_type_alias_type", "store_true", None, None, None, None),
+    "--use-type-checking-imports": ("use_type_checking_imports", "boolean_optional", None, None, None, None),
+    "--use-union-operator": ("use_union_operator", "boolean_optional", None, None, None, None),
+    "--use-unique-items-as-set": ("use_unique_items_as_set", "store_true", None, None, None, None),
+    "--validation": ("validation", "store_true", None, None, None, None),
+    "--validators": ("validators", "store", None, None, "str", None),
+    "--version": ("version", "store_true", None, None, None, None),
+    "--watch": ("watch", "store_true", None, None, None, None),
+    "--watch-delay": ("watch_delay", "store", None, None, "float", None),
+    "--wrap-string-literal": ("wrap_string_literal", "store_true", None, None, None, None),
+}
+
+# Namespace values argparse assigns when an option is absent
+DEFAULTS: dict[str, object] = {
+    "additional_imports": None,
+    "alias_generator": None,
+    "aliases": None,
+    "all_exports_collision_strategy": None,
+    "all_exports_scope": None,
+    "all_jobs": None,
+    "allof_class_hierarchy": None,
+    "allof_merge_mode": None,
+    "allow_extra_fields": None,
+    "allow_leading_underscore_class_name": None,
+    "allow_population_by_field_name": None,
+    "allow_private_network": None,
+    "allow_remote_refs": None,
+    "base_class": None,
+    "base_class_map": None,
+    "bundle_schema": None,
+    "cache_dir": None,
+    "capitalise_enum_members": None,
+    "check": None,
+    "class_decorators": None,
+    "class_name": None,
+    "class_name_affix_scope": None,
+    "class_name_prefix": None,
+    "class_name_suffix": None,
+    "collapse_reuse_models": None,
+    "collapse_root_models": None,
+    "collapse_root_models_name_strategy": None,
+    "custom_file_header": None,
+    "custom_file_header_mode": None,
+    "custom_file_header_path": None,
+    "custom_formatters": None,
+    "custom_formatters_kwargs": None,
+    "custom_template_dir": None,
+    "dataclass_arguments": None,
+    "debug": None,
+    "default_values": None,
+    "diff_against": None,
+    "disable_appending_item_suffix": None,
+    "disable_future_imports": None,
+    "disable_timestamp": None,
+    "disable_warnings": None,
+    "duplicate_name_suffix": None,
+    "emit_model_metadata": None,
+    "empty_enum_field_name": None,
+    "enable_command_header": None,
+    "enable_faux_immutability": None,
+    "enable_generated_header_marker": None,
+    "enable_version_header": None,
+    "encoding": None,
+    "enum_field_as_literal": None,
+    "enum_field_as_literal_map": None,
+    "external_ref_mapping": None,
+    "extra_fields": None,
+    "extra_template_data": None,
+    "fail_on_multi_module_stdout": None,
+    "field_constraints": None,
+    "field_extra_keys": None,
+    "field_extra_keys_without_x_prefix": None,
+    "field_include_all_keys": None,
+    "field_type_collision_strategy": None,
+    "force_optional": None,
+    "formatters": None,
+    "frozen_dataclasses": None,
+    "generate_cli_command": None,
+    "generate_prompt": None,
+    "generate_pyproject_config": None,
+    "generate_schema_validators": None,
+    "graphql_no_typename": None,
+    "help": "==SUPPRESS==",
+    "http_backend": None,
+    "http_headers": None,
+    "http_ignore_tls": None,
+    "http_local_ref_path": None,
+    "http_query_parameters": None,
+    "http_timeout": None,
+    "ignore_enum_constraints": None,
+    "ignore_pyproject": False,
+    "import_overrides": None,
+    "include_path_parameters": None,
+    "infer_union_variant_names": None,
+    "input": None,
+    "input_file_type": None,
+    "input_model": None,
+    "input_model_ref_strategy": None,
+    "job": None,
+    "keep_model_order": None,
+    "keyword_only": None,
+    "list_deprecations": None,
+    "list_experimental": None,
+    "locked": None,
+    "lockfile": None,
+    "model_extra_keys": None,
+    "model_extra_keys_without_x_prefix": None,
+    "model_name_map": None,
+    "module_split_mode": None,
+    "naming_strategy": None,
+    "no_alias": None,
+    "no_color": False,
+    "openapi_exclude_operation_ids": None,
+    "openapi_exclude_tags": None,
+    "openapi_include_info_version": None,
+    "openapi_include_operation_ids": None,
+    "openapi_include_paths": None,
+    "openapi_include_tags": None,
+    "openapi_scopes": None,
+    "original_field_name_delimiter": None,
+    "output": None,
+    "output_date_class": None,
+    "output_datetime_class": None,
+    "output_format": None,
+    "output_format_json_schema": None,
+    "output_model_type": None,
+    "parent_scoped_naming": None,
+    "preset": None,
+    "profile": None,
+    "read_only_write_only_model_type": None,
+    "ref_bundle": None,
+    "remove_special_field_name_prefix": None,
+    "reuse_model": None,
+    "reuse_scope": None,
+    "sample_size": None,
+    "schema_validator_base_class_name": None,
+    "schema_validator_type": None,
+    "schema_version": None,
+    "schema_version_mode": None,
+    "serialization_aliases": None,
+    "set_default_enum_member": None,
+    "shared_module_name": None,
+    "skip_root_model": None,
+    "snake_case_field": None,
+    "special_field_name_prefix": None,
+    "strict_dotted_module_names": None,
+    "strict_nullable": None,
+    "strict_refs": None,
+    "strict_types": None,
+    "strip_default_none": None,
+    "target_pydantic_version": None,
+    "target_python_version": None,
+    "treat_dot_as_module": None,
+    "type_mappings": None,
+    "type_overrides": None,
+    "union_mode": None,
+    "update_lock": None,
+    "update_ref_bundle": None,
+    "url": None,
+    "use_annotated": None,
+    "use_attribute_docstrings": None,
+    "use_closed_typed_dict": None,
+    "use_decimal_for_multiple_of": None,
+    "use_default": None,
+    "use_default_factory_for_optional_nested_models": None,
+    "use_default_kwarg": None,
+    "use_double_quotes": None,
+    "use_enum_values_in_discriminator": None,
+    "use_exact_imports": None,
+    "use_field_description": None,
+    "use_field_description_example": None,
+    "use_frozen_field": None,
+    "use_generic_base_class": None,
+    "use_generic_container_types": None,
+    "use_inline_field_description": None,
+    "use_missing_sentinel": None,
+    "use_non_positive_negative_number_constrained_types": None,
+    "use_object_type": None,
+    "use_one_literal_as_default": None,
+    "use_operation_id_as_name": None,
+    "use_pendulum": None,
+    "use_root_model_sequence_interface": None,
+    "use_root_model_type_alias": None,
+    "use_schema_description": None,
+    "use_serialization_alias": None,
+    "use_serialize_as_any": None,
+    "use_single_line_docstring": None,
+    "use_specialized_enum": None,
+    "use_standard_collections": None,
+    "use_standard_primitive_types": None,
+    "use_status_code_in_response_name": None,
+    "use_subclass_enum": None,
+    "use_title_as_name": None,
+    "use_total_false_for_typed_dict": None,
+    "use_tuple_for_fixed_items": None,
+    "use_tuple_for_fixed_length_arrays": None,
+    "use_type_alias": None,
+    "use_type_alias_type": None,
+    "use_type_checking_imports": None,
+    "use_union_operator": None,
+    "use_unique_items_as_set": None,
+    "validation": None,
+    "validators": None,
+    "version": False,
+    "watch": None,
+    "watch_delay": None,
+    "wrap_string_literal": None,
+}
+
+MUTUALLY_EXCLUSIVE_DESTS: tuple[frozenset[str], ...] = (
+    frozenset({"allow_extra_fields", "extra_fields"}),
+    frozenset({"locked", "update_lock"}),
+    frozenset({"all_jobs", "job"}),
+)
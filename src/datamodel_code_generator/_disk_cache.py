@@ -0,0 +1,100 @@
+"""Persistent content-addressed cache for expensive schema conversions.
+
+Entries live under ``<cache_dir>/<namespace>/`` and are keyed by a digest of
+everything that can change the converted result: input contents, resolved
+includes, relevant options and tool versions. Values are stored with
+``marshal`` like the in-process parsed-source cache, so only values ``marshal``
+supports are cached. Anything else, and any I/O failure, falls back to
+converting without the cache.
+
+Most namespaces hold primitive ``YamlValue``-shaped data, but the dynamic model
+namespace holds compiled code objects that are loaded and executed to create
+model classes. ``marshal`` does not guard against crafted data either, so the
+cache directory must be as trusted as the installed code: it should be writable
+only by the user running the generator, and never be shared with or copied from
+untrusted sources.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import marshal
+import os
+import sys
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+CACHE_FORMAT_VERSION = 1
+"""Bump when a cached conversion changes without a package version change."""
+
+
+class CacheKey:
+    """Incrementally build a cache key digest from length-prefixed parts."""
+
+    def __init__(self, namespace: str) -> None:
+        """Start a key scoped to ``namespace`` and the running package and Python versions."""
+        from datamodel_code_generator import get_version  # noqa: PLC0415
+
+        self._digest = sha256()
+        self.add(namespace, str(CACHE_FORMAT_VERSION), get_version(), sys.version.split()[0])
+
+    def add(self, *parts: str | bytes | None) -> CacheKey:
+        """Append ``parts`` to the key; ``None`` is distinct from an empty value."""
+        for part in parts:
+            data = b"\x00" if part is None else b"\x01" + (part.encode() if isinstance(part, str) else part)
+            self._digest.update(len(data).to_bytes(8, "little"))
+            self._digest.update(data)
+        return self
+
+    def hexdigest(self) -> str:
+        """Return the finished key."""
+        return self._digest.hexdigest()
+
+
+class DiskCache:
+    """A directory of marshal-encoded conversion results."""
+
+    def __init__(self, cache_dir: Path, namespace: str) -> None:
+        """Use ``cache_dir / namespace`` as the entry directory."""
+        self.directory = cache_dir / namespace
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.marshal"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or ``None`` when missing or unreadable."""
+        try:
+            data = self._entry_path(key).read_bytes()
+        except OSError:
+            return None
+        try:
+            # Entries are written by ``set`` below into a user-owned cache directory.
+            return marshal.loads(data)  # noqa: S302
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` atomically; unsupported values are skipped."""
+        try:
+            data = marshal.dumps(value)
+        except ValueError:
+            return
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        except OSError:
+            return
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            temp_path.replace(path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp_path.unlink()
+
+
+__all__ = ["CACHE_FORMAT_VERSION", "CacheKey", "DiskCache"]
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from datamodel_code_generator._python_type_annotation import PythonTypeExpr
@@ -87,6 +87,66 @@ def _collect_python_type_tokens(value: object) -> set[str]:
     return tokens
 
 
+def _python_type_expr_classes() -> dict[str, type[PythonTypeExpr]]:
+    from datamodel_code_generator import _python_type_annotation  # noqa: PLC0415
+
+    return {
+        name: value
+        for name, value in vars(_python_type_annotation).items()
+        if isinstance(value, type) and issubclass(value, _python_type_annotation.PythonTypeExpr) and is_dataclass(value)
+    }
+
+
+def _dump_python_type_expr_value(value: object) -> object:
+    from datamodel_code_generator._python_type_annotation import PythonTypeExpr  # noqa: PLC0415
+
+    match value:
+        case PythonTypeExpr() if is_dataclass(value):
+            return [
+                type(value).__name__,
+                *(_dump_python_type_expr_value(getattr(value, field.name)) for field in fields(value)),
+            ]
+        case tuple():
+            return tuple(map(_dump_python_type_expr_value, value))
+        case _:
+            return value
+
+
+def _load_python_type_expr_value(value: object, classes: Mapping[str, type[PythonTypeExpr]]) -> object:
+    match value:
+        case list([str() as class_name, *arguments]):
+            return classes[class_name](*(_load_python_type_expr_value(argument, classes) for argument in arguments))
+        case tuple():
+            return tuple(_load_python_type_expr_value(item, classes) for item in value)
+        case _:
+            return value
+
+
+def dump_loaded_schema(loaded: LoadedInputModelSchema) -> dict[str, object]:
+    """Encode a loaded schema and its expressions as marshal-compatible primitives.
+
+    Expressions become lists headed by their class name; tuples stay tuples, so the
+    encoding is unambiguous without a JSON round trip.
+    """
+    return {
+        "schema": loaded.schema,
+        "python_type_expressions": {
+            token: _dump_python_type_expr_value(expression)
+            for token, expression in loaded.python_type_expressions.items()
+        },
+    }
+
+
+def load_loaded_schema(data: Mapping[str, Any]) -> LoadedInputModelSchema:
+    """Rebuild a schema encoded by ``dump_loaded_schema``."""
+    classes = _python_type_expr_classes()
+    expressions = {
+        token: cast("PythonTypeExpr", _load_python_type_expr_value(value, classes))
+        for token, value in data["python_type_expressions"].items()
+    }
+    return LoadedInputModelSchema(data["schema"], MappingProxyType(expressions))
+
+
 def externalize_python_type_token(value: Any, expressions: Mapping[str, PythonTypeExpr] | None) -> Any:
     """Render a private token only when data crosses into generated output metadata."""
     if expressions is None or not isinstance(value, str) or (expression := expressions.get(value)) is None:
@@ -100,6 +160,8 @@ def externalize_python_type_token(value: Any, expressions: Mapping[str, PythonTy
 __all__ = [
     "LoadedInputModelSchema",
     "PythonTypeExpressionCollector",
+    "dump_loaded_schema",
     "externalize_python_type_token",
     "is_python_type_token",
+    "load_loaded_schema",
 ]
@@ -0,0 +1,130 @@
+"""Inspect the leading content of an input document from a bounded prefix.
+
+Automatic input type detection mostly needs a few root keys such as ``openapi`` or
+``$schema``, which conventionally come first, or a Protocol Buffers header. These
+helpers scan a prefix of the document for them without decoding nested values, so
+a large specification does not have to be parsed twice.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+NESTED_VALUE = object()
+"""Stands in for an object or array value, which is skipped rather than decoded."""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_PROTOBUF_HEADER = re.compile(r"\ufeff?[ \t\n\r]*(?:syntax|edition)[ \t]*=")
+# An unterminated string swallows the rest of the prefix, so its brackets are never counted.
+_JSON_STRUCTURE = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}\[\]]', re.DOTALL)
+_YAML_ROOT_KEY = re.compile(
+    r"""(?:"(?P<double>[^"\\]*)"|'(?P<single>[^']*)'|(?P<plain>[^\s#'"{}\[\],&*!|>%@`?:-][^:#]*?))"""
+    r"""\s*:(?:[ \t]+(?P<value>"[^"]*"|'[^']*'|[^#]*?))?[ \t]*(?:[ \t]#.*)?"""
+)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    return pos if match is None else match.end()
+
+
+def _skip_nested_value(text: str, pos: int) -> int:
+    depth = 0
+    for match in _JSON_STRUCTURE.finditer(text, pos):
+        match match.group():
+            case "{" | "[":
+                depth += 1
+            case "}" | "]":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+    msg = "Nested value continues past the prefix"
+    raise ValueError(msg)
+
+
+def _iter_json_root_items(text: str) -> Iterator[tuple[str, Any] | None]:
+    """Yield the root entries of a JSON object, then ``None`` if its closing brace is reached."""
+    decode = json.JSONDecoder().raw_decode
+    pos = _skip_whitespace(text, text.find("{") + 1)
+    while pos < len(text) and text[pos] != "}":
+        key, pos = decode(text, pos)
+        pos = _skip_whitespace(text, pos)
+        if not isinstance(key, str) or text[pos] != ":":
+            return
+        pos = _skip_whitespace(text, pos + 1)
+        if text[pos] in "{[":
+            pos = _skip_nested_value(text, pos)
+            yield key, NESTED_VALUE
+        else:
+            value, pos = decode(text, pos)
+            yield key, value
+        pos = _skip_whitespace(text, pos)
+        if text[pos] != ",":
+            break
+        pos = _skip_whitespace(text, pos + 1)
+    if text[pos] == "}":
+        yield None
+
+
+def _iter_yaml_root_items(text: str) -> Iterator[tuple[str, Any] | None]:
+    """Yield the root entries of a block mapping, then ``None`` if every line was read."""
+    started = False
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#") or line[:1] in {" ", "\t"}:
+            continue
+        if not started and (line.startswith("%") or line.rstrip() == "---"):
+            continue
+        started = True
+        if line.startswith("- ") or (match := _YAML_ROOT_KEY.fullmatch(line)) is None:
+            return
+        key = match.group("double") or match.group("single") or match.group("plain")
+        value = match.group("value")
+        if value and value[:1] == value[-1:] and value[:1] in {'"', "'"} and len(value) > 1:
+            value = value[1:-1]
+        yield key, value or NESTED_VALUE
+    yield None
+
+
+def has_protobuf_header(prefix: str) -> bool:
+    """Return whether ``prefix`` opens with a Protocol Buffers ``syntax`` or ``edition`` statement.
+
+    Such a first line cannot start a YAML mapping, so it is safe to decide on.
+    """
+    return _PROTOBUF_HEADER.match(prefix) is not None
+
+
+def line_prefix(text: str, limit: int) -> str:
+    """Return at most ``limit`` characters of ``text``, cut after a line break when shortened."""
+    if len(text) <= limit:
+        return text
+    prefix = text[:limit]
+    return prefix[: prefix.rfind("\n") + 1]
+
+
+def sniff_root_mapping(prefix: str, *, is_json: bool) -> tuple[dict[str, Any], bool]:
+    """Return the root mapping keys found in ``prefix`` and whether the scan read all of them.
+
+    Nested values map to ``NESTED_VALUE``. Scanning stops quietly at the end of the
+    prefix or at anything that is not a plain root mapping entry, and the flag is then
+    ``False``. A YAML mapping has no closing token, so for YAML the flag only means
+    every line of ``prefix`` was read; the caller must also know that ``prefix`` is
+    the whole document. A YAML prefix must end at a line break, see ``line_prefix``.
+    """
+    items = _iter_json_root_items(prefix) if is_json else _iter_yaml_root_items(prefix)
+    keys: dict[str, Any] = {}
+    try:
+        for item in items:
+            if item is None:
+                return keys, True
+            keys.setdefault(*item)
+    except (IndexError, ValueError):
+        pass
+    return keys, False
+
+
+__all__ = ["NESTED_VALUE", "has_protobuf_header", "line_prefix", "sniff_root_mapping"]
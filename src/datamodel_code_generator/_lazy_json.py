@@ -0,0 +1,188 @@
+"""Memory-mapped, lazily decoded loading of very large JSON specifications.
+
+Very large single-file specifications (multi-hundred-MB OpenAPI bundles) are
+memory-mapped instead of read into memory, and only the containers listed by the
+parser are split up front. Each of their entries stays an undecoded span of the
+mapped file until the parser first reads it, so peak memory tracks what is
+actually parsed rather than the whole document.
+
+Splitting a container without decoding its entries relies on ``msgspec.Raw``, so
+this mode is only used when msgspec is installed; otherwise inputs are decoded
+eagerly as before.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import mmap
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from datamodel_code_generator import YamlValue
+
+LazyJsonPath = tuple[str, ...]
+"""Key path of a container that is decoded lazily; ``"*"`` matches any key."""
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_UTF8_ENCODINGS = frozenset({"utf-8", "utf8", "utf_8", "utf-8-sig", "utf_8_sig"})
+_RAW_OBJECT_DECODER = msgspec.json.Decoder(dict[str, msgspec.Raw])
+_VALUE_DECODER = msgspec.json.Decoder()
+
+
+def _decode_value(raw: msgspec.Raw) -> YamlValue:
+    """Decode one span, re-parsing with the standard library when msgspec rejects it."""
+    try:
+        return _VALUE_DECODER.decode(raw)
+    except msgspec.DecodeError:
+        return json.loads(bytes(raw))
+
+
+def _matches(path: LazyJsonPath, pattern: LazyJsonPath) -> bool:
+    return len(path) == len(pattern) and all(part in {key, "*"} for key, part in zip(path, pattern, strict=True))
+
+
+class LazyJsonObject(dict[str, Any]):  # noqa: FURB189, PLW1641 - parsers check isinstance(value, dict).
+    """A JSON object whose entries are decoded from the mapped file on first access.
+
+    Undecoded entries are stored as ``msgspec.Raw`` spans and replaced in place by
+    their decoded value when read through any mapping accessor. Entries whose key
+    path is listed in ``lazy_paths`` are themselves returned as ``LazyJsonObject``
+    instances; everything else is decoded in full, so schema objects handed to
+    model validation are always plain containers.
+    """
+
+    __slots__ = ("_lazy_paths", "_path")
+
+    def __init__(self, raw: msgspec.Raw, path: LazyJsonPath, lazy_paths: tuple[LazyJsonPath, ...]) -> None:
+        """Split ``raw`` into undecoded entry spans."""
+        super().__init__(_RAW_OBJECT_DECODER.decode(raw))
+        self._path = path
+        self._lazy_paths = lazy_paths
+
+    def _materialize(self, key: str, value: Any) -> Any:
+        if not isinstance(value, msgspec.Raw):
+            return value
+        child_path = (*self._path, key)
+        decoded: Any
+        if memoryview(value)[:1] == b"{" and any(_matches(child_path, pattern) for pattern in self._lazy_paths):
+            decoded = LazyJsonObject(value, child_path, self._lazy_paths)
+        else:
+            decoded = _decode_value(value)
+        dict.__setitem__(self, key, decoded)  # noqa: PLC2801 - store without re-entering overrides
+        return decoded
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the decoded entry for ``key``."""
+        return self._materialize(key, dict.__getitem__(self, key))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys; defined so ``dict(obj)`` and ``{**obj}`` go through ``__getitem__``."""
+        return dict.__iter__(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the decoded entry for ``key``, or ``default``."""
+        if key not in self:
+            return default
+        return self[key]
+
+    def items(self) -> list[tuple[str, Any]]:  # ty: ignore[invalid-method-override]
+        """Return decoded ``(key, value)`` pairs."""
+        return [(key, self[key]) for key in dict.keys(self)]
+
+    def values(self) -> list[Any]:  # ty: ignore[invalid-method-override]
+        """Return decoded values."""
+        return [self[key] for key in dict.keys(self)]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove ``key`` and return its decoded value."""
+        if key not in self and default:
+            return default[0]
+        value = self[key]
+        dict.pop(self, key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        """Remove and return the last decoded ``(key, value)`` pair."""
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return the decoded entry for ``key``, inserting ``default`` when absent."""
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)  # noqa: PLC2801 - store without re-entering overrides
+        return default
+
+    def copy(self) -> dict[str, Any]:
+        """Return a shallow plain-dict copy with every entry decoded."""
+        return dict(self.items())
+
+    def __or__(self, other: Any) -> Any:
+        """Merge like ``dict.__or__`` with decoded entries."""
+        if not isinstance(other, dict):
+            return NotImplemented
+        return {**self, **other}
+
+    def __ror__(self, other: Any) -> Any:
+        """Merge like ``dict.__ror__`` with decoded entries."""
+        if not isinstance(other, dict):
+            return NotImplemented
+        return {**other, **self}
+
+    def __eq__(self, other: object) -> bool:
+        """Compare decoded contents."""
+        return self.copy() == other
+
+    def __ne__(self, other: object) -> bool:
+        """Compare decoded contents."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Represent the decoded contents."""
+        return repr(self.copy())
+
+    def __copy__(self) -> dict[str, Any]:
+        """Return a shallow plain-dict copy with every entry decoded."""
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> LazyJsonObject:
+        """Deep-copy decoded entries while sharing the immutable undecoded spans."""
+        clone = LazyJsonObject.__new__(LazyJsonObject)
+        clone._path = self._path  # noqa: SLF001
+        clone._lazy_paths = self._lazy_paths  # noqa: SLF001
+        memo[id(self)] = clone
+        for key, value in dict.items(self):
+            dict.__setitem__(clone, key, value if isinstance(value, msgspec.Raw) else copy.deepcopy(value, memo))
+        return clone
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        """Pickle as a plain dict."""
+        return dict, (self.copy(),)
+
+
+def load_lazy_json_from_path(path: Path, encoding: str, lazy_paths: tuple[LazyJsonPath, ...]) -> LazyJsonObject | None:
+    """Memory-map a large JSON object and return it with ``lazy_paths`` decoded lazily.
+
+    Returns ``None`` when the file is not a UTF-8 JSON object, so the caller can
+    fall back to the regular eager loading (and its error reporting).
+    """
+    if encoding.lower() not in _UTF8_ENCODINGS:
+        return None
+    with path.open("rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if view[:3] == _UTF8_BOM:
+        view = view[3:]
+    try:
+        return LazyJsonObject(msgspec.Raw(view), (), lazy_paths)
+    except msgspec.DecodeError:
+        return None
+
+
+__all__ = ["LazyJsonObject", "LazyJsonPath", "load_lazy_json_from_path"]
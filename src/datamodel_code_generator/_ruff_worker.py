@@ -0,0 +1,393 @@
+"""Long-lived Ruff formatter worker driven over the Ruff language server protocol.
+
+A worker owns one ``ruff server`` process and feeds it many code buffers over
+stdin/stdout framing, so repeated formatting avoids process spawn and Ruff
+configuration discovery. Workers are pooled per formatter settings and are
+restarted transparently when the server process fails.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import subprocess  # noqa: S404
+import threading
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Any
+
+_RUFF_CONFIG_FILE_NAMES: tuple[str, ...] = (".ruff.toml", "ruff.toml", "pyproject.toml")
+_DOCUMENT_NAME = "__datamodel_codegen_stdin__.py"
+_FIX_ALL_KIND = "source.fixAll.ruff"
+_INVALID_SYNTAX_CODE = "invalid-syntax"
+_TYPE_CHECKING_UNFIXABLE: tuple[str, ...] = ("TC001", "TC002", "TC003")
+
+
+class RuffWorkerError(RuntimeError):
+    """Raised when the Ruff server rejects a request or cannot be kept alive."""
+
+
+class _RuffServerExitedError(RuffWorkerError):
+    """Raised when the Ruff server process closes its pipes unexpectedly."""
+
+
+@dataclass(frozen=True, slots=True)
+class RuffWorkerKey:
+    """Settings that must match for two formatters to share one Ruff worker."""
+
+    ruff_path: str
+    settings_path: str
+    use_type_checking_imports: bool
+    config_fingerprint: tuple[tuple[str, int, int], ...]
+
+
+def ruff_config_fingerprint(settings_path: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return stat fingerprints of Ruff configuration files visible from a directory."""
+    fingerprint: list[tuple[str, int, int]] = []
+    for directory in (settings_path, *settings_path.parents):
+        for name in _RUFF_CONFIG_FILE_NAMES:
+            candidate = directory / name
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            fingerprint.append((str(candidate), stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def _character_offset(line: str, character: int, position_encoding: str) -> int:
+    """Convert an LSP character offset into a Python string index."""
+    if position_encoding == "utf-32":
+        return min(character, len(line))
+    codec, width = ("utf-8", 1) if position_encoding == "utf-8" else ("utf-16-le", 2)
+    encoded = line.encode(codec, errors="surrogatepass")
+    return len(encoded[: character * width].decode(codec, errors="ignore"))
+
+
+def apply_text_edits(text: str, edits: list[dict[str, Any]], position_encoding: str) -> str:
+    """Apply LSP ``TextEdit`` objects to a text buffer."""
+    if not edits:
+        return text
+    lines = text.splitlines(keepends=True)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    def offset(position: dict[str, int]) -> int:
+        line_number = position["line"]
+        if line_number >= len(lines):
+            return len(text)
+        return line_starts[line_number] + _character_offset(
+            lines[line_number], position["character"], position_encoding
+        )
+
+    resolved = sorted(
+        ((offset(edit["range"]["start"]), offset(edit["range"]["end"]), edit["newText"]) for edit in edits),
+        key=itemgetter(0, 1),
+        reverse=True,
+    )
+    for start, end, new_text in resolved:
+        text = f"{text[:start]}{new_text}{text[end:]}"
+    return text
+
+
+class RuffWorker:
+    """One ``ruff server`` process that formats and fixes many code buffers."""
+
+    def __init__(self, key: RuffWorkerKey) -> None:
+        """Create a worker; the server process starts on the first request."""
+        self.key = key
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._document_version = 0
+        self._position_encoding = "utf-16"
+        self._document_uri = (Path(key.settings_path) / _DOCUMENT_NAME).as_uri()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker currently owns a live server process."""
+        return self._process is not None and self._process.poll() is None
+
+    def fix(self, code: str) -> str:
+        """Apply all Ruff fixes, including unsafe ones, to a code buffer."""
+        return self._run(code, fix=True, format_=False)
+
+    def format(self, code: str) -> str:
+        """Format a code buffer with Ruff."""
+        return self._run(code, fix=False, format_=True)
+
+    def fix_and_format(self, code: str) -> str:
+        """Apply all Ruff fixes and then format a code buffer."""
+        return self._run(code, fix=True, format_=True)
+
+    def close(self) -> None:
+        """Shut the server process down, killing it if it does not exit promptly."""
+        with self._lock:
+            self._stop()
+
+    def _run(self, code: str, *, fix: bool, format_: bool) -> str:
+        with self._lock:
+            try:
+                return self._process_document(code, fix=fix, format_=format_)
+            except (_RuffServerExitedError, OSError):
+                self._stop()
+            try:
+                return self._process_document(code, fix=fix, format_=format_)
+            except (_RuffServerExitedError, OSError) as exc:
+                self._stop()
+                msg = f"Ruff server worker failed after a restart: {exc}"
+                raise RuffWorkerError(msg) from exc
+
+    def _process_document(self, code: str, *, fix: bool, format_: bool) -> str:
+        self._ensure_started()
+        self._document_version += 1
+        self._notify(
+            "textDocument/didOpen",
+            {
+                "textDocument": {
+                    "uri": self._document_uri,
+                    "languageId": "python",
+                    "version": self._document_version,
+                    "text": code,
+                }
+            },
+        )
+        try:
+            if fix:
+                code = self._apply_fix_all(code)
+            if format_:
+                edits = self._request(
+                    "textDocument/formatting",
+                    {
+                        "textDocument": {"uri": self._document_uri},
+                        "options": {"tabSize": 4, "insertSpaces": True},
+                    },
+                )
+                if edits is None:
+                    self._raise_for_syntax_errors()
+                code = apply_text_edits(code, edits or [], self._position_encoding)
+        finally:
+            if self.is_running:
+                self._notify("textDocument/didClose", {"textDocument": {"uri": self._document_uri}})
+        return code
+
+    def _raise_for_syntax_errors(self) -> None:
+        """Fail like ``ruff format -`` does, since the server skips unparsable documents silently."""
+        report = self._request("textDocument/diagnostic", {"textDocument": {"uri": self._document_uri}})
+        messages = [
+            f"{item['range']['start']['line'] + 1}:{item['range']['start']['character'] + 1}: {item['message']}"
+            for item in (report or {}).get("items", [])
+            if item.get("code") == _INVALID_SYNTAX_CODE
+        ]
+        if messages:
+            msg = "Ruff server failed to parse the code:\n" + "\n".join(messages)
+            raise RuffWorkerError(msg)
+
+    def _apply_fix_all(self, code: str) -> str:
+        line_count = code.count("\n") + 1
+        actions = self._request(
+            "textDocument/codeAction",
+            {
+                "textDocument": {"uri": self._document_uri},
+                "range": {"start": {"line": 0, "character": 0}, "end": {"line": line_count, "character": 0}},
+                "context": {"diagnostics": [], "only": [_FIX_ALL_KIND]},
+            },
+        )
+        for action in actions or []:
+            if action.get("kind") != _FIX_ALL_KIND:
+                continue
+            if "edit" not in action and "data" in action:
+                action = self._request("codeAction/resolve", action)  # noqa: PLW2901
+            edits = (action.get("edit") or {}).get("changes", {}).get(self._document_uri, [])
+            if not edits:
+                continue
+            code = apply_text_edits(code, edits, self._position_encoding)
+            self._document_version += 1
+            self._notify(
+                "textDocument/didChange",
+                {
+                    "textDocument": {"uri": self._document_uri, "version": self._document_version},
+                    "contentChanges": [{"text": code}],
+                },
+            )
+        return code
+
+    def _initialization_options(self) -> dict[str, Any]:
+        configuration: dict[str, Any] = {"unsafe-fixes": True}
+        if not self.key.use_type_checking_imports:
+            configuration["lint"] = {"unfixable": list(_TYPE_CHECKING_UNFIXABLE)}
+        return {
+            "settings": {
+                "fixAll": True,
+                "organizeImports": False,
+                "showSyntaxErrors": True,
+                "configuration": configuration,
+            }
+        }
+
+    def _ensure_started(self) -> None:
+        if self.is_running:
+            return
+        self._stop()
+        self._process = subprocess.Popen(  # noqa: S603
+            (self.key.ruff_path, "server"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.key.settings_path,
+        )
+        root_uri = Path(self.key.settings_path).as_uri()
+        result = self._request(
+            "initialize",
+            {
+                "processId": None,
+                "rootUri": root_uri,
+                "workspaceFolders": [{"uri": root_uri, "name": Path(self.key.settings_path).name or root_uri}],
+                "capabilities": {"general": {"positionEncodings": ["utf-32", "utf-16"]}},
+                "initializationOptions": self._initialization_options(),
+            },
+        )
+        self._position_encoding = (result or {}).get("capabilities", {}).get("positionEncoding", "utf-16")
+        self._notify("initialized", {})
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                self._write(process, {"jsonrpc": "2.0", "id": self._new_id(), "method": "shutdown"})
+                self._write(process, {"jsonrpc": "2.0", "method": "exit"})
+                process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                stream.close()
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _notify(self, method: str, params: dict[str, Any]) -> None:
+        self._write(self._require_process(), {"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _request(self, method: str, params: dict[str, Any]) -> Any:
+        process = self._require_process()
+        request_id = self._new_id()
+        self._write(process, {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        while True:
+            message = self._read(process)
+            if "method" in message:
+                if "id" in message:
+                    self._write(process, {"jsonrpc": "2.0", "id": message["id"], "result": None})
+                continue
+            if message.get("id") != request_id:
+                continue
+            if (error := message.get("error")) is not None:
+                msg = f"Ruff server {method} request failed: {error.get('message', error)}"
+                raise RuffWorkerError(msg)
+            return message.get("result")
+
+    def _require_process(self) -> subprocess.Popen[bytes]:
+        if self._process is None:
+            msg = "Ruff server is not running"
+            raise _RuffServerExitedError(msg)
+        return self._process
+
+    @staticmethod
+    def _write(process: subprocess.Popen[bytes], message: dict[str, Any]) -> None:
+        stdin: IO[bytes] | None = process.stdin
+        if stdin is None:  # pragma: no cover
+            msg = "Ruff server stdin is closed"
+            raise _RuffServerExitedError(msg)
+        body = json.dumps(message).encode("utf-8")
+        stdin.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        stdin.flush()
+
+    @staticmethod
+    def _read(process: subprocess.Popen[bytes]) -> dict[str, Any]:
+        stdout: IO[bytes] | None = process.stdout
+        if stdout is None:  # pragma: no cover
+            msg = "Ruff server stdout is closed"
+            raise _RuffServerExitedError(msg)
+        content_length: int | None = None
+        while True:
+            line = stdout.readline()
+            if not line:
+                msg = f"Ruff server exited with code {process.poll()}"
+                raise _RuffServerExitedError(msg)
+            if line in {b"\r\n", b"\n"}:
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.strip().lower() == "content-length":
+                content_length = int(value.strip())
+        if content_length is None:
+            msg = "Ruff server sent a message without Content-Length"
+            raise _RuffServerExitedError(msg)
+        body = stdout.read(content_length)
+        if len(body) != content_length:
+            msg = f"Ruff server exited with code {process.poll()}"
+            raise _RuffServerExitedError(msg)
+        return json.loads(body)
+
+
+_WORKERS: dict[RuffWorkerKey, RuffWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+_SESSION_DEPTH = 0
+
+
+def ruff_worker_session_active() -> bool:
+    """Whether a Ruff worker session is currently open."""
+    return _SESSION_DEPTH > 0
+
+
+def enter_ruff_worker_session() -> None:
+    """Open a (possibly nested) Ruff worker session."""
+    global _SESSION_DEPTH  # noqa: PLW0603
+    with _WORKERS_LOCK:
+        _SESSION_DEPTH += 1
+
+
+def exit_ruff_worker_session() -> None:
+    """Close a Ruff worker session, stopping pooled workers when the outermost one ends."""
+    global _SESSION_DEPTH  # noqa: PLW0603
+    with _WORKERS_LOCK:
+        _SESSION_DEPTH = max(0, _SESSION_DEPTH - 1)
+        if _SESSION_DEPTH:
+            return
+    shutdown_ruff_workers()
+
+
+def get_ruff_worker(key: RuffWorkerKey) -> RuffWorker:
+    """Return the pooled worker for ``key``, retiring workers made stale by config edits."""
+    with _WORKERS_LOCK:
+        if (worker := _WORKERS.get(key)) is not None:
+            return worker
+        stale = [
+            existing_key
+            for existing_key in _WORKERS
+            if existing_key.ruff_path == key.ruff_path
+            and existing_key.settings_path == key.settings_path
+            and existing_key.use_type_checking_imports == key.use_type_checking_imports
+        ]
+        stale_workers = [_WORKERS.pop(existing_key) for existing_key in stale]
+        worker = _WORKERS[key] = RuffWorker(key)
+    for stale_worker in stale_workers:
+        stale_worker.close()
+    return worker
+
+
+def shutdown_ruff_workers() -> None:
+    """Stop every pooled Ruff worker."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_ruff_workers)
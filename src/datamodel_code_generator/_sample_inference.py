@@ -0,0 +1,262 @@
+"""Infer JSON Schema from CSV, JSON and JSON-lines samples without loading them whole.
+
+Records are read incrementally and fed to a genson ``SchemaBuilder`` one at a
+time, so memory grows with the inferred schema rather than with the sample. A
+top-level JSON array is streamed element by element, and whitespace-separated
+JSON values (JSON lines or concatenated documents) are treated as records of a
+single type. With a sample size, a fixed-seed reservoir keeps that many records
+in input order. Large files are split into record batches that are inferred in
+forked worker processes and merged back in order with ``add_schema``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Executor, Future
+
+STREAM_CHUNK_SIZE = 1 << 16
+"""Characters read from the input per refill of the JSON stream buffer."""
+
+INFERENCE_BATCH_RECORDS = 2_000
+"""Records inferred per worker task when a process pool is used."""
+
+INFERENCE_PROCESS_POOL_MIN_BYTES = 32 << 20
+"""Smallest sample file that is worth inferring in forked worker processes."""
+
+_SAMPLE_SEED = 0
+_MAX_PENDING_BATCHES = 16
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+_Record = TypeVar("_Record")
+
+
+class _JsonStreamReader:
+    """Decode consecutive JSON values from a text stream through a bounded buffer."""
+
+    def __init__(self, file: IO[str]) -> None:
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._chunk_size = STREAM_CHUNK_SIZE
+        self._decode = json.JSONDecoder().raw_decode
+
+    def _read_more(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character, or ``None`` at the end of input."""
+        while (match := _NON_WHITESPACE.search(self._buffer, self._pos)) is None:
+            self._pos = len(self._buffer)
+            if not self._read_more():
+                return None
+        self._pos = match.start()
+        return self._buffer[self._pos]
+
+    def skip(self) -> None:
+        """Consume the character returned by ``peek``."""
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value after any whitespace, reading ahead until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Values larger than the buffer are retried with geometrically growing
+                # reads, so decoding them stays linear in their size.
+                self._chunk_size *= 2
+                if not self._read_more():
+                    raise
+                continue
+            # A number or literal ending exactly at the buffer end may continue in the next chunk.
+            if end < len(self._buffer) or not self._read_more():
+                self._pos = end
+                self._chunk_size = STREAM_CHUNK_SIZE
+                return value
+
+
+def _iter_json_array_items(reader: _JsonStreamReader) -> Iterator[Any]:
+    reader.skip()
+    if reader.peek() == "]":
+        reader.skip()
+    else:
+        while True:
+            yield reader.value()
+            match reader.peek():
+                case ",":
+                    reader.skip()
+                case "]":
+                    reader.skip()
+                    break
+                case None:
+                    msg = "Unterminated top-level JSON array"
+                    raise ValueError(msg)
+                case _:
+                    msg = "Expecting ',' delimiter in top-level JSON array"
+                    raise ValueError(msg)
+    if reader.peek() is not None:
+        msg = "Extra data after top-level JSON array"
+        raise ValueError(msg)
+
+
+def _iter_json_values(reader: _JsonStreamReader) -> Iterator[Any]:
+    yield reader.value()
+    while reader.peek() is not None:
+        yield reader.value()
+
+
+def iter_json_records(file: IO[str]) -> tuple[Iterator[Any], bool]:
+    """Return the records of a JSON sample and whether they are the items of a top-level array."""
+    reader = _JsonStreamReader(file)
+    if reader.peek() == "[":
+        return _iter_json_array_items(reader), True
+    return _iter_json_values(reader), False
+
+
+def iter_csv_records(file: IO[str]) -> Iterator[dict[str, Any]]:
+    """Yield CSV rows keyed by the header columns, dropping cells beyond the header."""
+    import csv  # noqa: PLC0415
+
+    reader = csv.DictReader(file)
+    if reader.fieldnames is None:
+        msg = "CSV file has no header row"
+        raise ValueError(msg)
+    has_rows = False
+    for row in reader:
+        has_rows = True
+        yield {key: value for key, value in row.items() if key is not None}
+    if not has_rows:
+        msg = "CSV file has no data rows"
+        raise ValueError(msg)
+
+
+def is_json_lines_text(text: str) -> bool:
+    """Return whether ``text`` starts with two JSON objects or arrays on consecutive lines."""
+    lines = (line for raw_line in text.splitlines() if (line := raw_line.strip()))
+    first_lines = list(islice(lines, 2))
+    if len(first_lines) < 2:  # noqa: PLR2004
+        return False
+    for line in first_lines:
+        if line[0] not in "[{":
+            return False
+        try:
+            json.loads(line)
+        except ValueError:
+            return False
+    return True
+
+
+def reservoir_sample(records: Iterable[_Record], size: int) -> list[_Record]:
+    """Return a uniform sample of ``size`` records in input order from a single pass."""
+    rng = random.Random(_SAMPLE_SEED)  # noqa: S311
+    reservoir: list[tuple[int, _Record]] = []
+    for index, record in enumerate(records):
+        if index < size:
+            reservoir.append((index, record))
+        elif (slot := rng.randrange(index + 1)) < size:
+            reservoir[slot] = (index, record)
+    reservoir.sort(key=itemgetter(0))
+    return [record for _, record in reservoir]
+
+
+def _build_schema(records: Iterable[Any]) -> dict[str, Any]:
+    from genson import SchemaBuilder  # noqa: PLC0415
+
+    builder = SchemaBuilder()
+    for record in records:
+        builder.add_object(record)
+    return builder.to_schema()
+
+
+def _build_schema_in_batches(records: Iterable[Any], executor: Executor) -> dict[str, Any]:
+    from concurrent.futures.process import BrokenProcessPool  # noqa: PLC0415
+
+    from genson import SchemaBuilder  # noqa: PLC0415
+
+    builder = SchemaBuilder()
+    pending: deque[tuple[list[Any], Future[dict[str, Any]] | None]] = deque()
+    pool: Executor | None = executor
+
+    def merge_oldest() -> None:
+        nonlocal pool
+        batch, future = pending.popleft()
+        try:
+            schema = _build_schema(batch) if future is None else future.result()
+        except BrokenProcessPool:  # pragma: no cover
+            pool = None
+            schema = _build_schema(batch)
+        builder.add_schema(schema)
+
+    iterator = iter(records)
+    while batch := list(islice(iterator, INFERENCE_BATCH_RECORDS)):
+        pending.append((batch, None if pool is None else pool.submit(_build_schema, batch)))
+        if len(pending) >= _MAX_PENDING_BATCHES:
+            merge_oldest()
+    while pending:
+        merge_oldest()
+    return builder.to_schema()
+
+
+def infer_records_schema(
+    records: Iterable[Any],
+    *,
+    is_array: bool,
+    sample_size: int | None = None,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
+    """Infer the schema genson would build for ``records`` added one by one.
+
+    With ``is_array`` the records are the items of a top-level array and the result
+    matches ``SchemaBuilder.add_object`` on the whole list.
+    """
+    if sample_size is not None:
+        records = reservoir_sample(records, sample_size)
+    schema = _build_schema(records) if executor is None else _build_schema_in_batches(records, executor)
+    if not is_array:
+        return schema
+    array_schema: dict[str, Any] = {"$schema": schema.pop("$schema"), "type": "array"}
+    if schema:
+        array_schema["items"] = schema
+    return array_schema
+
+
+def start_inference_pool(size: int, sample_size: int | None) -> Executor | None:
+    """Start worker processes for a ``size``-character sample when batching pays off."""
+    if sample_size is not None and sample_size <= INFERENCE_BATCH_RECORDS:
+        return None
+    from datamodel_code_generator.parser._read_ahead import start_fork_process_pool  # noqa: PLC0415
+
+    # The inference cost grows with the sample size, so the pool is gated on it directly.
+    return start_fork_process_pool(size, INFERENCE_PROCESS_POOL_MIN_BYTES)
+
+
+__all__ = [
+    "INFERENCE_BATCH_RECORDS",
+    "INFERENCE_PROCESS_POOL_MIN_BYTES",
+    "STREAM_CHUNK_SIZE",
+    "infer_records_schema",
+    "is_json_lines_text",
+    "iter_csv_records",
+    "iter_json_records",
+    "reservoir_sample",
+    "start_inference_pool",
+]
@@ -99,6 +99,7 @@ class BaseGenerateConfig(TypedDict):
     reuse_scope: NotRequired[ReuseScope]
     shared_module_name: NotRequired[str]
     encoding: NotRequired[str]
+    sample_size: NotRequired[int | None]
     enum_field_as_literal: NotRequired[LiteralType | None]
     enum_field_as_literal_map: NotRequired[dict[str, str] | None]
     ignore_enum_constraints: NotRequired[bool]
@@ -119,6 +120,10 @@ class BaseGenerateConfig(TypedDict):
     model_extra_keys_without_x_prefix: NotRequired[set[str] | None]
     include_path_parameters: NotRequired[bool]
     openapi_include_paths: NotRequired[list[str] | None]
+    openapi_include_tags: NotRequired[list[str] | None]
+    openapi_exclude_tags: NotRequired[list[str] | None]
+    openapi_include_operation_ids: NotRequired[list[str] | None]
+    openapi_exclude_operation_ids: NotRequired[list[str] | None]
     openapi_include_info_version: NotRequired[bool]
     graphql_no_typename: NotRequired[bool]
     wrap_string_literal: NotRequired[bool | None]
@@ -143,6 +148,9 @@ class BaseGenerateConfig(TypedDict):
     lockfile: NotRequired[Path | None]
     update_lock: NotRequired[bool]
     locked: NotRequired[bool]
+    ref_bundle: NotRequired[Path | None]
+    update_ref_bundle: NotRequired[bool]
+    cache_dir: NotRequired[Path | None]
     use_annotated: NotRequired[bool]
     use_serialize_as_any: NotRequired[bool]
     use_non_positive_negative_number_constrained_types: NotRequired[bool]
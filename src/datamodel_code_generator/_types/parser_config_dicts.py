@@ -135,6 +135,7 @@ class ParserConfigDict(TypedDict):
     http_local_ref_path: NotRequired[Path | None]
     http_ignore_tls: NotRequired[bool]
     http_timeout: NotRequired[float | None]
+    cache_dir: NotRequired[Path | None]
     use_annotated: NotRequired[bool]
     use_serialize_as_any: NotRequired[bool]
     use_non_positive_negative_number_constrained_types: NotRequired[bool]
@@ -212,6 +213,10 @@ class OpenAPIParserConfigDict(JSONSchemaParserConfigDict, closed=True):
     include_path_parameters: NotRequired[bool]
     use_status_code_in_response_name: NotRequired[bool]
     openapi_include_paths: NotRequired[list[str] | None]
+    openapi_include_tags: NotRequired[list[str] | None]
+    openapi_exclude_tags: NotRequired[list[str] | None]
+    openapi_include_operation_ids: NotRequired[list[str] | None]
+    openapi_exclude_operation_ids: NotRequired[list[str] | None]
     openapi_include_info_version: NotRequired[bool]
     openapi_version: NotRequired[OpenAPIVersion | None]
 
@@ -221,6 +226,10 @@ class AsyncAPIParserConfigDict(JSONSchemaParserConfigDict, closed=True):
     include_path_parameters: NotRequired[bool]
     use_status_code_in_response_name: NotRequired[bool]
     openapi_include_paths: NotRequired[list[str] | None]
+    openapi_include_tags: NotRequired[list[str] | None]
+    openapi_exclude_tags: NotRequired[list[str] | None]
+    openapi_include_operation_ids: NotRequired[list[str] | None]
+    openapi_exclude_operation_ids: NotRequired[list[str] | None]
     openapi_include_info_version: NotRequired[bool]
     openapi_version: NotRequired[OpenAPIVersion | None]
     asyncapi_version: NotRequired[AsyncAPIVersion | None]
@@ -0,0 +1 @@
+__version__ = '0.1.dev32+g8976d4883'
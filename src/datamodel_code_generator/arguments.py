@@ -8,11 +8,12 @@ template customization, OpenAPI-specific options, and general options.
 from __future__ import annotations
 
 import json
-from argparse import ArgumentParser, ArgumentTypeError, BooleanOptionalAction, Namespace, RawDescriptionHelpFormatter
+from argparse import ArgumentParser, ArgumentTypeError, BooleanOptionalAction, RawDescriptionHelpFormatter
 from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
+from datamodel_code_generator._cli_fast_parser import namespace
 from datamodel_code_generator._format_types import DateClassType, DatetimeClassType, Formatter, PythonVersion
 from datamodel_code_generator.deprecations import deprecation_message
 from datamodel_code_generator.enums import (
@@ -46,13 +47,11 @@ from datamodel_code_generator.parser import LiteralType
 from datamodel_code_generator.preset_names import PRESET_NAMES
 
 if TYPE_CHECKING:
-    from argparse import Action
+    from argparse import Action, Namespace
     from collections.abc import Iterable, Sequence
 
 DEFAULT_ENCODING = "utf-8"
 
-namespace = Namespace(no_color=False)
-
 
 def _dataclass_arguments(value: str) -> DataclassArguments:
     """Parse JSON string and validate it as DataclassArguments."""
@@ -269,6 +268,20 @@ remote_lock_options.add_argument(
     default=None,
     help="Require an existing remote lock and validate each fetched resource against it (experimental).",
 )
+base_options.add_argument(
+    "--ref-bundle",
+    help=(
+        "Serve every HTTP(S) schema fetch from this offline reference bundle, a zip archive of fetched documents, "
+        "without network access or DNS resolution. A resource missing from the bundle is an error. "
+        "Relative paths resolve from the invocation working directory."
+    ),
+)
+base_options.add_argument(
+    "--update-ref-bundle",
+    action="store_true",
+    default=None,
+    help="Fetch remote references over the network and write every fetched document to --ref-bundle after generation.",
+)
 base_options.add_argument(
     "--input",
     help="Input file/directory (default: stdin)",
@@ -283,6 +296,13 @@ base_options.add_argument(
     ),
     choices=[i.value for i in InputFileType],
 )
+base_options.add_argument(
+    "--sample-size",
+    type=int,
+    default=None,
+    help="Infer raw sample data (json, yaml, csv) from a reproducible random sample of this many records "
+    "(CSV rows, JSON-lines records or top-level array items) instead of all of them.",
+)
 base_options.add_argument(
     "--external-ref-mapping",
     nargs="+",
@@ -1273,6 +1293,50 @@ openapi_options.add_argument(
     ),
     default=None,
 )
+openapi_options.add_argument(
+    "--openapi-include-tags",
+    nargs="+",
+    metavar="PATTERN",
+    help=(
+        "Include only OpenAPI operations with a tag matching fnmatch patterns. "
+        "Example: 'pets' 'admin-*'. "
+        "Component schemas are limited to those referenced by the selected operations."
+    ),
+    default=None,
+)
+openapi_options.add_argument(
+    "--openapi-exclude-tags",
+    nargs="+",
+    metavar="PATTERN",
+    help=(
+        "Exclude OpenAPI operations with a tag matching fnmatch patterns. "
+        "Example: 'pets' 'admin-*'. "
+        "Component schemas are limited to those referenced by the selected operations."
+    ),
+    default=None,
+)
+openapi_options.add_argument(
+    "--openapi-include-operation-ids",
+    nargs="+",
+    metavar="PATTERN",
+    help=(
+        "Include only OpenAPI operations whose operationId matches fnmatch patterns. "
+        "Example: 'listPets' 'get*'. "
+        "Component schemas are limited to those referenced by the selected operations."
+    ),
+    default=None,
+)
+openapi_options.add_argument(
+    "--openapi-exclude-operation-ids",
+    nargs="+",
+    metavar="PATTERN",
+    help=(
+        "Exclude OpenAPI operations whose operationId matches fnmatch patterns. "
+        "Example: 'listPets' 'get*'. "
+        "Component schemas are limited to those referenced by the selected operations."
+    ),
+    default=None,
+)
 openapi_options.add_argument(
     "--openapi-include-info-version",
     help="Emit OpenAPI info.version as OPENAPI_INFO_VERSION in generated models",
@@ -1337,6 +1401,13 @@ graphql_options.add_argument(
 # ======================================================================================
 # General options
 # ======================================================================================
+general_options.add_argument(
+    "--cache-dir",
+    type=Path,
+    default=None,
+    help="Directory for persistent caches of expensive schema compilation (e.g. Protocol Buffers descriptors). "
+    "Entries are keyed by input contents, so the directory can be shared between runs and projects.",
+)
 general_options.add_argument(
     "--check",
     action="store_true",
@@ -1345,6 +1416,13 @@ general_options.add_argument(
     "Exits with code 1 if differences found, 0 if up-to-date. "
     "Useful for CI to ensure generated code is committed.",
 )
+general_options.add_argument(
+    "--bundle-schema",
+    action="store_true",
+    default=None,
+    help="Write --input with every local file $ref internalized into one self-contained JSON document to --output "
+    "or stdout, then exit (experimental).",
+)
 general_options.add_argument(
     "--diff-against",
     metavar="BASELINE_INPUT",
@@ -131,6 +131,7 @@ class BaseGenerateConfig(BaseModel):
     reuse_scope: ReuseScope = ReuseScope.Module
     shared_module_name: str = DEFAULT_SHARED_MODULE_NAME
     encoding: str = "utf-8"
+    sample_size: int | None = None
     enum_field_as_literal: LiteralType | None = None
     enum_field_as_literal_map: dict[str, str] | None = None
     ignore_enum_constraints: bool = False
@@ -151,6 +152,10 @@ class BaseGenerateConfig(BaseModel):
     model_extra_keys_without_x_prefix: set[str] | None = None
     include_path_parameters: bool = False
     openapi_include_paths: list[str] | None = None
+    openapi_include_tags: list[str] | None = None
+    openapi_exclude_tags: list[str] | None = None
+    openapi_include_operation_ids: list[str] | None = None
+    openapi_exclude_operation_ids: list[str] | None = None
     openapi_include_info_version: bool = False
     graphql_no_typename: bool = False
     wrap_string_literal: bool | None = None
@@ -175,8 +180,12 @@ class BaseGenerateConfig(BaseModel):
     lockfile: Path | None = None
     update_lock: bool = False
     locked: bool = False
+    ref_bundle: Path | None = None
+    update_ref_bundle: bool = False
+    cache_dir: Path | None = None
     _remote_lock: Any | None = PrivateAttr(default=None)
     _remote_lock_resolved: bool = PrivateAttr(default=False)
+    _remote_ref_bundle: Any | None = PrivateAttr(default=None)
 
     @property
     def remote_lock(self) -> Any | None:
@@ -193,6 +202,15 @@ class BaseGenerateConfig(BaseModel):
         self._remote_lock = remote_lock
         self._remote_lock_resolved = True
 
+    @property
+    def remote_ref_bundle(self) -> Any | None:
+        """Return the generation-scoped remote reference bundle, if opened."""
+        return self._remote_ref_bundle
+
+    def resolve_remote_ref_bundle(self, remote_ref_bundle: Any | None) -> None:
+        """Record the remote reference bundle opened for one generation on this config instance."""
+        self._remote_ref_bundle = remote_ref_bundle
+
     use_annotated: bool = False
     use_serialize_as_any: bool = False
     use_non_positive_negative_number_constrained_types: bool = False
@@ -259,6 +277,15 @@ class BaseGenerateConfig(BaseModel):
         """Require additional imports to be safe Python import paths."""
         return _validate_additional_import_paths(value)
 
+    @field_validator("sample_size")
+    @classmethod
+    def validate_sample_size(cls, value: int | None) -> int | None:
+        """Require a positive raw-data sample size."""
+        if value is not None and value < 1:
+            msg = "--sample-size must be a positive integer"
+            raise ValueError(msg)
+        return value
+
     @model_validator(mode="after")
     def normalize_schema_validator_type(self) -> Self:
         """Keep the legacy boolean flag and explicit backend selection in sync."""
@@ -276,6 +303,14 @@ class BaseGenerateConfig(BaseModel):
             raise ValueError(msg)
         return self
 
+    @model_validator(mode="after")
+    def validate_ref_bundle_mode(self) -> Self:
+        """Require a bundle path when the bundle is updated."""
+        if self.update_ref_bundle and self.ref_bundle is None:
+            msg = "--update-ref-bundle requires --ref-bundle"
+            raise ValueError(msg)
+        return self
+
     @model_validator(mode="after")
     def normalize_use_type_alias_type(self) -> Self:
         """Enable type aliases when their implementation is explicitly selected."""
@@ -171,6 +171,7 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
     "--input-model": CLIOptionMeta(name="--input-model", category=OptionCategory.BASE),
     "--input-model-ref-strategy": CLIOptionMeta(name="--input-model-ref-strategy", category=OptionCategory.BASE),
     "--input-file-type": CLIOptionMeta(name="--input-file-type", category=OptionCategory.BASE),
+    "--sample-size": CLIOptionMeta(name="--sample-size", category=OptionCategory.BASE),
     "--encoding": CLIOptionMeta(name="--encoding", category=OptionCategory.BASE),
     "--schema-version": CLIOptionMeta(name="--schema-version", category=OptionCategory.BASE),
     "--schema-version-mode": CLIOptionMeta(name="--schema-version-mode", category=OptionCategory.BASE),
@@ -863,6 +864,30 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
         topic=OptionTopic.OPENAPI,
         group=OptionGroup.OPENAPI_PATHS,
     ),
+    "--openapi-include-tags": CLIOptionMeta(
+        name="--openapi-include-tags",
+        category=OptionCategory.OPENAPI,
+        topic=OptionTopic.OPENAPI,
+        group=OptionGroup.OPENAPI_PATHS,
+    ),
+    "--openapi-exclude-tags": CLIOptionMeta(
+        name="--openapi-exclude-tags",
+        category=OptionCategory.OPENAPI,
+        topic=OptionTopic.OPENAPI,
+        group=OptionGroup.OPENAPI_PATHS,
+    ),
+    "--openapi-include-operation-ids": CLIOptionMeta(
+        name="--openapi-include-operation-ids",
+        category=OptionCategory.OPENAPI,
+        topic=OptionTopic.OPENAPI,
+        group=OptionGroup.OPENAPI_PATHS,
+    ),
+    "--openapi-exclude-operation-ids": CLIOptionMeta(
+        name="--openapi-exclude-operation-ids",
+        category=OptionCategory.OPENAPI,
+        topic=OptionTopic.OPENAPI,
+        group=OptionGroup.OPENAPI_PATHS,
+    ),
     "--openapi-include-info-version": CLIOptionMeta(
         name="--openapi-include-info-version", category=OptionCategory.OPENAPI
     ),
@@ -879,6 +904,24 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
     # ==========================================================================
     # General Options
     # ==========================================================================
+    "--cache-dir": CLIOptionMeta(name="--cache-dir", category=OptionCategory.GENERAL),
+    "--bundle-schema": CLIOptionMeta(
+        name="--bundle-schema",
+        category=OptionCategory.GENERAL,
+        requires=(
+            CLIOptionRelation(
+                option="--input",
+                message="`--bundle-schema` requires --input with the root schema path.",
+            ),
+        ),
+        conflicts=(
+            CLIOptionRelation(option="--check"),
+            CLIOptionRelation(option="--diff-against"),
+            CLIOptionRelation(option="--watch"),
+            CLIOptionRelation(option="--url"),
+            CLIOptionRelation(option="--input-model"),
+        ),
+    ),
     "--check": CLIOptionMeta(name="--check", category=OptionCategory.GENERAL),
     "--diff-against": CLIOptionMeta(
         name="--diff-against",
@@ -934,6 +977,12 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
         category=OptionCategory.GENERAL,
         conflicts=(CLIOptionRelation(option="--update-lock"),),
     ),
+    "--ref-bundle": CLIOptionMeta(name="--ref-bundle", category=OptionCategory.GENERAL),
+    "--update-ref-bundle": CLIOptionMeta(
+        name="--update-ref-bundle",
+        category=OptionCategory.GENERAL,
+        requires=(CLIOptionRelation(option="--ref-bundle"),),
+    ),
     "--ignore-pyproject": CLIOptionMeta(name="--ignore-pyproject", category=OptionCategory.GENERAL),
     "--generate-cli-command": CLIOptionMeta(name="--generate-cli-command", category=OptionCategory.GENERAL),
     "--generate-pyproject-config": CLIOptionMeta(name="--generate-pyproject-config", category=OptionCategory.GENERAL),
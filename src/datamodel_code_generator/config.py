@@ -211,6 +211,7 @@ class ParserConfig(BaseModel):
     http_local_ref_path: Path | None = None
     http_ignore_tls: bool = False
     http_timeout: float | None = None
+    cache_dir: Path | None = None
     use_annotated: bool = False
     use_serialize_as_any: bool = False
     use_non_positive_negative_number_constrained_types: bool = False
@@ -304,6 +305,10 @@ class OpenAPIParserConfig(JSONSchemaParserConfig):
     include_path_parameters: bool = False
     use_status_code_in_response_name: bool = False
     openapi_include_paths: list[str] | None = None
+    openapi_include_tags: list[str] | None = None
+    openapi_exclude_tags: list[str] | None = None
+    openapi_include_operation_ids: list[str] | None = None
+    openapi_exclude_operation_ids: list[str] | None = None
     openapi_include_info_version: bool = False
     openapi_version: OpenAPIVersion | None = None
 
@@ -315,6 +320,10 @@ class AsyncAPIParserConfig(JSONSchemaParserConfig):
     include_path_parameters: bool = False
     use_status_code_in_response_name: bool = False
     openapi_include_paths: list[str] | None = None
+    openapi_include_tags: list[str] | None = None
+    openapi_exclude_tags: list[str] | None = None
+    openapi_include_operation_ids: list[str] | None = None
+    openapi_exclude_operation_ids: list[str] | None = None
     openapi_include_info_version: bool = False
     openapi_version: OpenAPIVersion | None = None
     asyncapi_version: AsyncAPIVersion | None = None
@@ -8,36 +8,58 @@ from __future__ import annotations
 
 import ast
 import builtins
+import contextlib
 import hashlib
 import itertools
 import json
+import marshal
+import re
 import sys
+import tempfile
 import threading
 import types
+import typing
+from collections import OrderedDict, defaultdict
 from enum import Enum
-from pathlib import PurePath
-from typing import TYPE_CHECKING, Any
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, TypeGuard, cast
 
 import pydantic
 from pydantic import BaseModel
 
 from datamodel_code_generator import Error, generate, is_asyncapi, is_openapi
 from datamodel_code_generator.config import GenerateConfig, _rebuild_generate_config
-from datamodel_code_generator.enums import DataModelType, InputFileType
+from datamodel_code_generator.enums import DataModelType, InputFileType, ReuseScope
+from datamodel_code_generator.model.base import ALL_MODEL
 from datamodel_code_generator.parser._graph import stable_toposort
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
-_dynamic_models_cache: dict[str, dict[str, type]] = {}
+    from datamodel_code_generator._disk_cache import DiskCache
+
+_ModulePath = tuple[str, ...]
+
+_dynamic_models_cache: OrderedDict[str, dict[str, type]] = OrderedDict()
+_dynamic_models_cache_sizes: dict[str, int] = {}
 _dynamic_models_lock = threading.Lock()
 _dynamic_module_counter = itertools.count(1)
 _MISSING_MODULE = object()
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+_DYNAMIC_MODELS_CACHE_NAMESPACE = "dynamic-models"
 
 
-def _evict_dynamic_models_cache_entries(count: int) -> None:
-    for _ in range(count):
-        del _dynamic_models_cache[next(iter(_dynamic_models_cache))]
+def _evict_dynamic_models_cache_entries(
+    cache_size: int, max_bytes: int | None, incoming_bytes: int | None = None
+) -> None:
+    """Drop least recently used entries until the cache, plus an incoming entry, fits its limits."""
+    incoming_count = 0 if incoming_bytes is None else 1
+    total_bytes = 0 if max_bytes is None else sum(_dynamic_models_cache_sizes.values()) + (incoming_bytes or 0)
+    while _dynamic_models_cache and (
+        len(_dynamic_models_cache) + incoming_count > cache_size or (max_bytes is not None and total_bytes > max_bytes)
+    ):
+        cache_key, _ = _dynamic_models_cache.popitem(last=False)
+        total_bytes -= _dynamic_models_cache_sizes.pop(cache_key, 0)
 
 
 def _is_init_file(path_tuple: tuple[str, ...]) -> bool:
@@ -55,10 +77,11 @@ def _path_to_module_name(package_name: str, path_tuple: tuple[str, ...]) -> str:
 
 
 def _execute_single_module(
-    code: str,
+    code: str | types.CodeType,
     *,
     include_private_models: bool = False,
     module_name: str | None = None,
+    defer_build: bool = False,
 ) -> dict[str, type]:
     """Execute single module code and extract models."""
     namespace: dict[str, Any] = {"__builtins__": builtins.__dict__}
@@ -68,10 +91,7 @@ def _execute_single_module(
     exec(code, namespace)  # noqa: S102
 
     models = _extract_models(namespace, include_private=include_private_models)
-
-    for obj in models.values():
-        if issubclass(obj, BaseModel) and hasattr(obj, "__pydantic_generic_metadata__"):
-            obj.model_rebuild(_types_namespace=namespace)
+    _rebuild_models(models.values(), namespace, defer_build=defer_build)
 
     return models
 
@@ -107,15 +127,50 @@ def _build_module_edges(modules: dict[tuple[str, ...], str]) -> dict[tuple[str,
     return edges
 
 
-def _execute_multi_module(
-    modules: dict[tuple[str, ...], str],
-    *,
-    include_private_models: bool = False,
-    module_name: str | None = None,
-) -> dict[str, type]:
-    """Execute multiple modules and extract models."""
-    package_name = module_name or f"_dcg_dynamic_{next(_dynamic_module_counter)}"
+def _sort_module_paths(modules: dict[_ModulePath, str]) -> list[_ModulePath]:
+    """Return module paths in an order where every module runs after its relative imports."""
+    nodes = list(modules.keys())
+    nodes.sort(key=lambda p: (_is_init_file(p), p))
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edges = _build_module_edges(modules)
+    return stable_toposort(nodes, edges, key=node_index.__getitem__)
+
+
+def _is_model_rebuild_call(statement: ast.stmt) -> bool:
+    """Return whether ``statement`` is a bare ``Model.model_rebuild()`` call."""
+    match statement:
+        case ast.Expr(value=ast.Call(func=ast.Attribute(value=ast.Name(), attr="model_rebuild"), args=[], keywords=[])):
+            return True
+    return False
+
+
+def _compile_module(code: str, *, defer_build: bool) -> types.CodeType:
+    """Compile one generated module, without its trailing rebuilds when models build on first use.
+
+    Those calls would build every forward-referencing model as soon as the module runs;
+    ``_rebuild_models`` attaches the namespace that resolves the references lazily instead.
+    """
+    if not defer_build:
+        return compile(code, "<string>", "exec")
+    tree = ast.parse(code)
+    tree.body = [statement for statement in tree.body if not _is_model_rebuild_call(statement)]
+    return compile(tree, "<string>", "exec")
+
+
+def _compile_generated_modules(
+    result: str | dict[_ModulePath, str], *, defer_build: bool = False
+) -> types.CodeType | list[tuple[_ModulePath, types.CodeType]]:
+    """Compile generated source; multi-module output is compiled in execution order."""
+    if isinstance(result, str):
+        return _compile_module(result, defer_build=defer_build)
+    return [(path, _compile_module(result[path], defer_build=defer_build)) for path in _sort_module_paths(result)]
 
+
+@contextlib.contextmanager
+def _registered_package(
+    modules: Mapping[_ModulePath, str | types.CodeType], package_name: str, sorted_paths: Sequence[_ModulePath]
+) -> Iterator[dict[str, dict[str, Any]]]:
+    """Execute modules as ``package_name`` and yield their namespaces while they are importable."""
     created_modules: list[str] = []
     previous_modules: dict[str, types.ModuleType | object] = {}
     all_namespaces: dict[str, dict[str, Any]] = {}
@@ -126,12 +181,6 @@ def _execute_multi_module(
         created_modules.append(name)
 
     try:
-        nodes = list(modules.keys())
-        nodes.sort(key=lambda p: (_is_init_file(p), p))
-        node_index = {node: i for i, node in enumerate(nodes)}
-        edges = _build_module_edges(modules)
-        sorted_paths = stable_toposort(nodes, edges, key=node_index.__getitem__)
-
         for path_tuple in sorted_paths:
             generated_module_name = _path_to_module_name(package_name, path_tuple)
             module = types.ModuleType(generated_module_name)
@@ -152,24 +201,57 @@ def _execute_multi_module(
             generated_module_name = _path_to_module_name(package_name, path_tuple)
             exec(modules[path_tuple], all_namespaces[generated_module_name])  # noqa: S102
 
+        yield all_namespaces
+    finally:
+        for created_module_name in reversed(created_modules):
+            previous_module = previous_modules[created_module_name]
+            if previous_module is _MISSING_MODULE:
+                sys.modules.pop(created_module_name, None)
+            else:
+                sys.modules[created_module_name] = cast("types.ModuleType", previous_module)
+
+
+def _rebuild_models(models: Iterable[type], namespace: dict[str, Any], *, defer_build: bool = False) -> None:
+    """Resolve the models' forward references against ``namespace``.
+
+    With ``defer_build`` the namespace is only attached to each model, and pydantic
+    resolves it when the model is first used instead of building every model now.
+    """
+    for obj in models:
+        if issubclass(obj, BaseModel) and hasattr(obj, "__pydantic_generic_metadata__"):
+            if defer_build:
+                obj.__pydantic_parent_namespace__ = namespace
+            else:
+                obj.model_rebuild(_types_namespace=namespace)
+
+
+def _execute_multi_module(
+    modules: Mapping[_ModulePath, str | types.CodeType],
+    *,
+    include_private_models: bool = False,
+    module_name: str | None = None,
+    sorted_paths: Sequence[_ModulePath] | None = None,
+    defer_build: bool = False,
+) -> dict[str, type]:
+    """Execute multiple modules and extract models.
+
+    ``sorted_paths`` gives the execution order for precompiled modules; otherwise it is
+    derived from the relative imports in the module sources.
+    """
+    package_name = module_name or f"_dcg_dynamic_{next(_dynamic_module_counter)}"
+    if sorted_paths is None:
+        sorted_paths = _sort_module_paths(modules)  # ty: ignore[invalid-argument-type]
+
+    with _registered_package(modules, package_name, sorted_paths) as all_namespaces:
         models: dict[str, type] = {}
         combined_namespace: dict[str, Any] = {}
         for ns in all_namespaces.values():
             combined_namespace.update(ns)
             models.update(_extract_models(ns, include_private=include_private_models))
 
-        for obj in models.values():
-            if issubclass(obj, BaseModel) and hasattr(obj, "__pydantic_generic_metadata__"):
-                obj.model_rebuild(_types_namespace=combined_namespace)
+        _rebuild_models(models.values(), combined_namespace, defer_build=defer_build)
 
         return models
-    finally:
-        for created_module_name in reversed(created_modules):
-            previous_module = previous_modules[created_module_name]
-            if previous_module is _MISSING_MODULE:
-                sys.modules.pop(created_module_name, None)
-            else:
-                sys.modules[created_module_name] = previous_module
 
 
 def _should_extract_model_name(name: str, *, include_private: bool = False) -> bool:
@@ -189,21 +271,36 @@ def _extract_models(namespace: dict[str, Any], *, include_private: bool = False)
     return {
         k: v
         for k, v in namespace.items()
-        if isinstance(v, type)
+        if _is_model_class(v)
         and v.__module__ == module_name
         and _should_extract_model_name(k, include_private=include_private)
-        and ((issubclass(v, BaseModel) and v is not BaseModel) or (issubclass(v, Enum) and v is not Enum))
     }
 
 
-def _make_cache_key(schema: Mapping[str, Any], config: GenerateConfig, module_name: str | None = None) -> str | None:
+def _is_model_class(value: object) -> TypeGuard[type]:
+    return isinstance(value, type) and (
+        (issubclass(value, BaseModel) and value is not BaseModel) or (issubclass(value, Enum) and value is not Enum)
+    )
+
+
+def _make_cache_key(
+    schema: Mapping[str, Any],
+    config: GenerateConfig,
+    module_name: str | None = None,
+    schema_key: str | None = None,
+) -> str | None:
     """Create cache key from schema and config.
 
-    Returns None if the schema is not JSON-serializable.
+    A caller-supplied ``schema_key`` stands in for the schema contents, so the schema is
+    not serialized. Returns None if the schema is not JSON-serializable.
     """
     try:
-        schema_json = json.dumps(dict(schema), sort_keys=True, separators=(",", ":"))
-        config_json = config.model_dump_json(exclude_defaults=True)
+        schema_json = (
+            json.dumps(dict(schema), sort_keys=True, separators=(",", ":"))
+            if schema_key is None
+            else json.dumps({"schema_key": schema_key}, separators=(",", ":"))
+        )
+        config_json = config.model_dump_json(exclude_defaults=True, exclude={"cache_dir"})
         module_name_json = (
             json.dumps({"module_name": module_name}, sort_keys=True, separators=(",", ":"))
             if module_name is not None
@@ -220,6 +317,45 @@ def _make_cache_key(schema: Mapping[str, Any], config: GenerateConfig, module_na
     return f"{cache_key}:{module_name_digest}:{len(module_name_json)}"
 
 
+_CompiledModules = types.CodeType | list[tuple[_ModulePath, types.CodeType]]
+
+
+def _compiled_modules_disk_cache(config: GenerateConfig, cache_key: str | None) -> tuple[DiskCache, str] | None:
+    """Return the on-disk compiled module cache and entry key, when ``config.cache_dir`` is set."""
+    if config.cache_dir is None or cache_key is None:
+        return None
+    from datamodel_code_generator._disk_cache import CacheKey, DiskCache  # noqa: PLC0415
+
+    disk_key = CacheKey(_DYNAMIC_MODELS_CACHE_NAMESPACE).add(cache_key, pydantic.VERSION).hexdigest()
+    return DiskCache(config.cache_dir, _DYNAMIC_MODELS_CACHE_NAMESPACE), disk_key
+
+
+def _compile_dynamic_models(
+    input_: Mapping[str, Any], config: GenerateConfig, cache_key: str | None, *, defer_build: bool = False
+) -> tuple[_CompiledModules, int]:
+    """Generate and compile model code, reusing compiled code from ``config.cache_dir``.
+
+    Returns the code and its marshalled size, which is what the cache entry costs.
+    """
+    disk_cache = _compiled_modules_disk_cache(config, cache_key)
+    if disk_cache is not None:
+        cache, disk_key = disk_cache
+        match cache.get(disk_key):
+            case {"code": types.CodeType() | list() as compiled, "size": int() as size}:
+                return compiled, size
+
+    result = generate(input_=input_, config=config)
+    if result is None:  # pragma: no cover
+        msg = "generate() returned None"
+        raise Error(msg)
+    compiled = _compile_generated_modules(result, defer_build=defer_build)
+    size = len(marshal.dumps(compiled))
+    if disk_cache is not None:
+        cache, disk_key = disk_cache
+        cache.set(disk_key, {"code": compiled, "size": size})
+    return compiled, size
+
+
 def _detect_schema_input_file_type(input_: Mapping[str, Any]) -> InputFileType:
     """Detect schema input type for dynamic model generation."""
     if is_asyncapi(input_):
@@ -229,6 +365,15 @@ def _detect_schema_input_file_type(input_: Mapping[str, Any]) -> InputFileType:
     return InputFileType.JsonSchema
 
 
+def _with_deferred_build(config: GenerateConfig) -> GenerateConfig:
+    """Return ``config`` with ``defer_build`` added to every model's template data."""
+    extra_template_data: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+    for key, value in (config.extra_template_data or {}).items():
+        extra_template_data[key] = dict(value)
+    extra_template_data[ALL_MODEL]["defer_build"] = True
+    return config.model_copy(update={"extra_template_data": extra_template_data})
+
+
 def _normalize_target_model_names(target_model_names: Sequence[str] | None) -> tuple[str, ...] | None:
     if target_model_names is None:
         return None
@@ -267,13 +412,16 @@ def _filter_target_models(models: dict[str, type], target_model_names: tuple[str
     return {name: models[name] for name in target_model_names}
 
 
-def generate_dynamic_models(
+def generate_dynamic_models(  # noqa: PLR0913
     input_: Mapping[str, Any],
     *,
     config: GenerateConfig | None = None,
     cache_size: int = 128,
+    cache_max_bytes: int | None = None,
+    schema_key: str | None = None,
     module_name: str | None = None,
     target_model_names: Sequence[str] | None = None,
+    defer_build: bool = False,
 ) -> dict[str, type]:
     """Generate actual Python model classes from schema at runtime.
 
@@ -285,8 +433,15 @@ def generate_dynamic_models(
         input_: JSON Schema or OpenAPI schema as dict.
         config: A GenerateConfig object with generation options. If None, uses defaults.
         cache_size: Maximum number of schemas to cache. Set to 0 to disable caching.
+        cache_max_bytes: Optional budget for the in-memory cache, measured as the marshalled
+            size of each entry's compiled module code.
+        schema_key: Optional stable identifier of the schema contents, such as a tenant id
+            and schema version. It replaces hashing the serialized schema in the cache key,
+            so different schemas must never share a key.
         module_name: Optional module/package name to assign to generated classes.
         target_model_names: Optional model names to include in the returned dictionary.
+        defer_build: Set ``defer_build=True`` in the generated ``ConfigDict`` so each model's
+            validator is built on first use instead of when the models are created.
 
     Returns:
         Dictionary mapping class names to model classes.
@@ -295,7 +450,10 @@ def generate_dynamic_models(
         - Thread-safe (uses internal lock and cache)
         - Pydantic v2 only (v1 is not supported)
         - Not pickle-able (use model_dump() to serialize instances)
-        - Cached by schema + config + module_name hash with FIFO eviction when cache_size is exceeded
+        - Cached by schema (or schema_key) + config + module_name hash with least recently used
+          eviction when cache_size or cache_max_bytes is exceeded
+        - When config.cache_dir is set, compiled model code is also cached on disk, so other
+          processes skip code generation and compilation
         - Supports both single-module and multi-module output
 
     Example:
@@ -324,37 +482,288 @@ def generate_dynamic_models(
     elif config.input_file_type == InputFileType.Auto:
         config = config.model_copy(update={"input_file_type": _detect_schema_input_file_type(input_)})
 
+    if defer_build:
+        config = _with_deferred_build(config)
+
     normalized_target_model_names = _normalize_target_model_names(target_model_names)
-    cache_key = _make_cache_key(input_, config, module_name)
+    cache_key = _make_cache_key(input_, config, module_name, schema_key)
     use_cache = cache_size > 0 and cache_key is not None
 
     with _dynamic_models_lock:
         if use_cache:
             assert cache_key is not None
             if (cached_models := _dynamic_models_cache.get(cache_key)) is not None:
-                if (excess := len(_dynamic_models_cache) - cache_size) > 0:
-                    _evict_dynamic_models_cache_entries(excess)
+                _dynamic_models_cache.move_to_end(cache_key)
+                _evict_dynamic_models_cache_entries(cache_size, cache_max_bytes)
                 return _filter_target_models(cached_models, normalized_target_model_names)
 
-        result = generate(input_=input_, config=config)
-        if result is None:  # pragma: no cover
-            msg = "generate() returned None"
-            raise Error(msg)
+        compiled, size = _compile_dynamic_models(input_, config, cache_key, defer_build=defer_build)
         include_private_models = config.allow_leading_underscore_class_name
         models = (
-            _execute_single_module(result, include_private_models=include_private_models, module_name=module_name)
-            if isinstance(result, str)
-            else _execute_multi_module(result, include_private_models=include_private_models, module_name=module_name)
+            _execute_single_module(
+                compiled,
+                include_private_models=include_private_models,
+                module_name=module_name,
+                defer_build=defer_build,
+            )
+            if isinstance(compiled, types.CodeType)
+            else _execute_multi_module(
+                dict(compiled),
+                include_private_models=include_private_models,
+                module_name=module_name,
+                sorted_paths=[path for path, _ in compiled],
+                defer_build=defer_build,
+            )
         )
 
-        if use_cache:
-            if (excess := len(_dynamic_models_cache) - cache_size + 1) > 0:
-                _evict_dynamic_models_cache_entries(excess)
+        if use_cache and (cache_max_bytes is None or size <= cache_max_bytes):
+            _evict_dynamic_models_cache_entries(cache_size, cache_max_bytes, size)
             _dynamic_models_cache[cache_key] = models  # ty: ignore[invalid-assignment]
+            _dynamic_models_cache_sizes[cache_key] = size  # ty: ignore[invalid-assignment]
 
         return _filter_target_models(models, normalized_target_model_names)
 
 
+def _iter_annotation_types(annotation: Any) -> Iterator[type]:
+    if isinstance(annotation, type) and not typing.get_args(annotation):
+        yield annotation
+    for argument in typing.get_args(annotation):
+        yield from _iter_annotation_types(argument)
+
+
+def _bound_names(statement: ast.stmt) -> list[str]:
+    match statement:
+        case ast.ClassDef(name=name) | ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name):
+            return [name]
+        case ast.Import(names=aliases):
+            return [alias.asname or alias.name.partition(".")[0] for alias in aliases]
+        case ast.ImportFrom(names=aliases):
+            return [alias.asname or alias.name for alias in aliases]
+        case ast.Assign(targets=targets):
+            return [node.id for target in targets for node in ast.walk(target) if isinstance(node, ast.Name)]
+        case ast.AnnAssign(target=ast.Name(id=name)):
+            return [name]
+        case _:
+            name = getattr(statement, "name", None)  # ``type`` aliases on Python 3.12+
+            return [name.id] if isinstance(name, ast.Name) else []
+
+
+def _used_names(statement: ast.stmt) -> set[str]:
+    """Return the names a statement uses, including those inside string forward references."""
+    names: set[str] = set()
+    for node in ast.walk(statement):
+        match node:
+            case ast.Name(id=name):
+                names.add(name)
+            case ast.Constant(value=str() as value):
+                names.update(_IDENTIFIER_PATTERN.findall(value))
+    return names
+
+
+def _binding_label(name: str, statement: ast.stmt) -> object:
+    match statement:
+        case ast.Import(names=aliases):
+            return next(
+                ("import", alias.name) for alias in aliases if (alias.asname or alias.name.partition(".")[0]) == name
+            )
+        case ast.ImportFrom(module=imported_module, level=level, names=aliases):
+            return next(
+                ("from", imported_module, level, alias.name)
+                for alias in aliases
+                if (alias.asname or alias.name) == name
+            )
+        case _:
+            return ast.dump(statement)
+
+
+def _module_binding_labels(trees: dict[str, ast.Module]) -> dict[tuple[str, str], int]:
+    """Label each module-level binding by its definition and, transitively, by the bindings it uses.
+
+    Two bindings end up with the same label only when their definitions are identical
+    and every module-level name they use is bound to an identically labelled definition.
+    """
+    interned: dict[object, int] = {}
+    labels: dict[tuple[str, str], int] = {}
+    references: dict[tuple[str, str], list[tuple[str, tuple[str, str]]]] = {}
+    for module, tree in trees.items():
+        bindings = {name: statement for statement in tree.body for name in _bound_names(statement)}
+        for name, statement in bindings.items():
+            labels[module, name] = interned.setdefault(_binding_label(name, statement), len(interned))
+            references[module, name] = sorted(
+                (used, (module, used))
+                for used in _used_names(statement)
+                if used in bindings and bindings[used] is not statement
+            )
+    while True:
+        refined = {
+            binding: interned.setdefault(
+                (label, tuple((used, labels[target]) for used, target in references[binding])), len(interned)
+            )
+            for binding, label in labels.items()
+        }
+        if len(set(refined.values())) == len(set(labels.values())):
+            return labels
+        labels = refined
+
+
+def _share_identical_classes(modules: dict[_ModulePath, str], module_names: Iterable[str]) -> dict[str, list[str]]:
+    """Replace classes that an earlier sibling module already defines identically with imports of them.
+
+    ``module_names`` lists the top-level modules of ``modules`` to deduplicate, in
+    execution order; their code is rewritten in place. A class is only shared together
+    with its whole transitive closure, see ``_module_binding_labels``. Returns the
+    top-level class names each of those modules originally defined.
+    """
+    sources = {module: modules[f"{module}.py",] for module in module_names}
+    trees = {module: ast.parse(code) for module, code in sources.items()}
+    labels = _module_binding_labels(trees)
+    defining_modules: dict[int, str] = {}
+    class_names: dict[str, list[str]] = {}
+    for module, code in sources.items():
+        class_statements = [statement for statement in trees[module].body if isinstance(statement, ast.ClassDef)]
+        class_names[module] = [statement.name for statement in class_statements]
+        lines = code.splitlines(keepends=True)
+        for statement in reversed(class_statements):
+            defining_module = defining_modules.setdefault(labels[module, statement.name], module)
+            if defining_module != module:
+                start = min(node.lineno for node in [statement, *statement.decorator_list]) - 1
+                lines[start : statement.end_lineno] = [f"from .{defining_module} import {statement.name}\n"]
+        modules[f"{module}.py",] = "".join(lines)
+    return class_names
+
+
+def _collect_schema_models(
+    namespace: dict[str, Any], class_names: Iterable[str], package_name: str, *, include_private: bool = False
+) -> dict[str, type]:
+    """Return a module's named models plus the package models they inherit from or reference."""
+    models = {
+        name: namespace[name]
+        for name in class_names
+        if _is_model_class(namespace[name]) and _should_extract_model_name(name, include_private=include_private)
+    }
+    pending = list(models.values())
+    while pending:
+        model = pending.pop()
+        related: list[type] = list(model.__mro__[1:])
+        if issubclass(model, BaseModel):
+            for field in model.model_fields.values():
+                related.extend(_iter_annotation_types(field.annotation))
+        for candidate in related:
+            if (
+                candidate.__module__.startswith(f"{package_name}.")
+                and candidate.__name__ not in models
+                and _should_extract_model_name(candidate.__name__, include_private=include_private)
+                and issubclass(candidate, (BaseModel, Enum))
+            ):
+                models[candidate.__name__] = candidate
+                pending.append(candidate)
+    return models
+
+
+def generate_dynamic_models_batch(
+    inputs: Mapping[str, Mapping[str, Any]],
+    *,
+    config: GenerateConfig | None = None,
+    module_name: str | None = None,
+) -> dict[str, dict[str, type]]:
+    """Generate model classes for many schemas in a single generation pass.
+
+    The schemas are generated together as sibling modules of one package. A class
+    whose definition, and the definitions of everything it references, are identical
+    to a class of an earlier schema is imported from that schema's module instead of
+    being executed again, so the same class is returned for every schema that uses it.
+    Schemas with identical contents share one set of models.
+
+    Args:
+        inputs: Schemas to generate, keyed by a caller-chosen name such as a tenant id.
+        config: A GenerateConfig object shared by every schema. If None, uses defaults.
+            Its reuse scope is overridden to module scope.
+        module_name: Optional package name to assign to generated classes.
+
+    Returns:
+        Dictionary mapping each input key to its class name to model class mapping.
+
+    Note:
+        - Every schema must have the same input type (JSON Schema, OpenAPI or AsyncAPI)
+        - Results are not cached; use generate_dynamic_models for cached single schemas
+        - Shared classes belong to the module of the first schema that defines them
+
+    Example:
+        >>> address = {"type": "object", "properties": {"city": {"type": "string"}}}
+        >>> models = generate_dynamic_models_batch({
+        ...     "acme": {"title": "Customer", "type": "object", "properties": {"address": address}},
+        ...     "globex": {"title": "Supplier", "type": "object", "properties": {"address": address}},
+        ... })
+        >>> models["acme"]["Address"] is models["globex"]["Address"]
+        True
+    """
+    if pydantic.VERSION < "2.0.0":  # pragma: no cover
+        msg = f"generate_dynamic_models_batch requires Pydantic v2, found v{pydantic.VERSION}"
+        raise Error(msg)
+
+    _rebuild_generate_config()
+
+    if not inputs:
+        return {}
+
+    schema_texts: dict[str, str] = {}
+    stems_by_digest: dict[str, str] = {}
+    stem_by_key: dict[str, str] = {}
+    for key, schema in inputs.items():
+        try:
+            schema_text = json.dumps(dict(schema), separators=(",", ":"))
+            # Keys are only sorted for the digest; the file keeps the caller's field order.
+            digest = hashlib.sha256(
+                json.dumps(dict(schema), sort_keys=True, separators=(",", ":")).encode()
+            ).hexdigest()
+        except (TypeError, ValueError) as exc:
+            msg = f"Schema {key!r} is not JSON-serializable: {exc}"
+            raise Error(msg) from exc
+        if (stem := stems_by_digest.get(digest)) is None:
+            stem = stems_by_digest[digest] = f"schema_{len(stems_by_digest)}"
+            schema_texts[stem] = schema_text
+        stem_by_key[key] = stem
+
+    update: dict[str, Any] = {"reuse_scope": ReuseScope.Module, "output": None}
+    if config is None or config.input_file_type == InputFileType.Auto:
+        input_file_types = {_detect_schema_input_file_type(json.loads(text)) for text in schema_texts.values()}
+        if len(input_file_types) > 1:
+            found = ", ".join(sorted(input_file_type.value for input_file_type in input_file_types))
+            msg = f"generate_dynamic_models_batch requires schemas of a single input type, found: {found}"
+            raise Error(msg)
+        update["input_file_type"] = input_file_types.pop()
+    config = (config or GenerateConfig(output_model_type=DataModelType.PydanticV2BaseModel)).model_copy(update=update)
+
+    with _dynamic_models_lock, tempfile.TemporaryDirectory(prefix="dcg-dynamic-batch-") as directory:
+        for stem, schema_text in schema_texts.items():
+            (Path(directory) / f"{stem}.json").write_text(schema_text, encoding="utf-8")
+        result = generate(input_=Path(directory), config=config)
+        if result is None:  # pragma: no cover
+            msg = "generate() returned None"
+            raise Error(msg)
+        assert not isinstance(result, str)
+        class_names_by_stem = _share_identical_classes(result, schema_texts)
+        compiled = _compile_generated_modules(result)
+        assert not isinstance(compiled, types.CodeType)
+
+        package_name = module_name or f"_dcg_dynamic_{next(_dynamic_module_counter)}"
+        include_private_models = config.allow_leading_underscore_class_name
+        with _registered_package(dict(compiled), package_name, [path for path, _ in compiled]) as namespaces:
+            for namespace in namespaces.values():
+                _rebuild_models(_extract_models(namespace, include_private=True).values(), namespace)
+            models_by_stem = {
+                stem: _collect_schema_models(
+                    namespaces[_path_to_module_name(package_name, (f"{stem}.py",))],
+                    class_names,
+                    package_name,
+                    include_private=include_private_models,
+                )
+                for stem, class_names in class_names_by_stem.items()
+            }
+
+    return {key: models_by_stem[stem] for key, stem in stem_by_key.items()}
+
+
 def clear_dynamic_models_cache() -> int:
     """Clear the dynamic models cache.
 
@@ -364,4 +773,5 @@ def clear_dynamic_models_cache() -> int:
     with _dynamic_models_lock:
         count = len(_dynamic_models_cache)
         _dynamic_models_cache.clear()
+        _dynamic_models_cache_sizes.clear()
         return count
@@ -12,7 +12,9 @@ ExperimentalFeatureKind = Literal["input-format", "formatter", "cli-option", "py
 ExperimentalFeatureFormat = Literal["table", "json", "markdown"]
 ExperimentalFeatureId = Literal[
     "behavior.batch-generation-jobs",
+    "behavior.remote-reference-bundle",
     "behavior.remote-reference-lock",
+    "cli-option.bundle-schema",
     "cli-option.generate-schema-validators",
     "cli-option.schema-validator-type",
     "cli-option.use-missing-sentinel",
@@ -57,6 +59,21 @@ EXPERIMENTAL_FEATURES: dict[ExperimentalFeatureId, ExperimentalFeature] = {
             "before generation begins."
         ),
     ),
+    "behavior.remote-reference-bundle": ExperimentalFeature(
+        id="behavior.remote-reference-bundle",
+        kind="behavior",
+        target="--ref-bundle and --update-ref-bundle",
+        message=(
+            "Offline remote reference bundles are experimental: the archive layout may evolve, but resources "
+            "missing from a bundle remain fail-closed and credentials are never persisted."
+        ),
+        since_version="0.72.3",
+        note=(
+            "A bundle is a zip archive of raw response bodies keyed by SHA-256 body digest, plus an index in the "
+            "remote reference lock format. Serving from a bundle performs no network I/O or DNS resolution, and "
+            "--lockfile with --locked still verifies every bundled body."
+        ),
+    ),
     "behavior.remote-reference-lock": ExperimentalFeature(
         id="behavior.remote-reference-lock",
         kind="behavior",
@@ -87,6 +104,20 @@ EXPERIMENTAL_FEATURES: dict[ExperimentalFeatureId, ExperimentalFeature] = {
             "errors do not fall back."
         ),
     ),
+    "cli-option.bundle-schema": ExperimentalFeature(
+        id="cli-option.bundle-schema",
+        kind="cli-option",
+        target="--bundle-schema",
+        message=(
+            "Schema bundling is experimental: names chosen for copied definitions may change, but every bundled "
+            "reference stays a local JSON pointer."
+        ),
+        since_version="0.72.3",
+        note=(
+            "Only references into local files, and HTTP(S) references that the root $id maps to local files, are "
+            "bundled; other remote references are kept as they are."
+        ),
+    ),
     "cli-option.generate-schema-validators": ExperimentalFeature(
         id="cli-option.generate-schema-validators",
         kind="cli-option",
@@ -11,6 +11,7 @@ import re
 import shutil
 import subprocess  # noqa: S404
 import sys
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib import import_module, invalidate_caches
@@ -28,9 +29,11 @@ from datamodel_code_generator.deprecations import warn_deprecated
 from datamodel_code_generator.util import load_toml
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from types import CodeType
 
+    from datamodel_code_generator._ruff_worker import RuffWorker
+
 DEFAULT_FORMATTERS = _format_types.DEFAULT_FORMATTERS
 EXTERNAL_FORMATTERS = _format_types.EXTERNAL_FORMATTERS
 DateClassType = _format_types.DateClassType
@@ -512,6 +515,29 @@ def resolve_use_type_checking_imports(
     return not (is_multi_module_output and has_ruff_check and requires_runtime_imports_with_ruff_check)
 
 
+@contextmanager
+def ruff_worker_session() -> Iterator[None]:
+    """Reuse long-lived Ruff worker processes for every formatter created inside the block.
+
+    Ruff check and format requests issued by ``CodeFormatter`` instances are served by one
+    ``ruff server`` process per formatter settings instead of one subprocess per call. Workers are
+    shared across ``generate()`` calls and stopped when the outermost session exits.
+    """
+    from datamodel_code_generator import _ruff_worker  # noqa: PLC0415
+
+    _ruff_worker.enter_ruff_worker_session()
+    try:
+        yield
+    finally:
+        _ruff_worker.exit_ruff_worker_session()
+
+
+def _ruff_worker_session_active() -> bool:
+    if (ruff_worker := sys.modules.get("datamodel_code_generator._ruff_worker")) is None:
+        return False
+    return ruff_worker.ruff_worker_session_active()
+
+
 class CodeFormatter:
     """Formats generated code using black, isort, ruff, and custom formatters."""
 
@@ -530,6 +556,7 @@ class CodeFormatter:
         use_type_checking_imports: bool = True,  # noqa: FBT001, FBT002
         defer_formatting: bool = False,  # noqa: FBT001, FBT002
         formatter_cwd: Path | None = None,
+        use_ruff_worker: bool | None = None,  # noqa: FBT001
     ) -> None:
         """Initialize code formatter with configuration for black, isort, ruff, and custom formatters."""
         if formatters is None:
@@ -562,6 +589,7 @@ class CodeFormatter:
         self.encoding = encoding
         self.use_type_checking_imports = use_type_checking_imports
         self.python_version = python_version
+        self.use_ruff_worker = use_ruff_worker
         self._formatting_generated_code = False
 
         has_external_formatter = bool(EXTERNAL_FORMATTERS.intersection(formatters))
@@ -789,6 +817,8 @@ class CodeFormatter:
 
     def apply_ruff_lint(self, code: str) -> str:
         """Run ruff check with auto-fix on code."""
+        if (worker := self._get_ruff_worker()) is not None:
+            return worker.fix(code)
         result = self._run_ruff_command(
             self._ruff_check_command("-"),
             stdin=code.encode(self.encoding),
@@ -798,6 +828,8 @@ class CodeFormatter:
 
     def apply_ruff_formatter(self, code: str) -> str:
         """Format code using ruff format."""
+        if (worker := self._get_ruff_worker()) is not None:
+            return worker.format(code)
         ruff_path = self._find_ruff_path()
         result = self._run_ruff_command(
             (ruff_path, "format", "-"),
@@ -807,6 +839,8 @@ class CodeFormatter:
 
     def apply_ruff_check_and_format(self, code: str) -> str:
         """Run ruff check and format sequentially for reliable processing."""
+        if (worker := self._get_ruff_worker()) is not None:
+            return worker.fix_and_format(code)
         ruff_path = self._find_ruff_path()
         check_result = self._run_ruff_command(
             self._ruff_check_command("-", ruff_path=ruff_path),
@@ -819,6 +853,21 @@ class CodeFormatter:
         )
         return format_result.stdout.decode(self.encoding)
 
+    def _get_ruff_worker(self) -> RuffWorker | None:
+        """Return the pooled Ruff server worker when worker formatting is enabled."""
+        enabled = self.use_ruff_worker if self.use_ruff_worker is not None else _ruff_worker_session_active()
+        if not enabled:
+            return None
+        from datamodel_code_generator import _ruff_worker  # noqa: PLC0415
+
+        key = _ruff_worker.RuffWorkerKey(
+            ruff_path=self._find_ruff_path(),
+            settings_path=self.settings_path,
+            use_type_checking_imports=self.use_type_checking_imports,
+            config_fingerprint=_ruff_worker.ruff_config_fingerprint(Path(self.settings_path)),
+        )
+        return _ruff_worker.get_ruff_worker(key)
+
     def _run_ruff_command(
         self,
         command: tuple[str, ...],
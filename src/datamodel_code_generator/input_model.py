@@ -57,6 +57,7 @@ class Error(Exception):
 
 
 _MISSING_MODULE = object()
+_INPUT_MODEL_CACHE_NAMESPACE = "input-model"
 _ModuleRestoreState = tuple[str, object]
 
 
@@ -107,25 +108,33 @@ def _module_depth(module_name: str) -> int:
     return module_name.count(".")
 
 
-def _load_model_schema_isolated(
+def _load_model_schema_isolated(  # noqa: PLR0913
     input_models: list[str],
     input_file_type: InputFileType,
     ref_strategy: InputModelRefStrategy | None,
     output_model_type: DataModelType | None,
     expression_collector: PythonTypeExpressionCollector | None = None,
+    *,
+    module_files: dict[str, str] | None = None,
 ) -> dict[str, object]:
-    """Load a schema while restoring cwd-local import state afterwards."""
+    """Load a schema while restoring cwd-local import state afterwards.
+
+    ``module_files`` receives the digests of the user source files loaded for the schema.
+    """
     with PROCESS_STATE_LOCK:
         cwd_entry = str(Path.cwd())
         added_path = cwd_entry not in sys.path
         if not added_path:
-            return _load_model_schema(
+            schema = _load_model_schema(
                 input_models,
                 input_file_type,
                 ref_strategy,
                 output_model_type,
                 expression_collector,
             )
+            if module_files is not None:
+                module_files.update(_hash_user_module_files(input_models))
+            return schema
 
         directory = Path(cwd_entry).resolve()
         environment_directory = Path(sys.prefix).resolve()
@@ -133,13 +142,16 @@ def _load_model_schema_isolated(
         baseline_modules = sys.modules.copy()
         sys.path.insert(0, cwd_entry)
         try:
-            return _load_model_schema(
+            schema = _load_model_schema(
                 input_models,
                 input_file_type,
                 ref_strategy,
                 output_model_type,
                 expression_collector,
             )
+            if module_files is not None:
+                module_files.update(_hash_user_module_files(input_models))
+            return schema
         finally:
             current_modules = sys.modules.copy()
             local_module_names = sorted(
@@ -161,6 +173,45 @@ def _load_model_schema_isolated(
                 sys.path_importer_cache[cwd_entry] = cast("Any", importer_cache_entry)
 
 
+def _hash_user_module_files(input_models: list[str]) -> dict[str, str]:
+    """Return the sha256 digest of every loaded user source file, keyed by path.
+
+    User files are the path-style targets plus the modules in ``sys.modules`` that live
+    outside the Python installation and this package, so a change to any module the
+    targets may import invalidates a cached schema.
+    """
+    excluded_directories = {
+        Path(directory).resolve() for directory in (sys.prefix, sys.base_prefix, sys.exec_prefix)
+    } | {Path(__file__).resolve().parent}
+    paths = {
+        Path(modname).resolve()
+        for modname, _ in map(_split_input_model, input_models)
+        if _is_path_input_model_module(modname)
+    }
+    for module in list(sys.modules.values()):
+        if isinstance(module_file := getattr(module, "__file__", None), str) and module_file.endswith(".py"):
+            paths.add(Path(module_file).resolve())
+    return {
+        str(path): digest
+        for path in sorted(paths)
+        if not any(path.is_relative_to(directory) for directory in excluded_directories)
+        and (digest := _file_digest(path)) is not None
+    }
+
+
+def _file_digest(path: Path) -> str | None:
+    from hashlib import sha256  # noqa: PLC0415
+
+    try:
+        return sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _files_are_unchanged(module_files: dict[str, str]) -> bool:
+    return all(_file_digest(Path(path)) == digest for path, digest in module_files.items())
+
+
 def _restore_path_module(state: _ModuleRestoreState) -> None:
     module_name, previous_module = state
     if previous_module is _MISSING_MODULE:
@@ -864,8 +915,74 @@ def _load_model_schema_with_python_type_expressions(
     input_file_type: InputFileType,
     ref_strategy: InputModelRefStrategy | None = None,
     output_model_type: DataModelType | None = None,
+    cache_dir: Path | None = None,
+) -> LoadedInputModelSchema:
+    """Load the CLI-only schema transport without rendering runtime expressions.
+
+    With ``cache_dir``, the schema is reused while every user source file it was
+    extracted from is unchanged.
+    """
+    if cache_dir is None:
+        return _extract_loaded_model_schema(input_models, input_file_type, ref_strategy, output_model_type)
+
+    from datamodel_code_generator._disk_cache import DiskCache  # noqa: PLC0415
+    from datamodel_code_generator._input_model_transport import (  # noqa: PLC0415
+        dump_loaded_schema,
+        load_loaded_schema,
+    )
+
+    cache = DiskCache(cache_dir, _INPUT_MODEL_CACHE_NAMESPACE)
+    cache_key = _input_model_cache_key(input_models, input_file_type, ref_strategy, output_model_type)
+    match cache.get(cache_key):
+        case {"module_files": dict() as cached_files, "loaded": dict() as cached} if _files_are_unchanged(cached_files):
+            return load_loaded_schema(cached)
+        case _:
+            pass
+    module_files: dict[str, str] = {}
+    loaded = _extract_loaded_model_schema(
+        input_models, input_file_type, ref_strategy, output_model_type, module_files=module_files
+    )
+    cache.set(cache_key, {"module_files": module_files, "loaded": dump_loaded_schema(loaded)})
+    return loaded
+
+
+def _input_model_cache_key(
+    input_models: list[str],
+    input_file_type: InputFileType,
+    ref_strategy: InputModelRefStrategy | None,
+    output_model_type: DataModelType | None,
+) -> str:
+    """Key a cached schema by its targets and options, the working directory and pydantic version.
+
+    The targets are merged into one schema, so the key covers their whole ordered list: a
+    changed list misses the cache even when some of its targets were extracted before.
+    """
+    import pydantic  # noqa: PLC0415
+
+    from datamodel_code_generator import DataModelType  # noqa: PLC0415
+    from datamodel_code_generator._disk_cache import CacheKey  # noqa: PLC0415
+
+    return (
+        CacheKey(_INPUT_MODEL_CACHE_NAMESPACE)
+        .add(str(Path.cwd()), pydantic.VERSION, str(len(input_models)), *input_models)
+        .add(
+            input_file_type.value,
+            None if ref_strategy is None else ref_strategy.value,
+            _get_output_family(output_model_type or DataModelType.PydanticV2BaseModel),
+        )
+        .hexdigest()
+    )
+
+
+def _extract_loaded_model_schema(
+    input_models: list[str],
+    input_file_type: InputFileType,
+    ref_strategy: InputModelRefStrategy | None,
+    output_model_type: DataModelType | None,
+    *,
+    module_files: dict[str, str] | None = None,
 ) -> LoadedInputModelSchema:
-    """Load the CLI-only schema transport without rendering runtime expressions."""
+    """Extract the CLI schema transport, recording the user files it came from in ``module_files``."""
     expression_collector = PythonTypeExpressionCollector()
     schema = _load_model_schema_isolated(
         input_models,
@@ -873,6 +990,7 @@ def _load_model_schema_with_python_type_expressions(
         ref_strategy,
         output_model_type,
         expression_collector,
+        module_files=module_files,
     )
     return expression_collector.loaded_schema(schema)
 
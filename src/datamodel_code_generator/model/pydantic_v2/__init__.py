@@ -48,6 +48,7 @@ class ConfigDict(_BaseModel):
     use_enum_values: Optional[bool] = None  # noqa: UP045
     coerce_numbers_to_str: Optional[bool] = None  # noqa: UP045
     use_attribute_docstrings: Optional[bool] = None  # noqa: UP045
+    defer_build: Optional[bool] = None  # noqa: UP045
     json_schema_extra: Optional[Dict[str, Any]] = None  # noqa: UP006, UP045
 
     def dict(self, **kwargs: Any) -> dict[str, Any]:  # ty: ignore[invalid-type-form]
@@ -762,6 +762,7 @@ class BaseModel(BaseModelBase):
         ConfigAttribute("allow_mutation", "frozen", True),  # noqa: FBT003
         ConfigAttribute("frozen", "frozen", False),  # noqa: FBT003
         ConfigAttribute("use_attribute_docstrings", "use_attribute_docstrings", False),  # noqa: FBT003
+        ConfigAttribute("defer_build", "defer_build", False),  # noqa: FBT003
     ]
     _CONFIG_ATTRIBUTES_V2_11: ClassVar[list[ConfigAttribute]] = [
         ConfigAttribute("allow_population_by_field_name", "validate_by_name", False),  # noqa: FBT003
@@ -769,6 +770,7 @@ class BaseModel(BaseModelBase):
         ConfigAttribute("allow_mutation", "frozen", True),  # noqa: FBT003
         ConfigAttribute("frozen", "frozen", False),  # noqa: FBT003
         ConfigAttribute("use_attribute_docstrings", "use_attribute_docstrings", False),  # noqa: FBT003
+        ConfigAttribute("defer_build", "defer_build", False),  # noqa: FBT003
     ]
 
     @classmethod
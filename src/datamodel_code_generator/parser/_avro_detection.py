@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any, TypeAlias
 
 JsonSchema = dict[str, Any]
@@ -11,6 +12,7 @@ PRIMITIVE_TYPES = frozenset({"null", "boolean", "int", "long", "float", "double"
 NAMED_TYPES = frozenset({"record", "enum", "fixed"})
 COMPLEX_TYPES = NAMED_TYPES | {"array", "map"}
 JSON_SCHEMA_MARKER_KEYS = frozenset({"$schema", "$defs", "definitions", "properties", "allOf", "anyOf", "oneOf"})
+JSON_LINES_SUFFIXES = frozenset({".jsonl", ".ndjson"})
 
 
 def _is_avro_union_item(item: YamlValue) -> bool:
@@ -79,10 +81,32 @@ def _is_avro_schema_object(schema: JsonSchema) -> bool:
     return False
 
 
+def is_schema_registry_record(data: YamlValue) -> bool:
+    """Return whether data is a schema registry subject version wrapping its schema under ``schema``."""
+    return isinstance(data, dict) and "schema" in data and "type" not in data
+
+
+def is_avro_json_lines_text(text: str) -> bool:
+    """Return whether the first line of JSON-lines text is an Avro schema or registry record."""
+    first_line = next((line for line in text.removeprefix("\ufeff").splitlines() if line.strip()), "")
+    try:
+        data = json.loads(first_line)
+        if is_schema_registry_record(data):
+            if data.get("schemaType", "AVRO") != "AVRO":
+                return False
+            data = json.loads(data["schema"]) if isinstance(data["schema"], str) else data["schema"]
+    except ValueError:
+        return False
+    return is_avro_schema_data(data)
+
+
 __all__ = [
     "COMPLEX_TYPES",
+    "JSON_LINES_SUFFIXES",
     "JSON_SCHEMA_MARKER_KEYS",
     "NAMED_TYPES",
     "PRIMITIVE_TYPES",
+    "is_avro_json_lines_text",
     "is_avro_schema_data",
+    "is_schema_registry_record",
 ]
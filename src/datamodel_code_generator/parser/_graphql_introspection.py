@@ -0,0 +1,155 @@
+"""Serialize built GraphQL schemas in the introspection result format.
+
+``graphql.introspection_from_schema`` executes the introspection query, which first
+validates the whole schema and costs about as much as building it from SDL. The
+parser only needs a lossless, marshal-friendly form of a schema it has already
+built, so this walks the type map directly and emits the same ``{"__schema": ...}``
+shape that ``graphql.build_client_schema`` reads back.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import graphql
+
+# graphql-core 3.3 also reports the kind of each root operation type
+_ROOT_TYPE_HAS_KIND = graphql.version_info >= (3, 3)
+
+_NAMED_TYPE_KINDS: tuple[tuple[type[graphql.GraphQLNamedType], str], ...] = (
+    (graphql.GraphQLScalarType, "SCALAR"),
+    (graphql.GraphQLObjectType, "OBJECT"),
+    (graphql.GraphQLInterfaceType, "INTERFACE"),
+    (graphql.GraphQLUnionType, "UNION"),
+    (graphql.GraphQLEnumType, "ENUM"),
+    (graphql.GraphQLInputObjectType, "INPUT_OBJECT"),
+)
+
+
+def _kind(type_: graphql.GraphQLNamedType) -> str:
+    return next(kind for cls, kind in _NAMED_TYPE_KINDS if isinstance(type_, cls))
+
+
+def _type_ref(type_: graphql.GraphQLType) -> dict[str, Any]:
+    if isinstance(type_, graphql.GraphQLNonNull):
+        return {"kind": "NON_NULL", "name": None, "ofType": _type_ref(cast("graphql.GraphQLType", type_.of_type))}
+    if isinstance(type_, graphql.GraphQLList):
+        return {"kind": "LIST", "name": None, "ofType": _type_ref(cast("graphql.GraphQLType", type_.of_type))}
+    named_type = graphql.assert_named_type(type_)
+    return {"kind": _kind(named_type), "name": named_type.name, "ofType": None}
+
+
+def _default_value(value: graphql.GraphQLArgument | graphql.GraphQLInputField) -> str | None:
+    get_default_value_ast = getattr(graphql.utilities, "get_default_value_ast", None)
+    if get_default_value_ast is not None:  # graphql-core >= 3.3
+        ast = get_default_value_ast(value)
+    elif value.default_value is graphql.Undefined:  # pragma: no cover
+        ast = None
+    else:  # pragma: no cover
+        ast = graphql.ast_from_value(value.default_value, value.type)
+    return None if ast is None else graphql.print_ast(ast)
+
+
+def _deprecation(item: Any) -> dict[str, Any]:
+    reason = getattr(item, "deprecation_reason", None)
+    return {"isDeprecated": reason is not None, "deprecationReason": reason}
+
+
+def _directive_deprecation(directive: graphql.GraphQLDirective) -> dict[str, Any]:
+    if hasattr(directive, "deprecation_reason"):  # pragma: no cover - graphql-core >= 3.3
+        return _deprecation(directive)
+    return {}
+
+
+def _root_type(root: graphql.GraphQLObjectType | None) -> dict[str, Any] | None:
+    if root is None:
+        return None
+    if _ROOT_TYPE_HAS_KIND:  # pragma: no cover - graphql-core >= 3.3
+        return {"kind": "OBJECT", "name": root.name}
+    return {"name": root.name}
+
+
+def _input_values(values: dict[str, graphql.GraphQLArgument] | dict[str, graphql.GraphQLInputField]) -> list[Any]:
+    return [
+        {
+            "name": name,
+            "description": value.description,
+            "type": _type_ref(value.type),
+            "defaultValue": _default_value(value),
+            **_deprecation(value),
+        }
+        for name, value in values.items()
+    ]
+
+
+def _named_type(schema: graphql.GraphQLSchema, type_: graphql.GraphQLNamedType) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "kind": _kind(type_),
+        "name": type_.name,
+        "description": type_.description,
+        "specifiedByURL": None,
+        "isOneOf": None,
+        "fields": None,
+        "inputFields": None,
+        "interfaces": None,
+        "enumValues": None,
+        "possibleTypes": None,
+    }
+    match type_:
+        case graphql.GraphQLScalarType():
+            result["specifiedByURL"] = type_.specified_by_url
+        case graphql.GraphQLObjectType() | graphql.GraphQLInterfaceType():
+            result["fields"] = [
+                {
+                    "name": name,
+                    "description": field.description,
+                    "args": _input_values(field.args),
+                    "type": _type_ref(field.type),
+                    **_deprecation(field),
+                }
+                for name, field in type_.fields.items()
+            ]
+            result["interfaces"] = [_type_ref(interface) for interface in type_.interfaces]
+            if isinstance(type_, graphql.GraphQLInterfaceType):
+                result["possibleTypes"] = [_type_ref(possible) for possible in schema.get_possible_types(type_)]
+        case graphql.GraphQLUnionType():
+            result["possibleTypes"] = [_type_ref(possible) for possible in type_.types]
+        case graphql.GraphQLEnumType():
+            result["enumValues"] = [
+                {"name": name, "description": value.description, **_deprecation(value)}
+                for name, value in type_.values.items()
+            ]
+        case graphql.GraphQLInputObjectType():
+            result["isOneOf"] = getattr(type_, "is_one_of", False)
+            result["inputFields"] = _input_values(type_.fields)
+    return result
+
+
+def introspect_schema(schema: graphql.GraphQLSchema) -> dict[str, Any]:
+    """Return ``schema`` as an introspection result without executing a query."""
+    root_types = {
+        "queryType": schema.query_type,
+        "mutationType": schema.mutation_type,
+        "subscriptionType": schema.subscription_type,
+    }
+    return {
+        "__schema": {
+            "description": schema.description,
+            **{key: _root_type(root) for key, root in root_types.items()},
+            "types": [_named_type(schema, type_) for type_ in schema.type_map.values()],
+            "directives": [
+                {
+                    "name": directive.name,
+                    "description": directive.description,
+                    "isRepeatable": directive.is_repeatable,
+                    **_directive_deprecation(directive),
+                    "locations": [location.name for location in directive.locations],
+                    "args": _input_values(directive.args),
+                }
+                for directive in schema.directives
+            ],
+        }
+    }
+
+
+__all__ = ["introspect_schema"]
@@ -0,0 +1,217 @@
+"""Concurrent read-ahead for multi-file parser inputs.
+
+Directory and path-list inputs are read (and, for parsers that accept decoded
+sources, decoded) on a thread pool while the parser consumes earlier files.
+Large YAML batches can additionally be decoded in worker processes, which send
+results back as ``marshal`` data. Workers never touch parser state: they only
+return file contents, decoded data, or the exception to re-raise, and the parser
+turns them into sources in the original deterministic order on its own thread.
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from datamodel_code_generator import _load_parser_source_data_from_bytes, load_yaml
+from datamodel_code_generator.util import _YAML_DEPRECATED_BOOL_VALUES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from datamodel_code_generator import YamlValue
+
+READ_AHEAD_MIN_FILES = 4
+"""Smallest multi-file input that is worth starting a thread pool for."""
+
+YAML_PROCESS_POOL_MIN_FILES = 32
+"""Smallest number of YAML files that is worth forking decoder processes for."""
+
+_READ_AHEAD_WINDOW = 64
+_MAX_THREAD_WORKERS = 8
+_MAX_PROCESS_WORKERS = 8
+_YAML_SUFFIXES = frozenset({".yaml", ".yml"})
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+@dataclass(frozen=True, slots=True)
+class PreloadedSource:
+    """File contents and optional decoded data prepared by a read-ahead worker."""
+
+    resolved_path: Path
+    data: bytes | None = None
+    text: str | None = None
+    raw_data: Any = None
+    decoded: bool = False
+    error: BaseException | None = None
+
+    def raise_error(self) -> None:
+        """Re-raise the exception captured by the worker, if any."""
+        if self.error is not None:
+            raise self.error
+
+
+def _decode_yaml_to_marshal(text: str) -> bytes | None:
+    """Decode YAML in a worker process; ``None`` asks the parent to decode it itself."""
+    try:
+        return marshal.dumps(load_yaml(text))
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def start_fork_process_pool(task_count: int, min_tasks: int) -> ProcessPoolExecutor | None:
+    """Start a forked worker pool for ``task_count`` CPU-bound tasks, or return ``None``.
+
+    Processes are only used where it is safe and worthwhile: on Linux with the ``fork``
+    start method (``spawn`` would re-run the caller's ``__main__``), with more than one
+    CPU, for at least ``min_tasks`` tasks, and while the process is still single-threaded.
+    The pool is started eagerly so the fork happens before any read-ahead threads exist.
+    """
+    cpu_count = os.cpu_count() or 1
+    if (
+        task_count < min_tasks
+        or cpu_count < 2  # noqa: PLR2004
+        or not sys.platform.startswith("linux")
+        or threading.active_count() > 1
+    ):
+        return None
+    import multiprocessing  # noqa: PLC0415
+
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=min(cpu_count, _MAX_PROCESS_WORKERS), mp_context=multiprocessing.get_context("fork")
+        )
+        executor.submit(int).result()
+    except (OSError, RuntimeError, BrokenProcessPool):  # pragma: no cover
+        return None
+    return executor
+
+
+class YamlDecodePool:
+    """Decode YAML documents in forked worker processes with marshal hand-back."""
+
+    def __init__(self, executor: Executor) -> None:
+        """Wrap started worker processes."""
+        self._executor: Executor | None = executor
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, yaml_file_count: int) -> YamlDecodePool | None:
+        """Return a started pool, or ``None`` when decoding should stay in-process."""
+        executor = start_fork_process_pool(yaml_file_count, YAML_PROCESS_POOL_MIN_FILES)
+        return None if executor is None else cls(executor)
+
+    def load_yaml(self, text: str) -> YamlValue:
+        """Decode one YAML document, falling back to in-process decoding."""
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            try:
+                if (data := executor.submit(_decode_yaml_to_marshal, text).result()) is not None:
+                    return marshal.loads(data)  # noqa: S302
+            except (BrokenProcessPool, RuntimeError):  # pragma: no cover
+                self.shutdown()
+        return load_yaml(text)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_read_ahead(
+    items: Iterable[_Item],
+    load: Callable[[_Item], _Result],
+    *,
+    max_workers: int | None = None,
+) -> Iterator[_Result]:
+    """Run ``load`` for each item on a thread pool and yield the results in input order.
+
+    At most ``_READ_AHEAD_WINDOW`` items are in flight, so memory stays bounded and an
+    early stop by the consumer cancels the remaining work.
+    """
+    workers = max_workers or min(_MAX_THREAD_WORKERS, (os.cpu_count() or 1) + 4)
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datamodel-codegen-read-ahead") as executor:
+        pending: deque[Future[_Result]] = deque(
+            executor.submit(load, item) for item in islice(iterator, _READ_AHEAD_WINDOW)
+        )
+        try:
+            while pending:
+                future = pending.popleft()
+                for item in islice(iterator, 1):
+                    pending.append(executor.submit(load, item))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _preload_text(path: Path, encoding: str) -> PreloadedSource:
+    try:
+        return PreloadedSource(resolved_path=path, text=path.read_text(encoding=encoding))
+    except Exception as exc:  # noqa: BLE001
+        return PreloadedSource(resolved_path=path, error=exc)
+
+
+def _preload_data(path: Path, encoding: str, yaml_pool: YamlDecodePool | None, *, decode: bool) -> PreloadedSource:
+    resolved_path = path
+    try:
+        resolved_path = path.resolve()
+        data = resolved_path.read_bytes()
+        if not decode or any(value in data.decode(encoding) for value in _YAML_DEPRECATED_BOOL_VALUES):
+            # Deprecated YAML bool warnings are left to the parser thread so they surface as before.
+            return PreloadedSource(resolved_path=resolved_path, data=data)
+        load_yaml_text = load_yaml if yaml_pool is None else yaml_pool.load_yaml
+        raw_data = _load_parser_source_data_from_bytes(resolved_path, data, encoding, load_yaml_text=load_yaml_text)
+    except Exception as exc:  # noqa: BLE001
+        return PreloadedSource(resolved_path=resolved_path, error=exc)
+    return PreloadedSource(resolved_path=resolved_path, data=data, raw_data=raw_data, decoded=True)
+
+
+def iter_preloaded_sources(
+    paths: Sequence[Path],
+    encoding: str,
+    *,
+    as_text: bool,
+    decode: bool,
+) -> Iterator[PreloadedSource]:
+    """Read (and optionally decode) ``paths`` concurrently, yielding them in order.
+
+    ``as_text`` reads files like ``Path.read_text``; otherwise raw bytes are read so the
+    caller can build decoded sources. ``decode`` additionally parses JSON/YAML in the
+    workers. Exceptions are captured and returned for the caller to re-raise in order.
+    """
+    if as_text:
+        yield from iter_read_ahead(paths, lambda path: _preload_text(path, encoding))
+        return
+    yaml_pool = YamlDecodePool.create(sum(path.suffix.lower() in _YAML_SUFFIXES for path in paths)) if decode else None
+    try:
+        yield from iter_read_ahead(paths, lambda path: _preload_data(path, encoding, yaml_pool, decode=decode))
+    finally:
+        if yaml_pool is not None:
+            yaml_pool.shutdown()
+
+
+__all__ = [
+    "READ_AHEAD_MIN_FILES",
+    "YAML_PROCESS_POOL_MIN_FILES",
+    "PreloadedSource",
+    "YamlDecodePool",
+    "iter_preloaded_sources",
+    "iter_read_ahead",
+    "start_fork_process_pool",
+]
@@ -0,0 +1,129 @@
+"""Compact storage for XML Schema global declarations.
+
+A global declaration is kept as its marshalled subtree plus the in-scope namespace
+maps of its elements, so the element tree of the document it came from can be
+released once the document has been collected. The subtree is parsed again when the
+converter reads the declaration, and only a bounded number of recently read
+subtrees stay parsed.
+"""
+
+from __future__ import annotations
+
+import marshal
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, NamedTuple, cast
+from weakref import WeakKeyDictionary
+from xml.etree import ElementTree as ET  # noqa: S405
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+QNameKey = tuple[str | None, str]
+# tag, attributes, text, tail and children of one element.
+_Node = tuple[str, dict[str, str] | None, str | None, str | None, tuple["_Node", ...]]
+
+XSD_DECLARATION_CACHE_SIZE = 1024
+"""Most declaration subtrees kept parsed at once; older ones are parsed again when read."""
+
+
+class _DeclarationRecord(NamedTuple):
+    """Marshalled subtree of a global declaration and the namespace maps of its elements."""
+
+    text: bytes
+    namespaces: tuple[tuple[int, dict[str, str]], ...]
+
+
+class _DeclarationElement(ET.Element):
+    """Element of a declaration subtree read back from its record, carrying its in-scope namespaces."""
+
+    __slots__ = ("namespaces",)
+
+    namespaces: dict[str, str]
+
+
+def _encode(element: ET.Element) -> _Node:
+    return element.tag, element.attrib or None, element.text, element.tail, tuple(_encode(child) for child in element)
+
+
+def _decode(node: _Node) -> _DeclarationElement:
+    tag, attrib, text, tail, children = node
+    element = _DeclarationElement(tag, attrib or {})
+    element.text = text
+    element.tail = tail
+    element.extend([_decode(child) for child in children])
+    return element
+
+
+class _DeclarationStore:
+    """Compact declaration subtrees and parse them back on demand through a bounded cache."""
+
+    def __init__(self, cache_size: int | None = None) -> None:
+        self.cache_size = XSD_DECLARATION_CACHE_SIZE if cache_size is None else cache_size
+        # Entries keep their record alive, so its id is not reused while it is cached.
+        self._cache: OrderedDict[int, tuple[_DeclarationRecord, _DeclarationElement]] = OrderedDict()
+
+    @staticmethod
+    def compact(element: ET.Element, namespaces_for: Callable[[ET.Element], dict[str, str]]) -> _DeclarationRecord:
+        """Return a record of ``element``; namespace maps are stored once per run of elements sharing them."""
+        namespaces: list[tuple[int, dict[str, str]]] = []
+        for index, node in enumerate(element.iter()):
+            node_namespaces = namespaces_for(node)
+            if not namespaces or namespaces[-1][1] != node_namespaces:
+                namespaces.append((index, node_namespaces))
+        return _DeclarationRecord(marshal.dumps(_encode(element)), tuple(namespaces))
+
+    def materialize(self, record: _DeclarationRecord) -> _DeclarationElement:
+        """Return the parsed subtree of ``record``, parsing it again if it is no longer cached."""
+        record_id = id(record)
+        if (cached := self._cache.get(record_id)) is not None:
+            self._cache.move_to_end(record_id)
+            return cached[1]
+        element = _decode(marshal.loads(record.text))  # noqa: S302
+        starts = dict(record.namespaces)
+        namespaces = record.namespaces[0][1]
+        for index, node in enumerate(element.iter()):
+            namespaces = starts.get(index, namespaces)
+            cast("_DeclarationElement", node).namespaces = namespaces
+        self._cache[record_id] = (record, element)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return element
+
+
+class _DeclarationRegistry(Mapping[QNameKey, ET.Element]):
+    """Global declarations of one kind by qualified name, read back from compact records."""
+
+    def __init__(self, store: _DeclarationStore) -> None:
+        self._store = store
+        self._records: dict[QNameKey, _DeclarationRecord] = {}
+        self._keys: WeakKeyDictionary[ET.Element, QNameKey] = WeakKeyDictionary()
+
+    def __getitem__(self, key: QNameKey) -> ET.Element:
+        element = self._store.materialize(self._records[key])
+        self._keys[element] = key
+        return element
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._records
+
+    def __iter__(self) -> Iterator[QNameKey]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, key: QNameKey) -> _DeclarationRecord:
+        """Return the stored record of ``key`` without parsing it."""
+        return self._records[key]
+
+    def declare(self, key: QNameKey, record: _DeclarationRecord, *, replace: bool = False) -> None:
+        """Store ``record`` under ``key``; an earlier declaration wins unless ``replace`` is set."""
+        if replace:
+            self._records[key] = record
+        else:
+            self._records.setdefault(key, record)
+
+    def key_for(self, declaration: ET.Element) -> QNameKey | None:
+        """Return the key ``declaration`` was read through, or ``None`` if it was not read from here."""
+        return self._keys.get(declaration)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from typing import cast
 from xml.etree import ElementTree as ET  # noqa: S405
 
 XML_SCHEMA_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
 XML_SCHEMA_TAG = f"{{{XML_SCHEMA_NAMESPACE}}}schema"
+_XML_FEED_CHARS = 1 << 14
 
 
 def is_xml_schema_text(text: str) -> bool:
@@ -17,4 +19,19 @@ def is_xml_schema_text(text: str) -> bool:
     return root.tag == XML_SCHEMA_TAG
 
 
-__all__ = ["XML_SCHEMA_NAMESPACE", "XML_SCHEMA_TAG", "is_xml_schema_text"]
+def xml_root_tag(text: str) -> str | None:
+    """Return the qualified tag of the root element, reading only as far as its start tag."""
+    parser = ET.XMLPullParser(events=("start",))
+    try:
+        for start in range(0, len(text), _XML_FEED_CHARS):
+            parser.feed(text[start : start + _XML_FEED_CHARS])
+            for event in parser.read_events():
+                _name, element = cast("tuple[str, object]", event)
+                if isinstance(element, ET.Element):
+                    return element.tag
+    except ET.ParseError:
+        return None
+    return None
+
+
+__all__ = ["XML_SCHEMA_NAMESPACE", "XML_SCHEMA_TAG", "is_xml_schema_text", "xml_root_tag"]
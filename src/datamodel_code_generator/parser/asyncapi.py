@@ -115,6 +115,18 @@ class AsyncAPISchema:
     parse_as_file: bool = False
 
 
+@dataclass(frozen=True)
+class _RefExpansion:
+    """Schemas found under a ref target, with the nested refs that shaped them."""
+
+    schemas: list[AsyncAPISchema]
+    followed_paths: frozenset[tuple[str, ...]]
+    skipped_paths: frozenset[tuple[str, ...]]
+
+    def is_valid_for(self, seen_paths: set[tuple[str, ...]]) -> bool:
+        return self.skipped_paths <= seen_paths and self.followed_paths.isdisjoint(seen_paths)
+
+
 class MultiFormatSchemaObject(BaseModel):
     """AsyncAPI Multi Format Schema Object fields used by the parser."""
 
@@ -241,6 +253,9 @@ class AsyncAPIParser(OpenAPIParser):
     ) -> None:
         """Initialize the AsyncAPI parser."""
         super().__init__(source=source, config=config, **options)  # ty: ignore[invalid-argument-type]
+        self._asyncapi_ref_cache: dict[tuple[Any, ...], AsyncAPIResolvedRef] = {}
+        self._asyncapi_ref_schema_cache: dict[tuple[Any, ...], _RefExpansion] = {}
+        self._asyncapi_ref_traces: list[tuple[set[tuple[str, ...]], set[tuple[str, ...]]]] = []
 
     @property
     def schema_features(self) -> OpenAPISchemaFeatures:
@@ -423,7 +438,46 @@ class AsyncAPIParser(OpenAPIParser):
         if not isinstance(value, dict) or not isinstance(ref := value.get("$ref"), str):
             return None
         resolved = self._resolve_asyncapi_ref(ref)
-        return None if tuple(resolved.path) in seen_paths else resolved
+        resolved_path = tuple(resolved.path)
+        is_seen = resolved_path in seen_paths
+        if self._asyncapi_ref_traces:
+            followed_paths, skipped_paths = self._asyncapi_ref_traces[-1]
+            (skipped_paths if is_seen else followed_paths).add(resolved_path)
+        return None if is_seen else resolved
+
+    def _expand_resolved_ref(
+        self,
+        resolved: AsyncAPIResolvedRef,
+        seen_paths: set[tuple[str, ...]],
+        expand: Callable[..., list[AsyncAPISchema]],
+        *args: Any,
+    ) -> list[AsyncAPISchema]:
+        """Expand a resolved ref target with ``expand``, reusing earlier expansions of the same target.
+
+        A message or trait shared by many channels and operations yields the same
+        schemas every time it is reached with the same names, so it is walked and
+        converted once per parser run. ``seen_paths`` only matters for the nested
+        refs an expansion followed or skipped as cycles, so a cached expansion is
+        reused whenever the caller's ref chain treats those refs the same way.
+        """
+        resolved_path = tuple(resolved.path)
+        target_seen_paths = seen_paths | {resolved_path}
+        key = (expand, resolved_path, args)
+        expansion = self._asyncapi_ref_schema_cache.get(key)
+        if expansion is None or not expansion.is_valid_for(target_seen_paths):
+            self._asyncapi_ref_traces.append((set(), set()))
+            try:
+                with self._asyncapi_context(resolved.context):
+                    schemas = expand(resolved.value, *args, resolved.path, target_seen_paths)
+            finally:
+                followed_paths, skipped_paths = self._asyncapi_ref_traces.pop()
+            expansion = _RefExpansion(schemas, frozenset(followed_paths), frozenset(skipped_paths))
+            self._asyncapi_ref_schema_cache[key] = expansion
+        if self._asyncapi_ref_traces:
+            followed_paths, skipped_paths = self._asyncapi_ref_traces[-1]
+            followed_paths.update(expansion.followed_paths)
+            skipped_paths.update(expansion.skipped_paths)
+        return list(expansion.schemas)
 
     def _recurse_into_ref(
         self,
@@ -439,16 +493,26 @@ class AsyncAPIParser(OpenAPIParser):
             return None
         resolved_path = resolved.path
         ref_name = resolved_path[-1] if resolved_path else name
-        with self._asyncapi_context(resolved.context):
-            return recurse(
-                resolved.value,
-                _make_model_name(ref_name) if rename else name,
-                resolved_path,
-                seen_paths | {tuple(resolved_path)},
-            )
+        return self._expand_resolved_ref(resolved, seen_paths, recurse, _make_model_name(ref_name) if rename else name)
 
     def _resolve_asyncapi_ref(self, ref: str) -> AsyncAPIResolvedRef:
-        """Resolve an AsyncAPI Reference Object to raw data and a parser path."""
+        """Resolve an AsyncAPI Reference Object to raw data and a parser path.
+
+        Resolutions are memoized per ref and document context, so the parser
+        indexes each component ref once however many places use it.
+        """
+        key = (
+            ref,
+            id(self.raw_obj),
+            tuple(self.model_resolver.current_root),
+            self.model_resolver.current_base_path,
+            self.model_resolver.base_url,
+        )
+        if (resolved := self._asyncapi_ref_cache.get(key)) is None:
+            resolved = self._asyncapi_ref_cache[key] = self._resolve_asyncapi_ref_uncached(ref)
+        return AsyncAPIResolvedRef(resolved.value, list(resolved.path), resolved.context)
+
+    def _resolve_asyncapi_ref_uncached(self, ref: str) -> AsyncAPIResolvedRef:
         resolved_ref = self.model_resolver.resolve_ref(ref)
         file_part, fragment = ([*resolved_ref.split("#", 1), ""])[:2]
         raw_doc = self._get_ref_body(file_part) if file_part else self.raw_obj
@@ -567,15 +631,11 @@ class AsyncAPIParser(OpenAPIParser):
             binding_path = [*path, protocol_name]
             binding_name = _make_model_name(name, protocol_name)
             if resolved := self._resolve_ref_object(binding, seen_paths):
-                with self._asyncapi_context(resolved.context):
-                    schemas.extend(
-                        self._iter_binding_schemas(
-                            {protocol_name: resolved.value},
-                            name,
-                            resolved.path,
-                            seen_paths | {tuple(resolved.path)},
-                        )
+                schemas.extend(
+                    self._expand_resolved_ref(
+                        resolved, seen_paths, self._iter_protocol_binding_schemas, protocol_name, name
                     )
+                )
                 continue
             if not isinstance(binding, dict):
                 continue
@@ -591,6 +651,16 @@ class AsyncAPIParser(OpenAPIParser):
                 )
         return schemas
 
+    def _iter_protocol_binding_schemas(
+        self,
+        binding: Any,
+        protocol_name: str,
+        name: str,
+        path: list[str],
+        seen_paths: set[tuple[str, ...]],
+    ) -> list[AsyncAPISchema]:
+        return self._iter_binding_schemas({protocol_name: binding}, name, path, seen_paths)
+
     def _iter_parameter_schemas(
         self,
         parameter: Any,
@@ -623,16 +693,11 @@ class AsyncAPIParser(OpenAPIParser):
         schemas: list[AsyncAPISchema] = []
         for trait, trait_path in _iter_trait_items(traits, path):
             if resolved := self._resolve_ref_object(trait, seen_paths):
-                with self._asyncapi_context(resolved.context):
-                    schemas.extend(
-                        self._iter_message_trait_schemas(
-                            resolved.value,
-                            headers_name,
-                            binding_name,
-                            resolved.path,
-                            seen_paths | {tuple(resolved.path)},
-                        )
+                schemas.extend(
+                    self._expand_resolved_ref(
+                        resolved, seen_paths, self._iter_message_trait_schemas, headers_name, binding_name
                     )
+                )
                 continue
             if "headers" in trait and headers_name is not None:
                 if any(schema.name == headers_name for schema in schemas):
@@ -667,15 +732,9 @@ class AsyncAPIParser(OpenAPIParser):
         schemas: list[AsyncAPISchema] = []
         for trait, trait_path in _iter_trait_items(traits, path):
             if resolved := self._resolve_ref_object(trait, seen_paths):
-                with self._asyncapi_context(resolved.context):
-                    schemas.extend(
-                        self._iter_operation_trait_schemas(
-                            resolved.value,
-                            name,
-                            resolved.path,
-                            seen_paths | {tuple(resolved.path)},
-                        )
-                    )
+                schemas.extend(
+                    self._expand_resolved_ref(resolved, seen_paths, self._iter_operation_trait_schemas, name)
+                )
                 continue
             if "bindings" not in trait:
                 continue
@@ -997,4 +1056,7 @@ class AsyncAPIParser(OpenAPIParser):
             self._resolve_asyncapi_unparsed_json_pointer(context_sources)
             self._generate_forced_base_models()
         finally:
+            self._asyncapi_ref_cache.clear()
+            self._asyncapi_ref_schema_cache.clear()
+            self._asyncapi_ref_traces.clear()
             self._reset_local_source_cache()
@@ -6,34 +6,44 @@ JSON Schema parser while preserving Avro named type and logical type semantics.
 
 from __future__ import annotations
 
+import json
 import re
+from hashlib import sha256
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, cast
 
 from typing_extensions import Unpack
 
-from datamodel_code_generator import Error, YamlValue, load_yaml
+from datamodel_code_generator import Error, YamlValue, _load_json_or_yaml, load_json
 from datamodel_code_generator.parser import _avro_detection
 from datamodel_code_generator.parser._avro_detection import (
+    COMPLEX_TYPES,
+    JSON_LINES_SUFFIXES,
     NAMED_TYPES,
     PRIMITIVE_TYPES,
+    is_schema_registry_record,
 )
 from datamodel_code_generator.parser._avro_detection import (
     is_avro_schema_data as _is_avro_schema_data,
 )
 from datamodel_code_generator.parser._convert_common import _copy_schema, _namespace_name, _unique_name
+from datamodel_code_generator.parser.base import Source
 from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+from datamodel_code_generator.util import get_yaml_parse_errors, record_watch_dependency
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
     from urllib.parse import ParseResult
 
     from datamodel_code_generator._types import AvroParserConfigDict
     from datamodel_code_generator.config import AvroParserConfig
-    from datamodel_code_generator.parser.base import Source
+    from datamodel_code_generator.parser._read_ahead import PreloadedSource
 
 JsonSchema = dict[str, Any]
 
 NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_CANONICAL_JSON = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_NORMALIZED_JSON = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode
 
 STRING_SCHEMA: JsonSchema = {"type": "string"}
 NULL_SCHEMA: JsonSchema = {"type": "null"}
@@ -67,6 +77,47 @@ def __getattr__(name: str) -> Any:
     raise AttributeError(name)
 
 
+def _iter_json_line_schemas(lines: Iterable[str]) -> Iterator[YamlValue]:
+    """Yield the Avro schemas of a JSON-lines schema dump one line at a time.
+
+    Lines may hold a bare Avro schema or a schema registry subject version whose
+    ``schema`` member is the Avro schema, usually as an embedded JSON string.
+    Registry records for other schema types are skipped.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not (text := line.strip().removeprefix("\ufeff")):
+            continue
+        try:
+            schema = load_json(text)
+            if is_schema_registry_record(schema):
+                schema = _registry_record_schema(schema)
+        except ValueError as exc:
+            msg = f"Invalid JSON in Avro schema stream at line {line_number}: {exc}"
+            raise Error(msg) from exc
+        if schema is not None:
+            yield schema
+
+
+def _registry_record_schema(data: YamlValue) -> YamlValue:
+    """Return the Avro schema wrapped by a schema registry record, or ``None`` for other schema types."""
+    record = cast("dict[str, YamlValue]", data)
+    if record.get("schemaType", "AVRO") != "AVRO":
+        return None
+    return load_json(record["schema"]) if isinstance(record["schema"], str) else record["schema"]
+
+
+class _AvroSchemaLines:
+    """A JSON-lines Avro schema dump that is read lazily when converted."""
+
+    def __init__(self, path: Path, encoding: str) -> None:
+        self.path = path
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[YamlValue]:
+        with self.path.open(encoding=self.encoding) as file:
+            yield from _iter_json_line_schemas(file)
+
+
 class _Name(NamedTuple):
     fullname: str
     namespace: str | None
@@ -89,6 +140,64 @@ def _is_valid_namespace(namespace: str) -> bool:
     return not namespace or _is_valid_fullname(namespace)
 
 
+def _make_name(name: str, namespace: Any, enclosing_namespace: str | None) -> _Name:
+    if "." in name:
+        fullname = name
+        resolved_namespace = name.rsplit(".", maxsplit=1)[0]
+    else:
+        resolved_namespace = namespace if isinstance(namespace, str) else enclosing_namespace
+        fullname = f"{resolved_namespace}.{name}" if resolved_namespace else name
+    return _Name(fullname=fullname, namespace=resolved_namespace, name=name)
+
+
+def _parsing_canonical_form(schema: YamlValue, namespace: str | None = None) -> str:
+    """Return the Avro Parsing Canonical Form of ``schema``.
+
+    Attributes irrelevant to reading data (``doc``, ``aliases``, defaults, logical
+    types) are dropped and names are expanded to fullnames, so two schemas have
+    the same canonical form exactly when Avro considers them the same schema.
+    Malformed schemas still get a stable form; conversion reports their errors.
+    """
+    match schema:
+        case str() as name if name not in PRIMITIVE_TYPES:
+            return _CANONICAL_JSON(_make_name(name, None, namespace).fullname)
+        case [*_] as union:
+            return f"[{','.join(_parsing_canonical_form(item, namespace) for item in union)}]"
+        case dict():
+            pass
+        case _:
+            return _CANONICAL_JSON(schema)
+
+    type_name = schema.get("type")
+    if not isinstance(type_name, str) or type_name not in COMPLEX_TYPES:
+        return _parsing_canonical_form(type_name, namespace)
+    parts: list[str] = []
+    if type_name in NAMED_TYPES and isinstance(name := schema.get("name"), str):
+        name_info = _make_name(name, schema.get("namespace"), namespace)
+        namespace = name_info.namespace
+        parts.append(f'"name":{_CANONICAL_JSON(name_info.fullname)}')
+    parts.append(f'"type":"{type_name}"')
+    match type_name:
+        case "record":
+            fields = schema.get("fields")
+            canonical_fields = [
+                f'{{"name":{_CANONICAL_JSON(field.get("name"))},'
+                f'"type":{_parsing_canonical_form(field.get("type"), namespace)}}}'
+                for field in (fields if isinstance(fields, list) else [])
+                if isinstance(field, dict)
+            ]
+            parts.append(f'"fields":[{",".join(canonical_fields)}]')
+        case "enum":
+            parts.append(f'"symbols":{_CANONICAL_JSON(schema.get("symbols"))}')
+        case "array":
+            parts.append(f'"items":{_parsing_canonical_form(schema.get("items"), namespace)}')
+        case "map":
+            parts.append(f'"values":{_parsing_canonical_form(schema.get("values"), namespace)}')
+        case "fixed":
+            parts.append(f'"size":{_CANONICAL_JSON(schema.get("size"))}')
+    return f"{{{','.join(parts)}}}"
+
+
 class _AvroSchemaConverter:
     def __init__(self) -> None:
         self.named_schemas: dict[str, JsonSchema] = {}
@@ -100,17 +209,85 @@ class _AvroSchemaConverter:
     def convert_raw(self, raw_obj: YamlValue) -> dict[str, YamlValue]:
         self._collect_named_schemas(raw_obj)
         self._prepare_definition_names()
-        schema = self._convert_schema(raw_obj, namespace=None, root=True)
+        return self._finish_schema(self._convert_schema(raw_obj, namespace=None, root=True))
+
+    def convert_stream(self, schemas: Iterable[YamlValue]) -> dict[str, YamlValue]:
+        """Convert a stream of Avro schemas, such as a schema registry dump, into one schema.
+
+        Schemas that were already seen are skipped before their names are
+        collected. The fingerprint covers the whole key-sorted schema rather than
+        its Parsing Canonical Form, which drops attributes such as ``logicalType``,
+        ``default`` and ``doc`` that change the generated models. A named type
+        redefined differently by a later schema replaces the earlier definition,
+        so a dump of subject versions generates its latest versions. Only the
+        latest raw schema per name and a fingerprint per distinct schema are kept
+        while the stream is consumed. The root is the union of every distinct
+        top-level schema.
+        """
+        seen_fingerprints: set[bytes] = set()
+        roots: dict[str, YamlValue] = {}
+        for schema in schemas:
+            fingerprint = sha256(_NORMALIZED_JSON(schema).encode()).digest()
+            if fingerprint in seen_fingerprints:
+                continue
+            seen_fingerprints.add(fingerprint)
+            document = _AvroSchemaConverter()
+            document._collect_named_schemas(schema)
+            self.named_schemas.update(document.named_schemas)
+            self.names.update(document.names)
+            for root in schema if isinstance(schema, list) else [schema]:
+                match root:
+                    case {"type": str() as type_name, "name": str() as name} if type_name in NAMED_TYPES:
+                        fullname = _make_name(name, root.get("namespace"), None).fullname
+                        roots[fullname] = fullname
+                    case _:
+                        roots[_parsing_canonical_form(root)] = root
+        if not roots:
+            msg = "Avro schema stream does not contain any schemas"
+            raise Error(msg)
+
+        self._prepare_definition_names()
+        match list(roots.values()):
+            case [str() as fullname] if fullname in self.named_schemas:
+                schema = self._build_definition(fullname, as_root=True)
+            case [root]:
+                schema = self._convert_schema(root, namespace=None, root=True)
+            case root_schemas:
+                schema = {"anyOf": [self._convert_schema(root, namespace=None) for root in root_schemas]}
+        return self._finish_schema(schema)
+
+    def convert(self, source: Source) -> dict[str, YamlValue]:
+        match source.raw_data:
+            case _AvroSchemaLines() as schema_lines:
+                return self.convert_stream(schema_lines)
+            case None:
+                pass
+            case raw_obj:
+                return self.convert_raw(raw_obj)
+        if source.path.suffix.lower() in JSON_LINES_SUFFIXES:
+            return self.convert_stream(_iter_json_line_schemas(source.text.splitlines()))
+        try:
+            raw_obj = _load_json_or_yaml(source.text)
+        except get_yaml_parse_errors():
+            if not _avro_detection.is_avro_json_lines_text(source.text):
+                raise
+            return self.convert_stream(_iter_json_line_schemas(source.text.splitlines()))
+        if is_schema_registry_record(raw_obj):
+            try:
+                schema = _registry_record_schema(raw_obj)
+            except ValueError as exc:
+                msg = f"Invalid JSON in Avro schema registry record: {exc}"
+                raise Error(msg) from exc
+            return self.convert_stream([] if schema is None else [schema])
+        return self.convert_raw(raw_obj)
+
+    def _finish_schema(self, schema: JsonSchema) -> dict[str, YamlValue]:
         schema.setdefault("title", "Model")
         if self.definitions:
             schema["definitions"] = self.definitions
         schema.setdefault("$schema", "http://json-schema.org/draft-07/schema#")
         return cast("dict[str, YamlValue]", schema)
 
-    def convert(self, source: Source) -> dict[str, YamlValue]:
-        raw_obj = source.raw_data if source.raw_data is not None else load_yaml(source.text)
-        return self.convert_raw(raw_obj)
-
     def _collect_named_schemas(self, schema: YamlValue, namespace: str | None = None) -> None:
         match schema:
             case [*_] as union:
@@ -155,7 +332,7 @@ class _AvroSchemaConverter:
         if "." not in name and isinstance(namespace_value, str) and not _is_valid_namespace(namespace_value):
             msg = f"Invalid Avro namespace: {namespace_value}"
             raise Error(msg)
-        name_info = self._make_name(name, schema.get("namespace"), namespace)
+        name_info = _make_name(name, schema.get("namespace"), namespace)
         if (existing := self.named_schemas.get(name_info.fullname)) is not None and existing is not schema:
             msg = f"Duplicate Avro named type: {name_info.fullname}"
             raise Error(msg)
@@ -465,20 +642,11 @@ class _AvroSchemaConverter:
             converted["x-avro-scale"] = source["scale"]
         return converted
 
-    def _fullname_from_named_schema(self, schema: JsonSchema, namespace: str | None) -> str:
+    @staticmethod
+    def _fullname_from_named_schema(schema: JsonSchema, namespace: str | None) -> str:
         name = schema.get("name")
         assert isinstance(name, str)
-        return self._make_name(name, schema.get("namespace"), namespace).fullname
-
-    @staticmethod
-    def _make_name(name: str, namespace: Any, enclosing_namespace: str | None) -> _Name:
-        if "." in name:
-            fullname = name
-            resolved_namespace = name.rsplit(".", maxsplit=1)[0]
-        else:
-            resolved_namespace = namespace if isinstance(namespace, str) else enclosing_namespace
-            fullname = f"{resolved_namespace}.{name}" if resolved_namespace else name
-        return _Name(fullname=fullname, namespace=resolved_namespace, name=name)
+        return _make_name(name, schema.get("namespace"), namespace).fullname
 
     def _resolve_fullname(self, name: str, namespace: str | None) -> str:
         if name in self.named_schemas:
@@ -515,6 +683,13 @@ class AvroParser(JsonSchemaParser):
         """Initialize the Avro parser with JSON Schema parser configuration."""
         super().__init__(source=source, config=config, **options)
 
+    def _source_from_path(self, path: Path, preloaded: PreloadedSource | None = None) -> Source:
+        """Defer reading JSON-lines schema dumps so they are streamed during conversion."""
+        if path.suffix.lower() not in JSON_LINES_SUFFIXES or not path.is_file():
+            return super()._source_from_path(path, preloaded)
+        record_watch_dependency(path)
+        return Source(path=path.relative_to(self.base_path), raw_data=_AvroSchemaLines(path, self.encoding))
+
     def parse_raw(self) -> None:
         """Parse all Avro schema input sources into data models."""
         self._parse_converted_sources(_AvroSchemaConverter)
@@ -53,6 +53,7 @@ from datamodel_code_generator import (
     YamlValue,
     _internal_utils,
     _is_parsed_source_cache_enabled,
+    _load_parser_source_data_from_path_bytes,
     _read_parser_source_data_from_path,
 )
 from datamodel_code_generator._format_types import Formatter, PythonVersion
@@ -107,6 +108,8 @@ if TYPE_CHECKING:
         _ParserSimpleFieldData,
     )
     from datamodel_code_generator.model_metadata import GeneratedModelMetadata, ModelFieldMetadata, ModelMetadata
+    from datamodel_code_generator.parser._read_ahead import PreloadedSource
+    from datamodel_code_generator.ref_bundle import RemoteRefBundle
 
 
 # Preserve the existing parser.base export while sharing one canonical escape table.
@@ -1510,6 +1513,34 @@ class Source(BaseModel):
             raw_data=raw_data,
         )
 
+    @classmethod
+    def from_preloaded(
+        cls,
+        preloaded: PreloadedSource,
+        path: Path,
+        base_path: Path,
+        encoding: str,
+        *,
+        keep_text: bool = False,
+    ) -> Source:
+        """Create a Source from contents read ahead by a worker thread."""
+        if preloaded.text is not None:
+            record_watch_dependency(path)
+            return cls(path=path.relative_to(base_path), text=preloaded.text)
+        record_watch_dependency(preloaded.resolved_path)
+        preloaded.raise_error()
+        data = cast("bytes", preloaded.data)
+        raw_data = (
+            preloaded.raw_data
+            if preloaded.decoded
+            else _load_parser_source_data_from_path_bytes(preloaded.resolved_path, data, encoding)
+        )
+        return cls(
+            path=path.relative_to(base_path),
+            text=data.decode(encoding) if keep_text else "",
+            raw_data=raw_data,
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, YamlValue]) -> Source:
         """Create a Source from a dict."""
@@ -1858,6 +1889,9 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
     _config_class_name: ClassVar[str] = "ParserConfig"
     _cache_local_sources_during_parse: ClassVar[bool] = False
     _cache_parsed_sources_from_path: ClassVar[bool] = False
+    # Key paths of JSON containers whose entries are decoded on first access for very large inputs.
+    _lazy_json_paths: ClassVar[tuple[tuple[str, ...], ...]] = ()
+    _lazy_json_min_bytes: ClassVar[int] = 64 * 1024 * 1024
     _formatter_cwd: Path | None = None
     _http_fetch_session: _HTTPFetchSession | None = None
 
@@ -2198,8 +2232,12 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         self.http_query_parameters: Sequence[tuple[str, str]] | None = config.http_query_parameters
         self.http_ignore_tls: bool = config.http_ignore_tls
         self.http_timeout: float | None = config.http_timeout
+        self.cache_dir: Path | None = config.cache_dir
         remote_lock = getattr(config, "remote_lock", None)
         self._remote_response_observer = remote_lock.record_response if remote_lock is not None else None
+        self._remote_ref_bundle: RemoteRefBundle | None = getattr(config, "remote_ref_bundle", None)
+        if self._remote_ref_bundle is not None:
+            self._remote_response_observer = self._remote_ref_bundle.record_response
         self.use_annotated: bool = config.use_annotated
         if self.use_annotated and not self.field_constraints:  # pragma: no cover
             msg = "`use_annotated=True` has to be used with `field_constraints=True`"
@@ -2362,7 +2400,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             for source in cached_sources:
                 if source.raw_data is None:
                     yield Source(path=source.path, text=source.text)
-                else:  # pragma: no cover
+                else:
                     yield source.model_copy(deep=True)
             return
         yield from self._iter_source_uncached()
@@ -2375,14 +2413,13 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 yield Source.from_dict(self.source)
             case Path() as path:  # pragma: no cover
                 if path.is_dir():
-                    for p in sorted(path.rglob("*"), key=lambda p: p.name):
-                        if p.is_file():
-                            yield self._source_from_path(p)
+                    yield from self._iter_sources_from_paths([
+                        p for p in sorted(path.rglob("*"), key=lambda p: p.name) if p.is_file()
+                    ])
                 else:
                     yield self._source_from_path(path)
             case list() as paths:  # pragma: no cover
-                for path in paths:
-                    yield self._source_from_path(path)
+                yield from self._iter_sources_from_paths(paths)
             case _:
                 yield Source(
                     path=Path(self.source.path),
@@ -2391,8 +2428,32 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     ),
                 )
 
-    def _source_from_path(self, path: Path) -> Source:
+    def _iter_sources_from_paths(self, paths: Sequence[Path]) -> Iterator[Source]:
+        """Load multi-file inputs in order, reading and decoding ahead on worker threads."""
+        from datamodel_code_generator.parser._read_ahead import (  # noqa: PLC0415
+            READ_AHEAD_MIN_FILES,
+            iter_preloaded_sources,
+        )
+
+        if len(paths) < READ_AHEAD_MIN_FILES:
+            for path in paths:
+                yield self._source_from_path(path)
+            return
+        preloaded_sources = iter_preloaded_sources(
+            paths,
+            self.encoding,
+            as_text=not self._cache_parsed_sources_from_path,
+            decode=not self._use_parsed_source_cache,
+        )
+        for path, preloaded in zip(paths, preloaded_sources, strict=True):
+            yield self._source_from_path(path, preloaded)
+
+    def _source_from_path(self, path: Path, preloaded: PreloadedSource | None = None) -> Source:
         try:
+            if preloaded is not None:
+                return Source.from_preloaded(preloaded, path, self.base_path, self.encoding, keep_text=self.validation)
+            if (lazy_source := self._lazy_json_source_from_path(path)) is not None:
+                return lazy_source
             if self._use_parsed_source_cache:
                 return Source.from_cached_path(path, self.base_path, self.encoding, keep_text=self.validation)
             return Source.from_path(path, self.base_path, self.encoding)
@@ -2400,6 +2461,22 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             msg = f"File not found: {path}"
             raise Error(msg) from exc
 
+    def _lazy_json_source_from_path(self, path: Path) -> Source | None:
+        """Memory-map a very large JSON input and decode ``_lazy_json_paths`` entries on first access."""
+        if not self._lazy_json_paths or self.validation:
+            return None
+        resolved_path = path.resolve()
+        if resolved_path.stat().st_size < self._lazy_json_min_bytes:
+            return None
+        try:
+            from datamodel_code_generator._lazy_json import load_lazy_json_from_path  # noqa: PLC0415
+        except ImportError:  # pragma: no cover
+            return None
+        if (raw_data := load_lazy_json_from_path(resolved_path, self.encoding, self._lazy_json_paths)) is None:
+            return None
+        record_watch_dependency(resolved_path)
+        return Source(path=path.relative_to(self.base_path), raw_data=raw_data)
+
     def _source_path_for_diagnostics(self, source_path: Path | None = None) -> str:
         """Return source context without changing parser path semantics."""
         if source_path is not None and source_path.parts:
@@ -2440,8 +2517,18 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             return normalize(custom_base_path)
         return self.base_class or None
 
+    @property
+    def _serves_remote_refs_from_bundle(self) -> bool:
+        """Return whether HTTP(S) fetches are answered by a reference bundle instead of the network."""
+        return self._remote_ref_bundle is not None and not self._remote_ref_bundle.update
+
     def _get_text_from_url(self, url: str) -> str:
         def fetch(remote_url: str) -> str:
+            if self._serves_remote_refs_from_bundle:
+                assert self._remote_ref_bundle is not None
+                return self._remote_ref_bundle.get_text(
+                    remote_url, self.http_headers, self.http_query_parameters, self.encoding
+                )
             from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, _HTTPFetchSession  # noqa: PLC0415
 
             if (session := self._http_fetch_session) is None:
@@ -6,11 +6,14 @@ objects, interfaces, enums, scalars, inputs, and union types.
 
 from __future__ import annotations
 
+import json
 from functools import cached_property
+from itertools import starmap
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    cast,
 )
 
 from typing_extensions import Unpack
@@ -38,7 +41,6 @@ except ImportError as exc:  # pragma: no cover
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
     from pathlib import Path
     from urllib.parse import ParseResult
 
@@ -55,8 +57,30 @@ except AttributeError:
     graphql_resolver_kind = graphql.type.introspection.TypeFields.kind
 
 
-def build_graphql_schema(schema_str: str, *, source: str | None = None) -> graphql.GraphQLSchema:
-    """Build a graphql schema from a string."""
+def build_graphql_schema(
+    schema_str: str, *, source: str | None = None, cache_dir: Path | None = None
+) -> graphql.GraphQLSchema:
+    """Build a graphql schema from a string.
+
+    With ``cache_dir``, the validated schema is stored as its introspection result keyed
+    by the SDL digest, and later builds of the same SDL skip parsing and validation.
+    """
+    if cache_dir is None:
+        return _build_graphql_schema_from_sdl(schema_str, source=source)
+    from datamodel_code_generator._disk_cache import CacheKey, DiskCache  # noqa: PLC0415
+    from datamodel_code_generator.parser._graphql_introspection import introspect_schema  # noqa: PLC0415
+
+    cache = DiskCache(cache_dir, "graphql")
+    key = CacheKey("graphql").add(graphql.version, schema_str).hexdigest()
+    if isinstance(introspection := cache.get(key), dict):
+        # Stored from an already sorted schema, so the type map comes back in the same order.
+        return _build_client_schema(introspection, source=source)
+    schema = _build_graphql_schema_from_sdl(schema_str, source=source)
+    cache.set(key, introspect_schema(schema))
+    return schema
+
+
+def _build_graphql_schema_from_sdl(schema_str: str, *, source: str | None) -> graphql.GraphQLSchema:
     try:
         schema = graphql.build_schema(schema_str)
     except graphql.GraphQLSyntaxError as exc:
@@ -64,6 +88,47 @@ def build_graphql_schema(schema_str: str, *, source: str | None = None) -> graph
     return graphql.lexicographic_sort_schema(schema)
 
 
+def build_graphql_schema_from_introspection(
+    introspection: dict[str, Any], *, source: str | None = None
+) -> graphql.GraphQLSchema:
+    """Build a graphql schema from an introspection query result without re-validating SDL."""
+    return graphql.lexicographic_sort_schema(_build_client_schema(introspection, source=source))
+
+
+def _build_client_schema(introspection: dict[str, Any], *, source: str | None) -> graphql.GraphQLSchema:
+    try:
+        return graphql.build_client_schema(cast("graphql.IntrospectionQuery", introspection))
+    except (TypeError, graphql.GraphQLError) as exc:
+        raise InvalidFileFormatError(exc, InputFileType.GraphQL, source=source) from exc
+
+
+def load_graphql_introspection(text: str, *, source: str | None = None) -> dict[str, Any] | None:
+    """Return the introspection result in a JSON document, or ``None`` for SDL text.
+
+    Both the bare ``{"__schema": ...}`` form and a full ``{"data": {"__schema": ...}}``
+    query response are accepted.
+    """
+    if not text.lstrip().startswith("{"):
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError as exc:
+        raise InvalidFileFormatError(exc, InputFileType.GraphQL, source=source) from exc
+    if isinstance(data, dict) and isinstance(data.get("data"), dict):
+        data = data["data"]
+    if not isinstance(data, dict) or not isinstance(data.get("__schema"), dict):
+        msg = "JSON GraphQL input must be an introspection result with a '__schema' object"
+        raise InvalidFileFormatError(ValueError(msg), InputFileType.GraphQL, source=source)
+    return data
+
+
+def _sdl_text(text: str, source: str) -> str:
+    """Return SDL for one source, printing introspection results mixed with SDL files."""
+    if (introspection := load_graphql_introspection(text, source=source)) is None:
+        return text
+    return graphql.print_schema(build_graphql_schema_from_introspection(introspection, source=source))
+
+
 @snooper_to_methods()
 class GraphQLParser(Parser["GraphQLParserConfig", "JsonSchemaFeatures"]):
     """Parser for GraphQL schema files."""
@@ -302,47 +367,50 @@ class GraphQLParser(Parser["GraphQLParserConfig", "JsonSchemaFeatures"]):
         )
         self.generation_store.register_model(enum)
 
-    def parse_field(
-        self,
-        field_name: str,
-        alias: str | list[str] | None,
-        field: graphql.GraphQLField | graphql.GraphQLInputField,
-        original_field_name: str,
-        class_name: str | None = None,
-    ) -> DataModelFieldBase:
-        """Parse a GraphQL field and return a data model field."""
-        final_data_type = DataType(
-            is_optional=True,
-            use_union_operator=self.use_union_operator,
-            use_standard_collections=self.use_standard_collections,
-        )
-        data_type = final_data_type
-        obj = field.type
+    def _field_data_type(self, type_: graphql.GraphQLType) -> DataType:
+        """Build the data type for a field, innermost named type first.
 
+        Building bottom-up lets fresh data types register with their reference on
+        construction rather than through the generation store, whose reference updates
+        re-index every model parsed so far.
+        """
+        data_type_options = {
+            "use_union_operator": self.use_union_operator,
+            "use_standard_collections": self.use_standard_collections,
+        }
+        list_optionals: list[bool] = []
+        is_optional = True
+        obj = type_
         while graphql.is_list_type(obj) or graphql.is_non_null_type(obj):
             if graphql.is_list_type(obj):
-                data_type.is_list = True
-
-                new_data_type = DataType(
-                    is_optional=True,
-                    use_union_operator=self.use_union_operator,
-                    use_standard_collections=self.use_standard_collections,
-                )
-                data_type.data_types = [new_data_type]
-
-                data_type = new_data_type
+                list_optionals.append(is_optional)
+                is_optional = True
             elif graphql.is_non_null_type(obj):  # pragma: no cover
-                data_type.is_optional = False
+                is_optional = False
 
             obj = graphql.assert_wrapping_type(obj)
             obj = obj.of_type
 
         obj = graphql.assert_named_type(obj)
         if obj.name in self.references:
-            self.generation_store.replace_data_type_ref(data_type, self.references[obj.name])
+            data_type = DataType(reference=self.references[obj.name], is_optional=is_optional, **data_type_options)
         else:  # pragma: no cover
             # Only happens for Query and Mutation root types
-            data_type.type = obj.name
+            data_type = DataType(type=obj.name, is_optional=is_optional, **data_type_options)
+        for list_optional in reversed(list_optionals):
+            data_type = DataType(data_types=[data_type], is_list=True, is_optional=list_optional, **data_type_options)
+        return data_type
+
+    def parse_field(
+        self,
+        field_name: str,
+        alias: str | list[str] | None,
+        field: graphql.GraphQLField | graphql.GraphQLInputField,
+        original_field_name: str,
+        class_name: str | None = None,
+    ) -> DataModelFieldBase:
+        """Parse a GraphQL field and return a data model field."""
+        final_data_type = self._field_data_type(field.type)
 
         has_schema_default = self._has_schema_default(field)
         required = (
@@ -470,6 +538,18 @@ class GraphQLParser(Parser["GraphQLParserConfig", "JsonSchemaFeatures"]):
         )
         self.generation_store.register_model(data_model_type)
 
+    def _build_schema(self) -> graphql.GraphQLSchema:
+        """Build the schema from SDL sources, loading a lone introspection result directly."""
+        sources = [(source.text, self._source_path_for_diagnostics(source.path)) for source in self.iter_source]
+        source_label = ", ".join(path for _, path in sources if path != "<input>") or "<input>"
+        if len(sources) == 1 and (introspection := load_graphql_introspection(sources[0][0], source=source_label)):
+            return build_graphql_schema_from_introspection(introspection, source=source_label)
+        return build_graphql_schema(
+            "\n".join(starmap(_sdl_text, sources)),
+            source=source_label,
+            cache_dir=self.cache_dir,
+        )
+
     def parse_raw(self) -> None:
         """Parse the raw GraphQL schema and generate all data models."""
         self.all_graphql_objects = {}
@@ -494,19 +574,7 @@ class GraphQLParser(Parser["GraphQLParserConfig", "JsonSchemaFeatures"]):
             graphql.type.introspection.TypeKind.UNION: self.parse_union,
         }
 
-        source_paths: list[str] = []
-
-        def iter_source_texts() -> Iterator[str]:
-            for source in self.iter_source:
-                display_path = self._source_path_for_diagnostics(source.path)
-                if display_path != "<input>":
-                    source_paths.append(display_path)
-                yield source.text
-
-        schema: graphql.GraphQLSchema = build_graphql_schema(
-            "\n".join(iter_source_texts()),
-            source=", ".join(source_paths) or "<input>",
-        )
+        schema = self._build_schema()
         self.raw_obj = schema
 
         self._resolve_types([], schema)
@@ -117,6 +117,7 @@ if TYPE_CHECKING:
     from datamodel_code_generator._python_type_binding import BoundPythonType
     from datamodel_code_generator._types import JSONSchemaParserConfigDict
     from datamodel_code_generator.config import JSONSchemaParserConfig
+    from datamodel_code_generator.parser._read_ahead import PreloadedSource
     from datamodel_code_generator.parser.schema_version import JsonSchemaFeatures
 
 JsonSchemaLiteral = Union[bool, int, str]  # noqa: UP007
@@ -8790,7 +8791,9 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         """Get the body of a reference from URL or remote file."""
         if is_url(resolved_ref):
             url_scheme = urlparse(resolved_ref).scheme
-            uses_local_http_path = url_scheme in {"http", "https"} and self.http_local_ref_path is not None
+            uses_local_http_path = url_scheme in {"http", "https"} and (
+                self.http_local_ref_path is not None or self._serves_remote_refs_from_bundle
+            )
             if not uses_local_http_path:
                 if self.allow_remote_refs is False:
                     msg = (
@@ -9426,10 +9429,10 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             case list() as paths:
                 yield from ((self.base_path / path) for path in paths)
 
-    def _source_from_path(self, path: Path) -> Source:
+    def _source_from_path(self, path: Path, preloaded: PreloadedSource | None = None) -> Source:
         """Load one source path and contextualize cached JSON/YAML parse failures."""
         try:
-            return super()._source_from_path(path)
+            return super()._source_from_path(path, preloaded)
         except (json.JSONDecodeError, *get_yaml_parse_errors()) as exc:
             source_path = path.relative_to(self.base_path) if path.is_relative_to(self.base_path) else path
             raise InvalidFileFormatError(exc, self._input_file_type, source=source_path) from exc
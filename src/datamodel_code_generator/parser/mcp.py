@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import re
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from copy import deepcopy
+from hashlib import sha256
 from typing import Any, Literal, TypeAlias
 
 from pydantic import ConfigDict, Field, StrictStr, ValidationError
@@ -189,12 +191,14 @@ def _normalize_schema(
     schema: JSONSchemaMapping,
     definition_name: str,
     used_names: set[str],
+    enclosing_ref_map: Mapping[str, str] | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     schema_copy = dict(deepcopy(schema))
     root_definitions = [
         definitions for key in DEFINITION_KEYS if isinstance(definitions := schema_copy.get(key), Mapping)
     ]
-    ref_map: dict[str, str] = {}
+    # Hoisted definitions still refer to their siblings through the enclosing schema.
+    ref_map: dict[str, str] = dict(enclosing_ref_map or {})
     for definitions in root_definitions:
         for name in definitions:
             ref_map[str(name)] = _unique_definition_name(
@@ -207,7 +211,7 @@ def _normalize_schema(
         for name, inner_schema in definitions.items():
             if not isinstance(inner_schema, Mapping):
                 continue
-            normalized, nested = _normalize_schema(inner_schema, ref_map[str(name)], used_names)
+            normalized, nested = _normalize_schema(inner_schema, ref_map[str(name)], used_names, ref_map)
             hoisted_definitions.update(nested)
             hoisted_definitions[ref_map[str(name)]] = normalized
 
@@ -216,9 +220,48 @@ def _normalize_schema(
     return normalized_schema, hoisted_definitions
 
 
-def _add_tool_schema_definition(
+def _definition_digest(name: str, schema: JSONSchemaMapping) -> bytes:
+    body = {key: value for key, value in schema.items() if key != "title"}
+    text = json.dumps(body, separators=(",", ":"), default=str)
+    # Self references name the definition itself, so recursive helpers still compare equal.
+    text = text.replace(f'"#/$defs/{name}"', '"#/$defs/"').replace(f'"#/$defs/{name}/', '"#/$defs//')
+    return sha256(text.encode()).digest()
+
+
+def _merge_hoisted_definitions(
+    definitions: dict[str, Any],
+    hoisted_definitions: dict[str, Any],
+    canonical_names: dict[bytes, str],
+) -> dict[str, str]:
+    """Add hoisted definitions, reusing earlier ones with identical content.
+
+    Definitions whose body, ignoring the generated title, hashes like an earlier one are
+    dropped and references to them are rewritten. Repeating until nothing merges lets
+    parents whose only difference was a duplicate child collapse too. Returns the names
+    that were dropped, mapped to the definitions that replace them.
+    """
+    ref_map: dict[str, str] = {}
+    pending = hoisted_definitions
+    while True:
+        digests: dict[bytes, str] = {}
+        merged: dict[str, str] = {}
+        for name, schema in pending.items():
+            digest = _definition_digest(name, schema)
+            if (canonical := canonical_names.get(digest) or digests.setdefault(digest, name)) != name:
+                merged[name] = canonical
+        if not merged:
+            break
+        ref_map = {name: merged.get(target, target) for name, target in ref_map.items()} | merged
+        pending = {name: _rewrite_schema_refs(schema, merged) for name, schema in pending.items() if name not in merged}
+    canonical_names.update(digests)
+    definitions.update(pending)
+    return ref_map
+
+
+def _add_tool_schema_definition(  # noqa: PLR0913, PLR0917
     definitions: dict[str, Any],
     used_names: set[str],
+    canonical_names: dict[bytes, str],
     tool: MCPTool,
     schema_key: SchemaKey,
     suffix: str,
@@ -229,22 +272,28 @@ def _add_tool_schema_definition(
     definition_name = _unique_definition_name(f"{base_name} {suffix}", used_names)
     schema = tool.input_schema if schema_key == "inputSchema" else tool.output_schema
     normalized, hoisted_definitions = _normalize_schema(schema, definition_name, used_names)
-    definitions.update(hoisted_definitions)
+    if ref_map := _merge_hoisted_definitions(definitions, hoisted_definitions, canonical_names):
+        normalized = _rewrite_schema_refs(normalized, ref_map)
     definitions[definition_name] = normalized
 
 
-def convert_mcp_tools_to_jsonschema(data: Any) -> dict[str, Any]:
-    """Convert MCP tool definitions into a JSON Schema definitions document."""
-    tools = _extract_tools(data)
-    if not tools:
-        msg = "Invalid MCP tools document: no tool definitions were found"
-        raise Error(msg)
+def convert_mcp_tool_manifests_to_jsonschema(manifests: Iterable[Any]) -> dict[str, Any]:
+    """Convert a stream of MCP tool documents into one JSON Schema definitions document.
 
+    Each manifest accepts any shape ``convert_mcp_tools_to_jsonschema`` does and is
+    released once its tools are converted, so server catalogues can be read one
+    manifest at a time. Helper definitions with identical content are emitted once.
+    """
     definitions: dict[str, Any] = {}
     used_names: set[str] = set()
-    for tool in tools:
-        _add_tool_schema_definition(definitions, used_names, tool, "inputSchema", "Input")
-        _add_tool_schema_definition(definitions, used_names, tool, "outputSchema", "Output")
+    canonical_names: dict[bytes, str] = {}
+    for manifest in manifests:
+        for tool in _extract_tools(manifest):
+            _add_tool_schema_definition(definitions, used_names, canonical_names, tool, "inputSchema", "Input")
+            _add_tool_schema_definition(definitions, used_names, canonical_names, tool, "outputSchema", "Output")
+    if not definitions:
+        msg = "Invalid MCP tools document: no tool definitions were found"
+        raise Error(msg)
 
     return {
         "$schema": JSON_SCHEMA_DRAFT_2020_12,
@@ -252,3 +301,8 @@ def convert_mcp_tools_to_jsonschema(data: Any) -> dict[str, Any]:
         "properties": {},
         "$defs": definitions,
     }
+
+
+def convert_mcp_tools_to_jsonschema(data: Any) -> dict[str, Any]:
+    """Convert MCP tool definitions into a JSON Schema definitions document."""
+    return convert_mcp_tool_manifests_to_jsonschema((data,))
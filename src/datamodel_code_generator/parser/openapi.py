@@ -35,6 +35,7 @@ from datamodel_code_generator.parser.jsonschema import (
     JsonSchemaObject,
     JsonSchemaParser,
     get_model_by_path,
+    unescape_json_pointer_segment,
 )
 from datamodel_code_generator.reference import FieldNameResolver, is_url, snake_to_upper_camel
 from datamodel_code_generator.types import (
@@ -197,6 +198,56 @@ class ComponentsObject(BaseModel):
 
 
 _FIELD_NAME_RESOLVER = FieldNameResolver()
+_COMPONENTS_REF_PREFIX = "#/components/"
+
+
+def _matches_any_pattern(values: list[str], patterns: list[str] | None) -> bool:
+    return bool(patterns) and any(fnmatch.fnmatch(value, pattern) for value in values for pattern in patterns)
+
+
+def _collect_component_refs(
+    components: dict[str, Any],
+    roots: list[Any],
+    discriminator_subtypes: dict[str, list[str]],
+) -> dict[str, set[str]]:
+    """Return the names of the components reachable from ``roots`` through local refs, by section.
+
+    Discriminator mappings count as references, and a reached discriminator base
+    also reaches the schemas that extend it through ``allOf``.
+    """
+    reached: dict[str, set[str]] = defaultdict(set)
+    pending = list(roots)
+    while pending:
+        match pending.pop():
+            case dict() as value:
+                refs = [ref] if isinstance(ref := value.get("$ref"), str) else []
+                discriminator = value.get("discriminator")
+                if isinstance(discriminator, dict) and isinstance(mapping := discriminator.get("mapping"), dict):
+                    refs.extend(
+                        target if "/" in target else f"{_COMPONENTS_REF_PREFIX}schemas/{target}"
+                        for target in mapping.values()
+                        if isinstance(target, str)
+                    )
+                for ref in refs:
+                    if not ref.startswith(_COMPONENTS_REF_PREFIX):
+                        continue
+                    section, _, pointer = ref.removeprefix(_COMPONENTS_REF_PREFIX).partition("/")
+                    name = unescape_json_pointer_segment(pointer.partition("/")[0])
+                    if name in reached[section]:
+                        continue
+                    reached[section].add(name)
+                    section_components = components.get(section)
+                    if isinstance(section_components, dict) and name in section_components:
+                        pending.append(section_components[name])
+                    if section == "schemas":
+                        pending.extend(
+                            {"$ref": subtype_ref}
+                            for subtype_ref in discriminator_subtypes.get(f"{_COMPONENTS_REF_PREFIX}schemas/{name}", ())
+                        )
+                pending.extend(value.values())
+            case list() as items:
+                pending.extend(items)
+    return reached
 
 
 @snooper_to_methods()
@@ -204,6 +255,13 @@ class OpenAPIParser(JsonSchemaParser):
     """Parser for OpenAPI 2.0/3.0/3.1/3.2 and Swagger specifications."""
 
     SCHEMA_PATHS: ClassVar[list[str]] = ["#/components/schemas"]
+    _lazy_json_paths: ClassVar[tuple[tuple[str, ...], ...]] = (
+        ("components",),
+        ("components", "*"),
+        ("definitions",),
+        ("paths",),
+        ("webhooks",),
+    )
     _input_file_type: ClassVar[InputFileType] = InputFileType.OpenAPI
     _non_dict_source_is_invalid: ClassVar[bool] = True
     config: OpenAPIParserConfig
@@ -241,9 +299,23 @@ class OpenAPIParser(JsonSchemaParser):
         self.include_path_parameters: bool = self.config.include_path_parameters
         self.use_status_code_in_response_name: bool = self.config.use_status_code_in_response_name
         self.openapi_include_paths: list[str] | None = self.config.openapi_include_paths
+        self.openapi_include_tags: list[str] | None = self.config.openapi_include_tags
+        self.openapi_exclude_tags: list[str] | None = self.config.openapi_exclude_tags
+        self.openapi_include_operation_ids: list[str] | None = self.config.openapi_include_operation_ids
+        self.openapi_exclude_operation_ids: list[str] | None = self.config.openapi_exclude_operation_ids
+        self.has_operation_filters: bool = bool(
+            self.openapi_include_tags
+            or self.openapi_exclude_tags
+            or self.openapi_include_operation_ids
+            or self.openapi_exclude_operation_ids
+        )
         self.openapi_include_info_version: bool = self.config.openapi_include_info_version
         self.openapi_info_version: str | None = None
-        if self.openapi_include_paths and OpenAPIScope.Paths not in self.open_api_scopes:
+        if (
+            self.openapi_include_paths
+            and not self.has_operation_filters
+            and OpenAPIScope.Paths not in self.open_api_scopes
+        ):
             warn(
                 "--openapi-include-paths has no effect without --openapi-scopes paths",
                 stacklevel=2,
@@ -289,11 +361,12 @@ class OpenAPIParser(JsonSchemaParser):
                 "external files referenced from paths, consider using --openapi-scopes paths",
                 stacklevel=2,
             )
+        selected_components = self._selected_component_names(specification)
         if OpenAPIScope.Schemas in self.open_api_scopes:
-            for obj_name, raw_obj in schemas.items():
+            for obj_name in schemas if selected_components is None else selected_components["schemas"]:
                 self.parse_raw_obj(
                     obj_name,
-                    raw_obj,
+                    schemas[obj_name],
                     [*path_parts, "#/components", "schemas", obj_name],
                 )
         if OpenAPIScope.Paths in self.open_api_scopes:
@@ -319,7 +392,8 @@ class OpenAPIParser(JsonSchemaParser):
 
         if OpenAPIScope.RequestBodies in self.open_api_scopes:
             request_bodies: dict[str, Any] = specification.get("components", {}).get("requestBodies", {})
-            for body_name, raw_body in request_bodies.items():
+            for body_name in request_bodies if selected_components is None else selected_components["requestBodies"]:
+                raw_body = request_bodies[body_name]
                 resolved_body = self.get_ref_model(raw_body["$ref"]) if "$ref" in raw_body else raw_body
                 content = resolved_body.get("content", {})
                 for media_type, media_obj in content.items():
@@ -599,6 +673,69 @@ class OpenAPIParser(JsonSchemaParser):
             fnmatch.fnmatch(normalized_path, self._normalize_path(pattern)) for pattern in self.openapi_include_paths
         )
 
+    def _matches_operation_filters(self, operation: dict[str, Any]) -> bool:
+        """Check an operation against the tag and operationId include/exclude patterns.
+
+        Exclusions win over inclusions. When both tag and operationId include
+        patterns are given, matching either of them selects the operation.
+        """
+        tags = [tag for tag in operation.get("tags") or [] if isinstance(tag, str)]
+        operation_ids = [operation_id] if isinstance(operation_id := operation.get("operationId"), str) else []
+        if _matches_any_pattern(tags, self.openapi_exclude_tags) or _matches_any_pattern(
+            operation_ids, self.openapi_exclude_operation_ids
+        ):
+            return False
+        if not self.openapi_include_tags and not self.openapi_include_operation_ids:
+            return True
+        return _matches_any_pattern(tags, self.openapi_include_tags) or _matches_any_pattern(
+            operation_ids, self.openapi_include_operation_ids
+        )
+
+    def _selected_component_names(self, specification: dict[str, Any]) -> dict[str, list[str]] | None:
+        """Return the components, in document order, referenced by the selected operations.
+
+        Returns ``None`` when no tag or operationId filter is set, so every
+        component is parsed as before. Path items referenced from other files
+        are not walked; anything they need is still generated on demand when the
+        operation is parsed.
+        """
+        if not self.has_operation_filters:
+            return None
+        roots: list[Any] = []
+        scopes: list[tuple[Any, bool]] = [(specification.get("paths"), True)]
+        if OpenAPIScope.Webhooks in self.open_api_scopes:
+            scopes.append((specification.get("webhooks"), False))
+        for items, apply_path_filter in scopes:
+            for item_name, path_item in items.items() if isinstance(items, dict) else ():
+                if item_name == "parameters" or (apply_path_filter and not self._matches_path_pattern(item_name)):
+                    continue
+                methods = path_item
+                if isinstance(path_item, dict) and isinstance(item_ref := path_item.get("$ref"), str):
+                    if not item_ref.startswith("#"):
+                        continue
+                    methods = self.get_ref_model(item_ref)
+                if not isinstance(methods, dict):
+                    continue
+                operations = [
+                    operation
+                    for operation_name, operation in methods.items()
+                    if operation_name in OPERATION_NAMES
+                    and isinstance(operation, dict)
+                    and self._matches_operation_filters(operation)
+                ]
+                if operations:
+                    roots.extend((*operations, methods.get("parameters")))
+        if roots and isinstance(paths := specification.get("paths"), dict):
+            roots.append(paths.get("parameters"))
+        components = specification.get("components")
+        components = components if isinstance(components, dict) else {}
+        reached = _collect_component_refs(components, roots, self._discriminator_subtypes)
+        return {
+            section: [name for name in section_components if name in reached[section]]
+            for section in ("schemas", "requestBodies")
+            if isinstance(section_components := components.get(section, {}), dict)
+        }
+
     def _process_path_items(  # noqa: PLR0913
         self,
         items: dict[str, dict[str, Any]],
@@ -638,7 +775,9 @@ class OpenAPIParser(JsonSchemaParser):
             )
             with base_path_context:
                 for operation_name, raw_operation in methods.items():
-                    if operation_name not in OPERATION_NAMES:
+                    if operation_name not in OPERATION_NAMES or (
+                        self.has_operation_filters and not self._matches_operation_filters(raw_operation)
+                    ):
                         continue
                     operation = raw_operation
                     if item_parameters:
@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import contextlib
 import io
+import marshal
 import re
 import sys
 import tempfile
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 from warnings import warn
 
@@ -364,14 +367,9 @@ class _ProtoInputPreparer:
         self.temp_dir.cleanup()
 
     def _input_files(self, temp_path: Path) -> list[Path]:
-        source = self.parser.source
-        if isinstance(source, Path):
-            if source.is_dir():
-                paths = sorted((path for path in source.rglob("*.proto") if path.is_file()), key=lambda path: path.name)
-                return [self._write_sanitized_file(path, temp_path, source) for path in paths]
-            return [self._write_sanitized_file(source, temp_path, self.parser.base_path)]
-        if isinstance(source, list):
-            return [self._write_sanitized_file(path, temp_path, self.parser.base_path) for path in source]
+        if (input_paths := self.parser._input_proto_paths()) is not None:  # noqa: SLF001
+            paths, root = input_paths
+            return [self._write_sanitized_file(path, temp_path, root) for path in paths]
 
         input_files: list[Path] = []
         for index, item in enumerate(self.parser.iter_source):
@@ -406,6 +404,54 @@ class _ProtoInputPreparer:
                 stub.write_text(syntax, encoding=self.parser.encoding)
 
 
+_FRAGMENT_CACHE_MAX_SIZE = 1024
+# Marshal snapshots of per-file definitions survive ``--watch`` regenerations in the same process.
+_fragment_cache: OrderedDict[str, bytes] = OrderedDict()
+_fragment_cache_lock = Lock()
+
+
+class _ProtobufFragmentCache:
+    """Per-file converted definitions, kept in-process and optionally under ``--cache-dir``."""
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        if cache_dir is None:
+            self.disk_cache = None
+        else:
+            from datamodel_code_generator._disk_cache import DiskCache  # noqa: PLC0415
+
+            self.disk_cache = DiskCache(cache_dir, "protobuf-fragments")
+
+    def get(self, key: str) -> dict[str, dict[str, Any]] | None:
+        with _fragment_cache_lock:
+            data = _fragment_cache.get(key)
+            if data is not None:
+                _fragment_cache.move_to_end(key)
+        if data is not None:
+            return marshal.loads(data)  # noqa: S302
+        if self.disk_cache is None or (fragment := self.disk_cache.get(key)) is None:
+            return None
+        self._remember(key, marshal.dumps(fragment))
+        return fragment
+
+    def set(self, key: str, fragment: dict[str, dict[str, Any]]) -> None:
+        try:
+            data = marshal.dumps(fragment)
+        except ValueError:
+            # Source-safe non-finite defaults are not marshal-compatible; convert those files every time.
+            return
+        self._remember(key, data)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, fragment)
+
+    @staticmethod
+    def _remember(key: str, data: bytes) -> None:
+        with _fragment_cache_lock:
+            _fragment_cache[key] = data
+            _fragment_cache.move_to_end(key)
+            while len(_fragment_cache) > _FRAGMENT_CACHE_MAX_SIZE:
+                _fragment_cache.popitem(last=False)
+
+
 class _ProtobufDescriptorConverter:
     def __init__(
         self,
@@ -414,11 +460,13 @@ class _ProtobufDescriptorConverter:
         schema_version_mode: VersionMode | None,
         input_file_names: frozenset[str],
         source_safe_non_finite: bool,
+        cache_dir: Path | None = None,
     ) -> None:
         self.protobuf_version = protobuf_version
         self.schema_version_mode = schema_version_mode or VersionMode.Lenient
         self.input_file_names = input_file_names
         self.source_safe_non_finite = source_safe_non_finite
+        self.fragment_cache = _ProtobufFragmentCache(cache_dir)
         self.definitions: dict[str, dict[str, Any]] = {}
         self.enums: dict[str, Any] = {}
         self.messages: dict[str, Any] = {}
@@ -438,8 +486,25 @@ class _ProtobufDescriptorConverter:
         for file_descriptor in file_descriptor_set.file:
             if file_descriptor.name in WELL_KNOWN_PROTO_PATHS and file_descriptor.name not in self.input_file_names:
                 continue
-            comments = _comment_map(file_descriptor)
             effective_version = self._effective_version(file_descriptor)
+            fragment_key = self._fragment_key(file_descriptor, effective_version)
+            fragment = self.fragment_cache.get(fragment_key)
+            if fragment is None:
+                fragment = self._convert_file(file_descriptor, effective_version)
+                self.fragment_cache.set(fragment_key, fragment)
+            self.definitions.update(fragment)
+
+        return {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "Model",
+            "definitions": self.definitions,
+        }
+
+    def _convert_file(self, file_descriptor: Any, effective_version: ProtobufVersion) -> dict[str, dict[str, Any]]:
+        """Convert one file's top-level enums and messages into a definitions fragment."""
+        definitions, self.definitions = self.definitions, {}
+        try:
+            comments = _comment_map(file_descriptor)
             for index, enum_descriptor in enumerate(file_descriptor.enum_type):
                 path = (5, index)
                 self._convert_enum(
@@ -457,12 +522,50 @@ class _ProtobufDescriptorConverter:
                     (4, index),
                     effective_version,
                 )
-
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Model",
-            "definitions": self.definitions,
-        }
+            return self.definitions
+        finally:
+            self.definitions = definitions
+
+    def _fragment_key(self, file_descriptor: Any, effective_version: ProtobufVersion) -> str:
+        """Key a file's fragment by its descriptor and the symbol table slice it reads.
+
+        The slice holds the definition keys of every symbol the file defines or references
+        (collision suffixes depend on other files) and the first value of referenced enums,
+        which becomes the implicit proto3 default.
+        """
+        from datamodel_code_generator._disk_cache import CacheKey  # noqa: PLC0415
+
+        key = CacheKey("protobuf-fragment").add(
+            file_descriptor.SerializeToString(deterministic=True),
+            str(effective_version),
+            str(self.source_safe_non_finite),
+        )
+        package = file_descriptor.package
+        for enum_descriptor in file_descriptor.enum_type:
+            full_name = _full_name(package, (), enum_descriptor.name)
+            key.add(full_name, self._definition_key(full_name))
+        pending: list[tuple[Any, tuple[str, ...]]] = [(message, ()) for message in file_descriptor.message_type]
+        while pending:
+            message_descriptor, parents = pending.pop()
+            full_name = _full_name(package, parents, message_descriptor.name)
+            key.add(full_name, self._definition_key(full_name))
+            nested_parents = (*parents, message_descriptor.name)
+            for enum_descriptor in message_descriptor.enum_type:
+                enum_full_name = _full_name(package, nested_parents, enum_descriptor.name)
+                key.add(enum_full_name, self._definition_key(enum_full_name))
+            pending.extend((nested, nested_parents) for nested in message_descriptor.nested_type)
+            for field in message_descriptor.field:
+                if not field.type_name:
+                    continue
+                type_name = _type_name(field.type_name)
+                enum = self.enums.get(type_name)
+                key.add(
+                    type_name,
+                    self._definition_key(type_name),
+                    str(type_name in self.map_entries),
+                    enum.value[0].name if enum and enum.value else None,
+                )
+        return key.hexdigest()
 
     def _collect_symbols(self, messages: Iterable[Any], package: str, parents: tuple[str, ...]) -> None:
         for message_descriptor in messages:
@@ -748,6 +851,83 @@ class ProtobufParser(JsonSchemaParser):
                 with contextlib.suppress(OSError):
                     output_path.unlink()
 
+    def _input_proto_paths(self) -> tuple[list[Path], Path] | None:
+        """Return local input files and the root their descriptor names are relative to."""
+        source = self.source
+        if isinstance(source, Path):
+            if source.is_dir():
+                paths = sorted((path for path in source.rglob("*.proto") if path.is_file()), key=lambda path: path.name)
+                return paths, source
+            return [source], self.base_path
+        if isinstance(source, list):
+            return list(source), self.base_path
+        return None
+
+    def _descriptor_cache_key(self, well_known_include: Path, *, source_safe_non_finite: bool) -> str | None:
+        """Digest inputs, their transitive imports, include paths and tool versions.
+
+        Imports are resolved lexically in ``protoc`` include order; unresolved imports are
+        part of the key too, so creating a missing file invalidates the entry.
+        """
+        config = cast("ProtobufParserConfig", self.config)
+        if config.schema_version_mode == VersionMode.Strict and config.protobuf_version not in {
+            None,
+            ProtobufVersion.Auto,
+        }:
+            # Declared/requested version mismatches warn during conversion, which a cache hit would skip.
+            return None
+        from google.protobuf import __version__ as protobuf_runtime_version  # noqa: PLC0415
+        from grpc_tools import grpc_version  # noqa: PLC0415
+
+        from datamodel_code_generator._disk_cache import CacheKey  # noqa: PLC0415
+
+        key = CacheKey("protobuf-descriptors").add(
+            protobuf_runtime_version,
+            grpc_version.VERSION,
+            str(config.protobuf_version),
+            str(config.schema_version_mode),
+            str(source_safe_non_finite),
+            self.encoding,
+        )
+        sources: dict[str, bytes] = {}
+        include_roots: list[Path] = [self.base_path]
+        if (input_paths := self._input_proto_paths()) is None:
+            for index, item in enumerate(self.iter_source):
+                name = item.path.name if item.path.name.endswith(".proto") else f"input_{index}.proto"
+                sources[name] = item.text.encode(self.encoding)
+        else:
+            paths, root = input_paths
+            for path in paths:
+                sources[path.relative_to(root).as_posix() if path.is_relative_to(root) else path.name] = (
+                    path.read_bytes()
+                )
+            include_roots.extend(sorted({path.parent for path in paths} - {self.base_path, Path()}))
+        include_roots.append(well_known_include)
+        key.add(*(str(path) for path in include_roots))
+        for name, data in sources.items():
+            key.add(name, data)
+        pending = list(sources.values())
+        seen = set(sources)
+        while pending:
+            for import_path in IMPORT_PATTERN.findall(pending.pop().decode(self.encoding, errors="replace")):
+                if import_path in seen:
+                    continue
+                seen.add(import_path)
+                resolved = next((root / import_path for root in include_roots if (root / import_path).is_file()), None)
+                data = None if resolved is None else resolved.read_bytes()
+                key.add(import_path, data)
+                if data is not None:
+                    pending.append(data)
+        return key.hexdigest()
+
+    def _record_cached_source_dependencies(self) -> None:
+        """Record the watch dependencies a ``protoc`` run would have recorded."""
+        lexical_sources = self._lexical_source_files()
+        for path in lexical_sources:
+            record_watch_dependency(path)
+        if _watch_dependency_collection_is_active():
+            self._record_lexical_import_candidates(lexical_sources, self._persistent_include_paths(lexical_sources))
+
     def _lexical_source_files(self) -> Sequence[Path]:
         """Return persistent local sources without protoc's temporary sanitized copies."""
         if isinstance(self.source, Path):
@@ -805,14 +985,28 @@ class ProtobufParser(JsonSchemaParser):
     def _convert_to_json_schema_data(self, *, source_safe_non_finite: bool) -> dict[str, Any]:
         """Convert Protocol Buffers input sources for an internal parser consumer."""
         config = cast("ProtobufParserConfig", self.config)
+        cache_key: str | None = None
+        if self.cache_dir is not None:
+            from datamodel_code_generator._disk_cache import DiskCache  # noqa: PLC0415
+
+            _, well_known_include = _load_grpc_tools()
+            cache = DiskCache(self.cache_dir, "protobuf")
+            cache_key = self._descriptor_cache_key(well_known_include, source_safe_non_finite=source_safe_non_finite)
+            if cache_key is not None and (cached := cache.get(cache_key)) is not None:
+                self._record_cached_source_dependencies()
+                return cached
         descriptor_set, input_file_names = self._compile_descriptor_set()
         converter = _ProtobufDescriptorConverter(
             protobuf_version=config.protobuf_version,
             schema_version_mode=config.schema_version_mode,
             input_file_names=input_file_names,
             source_safe_non_finite=source_safe_non_finite,
+            cache_dir=self.cache_dir,
         )
-        return converter.convert(descriptor_set)
+        result = converter.convert(descriptor_set)
+        if cache_key is not None:
+            cache.set(cache_key, result)
+        return result
 
     def parse_raw(self) -> None:
         """Parse all Protocol Buffers input sources into data models."""
@@ -26,6 +26,11 @@ from datamodel_code_generator._format_types import DatetimeClassType
 from datamodel_code_generator.enums import VersionMode, XMLSchemaVersion
 from datamodel_code_generator.parser import _xmlschema_literals
 from datamodel_code_generator.parser._convert_common import _copy_schema, _namespace_name, _unique_name
+from datamodel_code_generator.parser._xmlschema_declarations import (
+    _DeclarationElement,
+    _DeclarationRegistry,
+    _DeclarationStore,
+)
 from datamodel_code_generator.parser._xmlschema_detection import (
     XML_SCHEMA_NAMESPACE,
     XML_SCHEMA_TAG,
@@ -48,9 +53,10 @@ from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
 from datamodel_code_generator.util import record_watch_dependency
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Mapping
     from urllib.parse import ParseResult
 
+    from datamodel_code_generator._disk_cache import DiskCache
     from datamodel_code_generator._types import XMLSchemaParserConfigDict
     from datamodel_code_generator.config import XMLSchemaParserConfig
 
@@ -108,6 +114,14 @@ DECIMAL_SCHEMA: JsonSchema = {"type": "number", "format": "decimal"}
 DATETIME_SCHEMA: JsonSchema = {"type": "string", "format": "date-time"}
 
 
+class _SchemaDocumentSummary(NamedTuple):
+    """Compact record of an XSD document scanned without retaining its element tree."""
+
+    target_namespace: str | None
+    uses_xsd11: bool
+    schema_locations: tuple[str | None, ...]
+
+
 class _OccurrenceContext(NamedTuple):
     required: bool = True
     repeating: bool = False
@@ -272,6 +286,46 @@ def _decode_xml_bytes(data: bytes, encoding: str) -> str:
     return data.decode(encoding)
 
 
+def _scan_schema_text(text: str, location: Path) -> _SchemaDocumentSummary:
+    """Stream an XSD document, discarding each top-level subtree as soon as it has been read.
+
+    A document whose text names neither the versioning namespace nor an XSD 1.1 element
+    cannot use XSD 1.1, so its scan stops at the first declaration: schema composition
+    elements come before every declaration.
+    """
+    may_use_xsd11 = XML_SCHEMA_VERSIONING_NAMESPACE in text or any(name in text for name in XSD11_ELEMENTS)
+    root: ET.Element | None = None
+    depth = 0
+    uses_xsd11 = False
+    schema_locations: list[str | None] = []
+    try:
+        for event, element in ET.iterparse(io.StringIO(text), events=("start", "end")):  # noqa: S314
+            if event == "end":
+                depth -= 1
+                if depth == 1 and root is not None:
+                    root.remove(element)
+                continue
+            depth += 1
+            if root is None:
+                root = element
+            elif depth == 2 and _is_xsd_element(element, "include", "import", "redefine", "override"):  # noqa: PLR2004
+                schema_locations.append(element.get("schemaLocation"))
+            elif depth == 2 and not may_use_xsd11 and not _is_xsd_element(element, "annotation"):  # noqa: PLR2004
+                break
+            if not uses_xsd11:
+                uses_xsd11 = _has_xmlschema_versioning_attribute(element) or _is_xsd_element(element, *XSD11_ELEMENTS)
+    except ET.ParseError as exc:
+        msg = f"Invalid XML Schema document {location}: {exc}"
+        raise Error(msg) from exc
+    if root is None:  # pragma: no cover
+        msg = f"Invalid XML Schema document {location}: empty document"
+        raise Error(msg)
+    if root.tag != XML_SCHEMA_TAG:
+        msg = f"XML Schema root element must be xs:schema: {location}"
+        raise Error(msg)
+    return _SchemaDocumentSummary(root.get("targetNamespace"), uses_xsd11, tuple(schema_locations))
+
+
 def _digest_bytes(data: bytes) -> str:
     return sha256(data).hexdigest()
 
@@ -289,6 +343,30 @@ def _xml_schema_cache_entry_is_fresh(entry: _XMLSchemaDataCacheEntry) -> bool:
     return all(path.is_file() and _digest_path(path) == digest for path, digest in entry.dependencies)
 
 
+def _xml_schema_disk_cache_key(cache_key: _XMLSchemaDataCacheKey) -> str:
+    from datamodel_code_generator._disk_cache import CacheKey  # noqa: PLC0415
+
+    return CacheKey("xmlschema").add(*(None if part is None else str(part) for part in cache_key)).hexdigest()
+
+
+def _load_xml_schema_disk_cache_entry(disk_cache: DiskCache, key: str) -> _XMLSchemaDataCacheEntry | None:
+    cached = disk_cache.get(key)
+    if not isinstance(cached, dict):
+        return None
+    entry = _XMLSchemaDataCacheEntry(
+        data=cached["data"],
+        dependencies=tuple((Path(path), digest) for path, digest in cached["dependencies"]),
+    )
+    return entry if _xml_schema_cache_entry_is_fresh(entry) else None
+
+
+def _store_xml_schema_disk_cache_entry(disk_cache: DiskCache, key: str, entry: _XMLSchemaDataCacheEntry) -> None:
+    disk_cache.set(
+        key,
+        {"data": entry.data, "dependencies": [(str(path), digest) for path, digest in entry.dependencies]},
+    )
+
+
 def _load_xml_schema_data_from_path(  # noqa: PLR0913
     path: Path,
     base_path: Path,
@@ -298,6 +376,7 @@ def _load_xml_schema_data_from_path(  # noqa: PLR0913
     schema_version_mode: VersionMode | None,
     use_xmlschema_datetime_default: bool,
     source_safe_non_finite: bool,
+    cache_dir: Path | None = None,
 ) -> dict[str, YamlValue]:
     resolved_path = path.resolve()
     resolved_base_path = base_path.resolve()
@@ -317,7 +396,7 @@ def _load_xml_schema_data_from_path(  # noqa: PLR0913
         while len(_xml_schema_data_seen_keys) > _XML_SCHEMA_DATA_CACHE_MAX_SIZE:
             _xml_schema_data_seen_keys.popitem(last=False)
 
-    if not use_cache:
+    if not use_cache and cache_dir is None:
         converter = _XMLSchemaConverter(
             base_path=base_path,
             encoding=encoding,
@@ -343,6 +422,18 @@ def _load_xml_schema_data_from_path(  # noqa: PLR0913
             _xml_schema_data_cache.move_to_end(cache_key)
             return _copy_schema(entry.data)
 
+    disk_cache: DiskCache | None = None
+    disk_cache_key = ""
+    if cache_dir is not None:
+        from datamodel_code_generator._disk_cache import DiskCache  # noqa: PLC0415
+
+        disk_cache = DiskCache(cache_dir, "xmlschema")
+        disk_cache_key = _xml_schema_disk_cache_key(cache_key)
+        if (entry := _load_xml_schema_disk_cache_entry(disk_cache, disk_cache_key)) is not None:
+            if use_cache:
+                _remember_xml_schema_data(cache_key, entry._replace(data=_copy_schema(entry.data)))
+            return entry.data
+
     converter = _XMLSchemaConverter(
         base_path=base_path,
         encoding=encoding,
@@ -352,16 +443,23 @@ def _load_xml_schema_data_from_path(  # noqa: PLR0913
         source_safe_non_finite=source_safe_non_finite,
     )
     data = converter.convert(Source(path=path.relative_to(base_path), text=_read_xml_text(path, encoding)))
-    dependencies = _xml_schema_cache_dependencies(converter.loaded_source_paths)
+    entry = _XMLSchemaDataCacheEntry(
+        data=_copy_schema(data),
+        dependencies=_xml_schema_cache_dependencies(converter.loaded_source_paths),
+    )
+    if disk_cache is not None:
+        _store_xml_schema_disk_cache_entry(disk_cache, disk_cache_key, entry)
+    if use_cache:
+        _remember_xml_schema_data(cache_key, entry)
+    return data
+
+
+def _remember_xml_schema_data(cache_key: _XMLSchemaDataCacheKey, entry: _XMLSchemaDataCacheEntry) -> None:
     with _xml_schema_data_cache_lock:
-        _xml_schema_data_cache[cache_key] = _XMLSchemaDataCacheEntry(
-            data=_copy_schema(data),
-            dependencies=dependencies,
-        )
+        _xml_schema_data_cache[cache_key] = entry
         _xml_schema_data_cache.move_to_end(cache_key)
         while len(_xml_schema_data_cache) > _XML_SCHEMA_DATA_CACHE_MAX_SIZE:
             _xml_schema_data_cache.popitem(last=False)
-    return data
 
 
 def _clear_xml_schema_data_cache() -> None:
@@ -441,17 +539,19 @@ class _XMLSchemaConverter:
         self._resolved_xmlschema_version: XMLSchemaVersion | None = None
         self.namespaces: dict[str, str] = {}
         self.target_namespace: str | None = None
-        self.simple_types: dict[QNameKey, ET.Element] = {}
-        self.complex_types: dict[QNameKey, ET.Element] = {}
-        self.elements: dict[QNameKey, ET.Element] = {}
-        self.attributes: dict[QNameKey, ET.Element] = {}
-        self.groups: dict[QNameKey, ET.Element] = {}
-        self.attribute_groups: dict[QNameKey, ET.Element] = {}
+        # Declarations are kept as compact records, so document trees are released once collected.
+        self._declarations = _DeclarationStore()
+        self.simple_types = _DeclarationRegistry(self._declarations)
+        self.complex_types = _DeclarationRegistry(self._declarations)
+        self.elements = _DeclarationRegistry(self._declarations)
+        self.attributes = _DeclarationRegistry(self._declarations)
+        self.groups = _DeclarationRegistry(self._declarations)
+        self.attribute_groups = _DeclarationRegistry(self._declarations)
         self.default_open_content: ET.Element | None = None
-        self._redefined_base_complex_types: dict[QNameKey, ET.Element] = {}
-        self._redefined_base_simple_types: dict[QNameKey, ET.Element] = {}
-        self._redefined_base_groups: dict[QNameKey, ET.Element] = {}
-        self._redefined_base_attribute_groups: dict[QNameKey, ET.Element] = {}
+        self._redefined_base_complex_types = _DeclarationRegistry(self._declarations)
+        self._redefined_base_simple_types = _DeclarationRegistry(self._declarations)
+        self._redefined_base_groups = _DeclarationRegistry(self._declarations)
+        self._redefined_base_attribute_groups = _DeclarationRegistry(self._declarations)
         self._active_groups: set[QNameKey] = set()
         self._active_attribute_groups: set[QNameKey] = set()
         self.substitution_groups: dict[QNameKey, set[QNameKey]] = {}
@@ -460,6 +560,7 @@ class _XMLSchemaConverter:
         self.local_elements: set[QNameKey] = set()
         self._loaded_locations: set[tuple[Path, str | None]] = set()
         self._element_namespaces: dict[int, dict[str, str]] = {}
+        self._schema_target_namespaces: dict[Path, str | None] = {}
         self._building_definitions: set[DefinitionKey] = set()
         self._built_definitions: dict[DefinitionKey, JsonSchema] = {}
         self._definitions: dict[str, JsonSchema] = {}
@@ -484,11 +585,11 @@ class _XMLSchemaConverter:
         self._definitions = self._build_definitions()
         global_elements = [
             (key, element)
-            for key, element in self.elements.items()
+            for key in self.elements
             if key in self.local_elements
-            and element.get("name")
-            and element.get("abstract") != "true"
             and key not in self.substitution_members
+            and (element := self.elements[key]).get("name")
+            and element.get("abstract") != "true"
         ]
 
         if len(global_elements) == 1:
@@ -547,10 +648,25 @@ class _XMLSchemaConverter:
         version = self._resolve_xmlschema_version(root)
         if self.xmlschema_version is not None and self.xmlschema_version != XMLSchemaVersion.Auto:
             return version
-        seen = seen_locations if seen_locations is not None else set()
         source_dir = source_path.parent if source_path.name else self.base_path
-        for child in _xsd_children(root, "include", "import", "redefine", "override"):
-            schema_location = child.get("schemaLocation")
+        return self._detect_included_xmlschema_version(
+            version,
+            source_dir,
+            tuple(
+                child.get("schemaLocation")
+                for child in _xsd_children(root, "include", "import", "redefine", "override")
+            ),
+            seen_locations if seen_locations is not None else set(),
+        )
+
+    def _detect_included_xmlschema_version(
+        self,
+        version: XMLSchemaVersion,
+        source_dir: Path,
+        schema_locations: tuple[str | None, ...],
+        seen: set[Path],
+    ) -> XMLSchemaVersion:
+        for schema_location in schema_locations:
             if not schema_location:
                 continue
             location = self._resolve_schema_location(source_dir, schema_location)
@@ -558,12 +674,23 @@ class _XMLSchemaConverter:
                 continue
             self.loaded_source_paths.add(location)
             seen.add(location)
-            included_root = self._parse_schema(_read_xml_text(location, self.encoding), location)
-            included_version = self._detect_effective_xmlschema_version(included_root, location, seen)
+            summary = self._scan_schema(location)
+            included_version = self._detect_included_xmlschema_version(
+                XMLSchemaVersion.V11 if summary.uses_xsd11 else XMLSchemaVersion.V10,
+                location.parent,
+                summary.schema_locations,
+                seen,
+            )
             if _version_decimal(included_version) > _version_decimal(version):
                 version = included_version
         return version
 
+    def _scan_schema(self, location: Path) -> _SchemaDocumentSummary:
+        """Summarize an included XSD for version detection without keeping its element tree."""
+        summary = _scan_schema_text(_read_xml_text(location, self.encoding), location)
+        self._schema_target_namespaces[location] = summary.target_namespace
+        return summary
+
     def _resolve_schema_location(self, source_dir: Path, schema_location: str) -> Path:
         base_path = self.base_path.resolve()
         location = (source_dir / schema_location).resolve()
@@ -616,6 +743,8 @@ class _XMLSchemaConverter:
         try:
             root: ET.Element | None = None
             active_namespaces: dict[str, str] = {}
+            # Elements share one read-only snapshot until a namespace declaration changes scope.
+            namespaces_snapshot: dict[str, str] | None = None
             namespace_stack: list[tuple[str, str | None]] = []
             for event, payload in ET.iterparse(io.StringIO(text), events=("start", "start-ns", "end-ns")):  # noqa: S314
                 match event:
@@ -623,6 +752,7 @@ class _XMLSchemaConverter:
                         prefix, uri = cast("tuple[str, str]", payload)
                         namespace_stack.append((prefix, active_namespaces.get(prefix)))
                         active_namespaces[prefix] = uri
+                        namespaces_snapshot = None
                         self.namespaces.setdefault(prefix, uri)
                     case "end-ns":
                         prefix, previous_uri = namespace_stack.pop()
@@ -630,11 +760,13 @@ class _XMLSchemaConverter:
                             active_namespaces.pop(prefix, None)
                         else:
                             active_namespaces[prefix] = previous_uri
+                        namespaces_snapshot = None
                     case "start":
                         element = cast("ET.Element", payload)
                         if root is None:
                             root = element
-                        self._element_namespaces[id(element)] = active_namespaces.copy()
+                        namespaces_snapshot = namespaces_snapshot or active_namespaces.copy()
+                        self._element_namespaces[id(element)] = namespaces_snapshot
                     case _:  # pragma: no cover
                         pass
         except ET.ParseError as exc:
@@ -668,19 +800,23 @@ class _XMLSchemaConverter:
             if not location.is_file():
                 continue
             self.loaded_source_paths.add(location)
-            included_root = self._parse_schema(_read_xml_text(location, self.encoding), location)
-            self._prepare_schema_root(
-                included_root, self._resolved_xmlschema_version or self._resolve_xmlschema_version(included_root)
-            )
+            # Only parse a document again when it is loaded under a new namespace override.
+            included_root: ET.Element | None = None
+            if location in self._schema_target_namespaces:
+                included_target_namespace = self._schema_target_namespaces[location]
+            else:
+                included_root = self._parse_included_schema(location)
+                included_target_namespace = included_root.get("targetNamespace")
             child_namespace_override = (
                 schema_namespace
-                if _local_name(child.tag) in {"include", "redefine", "override"}
-                and included_root.get("targetNamespace") is None
+                if _local_name(child.tag) in {"include", "redefine", "override"} and included_target_namespace is None
                 else None
             )
             load_key = (location, child_namespace_override)
             if load_key not in self._loaded_locations:
                 self._loaded_locations.add(load_key)
+                if included_root is None:
+                    included_root = self._parse_included_schema(location)
                 self._collect_schema(
                     included_root,
                     location,
@@ -697,6 +833,18 @@ class _XMLSchemaConverter:
         for child in root.iter():
             if _is_xsd_element(child, "element") and (ref := child.get("ref")):
                 self.referenced_elements.add(self._qname_key(ref, child))
+        self._release_schema(root)
+
+    def _release_schema(self, root: ET.Element) -> None:
+        """Forget the namespaces of a collected document, whose declarations are now records."""
+        for element in root.iter():
+            self._element_namespaces.pop(id(element), None)
+
+    def _parse_included_schema(self, location: Path) -> ET.Element:
+        root = self._parse_schema(_read_xml_text(location, self.encoding), location)
+        self._prepare_schema_root(root, self._resolved_xmlschema_version or self._resolve_xmlschema_version(root))
+        self._schema_target_namespaces[location] = root.get("targetNamespace")
+        return root
 
     def _collect_schema_declarations(
         self,
@@ -746,16 +894,14 @@ class _XMLSchemaConverter:
                 self.substitution_members.add(key)
         if replace:
             if local_name == "complexType" and key in registry:
-                self._redefined_base_complex_types.setdefault(key, registry[key])
+                self._redefined_base_complex_types.declare(key, registry.record(key))
             elif local_name == "simpleType" and key in registry:
-                self._redefined_base_simple_types.setdefault(key, registry[key])
+                self._redefined_base_simple_types.declare(key, registry.record(key))
             elif local_name == "group" and key in registry:
-                self._redefined_base_groups.setdefault(key, registry[key])
+                self._redefined_base_groups.declare(key, registry.record(key))
             elif local_name == "attributeGroup" and key in registry:
-                self._redefined_base_attribute_groups.setdefault(key, registry[key])
-            registry[key] = child
-        else:
-            registry.setdefault(key, child)
+                self._redefined_base_attribute_groups.declare(key, registry.record(key))
+        registry.declare(key, self._declarations.compact(child, self._namespaces_for), replace=replace)
 
     def _prepare_definition_names(self) -> None:
         keys = {self._type_definition_key(key) for key in set(self.simple_types) | set(self.complex_types)}
@@ -1122,7 +1268,7 @@ class _XMLSchemaConverter:
 
         schema = self._new_object_schema(child, mixed_owners=(complex_content, owner))
         if _local_name(child.tag) == "extension" and (base := child.get("base")):
-            owner_key = self._key_for_declaration(self.complex_types, owner)
+            owner_key = self.complex_types.key_for(owner)
             base_key = self._resolve_key(base, self.simple_types, self.complex_types, element=child)
             if owner_key is not None and base_key == owner_key:
                 base_complex_type = self._redefined_base_complex_types.get(base_key)
@@ -1487,7 +1633,7 @@ class _XMLSchemaConverter:
     def _resolve_key(
         self,
         qname: str | QNameKey,
-        *registries: dict[QNameKey, ET.Element],
+        *registries: Mapping[QNameKey, ET.Element],
         element: ET.Element | None = None,
     ) -> QNameKey:
         key = qname if isinstance(qname, tuple) else self._qname_key(qname, element)
@@ -1507,10 +1653,6 @@ class _XMLSchemaConverter:
             resolved.update(self.substitution_groups.get(ref, set()))
         return resolved
 
-    @staticmethod
-    def _key_for_declaration(registry: dict[QNameKey, ET.Element], declaration: ET.Element) -> QNameKey | None:
-        return next((key for key, element in registry.items() if element is declaration), None)
-
     @staticmethod
     def _type_definition_key(key: QNameKey) -> DefinitionKey:
         return ("type", key[0], key[1])
@@ -1538,6 +1680,8 @@ class _XMLSchemaConverter:
     def _namespaces_for(self, element: ET.Element | None) -> dict[str, str]:
         if element is None:  # pragma: no cover
             return self.namespaces
+        if isinstance(element, _DeclarationElement):
+            return element.namespaces
         return self._element_namespaces.get(id(element), self.namespaces)
 
     @staticmethod
@@ -1581,7 +1725,7 @@ class XMLSchemaParser(JsonSchemaParser):
 
     def _source_from_xml_path(self, path: Path) -> Source:
         relative_path = path.relative_to(self.base_path)
-        if not self._use_parsed_source_cache:
+        if not self._use_parsed_source_cache and self.cache_dir is None:
             return Source(path=relative_path, text=_read_xml_text(path, self.encoding))
 
         config = cast("XMLSchemaParserConfig", self.config)
@@ -1595,6 +1739,7 @@ class XMLSchemaParser(JsonSchemaParser):
                 schema_version_mode=config.schema_version_mode,
                 use_xmlschema_datetime_default=self.use_xmlschema_datetime_default,
                 source_safe_non_finite=True,
+                cache_dir=self.cache_dir,
             ),
         )
 
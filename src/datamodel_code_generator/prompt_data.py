@@ -21,6 +21,8 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--allow-remote-refs": "Enable fetching of `$ref` targets over HTTP/HTTPS.",
     "--base-class": "Specify a custom base class for generated models.",
     "--base-class-map": "Specify different base classes for specific models via JSON mapping.",
+    "--bundle-schema": "Bundle a multi-file schema into one self-contained JSON document.",
+    "--cache-dir": "Cache expensive schema compilation results on disk.",
     "--capitalize-enum-members": "Capitalize enum member names to UPPER_CASE format.",
     "--check": "Verify generated code matches existing output without modifying files.",
     "--class-decorators": "Add custom decorators to generated model classes.",
@@ -101,8 +103,12 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--no-use-standard-collections": "Use typing.Dict/List instead of built-in dict/list for container types.",
     "--no-use-type-checking-imports": "Keep generated model imports available at runtime when using Ruff fixes.",
     "--no-use-union-operator": "Use Union[X, Y] / Optional[X] instead of X | Y union operator.",
+    "--openapi-exclude-operation-ids": "Exclude OpenAPI operations with matching operationIds.",
+    "--openapi-exclude-tags": "Exclude OpenAPI operations with matching tags.",
     "--openapi-include-info-version": "Emit OpenAPI info.version as a generated constant.",
+    "--openapi-include-operation-ids": "Include only OpenAPI operations with matching operationIds.",
     "--openapi-include-paths": "Filter OpenAPI paths to include in model generation.",
+    "--openapi-include-tags": "Include only OpenAPI operations with matching tags.",
     "--openapi-scopes": "Specify OpenAPI scopes to generate (schemas, paths, parameters).",
     "--original-field-name-delimiter": "Specify delimiter for original field names when using snake-case conversion.",
     "--output": "Specify the destination path for generated Python code.",
@@ -112,9 +118,11 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--parent-scoped-naming": "Namespace models by their parent scope to avoid naming conflicts.",
     "--preset": "Apply an immutable built-in option preset.",
     "--read-only-write-only-model-type": "Generate separate request and response models for readOnly/writeOnly fields.",
+    "--ref-bundle": "Serve remote schema fetches from an offline reference bundle.",
     "--remove-special-field-name-prefix": "Remove the special prefix from field names.",
     "--reuse-model": "Reuse identical model definitions instead of generating duplicates.",
     "--reuse-scope": "Scope for model reuse detection (root or tree).",
+    "--sample-size": "Infer raw sample data from a random sample of records.",
     "--schema-validator-base-class-name": "Set the generated shared Pydantic v2 schema runtime validator base class...",
     "--schema-validator-type": "Select the schema-derived runtime validator backend.",
     "--schema-version": "Schema version to use for parsing.",
@@ -137,6 +145,7 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--type-overrides": "Replace schema model types with custom Python types via JSON mapping.",
     "--union-mode": "Union mode for combining anyOf/oneOf schemas (smart or left_to_right).",
     "--update-lock": "Create or atomically update the selected remote lock after generation (experimental).",
+    "--update-ref-bundle": "Write every fetched remote schema document to the reference bundle.",
     "--url": "Fetch a schema from a URL with custom HTTP headers.",
     "--use-annotated": "Use typing.Annotated for Field() with constraints.",
     "--use-attribute-docstrings": "Generate field descriptions as attribute docstrings instead of Field descriptions.",
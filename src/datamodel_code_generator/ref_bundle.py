@@ -0,0 +1,195 @@
+"""Offline bundles of remote schema resources.
+
+A bundle is a zip archive holding the raw body of every HTTP(S) resource that one
+generation fetched, plus an ``index.json`` that maps each request identity to its
+body. The index is a remote lock document: request identities, display origins and
+body digests are computed exactly as in ``remote_lock``, so a bundle can be checked
+against a committed lock and vice versa. Bodies are stored once per body digest.
+
+Serving a request from a bundle only hashes the request identity, so it performs no
+network I/O and no DNS resolution.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from datamodel_code_generator.remote_lock import (
+    _LOCK_VERSION,
+    RemoteLockEntry,
+    RemoteLockError,
+    _display_url,
+    _entries_from_document,
+    _request_sha256,
+    _sha256,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import TypeAlias
+
+    _ResponseObserver: TypeAlias = Callable[
+        [str, Sequence[tuple[str, str]] | None, Sequence[tuple[str, str]] | None, bytes], None
+    ]
+
+_INDEX_NAME = "index.json"
+_BODY_DIRECTORY = "bodies"
+# Fixed member timestamps keep the archive byte-identical for identical fetches.
+_MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class RefBundleError(RemoteLockError):
+    """Raised when a remote resource cannot be served from or written to a reference bundle."""
+
+
+def _body_member(body_sha256: str) -> str:
+    return f"{_BODY_DIRECTORY}/{body_sha256.partition(':')[2]}"
+
+
+def _read_index(path: Path) -> dict[str, RemoteLockEntry]:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            data = json.loads(archive.read(_INDEX_NAME).decode("utf-8"))
+    except (OSError, KeyError, UnicodeDecodeError, ValueError, zipfile.BadZipFile) as exc:
+        msg = f"Unable to read reference bundle {path}: {exc}"
+        raise RefBundleError(msg) from exc
+    return _entries_from_document(data, f"{path}:{_INDEX_NAME}")
+
+
+@dataclass(slots=True)
+class RemoteRefBundle:
+    """Serve remote resources from a bundle, or collect them into one for a single generation.
+
+    An updated bundle holds exactly the resources fetched by the generation that wrote it.
+    ``response_observer`` receives every body as if it had been fetched, so a remote lock
+    verifies bundled bytes the same way it verifies network responses.
+    """
+
+    path: Path
+    update: bool
+    response_observer: _ResponseObserver | None = None
+    _entries: dict[str, RemoteLockEntry] = field(default_factory=dict)
+    _bodies: dict[str, bytes] = field(default_factory=dict)
+    _committed: bool = False
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        *,
+        update: bool,
+        response_observer: _ResponseObserver | None = None,
+    ) -> RemoteRefBundle:
+        """Open an existing bundle for serving, or start an empty one for an update."""
+        if update:
+            return cls(path=path, update=True, response_observer=response_observer)
+        if not path.is_file():
+            msg = f"Reference bundle not found: {path}"
+            raise RefBundleError(msg)
+        return cls(path=path, update=False, response_observer=response_observer, _entries=_read_index(path))
+
+    def record_response(
+        self,
+        url: str,
+        headers: Sequence[tuple[str, str]] | None,
+        query_parameters: Sequence[tuple[str, str]] | None,
+        body: bytes,
+    ) -> None:
+        """Add the raw bytes returned for one HTTP(S) request to an updating bundle."""
+        if self.response_observer is not None:
+            self.response_observer(url, headers, query_parameters, body)
+        if not self.update:
+            return
+        entry = RemoteLockEntry(
+            request_sha256=_request_sha256(url, headers, query_parameters),
+            url=_display_url(url),
+            body_sha256=_sha256(body),
+        )
+        if (seen_entry := self._entries.get(entry.request_sha256)) is not None:
+            if seen_entry.body_sha256 != entry.body_sha256:
+                msg = f"Remote resource returned different content in one generation: {entry.url}"
+                raise RefBundleError(msg)
+            return
+        self._entries[entry.request_sha256] = entry
+        self._bodies[entry.body_sha256] = body
+
+    def get_body(
+        self,
+        url: str,
+        headers: Sequence[tuple[str, str]] | None,
+        query_parameters: Sequence[tuple[str, str]] | None,
+    ) -> bytes:
+        """Return the bundled raw bytes for one HTTP(S) request without touching the network."""
+        request_sha256 = _request_sha256(url, headers, query_parameters)
+        if (entry := self._entries.get(request_sha256)) is None:
+            msg = f"Remote resource is not in reference bundle {self.path}: {_display_url(url)}"
+            raise RefBundleError(msg)
+        if (body := self._bodies.get(entry.body_sha256)) is None:
+            try:
+                with zipfile.ZipFile(self.path) as archive:
+                    body = archive.read(_body_member(entry.body_sha256))
+            except (OSError, KeyError, zipfile.BadZipFile) as exc:
+                msg = f"Unable to read reference bundle {self.path}: {exc}"
+                raise RefBundleError(msg) from exc
+            if _sha256(body) != entry.body_sha256:
+                msg = f"Reference bundle content does not match its index: {entry.url}"
+                raise RefBundleError(msg)
+            self._bodies[entry.body_sha256] = body
+        if self.response_observer is not None:
+            self.response_observer(url, headers, query_parameters, body)
+        return body
+
+    def get_text(
+        self,
+        url: str,
+        headers: Sequence[tuple[str, str]] | None,
+        query_parameters: Sequence[tuple[str, str]] | None,
+        encoding: str = "utf-8",
+    ) -> str:
+        """Return a bundled body decoded like an HTTP response."""
+        try:
+            return self.get_body(url, headers, query_parameters).decode(encoding)
+        except UnicodeDecodeError as exc:
+            msg = f"Unable to decode bundled response for {_display_url(url)} using {encoding}: {exc}"
+            raise RefBundleError(msg) from exc
+
+    def _write_archive(self, file: zipfile.ZipFile) -> None:
+        entries = sorted(self._entries.values(), key=lambda entry: entry.request_sha256)
+        index = {"resources": [asdict(entry) for entry in entries], "version": _LOCK_VERSION}
+        members = [(_INDEX_NAME, json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True).encode() + b"\n")]
+        members.extend(
+            (_body_member(body_sha256), self._bodies[body_sha256])
+            for body_sha256 in sorted({entry.body_sha256 for entry in entries})
+        )
+        for name, data in members:
+            file.writestr(zipfile.ZipInfo(name, _MEMBER_DATE_TIME), data, compress_type=zipfile.ZIP_DEFLATED)
+
+    def commit(self) -> None:
+        """Atomically write an updated bundle at most once."""
+        if self._committed or not self.update:
+            return
+        temporary_path: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file_fd, name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            temporary_path = Path(name)
+            with os.fdopen(file_fd, "wb") as temporary_file, zipfile.ZipFile(temporary_file, "w") as archive:
+                self._write_archive(archive)
+            temporary_path.replace(self.path)
+        except OSError as exc:
+            if temporary_path is not None:
+                with contextlib.suppress(OSError):
+                    temporary_path.unlink()
+            msg = f"Unable to write reference bundle {self.path}: {exc}"
+            raise RefBundleError(msg) from exc
+        self._committed = True
+
+
+__all__ = ["RefBundleError", "RemoteRefBundle"]
@@ -7,6 +7,7 @@ schema field names to valid Python identifiers.
 
 from __future__ import annotations
 
+import os
 import re
 from collections import defaultdict
 from contextlib import contextmanager
@@ -699,6 +700,11 @@ class ModelResolver:  # noqa: PLR0904
             {} if default_value_overrides is None else {**default_value_overrides}
         )
 
+        # resolve_ref results keyed by the reference and the resolution context it reads
+        self._resolved_refs: dict[tuple[str, str, Path | None, str | None, str | None], str] = {}
+        # File names per directory, listed once for the file checks made while resolving references
+        self._directory_files: dict[Path, frozenset[str]] = {}
+
     def _get_model_name_map_value(self, path: str, generated_name: str, original_name: str) -> str | None:
         """Return an explicit model rename for a source path or generated name."""
         if not self.model_name_map:
@@ -866,7 +872,28 @@ class ModelResolver:  # noqa: PLR0904
 
     def add_id(self, id_: str, path: Sequence[str]) -> None:
         """Register an identifier mapping to a resolved reference path."""
-        self.ids["/".join(self.current_root)][id_] = self.resolve_ref(path)
+        resolved_ref = self.resolve_ref(path)
+        scoped_ids = self.ids["/".join(self.current_root)]
+        if scoped_ids.get(id_) != resolved_ref:
+            scoped_ids[id_] = resolved_ref
+            # Memoized resolutions may have looked this id up before it was registered.
+            self._resolved_refs.clear()
+
+    def _is_file(self, path: Path) -> bool:
+        """Return whether ``path`` is a file, listing its directory once for later checks.
+
+        A name missing from the listing is checked directly, so a case-insensitive file
+        system still matches a name spelled differently from the listing.
+        """
+        directory = path.parent
+        if (file_names := self._directory_files.get(directory)) is None:
+            try:
+                with os.scandir(directory) as entries:
+                    file_names = frozenset(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                file_names = frozenset()
+            self._directory_files[directory] = file_names
+        return path.name in file_names or path.is_file()
 
     def _get_path_absolute_local_file(self, ref: str) -> tuple[Path, str] | None:
         """Return the local file path for a path-absolute URI ref."""
@@ -889,7 +916,7 @@ class ModelResolver:  # noqa: PLR0904
 
         base_path = self._base_path.resolve()
         local_file_path = Path(base_path, relative_file_path).resolve()
-        if not local_file_path.is_relative_to(base_path) or not local_file_path.is_file():
+        if not local_file_path.is_relative_to(base_path) or not self._is_file(local_file_path):
             return None
 
         return local_file_path, fragment
@@ -907,9 +934,20 @@ class ModelResolver:  # noqa: PLR0904
             resolved_ref += f"#{fragment}"
         return resolved_ref
 
-    def resolve_ref(self, path: Sequence[str] | str) -> str:  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
-        """Resolve a reference path to its canonical form."""
+    def resolve_ref(self, path: Sequence[str] | str) -> str:
+        """Resolve a reference path to its canonical form.
+
+        Results are memoized per reference, current root, current base path, base URL
+        and root id, which is all the state resolution reads besides the registered
+        ids; registering a new id clears the memo.
+        """
         joined_path = path if isinstance(path, str) else self.join_path(tuple(path))
+        key = (joined_path, "/".join(self.current_root), self.current_base_path, self.base_url, self.root_id)
+        if (resolved_ref := self._resolved_refs.get(key)) is None:
+            resolved_ref = self._resolved_refs[key] = self._resolve_ref(joined_path)
+        return resolved_ref
+
+    def _resolve_ref(self, joined_path: str) -> str:  # noqa: PLR0911, PLR0912, PLR0914, PLR0915
         if joined_path == "#":
             return f"{'/'.join(self.current_root)}#"
         if path_absolute_ref := self._resolve_path_absolute_local_ref(joined_path):
@@ -942,7 +980,7 @@ class ModelResolver:  # noqa: PLR0904
             if (
                 self.root_id_base_path
                 and not self.base_url
-                and not (is_url(joined_path) or Path(self._base_path, file_path).is_file())
+                and not (is_url(joined_path) or self._is_file(Path(self._base_path, file_path)))
             ):
                 ref = f"{self.root_id_base_path}/{ref}"
 
@@ -18,7 +18,7 @@ import os
 import tempfile
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeGuard, cast
+from typing import TYPE_CHECKING, Any, TypeGuard, cast
 from urllib.parse import SplitResult, parse_qsl, urlsplit, urlunsplit
 
 if TYPE_CHECKING:
@@ -140,6 +140,11 @@ def _read_entries(path: Path) -> dict[str, RemoteLockEntry]:
     except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
         msg = f"Unable to read remote lock {path}: {exc}"
         raise RemoteLockError(msg) from exc
+    return _entries_from_document(data, path)
+
+
+def _entries_from_document(data: Any, path: Path | str) -> dict[str, RemoteLockEntry]:
+    """Validate a decoded lock document and index its resources by request identity."""
     version = data.get("version") if isinstance(data, dict) else None
     if not isinstance(data, dict) or type(version) is not int or version != _LOCK_VERSION:
         msg = f"Invalid remote lock {path}: expected version {_LOCK_VERSION}"
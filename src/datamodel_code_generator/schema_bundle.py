@@ -0,0 +1,343 @@
+"""Bundle a multi-file JSON Schema or OpenAPI document into one self-contained document.
+
+Every ``$ref`` that leaves the root file is internalized: the referenced value is
+copied into the root document once, and each reference to it is rewritten to a
+local JSON pointer. JSON Schema targets are collected under ``$defs``, or under
+``definitions`` when the root keeps its definitions there. OpenAPI targets are
+collected under ``components/schemas`` and Swagger 2.0 targets under ``definitions``,
+unless they come from another component (or Swagger ``parameters`` or ``responses``)
+section, which they then keep. References inside the copied
+values are followed the same way, so the result no longer depends on the files
+around it, and generating from it avoids the per-file base path, base URL and root
+switches that cross-file references need.
+
+Only references into files on disk are bundled. An HTTP(S) reference is bundled
+when the root ``$id`` maps it to a file next to the root document, as the parser
+does; any other HTTP(S) reference is left as it is.
+
+Generating from the bundle yields the models of the tree of files, except that:
+
+- a definition whose name is already taken in the root is named after its ``title``,
+  or else qualified by its file (``ResolvedModelsPets``), rather than given the
+  parser's duplicate suffix (``PetsModel``);
+- files of the same name in different directories stay separate models, where
+  generating one module from the tree may use a single model for both;
+- models may be emitted in another order, since the copied definitions follow the
+  root's own.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urljoin, urlparse
+
+from datamodel_code_generator import Error, _load_parser_source_data_from_path
+from datamodel_code_generator.reference import is_url
+
+if TYPE_CHECKING:
+    from datamodel_code_generator import YamlValue
+
+_SWAGGER_SECTIONS = frozenset({"parameters", "responses"})
+# These keywords hold instance data, where a "$ref" key is not a reference.
+_DATA_KEYWORDS = frozenset({"const", "default", "enum", "example"})
+# A copied document keeps only its schema content; its identity and nested containers stay behind.
+_DOCUMENT_ONLY_KEYWORDS = frozenset({"$defs", "$id", "$schema", "definitions"})
+_NAME_SEPARATORS = re.compile(r"[^0-9A-Za-z_]+")
+_DEFINITIONS_DRAFT = re.compile(r"draft-0[3-7]")
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer_token(token: str) -> str:
+    return unquote(token.replace("~1", "/").replace("~0", "~"))
+
+
+def _resolve_pointer(document: YamlValue, fragment: str, source: Path) -> tuple[tuple[str, ...], YamlValue]:
+    """Return the keys a JSON pointer walks and the value it reaches.
+
+    Like the parser, a fragment without a leading slash is read as a pointer, and an
+    unescaped slash may belong to a key such as a URL.
+    """
+    tokens = fragment.strip("/").split("/") if fragment.strip("/") else []
+    keys: list[str] = []
+    value = document
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            keys.append(token)
+            value = value[int(token)]
+            index += 1
+            continue
+        end = next(
+            (
+                end
+                for end in range(index + 1, len(tokens) + 1)
+                if isinstance(value, dict) and _unescape_pointer_token("/".join(tokens[index:end])) in value
+            ),
+            None,
+        )
+        if end is None or not isinstance(value, dict):
+            msg = f"Unresolved $ref target: {source}#{fragment}"
+            raise Error(msg)
+        key = _unescape_pointer_token("/".join(tokens[index:end]))
+        keys.append(key)
+        value = value[key]
+        index = end
+    return tuple(keys), value
+
+
+def _find_anchor(value: YamlValue, name: str, keys: tuple[str, ...] = ()) -> tuple[tuple[str, ...], YamlValue] | None:
+    """Return the subschema that declares ``name`` as its ``$anchor`` or plain-name ``$id``."""
+    if isinstance(value, dict):
+        if value.get("$anchor") == name or f"#{name}" in {value.get("$id"), value.get("id")}:
+            return keys, value
+        items = [(str(key), item) for key, item in value.items() if str(key) not in _DATA_KEYWORDS]
+    elif isinstance(value, list):
+        items = [(str(index), item) for index, item in enumerate(value)]
+    else:
+        return None
+    for key, item in items:
+        if (found := _find_anchor(item, name, (*keys, key))) is not None:
+            return found
+    return None
+
+
+def _get_container(document: dict[str, YamlValue], container: tuple[str, ...]) -> dict[str, YamlValue]:
+    value: YamlValue = document
+    for key in container:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(slots=True)
+class _SchemaBundler:
+    """Copy external reference targets into one root document.
+
+    Targets are keyed by their file and JSON pointer keys, so a target reached from
+    several files is copied once, and a cycle through external files ends at the
+    local reference that is already assigned. A root definition that only refers to
+    an external target of the same name receives the copy itself, and every
+    definition of a referenced file is bundled, as the parser generates them all.
+    """
+
+    root_path: Path
+    encoding: str
+    root: dict[str, YamlValue]
+    _documents: dict[Path, YamlValue] = field(default_factory=dict)
+    _targets: dict[tuple[Path, tuple[str, ...]], str] = field(default_factory=dict)
+    _proxies: dict[tuple[str, ...], tuple[Path, tuple[str, ...], YamlValue]] = field(default_factory=dict)
+    _bundled: dict[tuple[str, ...], dict[str, YamlValue]] = field(default_factory=dict)
+    _expanded_documents: set[Path] = field(default_factory=set)
+
+    def _container(self, keys: tuple[str, ...]) -> tuple[str, ...]:
+        """Return where the copy of a target reached through ``keys`` in its file is stored."""
+        if "openapi" in self.root:
+            return ("components", keys[1]) if len(keys) > 2 and keys[0] == "components" else ("components", "schemas")  # noqa: PLR2004
+        if "swagger" in self.root:
+            return (keys[0],) if len(keys) > 1 and keys[0] in _SWAGGER_SECTIONS else ("definitions",)
+        if "$defs" in self.root:
+            return ("$defs",)
+        schema = self.root.get("$schema")
+        if "definitions" in self.root or (isinstance(schema, str) and _DEFINITIONS_DRAFT.search(schema) is not None):
+            return ("definitions",)
+        return ("$defs",)
+
+    def bundle(self) -> dict[str, YamlValue]:
+        """Return a copy of the root document with every file reference internalized."""
+        self._documents[self.root_path] = self.root
+        self._collect_proxies()
+        result = self._rewrite(self.root, self.root_path, ())
+        for container, bundled in self._bundled.items():
+            parent = result
+            for key in container:
+                parent = parent.setdefault(key, {})
+            parent.update(bundled)
+        return result
+
+    def _collect_proxies(self) -> None:
+        components = self.root.get("components")
+        containers = [
+            ("$defs",),
+            ("definitions",),
+            *(("components", str(kind)) for kind in (components if isinstance(components, dict) else ())),
+        ]
+        for container in containers:
+            for name, entry in _get_container(self.root, container).items():
+                if not (isinstance(entry, dict) and set(entry) == {"$ref"} and isinstance(entry["$ref"], str)):
+                    continue
+                if (resolved := self._resolve(entry["$ref"], self.root_path)) is None:
+                    continue
+                target_path, keys, _ = resolved
+                if (
+                    target_path == self.root_path
+                    or (target_path, keys) in self._targets
+                    or (keys[-1] if keys else target_path.stem) != name
+                ):
+                    continue
+                location = (*container, str(name))
+                self._targets[target_path, keys] = "#/" + "/".join(_escape_pointer_token(key) for key in location)
+                self._proxies[location] = resolved
+
+    def _load(self, path: Path) -> YamlValue:
+        if (document := self._documents.get(path)) is None:
+            try:
+                document = _load_parser_source_data_from_path(path, self.encoding)
+            except FileNotFoundError:
+                msg = f"$ref file not found: {path}"
+                raise Error(msg) from None
+            self._documents[path] = document
+        return document
+
+    def _rewrite(self, value: YamlValue, path: Path, location: tuple[str, ...]) -> Any:
+        if path == self.root_path and (proxy := self._proxies.get(location)) is not None:
+            target_path, keys, target = proxy
+            return self._copy(target, target_path, keys, location)
+        if isinstance(value, list):
+            return [self._rewrite(item, path, (*location, str(index))) for index, item in enumerate(value)]
+        if not isinstance(value, dict):
+            return value
+        result: dict[str, Any] = {}
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str):
+                result[key] = self._rewrite_ref(item, path)
+            elif key == "mapping" and location[-1:] == ("discriminator",) and isinstance(item, dict):
+                # Mapping values are schema names or references; only references contain a slash or "#".
+                result[key] = {
+                    name: self._rewrite_ref(ref, path) if isinstance(ref, str) and ("/" in ref or "#" in ref) else ref
+                    for name, ref in item.items()
+                }
+            elif str(key) in _DATA_KEYWORDS or (key == "examples" and isinstance(item, list)):
+                result[key] = item
+            else:
+                result[key] = self._rewrite(item, path, (*location, str(key)))
+        return result
+
+    def _copy(self, target: YamlValue, path: Path, keys: tuple[str, ...], location: tuple[str, ...]) -> Any:
+        if not keys and isinstance(target, dict):
+            target = {key: value for key, value in target.items() if key not in _DOCUMENT_ONLY_KEYWORDS}
+        return self._rewrite(target, path, location)
+
+    def _local_path_for_uri(self, uri: str) -> Path | None:
+        """Map a URI under the root ``$id`` to the file at the same place next to the root document."""
+        if not isinstance(root_id := self.root.get("$id"), str) or not root_id:
+            return None
+        resolved, root_directory = urljoin(root_id, uri), urljoin(root_id, ".")
+        if not resolved.startswith(root_directory):
+            return None
+        local_path = (self.root_path.parent / unquote(resolved.removeprefix(root_directory))).resolve()
+        return local_path if local_path.is_file() else None
+
+    def _target_path(self, file_part: str, path: Path) -> Path | None:
+        if not file_part:
+            return path
+        if file_part.startswith("file://"):
+            return Path(unquote(urlparse(file_part).path)).resolve()
+        if is_url(file_part) or file_part.startswith("/"):
+            if (local_path := self._local_path_for_uri(file_part)) is not None:
+                return local_path
+            if is_url(file_part):
+                return None
+        return (path.parent / unquote(file_part)).resolve()
+
+    def _resolve(self, ref: str, path: Path) -> tuple[Path, tuple[str, ...], YamlValue] | None:
+        """Return the file, pointer keys and value that ``ref`` reaches, or ``None`` for a remote reference."""
+        file_part, _, fragment = ref.partition("#")
+        if (target_path := self._target_path(file_part, path)) is None:
+            return None
+        document = self._load(target_path)
+        anchor = _find_anchor(document, fragment) if fragment and not fragment.startswith("/") else None
+        keys, target = anchor or _resolve_pointer(document, fragment, target_path)
+        return target_path, keys, target
+
+    def _rewrite_ref(self, ref: str, path: Path) -> str:
+        if path == self.root_path and ref.startswith("#"):
+            return ref
+        if (resolved := self._resolve(ref, path)) is None:
+            return ref
+        target_path, keys, target = resolved
+        if target_path == self.root_path:
+            return "#" + "".join(f"/{_escape_pointer_token(key)}" for key in keys)
+        if (local_ref := self._targets.get((target_path, keys))) is not None:
+            return local_ref
+        container = self._container(keys)
+        bundled = self._bundled.setdefault(container, {})
+        name = self._name(target_path, keys, target, container)
+        local_ref = "#/" + "/".join(_escape_pointer_token(key) for key in (*container, name))
+        self._targets[target_path, keys] = local_ref
+        # Reserve the name before following references inside the target, which may lead back to it.
+        bundled[name] = {}
+        bundled[name] = self._copy(target, target_path, keys, (*container, name))
+        self._bundle_definitions(target_path)
+        return local_ref
+
+    def _bundle_definitions(self, path: Path) -> None:
+        """Bundle every definition of a referenced file, as the parser generates them all."""
+        if path in self._expanded_documents:
+            return
+        self._expanded_documents.add(path)
+        document = self._documents[path]
+        if not isinstance(document, dict):
+            return
+        containers = (
+            [("components", "schemas")]
+            if "openapi" in self.root
+            else [("definitions",)]
+            if "swagger" in self.root
+            else [("$defs",), ("definitions",)]
+        )
+        for container in containers:
+            if definitions := _get_container(document, container):
+                for name in definitions:
+                    self._rewrite_ref(
+                        "#/" + "/".join(_escape_pointer_token(key) for key in (*container, str(name))), path
+                    )
+                return
+
+    def _name(self, path: Path, keys: tuple[str, ...], target: YamlValue, container: tuple[str, ...]) -> str:
+        """Return a free definition name, trying the target's name, then its ``title``, then its file path."""
+        taken = self._bundled.get(container, {}).keys() | _get_container(self.root, container).keys()
+        relative_parts = (
+            path.relative_to(self.root_path.parent).with_suffix("").parts
+            if path.is_relative_to(self.root_path.parent)
+            else (path.stem,)
+        )
+        qualified = _NAME_SEPARATORS.sub("_", "_".join((*relative_parts, *keys[-1:]))).strip("_")
+        name = (keys[-1] if not keys[-1].isdigit() else qualified) if keys else path.stem
+        if "/" in name:
+            name = _NAME_SEPARATORS.sub("_", name).strip("_")
+        title = target.get("title") if isinstance(target, dict) else None
+        titled = _NAME_SEPARATORS.sub("_", title).strip("_") if isinstance(title, str) else ""
+        for candidate in (name, titled, qualified):
+            if candidate and candidate not in taken:
+                return candidate
+        suffix = 2
+        while f"{qualified}_{suffix}" in taken:
+            suffix += 1
+        return f"{qualified}_{suffix}"
+
+
+def bundle_schema(input_: Path, *, encoding: str = "utf-8") -> dict[str, YamlValue]:
+    """Return ``input_`` as one self-contained document with all file references internalized.
+
+    The input may be a JSON Schema or an OpenAPI document in JSON or YAML. The
+    returned document can be written out once and used as generation input in place
+    of the original tree of files.
+    """
+    root_path = input_.resolve()
+    if not root_path.is_file():
+        msg = f"File not found: {input_}"
+        raise Error(msg)
+    root = _load_parser_source_data_from_path(root_path, encoding)
+    if not isinstance(root, dict):
+        msg = f"Expected a mapping at the root of {input_}, got {type(root).__name__}"
+        raise Error(msg)
+    return _SchemaBundler(root_path=root_path, encoding=encoding, root=root).bundle()
+
+
+__all__ = ["bundle_schema"]
@@ -189,6 +189,26 @@ def get_yaml_backend() -> YamlBackend:
         return "ryaml"
 
 
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+
+@lru_cache(maxsize=1)
+def get_json_backend() -> JsonBackend:
+    """Detect the fastest available JSON decoding backend ('orjson', 'msgspec', or 'json')."""
+    try:
+        import orjson  # noqa: PLC0415, F401  # ty: ignore[unresolved-import]
+    except ImportError:
+        pass
+    else:
+        return "orjson"
+    try:
+        import msgspec  # noqa: PLC0415, F401
+    except ImportError:
+        return "json"
+    else:
+        return "msgspec"
+
+
 @lru_cache(maxsize=1)
 def get_yaml_parse_errors() -> tuple[type[Exception], ...]:
     """Return YAML parse error types for both backends."""
@@ -222,6 +222,7 @@ def watch_and_regenerate(
 ) -> Exit:
     """Watch every local generation dependency and fully regenerate on changes."""
     from datamodel_code_generator.__main__ import Exit  # noqa: PLC0415
+    from datamodel_code_generator.format import ruff_worker_session  # noqa: PLC0415
     from datamodel_code_generator.watch_dependencies import WatchDependencies  # noqa: PLC0415
 
     watchfiles = _get_watchfiles()
@@ -246,15 +247,16 @@ def watch_and_regenerate(
     )
     catch_up = False
     try:
-        while watch_roots := dependencies.watch_roots():
-            restart = _watch_once(
-                watch_context,
-                watch_roots,
-                catch_up=catch_up,
-            )
-            if not restart:
-                return Exit.OK
-            catch_up = True
+        with ruff_worker_session():
+            while watch_roots := dependencies.watch_roots():
+                restart = _watch_once(
+                    watch_context,
+                    watch_roots,
+                    catch_up=catch_up,
+                )
+                if not restart:
+                    return Exit.OK
+                catch_up = True
     except KeyboardInterrupt:
         print("\nWatch mode stopped.")  # noqa: T201
 
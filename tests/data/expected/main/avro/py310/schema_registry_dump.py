@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  schema_registry_dump.ndjson
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field, RootModel
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+
+
+class User(BaseModel):
+    id: int
+    email: str | None
+    address: Address
+
+
+class Status(Enum):
+    NEW = 'NEW'
+    SHIPPED = 'SHIPPED'
+
+
+class Order(BaseModel):
+    user: User
+    status: Status
+
+
+class Model(RootModel[Address | User | Order | str]):
+    root: Address | User | Order | str = Field(..., title='Model')
@@ -10,4 +10,4 @@ from pydantic import BaseModel
 class Model(BaseModel):
     id: str
     name: str
-    note: None
+    note: str | None
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  events.ndjson
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Payload(BaseModel):
+    x: float | None = None
+    y: int | None = None
+    page: str | None = None
+    sku: str | None = None
+    quantity: int | None = None
+
+
+class Model(BaseModel):
+    id: int
+    type: str
+    payload: Payload
+    user: str | None = None
+    tags: list[str] | None = None
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  events.ndjson
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Payload(BaseModel):
+    x: float | None = None
+    y: int | None = None
+    page: str | None = None
+
+
+class Model(BaseModel):
+    id: int
+    type: str
+    payload: Payload
+    user: str | None
@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  shared_definitions.json
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class SearchInputRange(BaseModel):
+    low: int | None = None
+    high: int | None = None
+
+
+class SearchInputNode(BaseModel):
+    label: str | None = None
+    children: list[SearchInputNode] | None = None
+
+
+class SearchInputSort(Enum):
+    relevance = 'relevance'
+    date = 'date'
+
+
+class FetchDocumentsInputSort(Enum):
+    date = 'date'
+    size = 'size'
+
+
+class FetchDocumentsInputPage(BaseModel):
+    cursor: str | None = None
+
+
+class SearchInputFilter(BaseModel):
+    term: str
+    range: SearchInputRange | None = None
+
+
+class SearchInput(BaseModel):
+    filter: SearchInputFilter
+    tree: SearchInputNode | None = None
+    sort: SearchInputSort | None = None
+
+
+class FetchDocumentsInput(BaseModel):
+    filter: SearchInputFilter
+    tree: SearchInputNode | None = None
+    sort: FetchDocumentsInputSort | None = None
+    page: FetchDocumentsInputPage | None = None
+
+
+SearchInputNode.model_rebuild()
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  operation_filters.yaml
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class OrderItem(BaseModel):
+    sku: str | None = None
+
+
+class Order(BaseModel):
+    id: str | None = None
+    items: list[OrderItem] | None = None
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  operation_filters.yaml
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from pydantic import BaseModel, RootModel
+
+
+class TenantId(RootModel[str]):
+    root: str
+
+
+class Owner(BaseModel):
+    name: str | None = None
+
+
+class OrderItem(BaseModel):
+    sku: str | None = None
+
+
+class Pet(BaseModel):
+    id: int
+    kind: str
+    owner: Owner | None = None
+
+
+class Dog(Pet):
+    barks: bool | None = None
+
+
+class Order(BaseModel):
+    id: str | None = None
+    items: list[OrderItem] | None = None
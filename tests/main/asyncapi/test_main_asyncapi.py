@@ -75,6 +75,55 @@ def test_asyncapi_converter_compatibility_attributes_are_lazy() -> None:
     assert convert_xml_schema_data.__module__ == "datamodel_code_generator.parser.xmlschema"
 
 
+@pytest.mark.allow_direct_assert
+def test_asyncapi_shared_refs_are_resolved_and_expanded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Refs reused across a catalogue are resolved once and their traits are walked once."""
+    channel_count = 20
+    specification = {
+        "asyncapi": "3.0.0",
+        "info": {"title": "Catalogue", "version": "1.0.0"},
+        "channels": {
+            f"channel{index}": {
+                "address": f"events.{index}",
+                "messages": {"event": {"$ref": "#/components/messages/Event"}},
+            }
+            for index in range(channel_count)
+        },
+        "components": {
+            "messages": {
+                "Event": {
+                    "payload": {"type": "object", "properties": {"id": {"type": "string"}}},
+                    "traits": [{"$ref": "#/components/messageTraits/Common"}],
+                }
+            },
+            "messageTraits": {
+                "Common": {"headers": {"type": "object", "properties": {"trace": {"type": "string"}}}},
+            },
+        },
+    }
+    resolved_refs: list[str] = []
+    trait_walks: list[object] = []
+    resolve_uncached = AsyncAPIParser._resolve_asyncapi_ref_uncached
+    iter_message_traits = AsyncAPIParser._iter_message_trait_schemas
+
+    def record_resolve(self: AsyncAPIParser, ref: str) -> object:
+        resolved_refs.append(ref)
+        return resolve_uncached(self, ref)
+
+    def record_trait_walk(self: AsyncAPIParser, traits: object, *args: object) -> object:
+        trait_walks.append(traits)
+        return iter_message_traits(self, traits, *args)
+
+    monkeypatch.setattr(AsyncAPIParser, "_resolve_asyncapi_ref_uncached", record_resolve)
+    monkeypatch.setattr(AsyncAPIParser, "_iter_message_trait_schemas", record_trait_walk)
+    output = AsyncAPIParser(source=json.dumps(specification)).parse()
+
+    assert sorted(resolved_refs) == ["#/components/messageTraits/Common", "#/components/messages/Event"]
+    assert len(trait_walks) == 4
+    assert "class EventPayload(BaseModel):" in output
+    assert "class EventHeaders(BaseModel):" in output
+
+
 def test_main_asyncapi_2_yaml(output_file: Path) -> None:
     """Generate models from an AsyncAPI 2.x YAML document."""
     run_main_and_assert(
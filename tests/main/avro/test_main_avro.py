@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import cast
 
@@ -10,7 +11,12 @@ import pytest
 from datamodel_code_generator import DataModelType, load_data
 from datamodel_code_generator.__main__ import Exit
 from datamodel_code_generator.format import PythonVersion, is_supported_in_black
-from datamodel_code_generator.parser.avro import convert_avro_schema_data
+from datamodel_code_generator.parser.avro import (
+    _AvroSchemaConverter,
+    _parsing_canonical_form,
+    convert_avro_schema_data,
+)
+from datamodel_code_generator.parser.base import Source
 from tests.conftest import assert_mutable_copy_is_isolated
 from tests.main.avro.conftest import assert_file_content
 from tests.main.conftest import (
@@ -223,6 +229,94 @@ def test_main_avro_official_c_schema_pass_corpus(output_file: Path, fixture_path
     )
 
 
+@_SKIP_BLACK
+def test_main_avro_schema_registry_dump(output_file: Path) -> None:
+    """Stream a JSON-lines schema registry dump, converting each distinct schema once."""
+    run_main_and_assert(
+        input_path=AVRO_DATA_PATH / "schema_registry_dump.ndjson",
+        output_path=output_file,
+        assert_func=assert_file_content,
+        expected_file=_expected_file("schema_registry_dump.py"),
+        extra_args=get_current_version_args(),
+        force_exec_validation=True,
+    )
+
+
+def test_main_avro_schema_registry_dump_invalid_line(
+    tmp_path: Path, output_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Report the line of a JSON-lines schema dump that is not valid JSON."""
+    input_path = tmp_path / "dump.jsonl"
+    input_path.write_text('"string"\n\n{"type": "record",\n', encoding="utf-8")
+    run_main_and_assert(
+        input_path=input_path,
+        output_path=output_file,
+        input_file_type="avro",
+        expected_exit=Exit.ERROR,
+        capsys=capsys,
+        expected_stderr_contains="Invalid JSON in Avro schema stream at line 3",
+    )
+
+
+@pytest.mark.allow_direct_assert
+def test_avro_pretty_printed_schema_registry_record() -> None:
+    """Unwrap an indented single schema registry record instead of reading it as JSON lines."""
+    schema = {"type": "record", "name": "User", "namespace": "acme", "fields": [{"name": "id", "type": "long"}]}
+    record = {"subject": "user-value", "version": 1, "id": 1, "schema": json.dumps(schema)}
+    source = Source(path=Path("user.json"), text=json.dumps(record, indent=2))
+
+    assert _AvroSchemaConverter().convert(source) == _AvroSchemaConverter().convert_raw(schema)
+
+
+@pytest.mark.allow_direct_assert
+def test_avro_schema_stream_deduplicates_identical_schemas() -> None:
+    """Skip schemas that were already seen and let later redefinitions win."""
+    first = {
+        "type": "record",
+        "name": "User",
+        "namespace": "acme",
+        "doc": "First",
+        "fields": [{"name": "id", "type": "long"}],
+    }
+    reordered = {"fields": first["fields"], "doc": "First", "namespace": "acme", "name": "User", "type": "record"}
+    changed = {**first, "doc": "Third", "fields": [{"name": "name", "type": "string"}]}
+
+    assert (
+        _parsing_canonical_form(first) == '{"name":"acme.User","type":"record","fields":[{"name":"id","type":"long"}]}'
+    )
+    assert _AvroSchemaConverter().convert_stream([first, reordered])["description"] == "First"
+    converted = _AvroSchemaConverter().convert_stream([first, reordered, changed])
+    assert converted["description"] == "Third"
+    assert list(cast("dict[str, object]", converted["properties"])) == ["name"]
+
+
+@pytest.mark.allow_direct_assert
+@pytest.mark.parametrize(
+    ("field_type", "field_extra", "expected_property"),
+    [
+        pytest.param(
+            {"type": "long", "logicalType": "timestamp-millis"},
+            {},
+            {"type": "string", "format": "date-time"},
+            id="logical_type",
+        ),
+        pytest.param("long", {"order": "descending"}, {"x-avro-order": "descending"}, id="order"),
+        pytest.param("long", {"doc": "Event time"}, {"type": "integer", "description": "Event time"}, id="doc"),
+    ],
+)
+def test_avro_schema_stream_keeps_versions_with_same_canonical_form(
+    field_type: object, field_extra: dict[str, object], expected_property: dict[str, object]
+) -> None:
+    """Convert later versions that only differ in attributes dropped by the Parsing Canonical Form."""
+    first = {"type": "record", "name": "Ev", "fields": [{"name": "ts", "type": "long"}]}
+    second = {"type": "record", "name": "Ev", "fields": [{"name": "ts", "type": field_type, **field_extra}]}
+
+    assert _parsing_canonical_form(first) == _parsing_canonical_form(second)
+    converted = _AvroSchemaConverter().convert_stream([first, second])
+    properties = cast("dict[str, dict[str, object]]", converted["properties"])
+    assert {key: value for key, value in properties["ts"].items() if key in expected_property} == expected_property
+
+
 def test_main_avro_schema_version_not_supported(output_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """Reject explicit schema-version for Avro, which does not define an in-schema version marker."""
     run_main_and_assert(
@@ -79,6 +79,7 @@ _CLI_FORMATTER_RELATED_OPTIONS = frozenset({
     "--wrap-string-literal",
 })
 _NON_GENERATION_CLI_OPTIONS = frozenset({
+    "--bundle-schema",
     "--debug",
     "--generate-cli-command",
     "--generate-prompt",
@@ -6,13 +6,16 @@ import ast
 from typing import TYPE_CHECKING
 
 import black
+import graphql
 import pytest
 
+from datamodel_code_generator.__main__ import Exit
 from tests.main.conftest import (
     DEFAULT_VALUES_DATA_PATH,
     EXPECTED_GRAPHQL_PATH,
     GRAPHQL_DATA_PATH,
     LEGACY_BLACK_SKIP,
+    InputFileTypeLiteral,
     run_main_and_assert,
 )
 from tests.main.graphql.conftest import assert_file_content
@@ -1063,3 +1066,53 @@ def test_main_graphql_no_typename(output_file: Path) -> None:
         expected_file="no_typename.py",
         extra_args=["--graphql-no-typename"],
     )
+
+
+@pytest.mark.parametrize("input_file_type", ["graphql", None])
+def test_main_graphql_introspection_json(input_file_type: InputFileTypeLiteral | None, output_file: Path) -> None:
+    """Generate the same models from an introspection query result as from the SDL it describes."""
+    run_main_and_assert(
+        input_path=GRAPHQL_DATA_PATH / "simple-star-wars-introspection.json",
+        output_path=output_file,
+        input_file_type=input_file_type,
+        assert_func=assert_file_content,
+        expected_file="simple_star_wars.py",
+        extra_args=["--output-model-type", "pydantic_v2.BaseModel"],
+        transform=lambda output: output.replace("simple-star-wars-introspection.json", "simple-star-wars.graphql"),
+    )
+
+
+def test_main_graphql_invalid_introspection_json(
+    output_file: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Reject JSON GraphQL input that is not an introspection result."""
+    input_path = tmp_path / "schema.json"
+    input_path.write_text('{"data": {"types": []}}', encoding="utf-8")
+    run_main_and_assert(
+        input_path=input_path,
+        output_path=output_file,
+        input_file_type="graphql",
+        expected_exit=Exit.ERROR,
+        capsys=capsys,
+        expected_stderr_contains="introspection result with a '__schema' object",
+    )
+
+
+def test_main_graphql_cache_dir_skips_sdl_build(
+    output_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reuse a GraphQL schema persisted under --cache-dir instead of parsing and validating the SDL again."""
+    for _ in range(2):
+        run_main_and_assert(
+            input_path=GRAPHQL_DATA_PATH / "simple-star-wars.graphql",
+            output_path=output_file,
+            input_file_type="graphql",
+            assert_func=assert_file_content,
+            expected_file="simple_star_wars.py",
+            extra_args=["--output-model-type", "pydantic_v2.BaseModel", "--cache-dir", str(tmp_path / "cache")],
+        )
+        monkeypatch.setattr(graphql, "build_schema", _fail_graphql_sdl_build)
+
+
+def _fail_graphql_sdl_build(*_: object) -> None:  # pragma: no cover
+    pytest.fail("GraphQL schema should be served from --cache-dir")
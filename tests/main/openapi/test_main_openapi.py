@@ -9434,6 +9434,112 @@ def test_main_openapi_include_paths_warning_without_paths_scope() -> None:
         assert_warnings_contain(w, "--openapi-include-paths has no effect without --openapi-scopes paths")
 
 
+@pytest.mark.cli_doc(
+    options=["--openapi-include-tags"],
+    option_description="""Include only OpenAPI operations with matching tags.
+
+The `--openapi-include-tags` flag selects operations whose tags match any of the fnmatch patterns.
+Component schemas are limited to those referenced by the selected operations, so unused schemas
+are neither parsed nor generated.""",
+    input_schema="openapi/operation_filters.yaml",
+    cli_args=["--openapi-include-tags", "pets"],
+    golden_output="openapi/operation_filters/tag_pets.py",
+)
+def test_main_openapi_include_tags(output_file: Path) -> None:
+    """Include only OpenAPI operations with matching tags.
+
+    The `--openapi-include-tags` flag selects operations whose tags match any of the fnmatch patterns.
+    Component schemas are limited to those referenced by the selected operations, so unused schemas
+    are neither parsed nor generated.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "operation_filters.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "operation_filters" / "tag_pets.py",
+        extra_args=["--openapi-include-tags", "pets"],
+    )
+
+
+@pytest.mark.cli_doc(
+    options=["--openapi-exclude-tags"],
+    option_description="""Exclude OpenAPI operations with matching tags.
+
+The `--openapi-exclude-tags` flag drops operations with a tag matching any of the fnmatch patterns.
+Component schemas only referenced by excluded operations are not generated.""",
+    input_schema="openapi/operation_filters.yaml",
+    cli_args=["--openapi-exclude-tags", "admin"],
+    golden_output="openapi/operation_filters/exclude_tag_admin.py",
+)
+def test_main_openapi_exclude_tags(output_file: Path) -> None:
+    """Exclude OpenAPI operations with matching tags.
+
+    The `--openapi-exclude-tags` flag drops operations with a tag matching any of the fnmatch patterns.
+    Component schemas only referenced by excluded operations are not generated.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "operation_filters.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "operation_filters" / "exclude_tag_admin.py",
+        extra_args=["--openapi-exclude-tags", "admin"],
+    )
+
+
+@pytest.mark.cli_doc(
+    options=["--openapi-include-operation-ids"],
+    option_description="""Include only OpenAPI operations with matching operationIds.
+
+The `--openapi-include-operation-ids` flag selects operations whose operationId matches any of the
+fnmatch patterns. It combines with `--openapi-include-tags`: an operation matching either is selected.""",
+    input_schema="openapi/operation_filters.yaml",
+    cli_args=["--openapi-scopes", "schemas", "paths", "--openapi-include-operation-ids", "get*", "listPets"],
+    golden_output="openapi/operation_filters/operation_ids_get_and_list_pets.py",
+)
+def test_main_openapi_include_operation_ids(output_file: Path) -> None:
+    """Include only OpenAPI operations with matching operationIds.
+
+    The `--openapi-include-operation-ids` flag selects operations whose operationId matches any of the
+    fnmatch patterns. It combines with `--openapi-include-tags`: an operation matching either is selected.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "operation_filters.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "operation_filters" / "operation_ids_get_and_list_pets.py",
+        extra_args=["--openapi-scopes", "schemas", "paths", "--openapi-include-operation-ids", "get*", "listPets"],
+    )
+
+
+@pytest.mark.cli_doc(
+    options=["--openapi-exclude-operation-ids"],
+    option_description="""Exclude OpenAPI operations with matching operationIds.
+
+The `--openapi-exclude-operation-ids` flag drops operations whose operationId matches any of the
+fnmatch patterns. Exclusions take precedence over the include filters.""",
+    input_schema="openapi/operation_filters.yaml",
+    cli_args=["--openapi-include-tags", "pets", "store", "--openapi-exclude-operation-ids", "*Pet*"],
+    golden_output="openapi/operation_filters/exclude_operation_ids_pets.py",
+)
+def test_main_openapi_exclude_operation_ids(output_file: Path) -> None:
+    """Exclude OpenAPI operations with matching operationIds.
+
+    The `--openapi-exclude-operation-ids` flag drops operations whose operationId matches any of the
+    fnmatch patterns. Exclusions take precedence over the include filters.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "operation_filters.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "operation_filters" / "exclude_operation_ids_pets.py",
+        extra_args=["--openapi-include-tags", "pets", "store", "--openapi-exclude-operation-ids", "*Pet*"],
+    )
+
+
 def test_main_openapi_deprecated_field(output_file: Path) -> None:
     """Test OpenAPI generation with deprecated field property."""
     run_main_and_assert(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import deepcopy
 from enum import Enum
 from typing import TYPE_CHECKING, Any, cast
@@ -12,6 +13,7 @@ import yaml
 
 from datamodel_code_generator import DataModelType, Error, InputFileType, generate, infer_input_type
 from datamodel_code_generator.__main__ import Exit
+from datamodel_code_generator.parser import protobuf as protobuf_parser
 from datamodel_code_generator.parser.protobuf import WELL_KNOWN_SCHEMAS, ProtobufParser, convert_protobuf_schema_data
 from tests.conftest import assert_mutable_copy_is_isolated, assert_output
 from tests.main.conftest import (
@@ -117,6 +119,140 @@ def test_main_protobuf_proto3_optional_schema_version(output_file: Path) -> None
     )
 
 
+@pytest.mark.cli_doc(
+    options=["--cache-dir"],
+    option_description="""Cache expensive schema compilation results on disk.
+
+The `--cache-dir` option stores compiled Protocol Buffers descriptor sets in the
+given directory. Entries are keyed by the contents of the input files, their
+transitive imports, the include paths and the tool versions, so an unchanged
+schema skips `protoc` on the next run and any edit is picked up automatically.""",
+    input_schema="protobuf/proto3_optional.proto",
+    cli_args=["--input-file-type", "protobuf", "--cache-dir", ".cache/datamodel-codegen"],
+    golden_output="main/protobuf/proto3_optional.py",
+)
+def test_main_protobuf_cache_dir(output_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache expensive schema compilation results on disk.
+
+    The `--cache-dir` option stores compiled Protocol Buffers descriptor sets in the
+    given directory. Entries are keyed by the contents of the input files, their
+    transitive imports, the include paths and the tool versions, so an unchanged
+    schema skips `protoc` on the next run and any edit is picked up automatically.
+    """
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        run_main_and_assert(
+            input_path=PROTOBUF_DATA_PATH / "proto3_optional.proto",
+            output_path=output_file,
+            input_file_type="protobuf",
+            extra_args=["--cache-dir", str(cache_dir)],
+            assert_func=assert_file_content,
+            expected_file="proto3_optional.py",
+        )
+        monkeypatch.setattr(ProtobufParser, "_compile_descriptor_set", _fail_compile_descriptor_set)
+
+
+def _fail_compile_descriptor_set(_self: ProtobufParser) -> Any:  # pragma: no cover
+    pytest.fail("protoc should not run for a cached descriptor set")
+
+
+@pytest.mark.allow_direct_assert
+def test_generate_api_protobuf_cache_dir_invalidated_by_imported_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Editing a transitively imported file invalidates the cached descriptor set."""
+    schema_dir = tmp_path / "schema"
+    schema_dir.mkdir()
+    (schema_dir / "common.proto").write_text(
+        'syntax = "proto3";\npackage cache.v1;\nmessage Money { int64 units = 1; }\n', encoding="utf-8"
+    )
+    (schema_dir / "order.proto").write_text(
+        'syntax = "proto3";\npackage cache.v1;\nimport "common.proto";\nmessage Order { Money total = 1; }\n',
+        encoding="utf-8",
+    )
+    compile_calls: list[None] = []
+    compile_descriptor_set = ProtobufParser._compile_descriptor_set
+
+    def counting_compile_descriptor_set(self: ProtobufParser) -> Any:
+        compile_calls.append(None)
+        return compile_descriptor_set(self)
+
+    monkeypatch.setattr(ProtobufParser, "_compile_descriptor_set", counting_compile_descriptor_set)
+
+    def run() -> str:
+        return str(
+            generate(
+                schema_dir / "order.proto",
+                input_file_type=InputFileType.Protobuf,
+                disable_timestamp=True,
+                cache_dir=tmp_path / "cache",
+            )
+        )
+
+    first = run()
+    assert run() == first
+    assert len(compile_calls) == 1
+
+    (schema_dir / "common.proto").write_text(
+        'syntax = "proto3";\npackage cache.v1;\nmessage Money { int64 units = 1; string currency = 2; }\n',
+        encoding="utf-8",
+    )
+    assert "currency" in run()
+    assert len(compile_calls) == 2
+
+
+@pytest.mark.allow_direct_assert
+def test_generate_api_protobuf_reconverts_only_changed_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unchanged files reuse cached definitions; a changed enum reconverts its dependents."""
+    monkeypatch.setattr(protobuf_parser, "_fragment_cache", OrderedDict())
+    schema_dir = tmp_path / "schema"
+    schema_dir.mkdir()
+    (schema_dir / "common.proto").write_text(
+        'syntax = "proto3";\npackage fragments.v1;\nenum Status { ACTIVE = 0; CLOSED = 1; }\n', encoding="utf-8"
+    )
+    (schema_dir / "order.proto").write_text(
+        'syntax = "proto3";\npackage fragments.v1;\nimport "common.proto";\nmessage Order { Status status = 1; }\n',
+        encoding="utf-8",
+    )
+    (schema_dir / "user.proto").write_text(
+        'syntax = "proto3";\npackage fragments.v1;\nmessage User { string name = 1; }\n', encoding="utf-8"
+    )
+    converted_files: list[str] = []
+    convert_file = protobuf_parser._ProtobufDescriptorConverter._convert_file
+
+    def recording_convert_file(self: Any, file_descriptor: Any, effective_version: Any) -> Any:
+        converted_files.append(file_descriptor.name)
+        return convert_file(self, file_descriptor, effective_version)
+
+    monkeypatch.setattr(protobuf_parser._ProtobufDescriptorConverter, "_convert_file", recording_convert_file)
+
+    def run() -> str:
+        return str(generate(schema_dir, input_file_type=InputFileType.Protobuf, disable_timestamp=True))
+
+    run()
+    assert sorted(converted_files) == ["common.proto", "order.proto", "user.proto"]
+
+    converted_files.clear()
+    (schema_dir / "user.proto").write_text(
+        'syntax = "proto3";\npackage fragments.v1;\nmessage User { string name = 1; int32 age = 2; }\n',
+        encoding="utf-8",
+    )
+    assert "age" in run()
+    assert converted_files == ["user.proto"]
+
+    converted_files.clear()
+    (schema_dir / "common.proto").write_text(
+        'syntax = "proto3";\npackage fragments.v1;\nenum Status { PENDING = 0; ACTIVE = 1; CLOSED = 2; }\n',
+        encoding="utf-8",
+    )
+    incremental = run()
+    assert sorted(converted_files) == ["common.proto", "order.proto"]
+
+    monkeypatch.setattr(protobuf_parser, "_fragment_cache", OrderedDict())
+    assert run() == incremental
+    assert "status: FragmentsV1Status | None = 'PENDING'" in incremental
+
+
 def test_main_protobuf_well_known_wrappers(output_file: Path) -> None:
     """Generate models for all wrapper well-known types and Empty."""
     run_main_and_assert(
@@ -21,6 +21,7 @@ from datamodel_code_generator import (
     clear_dynamic_models_cache,
     generate,
     generate_dynamic_models,
+    generate_dynamic_models_batch,
     load_yaml_dict_from_path,
 )
 from datamodel_code_generator.config import GenerateConfig
@@ -445,6 +446,76 @@ def test_clear_cache() -> None:
     assert clear_dynamic_models_cache() == 0
 
 
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that a cache hit protects an entry from the next eviction."""
+    schemas = [make_object_schema({f"field{i}": {"type": "string"}}) for i in range(4)]
+    first, second, _ = (generate_dynamic_models(schema, cache_size=3) for schema in schemas[:3])
+
+    assert generate_dynamic_models(schemas[0], cache_size=3) is first
+    generate_dynamic_models(schemas[3], cache_size=3)
+
+    assert generate_dynamic_models(schemas[0], cache_size=3) is first
+    assert generate_dynamic_models(schemas[1], cache_size=3) is not second
+
+
+def test_cache_max_bytes_limits_cached_entries() -> None:
+    """Test that the byte budget evicts entries and skips entries larger than the budget."""
+    from datamodel_code_generator import dynamic as dcg
+
+    schemas = [make_object_schema({f"field{i}": {"type": "string"}}) for i in range(3)]
+    generate_dynamic_models(schemas[0])
+    entry_size = next(iter(dcg._dynamic_models_cache_sizes.values()))
+    clear_dynamic_models_cache()
+
+    for schema in schemas:
+        generate_dynamic_models(schema, cache_max_bytes=entry_size * 2)
+    assert len(dcg._dynamic_models_cache) == 2
+    assert sum(dcg._dynamic_models_cache_sizes.values()) <= entry_size * 2
+
+    generate_dynamic_models(make_object_schema({"other": {"type": "integer"}}), cache_max_bytes=1)
+    assert clear_dynamic_models_cache() == 2
+
+
+def test_schema_key_replaces_schema_hashing() -> None:
+    """Test that schema_key identifies cached models without serializing the schema."""
+    from datamodel_code_generator import dynamic as dcg
+
+    schema = make_object_schema({"name": {"type": "string"}})
+    models = generate_dynamic_models(schema, schema_key="tenant-1:v1")
+
+    assert generate_dynamic_models(dict(schema), schema_key="tenant-1:v1") is models
+    assert generate_dynamic_models(schema, schema_key="tenant-1:v2") is not models
+    assert generate_dynamic_models(schema) is not models
+    assert dcg._make_cache_key({"custom": object()}, make_config(), schema_key="tenant-1:v1") is not None
+
+
+@pytest.mark.parametrize("module_split_mode", [None, ModuleSplitMode.Single])
+def test_compiled_models_are_cached_on_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, module_split_mode: ModuleSplitMode | None
+) -> None:
+    """Test that config.cache_dir lets a cold in-memory cache skip generation and compilation."""
+    from datamodel_code_generator import dynamic as dcg
+
+    schema: dict[str, Any] = {
+        "$defs": {"User": {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}},
+        "$ref": "#/$defs/User",
+    }
+    config = make_config(module_split_mode=module_split_mode).model_copy(update={"cache_dir": tmp_path})
+    generate_dynamic_models(schema, config=config)
+    assert list((tmp_path / "dynamic-models").rglob("*.marshal"))
+    clear_dynamic_models_cache()
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        pytest.fail("generate() should not run on a disk cache hit")
+
+    monkeypatch.setattr(dcg, "generate", fail)
+    monkeypatch.setattr(dcg, "compile", fail, raising=False)
+    models = generate_dynamic_models(schema, config=config)
+
+    assert models["User"](name="Alice").name == "Alice"
+    assert len(dcg._dynamic_models_cache) == 1
+
+
 def test_concurrent_same_schema() -> None:
     """Test concurrent access with the same schema."""
     schema = make_object_schema({"name": {"type": "string"}})
@@ -869,3 +940,183 @@ def test_execute_multi_module_enum_only() -> None:
     models = _execute_multi_module(modules)
     assert "Status" in models
     assert models["Status"].ACTIVE.value == "active"
+
+
+def test_generate_dynamic_models_batch_shares_identical_definitions() -> None:
+    """Batch generation reuses one class for identical definitions and for identical schemas."""
+    address = make_object_schema({"city": {"type": "string"}, "kind": {"enum": ["home", "office"]}})
+    customer = {"title": "Customer", **make_object_schema({"address": address, "name": {"type": "string"}})}
+    supplier = {"title": "Supplier", **make_object_schema({"address": address, "code": {"type": "integer"}})}
+
+    models = generate_dynamic_models_batch({"acme": customer, "globex": supplier, "initech": customer})
+
+    assert sorted(models["acme"]) == ["Address", "Customer", "Kind"]
+    assert sorted(models["globex"]) == ["Address", "Kind", "Supplier"]
+    assert models["initech"] is models["acme"]
+    assert models["acme"]["Address"] is models["globex"]["Address"]
+    assert models["globex"]["Supplier"].model_fields["address"].annotation == models["globex"]["Address"] | None
+    customer_instance = models["acme"]["Customer"].model_validate({"address": {"kind": "home"}, "name": "A"})
+    assert customer_instance.address.kind is models["globex"]["Kind"].home
+
+
+def test_generate_dynamic_models_batch_keeps_schemas_that_only_match_structurally() -> None:
+    """Classes that differ in name or description stay separate instead of collapsing into one."""
+    fields = make_object_schema({"id": {"type": "integer"}})
+    first = {"title": "Customer", "description": "First customer.", **fields}
+    second = {"title": "Customer", "description": "Second customer.", **fields}
+
+    config = make_config().model_copy(update={"use_schema_description": True})
+
+    models = generate_dynamic_models_batch({"a": first, "b": second, "c": {"title": "Order", **fields}}, config=config)
+
+    assert list(models["a"]) == list(models["b"]) == ["Customer"]
+    assert list(models["c"]) == ["Order"]
+    assert models["a"]["Customer"] is not models["b"]["Customer"]
+    assert models["a"]["Customer"].__doc__.strip() == "First customer."
+    assert models["b"]["Customer"].__doc__.strip() == "Second customer."
+
+
+def test_generate_dynamic_models_batch_shares_only_identical_ref_closures() -> None:
+    """Classes are shared only when every definition they reference is identical too."""
+
+    def tree_schema(item: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "title": "Root",
+            **make_object_schema({"node": {"$ref": "#/definitions/Node"}}),
+            "definitions": {"Node": make_object_schema({"item": {"$ref": "#/definitions/Item"}}), "Item": item},
+        }
+
+    text_item = make_object_schema({"text": {"type": "string"}}, required=["text"])
+    count_item = make_object_schema({"count": {"type": "integer"}}, required=["count"])
+
+    models = generate_dynamic_models_batch({
+        "a": tree_schema(text_item),
+        "b": tree_schema(count_item),
+        "c": {**tree_schema(text_item), "$comment": "same models as a"},
+    })
+
+    assert sorted(models["a"]) == sorted(models["b"]) == ["Item", "Node", "Root"]
+    assert models["a"]["Root"] is not models["b"]["Root"]
+    assert models["a"]["Node"] is not models["b"]["Node"]
+    assert models["c"] == models["a"]
+    assert models["a"]["Root"].model_validate({"node": {"item": {"text": "x"}}}).node.item.text == "x"
+    assert models["b"]["Root"].model_validate({"node": {"item": {"count": 1}}}).node.item.count == 1
+    with pytest.raises(pydantic.ValidationError):
+        models["a"]["Root"].model_validate({"node": {"item": {"count": 1}}})
+
+
+def test_generate_dynamic_models_batch_single_schema_with_config() -> None:
+    """A single schema in a batch keeps the root name and honors the shared config."""
+    config = make_config(class_name="Tenant")
+
+    models = generate_dynamic_models_batch(
+        {"only": make_object_schema({"id": {"type": "integer"}}, required=["id"])},
+        config=config,
+        module_name="tenant_batch_models",
+    )
+
+    assert list(models["only"]) == ["Tenant"]
+    assert models["only"]["Tenant"].__module__ == "tenant_batch_models.schema_0"
+    assert models["only"]["Tenant"](id=1).id == 1
+    assert generate_dynamic_models_batch({}) == {}
+
+
+def test_generate_dynamic_models_batch_keeps_field_order() -> None:
+    """Batch models keep the schema's property order, as generate_dynamic_models does."""
+    schema = {"title": "Event", **make_object_schema({"zeta": {"type": "string"}, "alpha": {"type": "integer"}})}
+
+    models = generate_dynamic_models_batch({"first": schema, "second": {**schema, "type": "object"}})
+
+    expected = list(generate_dynamic_models(schema)["Event"].model_fields)
+    assert expected == ["zeta", "alpha"]
+    assert list(models["first"]["Event"].model_fields) == expected
+    assert models["second"] is models["first"]
+
+
+def test_generate_dynamic_models_batch_rejects_invalid_inputs() -> None:
+    """Mixed input types and unserializable schemas are reported as errors."""
+    openapi_schema = {"openapi": "3.0.0", "info": {"title": "API", "version": "1"}, "paths": {}}
+    with pytest.raises(Error, match="single input type, found: jsonschema, openapi"):
+        generate_dynamic_models_batch({"a": make_object_schema({}), "b": openapi_schema})
+    with pytest.raises(Error, match="Schema 'bad' is not JSON-serializable"):
+        generate_dynamic_models_batch({"bad": {"default": object()}})
+
+
+@pytest.mark.parametrize("module_split_mode", [None, ModuleSplitMode.Single])
+def test_defer_build_builds_models_on_first_use(module_split_mode: ModuleSplitMode | None) -> None:
+    """Deferred models stay incomplete until validation and then resolve references."""
+    schema: dict[str, Any] = {
+        "$defs": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "string"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}},
+                },
+            },
+            "Tree": {
+                "type": "object",
+                "properties": {"root": {"$ref": "#/$defs/Node"}, "size": {"type": "integer"}},
+                "required": ["root"],
+            },
+        },
+        "$ref": "#/$defs/Tree",
+    }
+
+    models = generate_dynamic_models(
+        schema, config=make_config(module_split_mode=module_split_mode), cache_size=0, defer_build=True
+    )
+
+    assert models["Tree"].model_config["defer_build"] is True
+    assert not models["Tree"].__pydantic_complete__
+    tree = models["Tree"].model_validate({"root": {"value": "a", "children": [{"value": "b"}]}})
+    assert models["Tree"].__pydantic_complete__
+    assert tree.model_dump(exclude_none=True) == {"root": {"value": "a", "children": [{"value": "b"}]}}
+    assert isinstance(tree.root.children[0], models["Node"])
+
+
+@pytest.mark.parametrize("module_split_mode", [None, ModuleSplitMode.Single])
+def test_defer_build_keeps_forward_referencing_models_unbuilt(module_split_mode: ModuleSplitMode | None) -> None:
+    """Circular and forward-referencing models are not rebuilt eagerly when building is deferred."""
+    schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"node": {"$ref": "#/$defs/Node"}},
+        "$defs": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "other": {"$ref": "#/$defs/Other"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}},
+                },
+            },
+            "Other": {"type": "object", "properties": {"node": {"$ref": "#/$defs/Node"}}},
+        },
+    }
+    config = make_config(module_split_mode=module_split_mode)
+
+    eager = generate_dynamic_models(schema, config=config, cache_size=0)
+    models = generate_dynamic_models(schema, config=config, cache_size=0, defer_build=True)
+
+    assert eager["Model"].__pydantic_complete__
+    assert eager["Node"].__pydantic_complete__
+    assert [name for name, model in models.items() if model.__pydantic_complete__] == []
+    model = models["Model"].model_validate({"node": {"other": {"node": {}}, "children": [{}]}})
+    assert models["Model"].__pydantic_complete__
+    assert isinstance(model.node.other.node, models["Node"])
+    assert model.model_dump(exclude_none=True) == {"node": {"other": {"node": {}}, "children": [{}]}}
+
+
+def test_defer_build_is_part_of_cache_key() -> None:
+    """Deferred and eagerly built models are cached separately and keep extra template data."""
+    schema = make_object_schema({"name": {"type": "string"}})
+    config = make_config(class_name="Customer")
+    config = config.model_copy(update={"extra_template_data": {"Customer": {"frozen": True}}})
+
+    eager = generate_dynamic_models(schema, config=config)
+    deferred = generate_dynamic_models(schema, config=config, defer_build=True)
+
+    assert eager["Customer"] is not deferred["Customer"]
+    assert "defer_build" not in eager["Customer"].model_config
+    assert deferred["Customer"].model_config["frozen"] is True
+    assert deferred["Customer"](name="A").name == "A"
+    assert config.extra_template_data == {"Customer": {"frozen": True}}
@@ -54,6 +54,7 @@ from datamodel_code_generator.config import GenerateConfig
 from datamodel_code_generator.format import CodeFormatter, Formatter, PythonVersion
 from datamodel_code_generator.model.pydantic_v2 import UnionMode
 from datamodel_code_generator.parser import LiteralType
+from datamodel_code_generator.parser.mcp import convert_mcp_tools_to_jsonschema
 from datamodel_code_generator.parser.openapi import OpenAPIParser
 from tests.conftest import (
     HttpxGetMockFactory,
@@ -1213,6 +1214,7 @@ def test_direct_input_dict(tmp_path: Path) -> None:
         ("servers_list.json", "mcp_tools/servers_list.py"),
         ("top_level_tool_definitions.json", "mcp_tools/top_level_tool_definitions.py"),
         ("definitions_ref.json", "mcp_tools/definitions_ref.py"),
+        ("shared_definitions.json", "mcp_tools/shared_definitions.py"),
     ],
 )
 def test_mcp_tools(input_file: str, expected_file: str, output_file: Path) -> None:
@@ -1226,6 +1228,45 @@ def test_mcp_tools(input_file: str, expected_file: str, output_file: Path) -> No
     )
 
 
+@pytest.mark.parametrize(
+    ("input_name", "expected_file"),
+    [
+        ("server_manifests.ndjson", "mcp_tools/server_manifests.py"),
+        ("manifests", "mcp_tools/manifests_directory.py"),
+    ],
+)
+def test_mcp_tools_server_manifests(input_name: str, expected_file: str, output_file: Path) -> None:
+    """Stream MCP server manifests from JSON lines or a directory, sharing identical helper definitions."""
+    run_main_and_assert(
+        input_path=DATA_PATH / "mcp_tools" / input_name,
+        output_path=output_file,
+        input_file_type="mcp-tools",
+        assert_func=assert_file_content,
+        expected_file=expected_file,
+    )
+
+
+@pytest.mark.allow_direct_assert
+def test_convert_mcp_tools_to_jsonschema_shares_identical_definitions() -> None:
+    """Identical helper definitions, including recursive ones and their parents, are emitted once."""
+    data = json.loads((DATA_PATH / "mcp_tools" / "shared_definitions.json").read_text(encoding="utf-8"))
+
+    definitions = convert_mcp_tools_to_jsonschema(data)["$defs"]
+
+    assert list(definitions) == [
+        "SearchInputFilter",
+        "SearchInputRange",
+        "SearchInputNode",
+        "SearchInputSort",
+        "SearchInput",
+        "FetchDocumentsInputSort",
+        "FetchDocumentsInputPage",
+        "FetchDocumentsInput",
+    ]
+    assert definitions["FetchDocumentsInput"]["properties"]["filter"] == {"$ref": "#/$defs/SearchInputFilter"}
+    assert definitions["SearchInputNode"]["properties"]["children"]["items"] == {"$ref": "#/$defs/SearchInputNode"}
+
+
 def test_mcp_tools_dangling_local_ref(output_file: Path) -> None:
     """Warn for an unresolved local ref while preserving MCP tool output."""
     with pytest.warns(DanglingRefWarning, match=r"Unresolved local \$ref"):
@@ -208,3 +208,43 @@ def test_main_json_snake_case_field(output_file: Path) -> None:
         assert_func=assert_file_content,
         extra_args=["--snake-case-field"],
     )
+
+
+def test_main_json_lines(output_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test JSON-lines records are detected and merged into one model."""
+    run_main_and_assert(
+        input_path=JSON_DATA_PATH / "events.ndjson",
+        output_path=output_file,
+        assert_func=assert_file_content,
+        expected_file="json_lines.py",
+        capsys=capsys,
+        expected_stderr_contains="The input file type was determined to be: json",
+    )
+
+
+@pytest.mark.cli_doc(
+    options=["--sample-size"],
+    option_description="""Infer raw sample data from a random sample of records.
+
+The `--sample-size` flag keeps a reproducible random sample of this many records (CSV rows,
+JSON-lines records or top-level array items) while the input is streamed, and infers the
+schema from them instead of from every record. Sampled records keep their input order.""",
+    input_schema="json/events.ndjson",
+    cli_args=["--input-file-type", "json", "--sample-size", "2"],
+    golden_output="json/json_lines_sample_size.py",
+)
+def test_main_json_lines_sample_size(output_file: Path) -> None:
+    """Infer raw sample data from a random sample of records.
+
+    The `--sample-size` flag keeps a reproducible random sample of this many records (CSV rows,
+    JSON-lines records or top-level array items) while the input is streamed, and infers the
+    schema from them instead of from every record. Sampled records keep their input order.
+    """
+    run_main_and_assert(
+        input_path=JSON_DATA_PATH / "events.ndjson",
+        output_path=output_file,
+        input_file_type="json",
+        assert_func=assert_file_content,
+        expected_file="json_lines_sample_size.py",
+        extra_args=["--sample-size", "2"],
+    )
@@ -0,0 +1,188 @@
+"""End-to-end tests for bundling a multi-file schema into one document."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from datamodel_code_generator import DataModelType, InputFileType, generate
+from datamodel_code_generator.__main__ import Exit
+from tests.main.conftest import DATA_PATH, EXPECTED_MAIN_PATH, run_main_and_assert, run_main_with_args
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SCHEMA_BUNDLE_PATH = DATA_PATH / "jsonschema" / "schema_bundle"
+SCHEMA_BUNDLE_EXPECTED_PATH = EXPECTED_MAIN_PATH / "schema_bundle"
+
+
+def _generate(input_: Path, input_file_type: InputFileType = InputFileType.JsonSchema, **options: str) -> str:
+    return str(
+        generate(
+            input_,
+            input_file_type=input_file_type,
+            output_model_type=DataModelType.PydanticV2BaseModel,
+            disable_timestamp=True,
+            **options,
+        )
+    ).split("\n", 2)[2]
+
+
+def _generate_from_bundle(input_: Path, input_file_type: InputFileType, tmp_path: Path) -> str:
+    bundle_file = tmp_path / "bundle.json"
+    run_main_and_assert(
+        input_path=input_,
+        output_path=bundle_file,
+        extra_args=["--bundle-schema"],
+        skip_code_validation=True,
+    )
+    return _generate(bundle_file, input_file_type)
+
+
+@pytest.mark.cli_doc(
+    options=["--bundle-schema"],
+    option_description="""Bundle a multi-file schema into one self-contained JSON document.
+
+The `--bundle-schema` flag reads the `--input` schema, copies every value that a
+`$ref` reaches in another local file into the root document once, and rewrites
+each reference to a local JSON pointer. JSON Schema targets are collected under
+`$defs` (or `definitions` for draft-07 and earlier roots that already use it).
+OpenAPI targets are collected under `components/schemas` and Swagger 2.0 targets
+under `definitions`; targets taken from another components section, or from Swagger
+`parameters` or `responses`, stay in that section. A root definition that only
+refers to a definition of the same name in another file receives the referenced
+value directly, and every definition of a referenced file is bundled, so the bundle
+generates the models of the tree of files, with three differences. A definition
+whose name the root already uses is named after its `title`, or else after its file
+(`ResolvedModelsPets` instead of `PetsModel`). Files of the same name in different
+directories stay separate models, where generating one module from the tree may
+use a single model for both. Models may be emitted in another order.
+
+The bundle is written to `--output`, or to stdout without `--output`, and no models
+are generated. Generating from the bundle instead of the tree of files skips the
+per-file path, base URL and root switching that cross-file references need, and the
+bundle can be committed as one reviewable input.""",
+    input_schema="jsonschema/schema_bundle/household.json",
+    cli_args=["--bundle-schema"],
+    expected_stdout="main/schema_bundle/household.txt",
+    related_options=["--input", "--output", "--ref-bundle"],
+)
+def test_bundle_schema_writes_self_contained_document_to_stdout(capsys: pytest.CaptureFixture[str]) -> None:
+    """Cross-file refs, including a cycle between files, become local refs in one document."""
+    run_main_and_assert(
+        input_path=SCHEMA_BUNDLE_PATH / "household.json",
+        extra_args=["--bundle-schema"],
+        capsys=capsys,
+        expected_stdout_path=SCHEMA_BUNDLE_EXPECTED_PATH / "household.txt",
+        assert_no_stderr=True,
+    )
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_output_generates_the_same_models(tmp_path: Path) -> None:
+    """Generation from the written bundle matches generation from the tree of files."""
+    bundle_file = tmp_path / "bundle" / "household.json"
+    run_main_and_assert(
+        input_path=SCHEMA_BUNDLE_PATH / "household.json",
+        output_path=bundle_file,
+        extra_args=["--bundle-schema"],
+        skip_code_validation=True,
+    )
+
+    assert bundle_file.read_text(encoding="utf-8") == (SCHEMA_BUNDLE_EXPECTED_PATH / "household.txt").read_text(
+        encoding="utf-8"
+    )
+    assert _generate(bundle_file, class_name="Household") == _generate(
+        SCHEMA_BUNDLE_PATH / "household.json", class_name="Household"
+    )
+
+
+@pytest.mark.allow_direct_assert
+@pytest.mark.parametrize(
+    ("input_", "input_file_type"),
+    [
+        (DATA_PATH / "openapi" / "all_of_with_relative_ref" / "openapi.yaml", InputFileType.OpenAPI),
+        (DATA_PATH / "openapi" / "allof_required_inherited_external" / "openapi.yaml", InputFileType.OpenAPI),
+        (DATA_PATH / "openapi" / "external_ref_mapping" / "api_nested.yaml", InputFileType.OpenAPI),
+        (DATA_PATH / "jsonschema" / "multiple_files_json_pointer" / "file_a.json", InputFileType.JsonSchema),
+        (DATA_PATH / "jsonschema" / "multiple_files_json_pointer" / "file_c.json", InputFileType.JsonSchema),
+    ],
+)
+def test_bundle_schema_fixture_generates_the_same_models(
+    input_: Path, input_file_type: InputFileType, tmp_path: Path
+) -> None:
+    """Proxy definitions, wrapper models and unreferenced definitions of referenced files all survive bundling."""
+    assert _generate_from_bundle(input_, input_file_type, tmp_path) == _generate(input_, input_file_type)
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_fixture_renames_colliding_definition(tmp_path: Path) -> None:
+    """A definition whose name the root already uses is qualified by its file, and models may be reordered."""
+    input_ = DATA_PATH / "openapi" / "same_name_objects.yaml"
+    original = _generate(input_, InputFileType.OpenAPI)
+    bundled = _generate_from_bundle(input_, InputFileType.OpenAPI, tmp_path)
+
+    assert "class PetsModel(" in original
+    assert "class ResolvedModelsPets(" in bundled
+    assert sorted(bundled.replace("ResolvedModelsPets", "PetsModel").splitlines()) == sorted(original.splitlines())
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_fixture_keeps_same_named_files_apart(tmp_path: Path) -> None:
+    """Same-named files in two directories stay two models, and a colliding one is named by its title."""
+    input_ = DATA_PATH / "jsonschema" / "external_reference" / "ref0.json"
+    original = _generate(input_)
+    bundled = _generate_from_bundle(input_, InputFileType.JsonSchema, tmp_path)
+
+    assert "other_ref1: Ref1 | None = None" in original
+    assert "class Other(BaseModel):" in bundled
+    assert "class OtherRef1(RootModel[Other | None]):" in bundled
+    assert "other_ref1: OtherRef1 | None = None" in bundled
+    assert {line for line in original.splitlines() if line.startswith("class ")} < {
+        line for line in bundled.splitlines() if line.startswith("class ")
+    }
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "expected_stderr"),
+    [
+        (
+            ["--url", "https://example.com/schema.json"],
+            "Error: --bundle-schema cannot be used with --url; use a local --input path\n",
+        ),
+        (["--check"], "Error: --bundle-schema and --check cannot be used together\n"),
+        (
+            ["--diff-against", str(SCHEMA_BUNDLE_PATH / "household.json")],
+            "Error: --bundle-schema and --diff-against cannot be used together\n",
+        ),
+        (["--watch"], "Error: --bundle-schema and --watch cannot be used together\n"),
+    ],
+)
+def test_bundle_schema_rejects_incompatible_options(
+    extra_args: list[str], expected_stderr: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Bundling needs one local input and runs instead of generation, checks and watches."""
+    input_args = [] if "--url" in extra_args else ["--input", str(SCHEMA_BUNDLE_PATH / "household.json")]
+    run_main_with_args(
+        [*input_args, "--output", str(tmp_path / "bundle.json"), "--bundle-schema", *extra_args],
+        expected_exit=Exit.ERROR,
+        capsys=capsys,
+        expected_stderr=expected_stderr,
+    )
+
+
+def test_bundle_schema_reports_unresolved_reference(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """A reference to a missing file fails without writing a partial bundle."""
+    schema = tmp_path / "schema.json"
+    schema.write_text('{"properties": {"pet": {"$ref": "pet.json"}}}', encoding="utf-8")
+    output = tmp_path / "bundle.json"
+    run_main_and_assert(
+        input_path=schema,
+        output_path=output,
+        extra_args=["--bundle-schema"],
+        expected_exit=Exit.ERROR,
+        output_should_not_exist=True,
+        capsys=capsys,
+        expected_stderr_contains="$ref file not found:",
+    )
@@ -22,7 +22,16 @@ from pathlib import Path
 
 import pytest
 
-from datamodel_code_generator import DataModelType, Formatter, InputFileType, ModuleSplitMode, YamlValue, generate
+from datamodel_code_generator import (
+    DataModelType,
+    Formatter,
+    GenerateConfig,
+    InputFileType,
+    ModuleSplitMode,
+    YamlValue,
+    generate,
+    generate_dynamic_models,
+)
 from datamodel_code_generator.model.msgspec import DataModelField as MsgspecDataModelField
 from datamodel_code_generator.model.msgspec import DataTypeManager as MsgspecDataTypeManager
 from datamodel_code_generator.model.msgspec import Struct as MsgspecStruct
@@ -34,6 +43,7 @@ PERFORMANCE_DATA_PATH: Path = Path(__file__).parent.parent / "data" / "performan
 EXPECTED_STARTUP_MEASUREMENT_CASES = {
     "import-package",
     "import-arguments",
+    "import-cli-fast-parser",
     "import-main",
     "import-config",
     "cli-version",
@@ -1084,3 +1094,30 @@ def test_perf_extreme_duplicate_names_pydantic_v2(tmp_path: Path, extreme_duplic
     )
     content = output_file.read_text()
     assert content.count("class ") >= 1000
+
+
+@pytest.fixture(scope="module")
+def large_models_dynamic_cache(tmp_path_factory: pytest.TempPathFactory) -> tuple[dict[str, YamlValue], GenerateConfig]:
+    """Warm a disk cache of the 500-model dynamic package so only execution is measured."""
+    schema = json.loads((PERFORMANCE_DATA_PATH / "large_models.json").read_text())
+    config = GenerateConfig(
+        input_file_type=InputFileType.JsonSchema,
+        output_model_type=DataModelType.PydanticV2BaseModel,
+        cache_dir=tmp_path_factory.mktemp("dynamic_models_cache"),
+    )
+    for defer_build in (False, True):
+        generate_dynamic_models(schema, config=config, cache_size=0, defer_build=defer_build)
+    return schema, config
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark
+@pytest.mark.parametrize("defer_build", [False, True], ids=["eager", "deferred"])
+def test_perf_dynamic_models_time_to_first_validation(
+    large_models_dynamic_cache: tuple[dict[str, YamlValue], GenerateConfig], defer_build: bool
+) -> None:
+    """Performance test: create 500 cached dynamic models and validate against one of them."""
+    schema, config = large_models_dynamic_cache
+    models = generate_dynamic_models(schema, config=config, cache_size=0, defer_build=defer_build)
+    instance = models["Model250"].model_validate({"id": 1, "name": "first"})
+    assert instance.name == "first"
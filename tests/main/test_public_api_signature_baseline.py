@@ -105,6 +105,7 @@ _PUBLIC_MODULE_EXPORTS: dict[str, frozenset[str]] = {
         "TargetPydanticVersion",
         "VersionMode",
         "XMLSchemaVersion",
+        "bundle_schema",
         "clear_dynamic_models_cache",
         "detect_jsonschema_version",
         "detect_openapi_version",
@@ -112,6 +113,7 @@ _PUBLIC_MODULE_EXPORTS: dict[str, frozenset[str]] = {
         "enable_parsed_source_cache",
         "generate",
         "generate_dynamic_models",
+        "generate_dynamic_models_batch",
     }),
     "datamodel_code_generator._types": frozenset({
         "AsyncAPIParserConfigDict",
@@ -316,6 +318,7 @@ def _baseline_generate(
     reuse_scope: ReuseScope = ReuseScope.Module,
     shared_module_name: str = DEFAULT_SHARED_MODULE_NAME,
     encoding: str = "utf-8",
+    sample_size: int | None = None,
     enum_field_as_literal: LiteralType | None = None,
     enum_field_as_literal_map: dict[str, str] | None = None,
     ignore_enum_constraints: bool = False,
@@ -339,6 +342,10 @@ def _baseline_generate(
     openapi_scopes: list[OpenAPIScope] | None = None,
     include_path_parameters: bool = False,
     openapi_include_paths: list[str] | None = None,
+    openapi_include_tags: list[str] | None = None,
+    openapi_exclude_tags: list[str] | None = None,
+    openapi_include_operation_ids: list[str] | None = None,
+    openapi_exclude_operation_ids: list[str] | None = None,
     openapi_include_info_version: bool = False,
     graphql_scopes: list[GraphQLScope] | None = None,
     graphql_no_typename: bool = False,
@@ -364,6 +371,9 @@ def _baseline_generate(
     lockfile: Path | None = None,
     update_lock: bool = False,
     locked: bool = False,
+    ref_bundle: Path | None = None,
+    update_ref_bundle: bool = False,
+    cache_dir: Path | None = None,
     use_annotated: bool = False,
     use_serialize_as_any: bool = False,
     use_non_positive_negative_number_constrained_types: bool = False,
@@ -566,6 +576,7 @@ class _BaselineParser:
         http_local_ref_path: Path | None = None,
         http_ignore_tls: bool = False,
         http_timeout: float | None = None,
+        cache_dir: Path | None = None,
         use_annotated: bool = False,
         use_serialize_as_any: bool = False,
         use_non_positive_negative_number_constrained_types: bool = False,
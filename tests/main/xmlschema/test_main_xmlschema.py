@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import codecs
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import Any, cast
 
 import pytest
 import yaml
 
-from datamodel_code_generator import InputFileType
+from datamodel_code_generator import Error, InputFileType
 from datamodel_code_generator.__main__ import Exit
+from datamodel_code_generator.parser import _xmlschema_declarations as xmlschema_declarations
 from datamodel_code_generator.parser import xmlschema as xmlschema_parser
+from datamodel_code_generator.parser.base import Source
 from datamodel_code_generator.parser.xmlschema import (
     _clear_xml_schema_data_cache,
     _load_xml_schema_data_from_path,
     _read_xml_text,
+    _scan_schema_text,
+    _SchemaDocumentSummary,
     convert_xml_schema_data,
 )
 from tests.conftest import assert_output
@@ -30,9 +35,6 @@ from tests.main.conftest import (
 )
 from tests.main.xmlschema.conftest import assert_file_content
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 def test_main_xmlschema_purchase_order(output_file: Path) -> None:
     """Generate models from an XML Schema document."""
@@ -67,6 +69,146 @@ def test_main_xmlschema_with_parsed_source_cache(output_file: Path) -> None:
     )
 
 
+def test_main_xmlschema_cache_dir_skips_conversion(
+    output_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reuse XML Schema conversion results persisted under --cache-dir by an earlier run."""
+    _clear_xml_schema_data_cache()
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        run_main_and_assert(
+            input_path=XML_SCHEMA_DATA_PATH / "purchase_order.xsd",
+            output_path=output_file,
+            input_file_type="xmlschema",
+            extra_args=["--cache-dir", str(cache_dir)],
+            assert_func=assert_file_content,
+            expected_file="purchase_order.py",
+        )
+        _clear_xml_schema_data_cache()
+        monkeypatch.setattr(xmlschema_parser._XMLSchemaConverter, "_parse_schema", _fail_xml_schema_conversion)
+
+
+def _fail_xml_schema_conversion(*_: object) -> None:  # pragma: no cover
+    pytest.fail("XML Schema conversion should be served from --cache-dir")
+
+
+@pytest.mark.allow_direct_assert
+def test_load_xml_schema_data_from_path_cache_dir_tracks_includes(tmp_path: Path) -> None:
+    """A persisted XML Schema entry is reconverted when an included document changes."""
+    for name in ("advanced_constructs.xsd", "advanced_constructs_included.xsd"):
+        (tmp_path / name).write_bytes((XML_SCHEMA_DATA_PATH / name).read_bytes())
+    schema_path = tmp_path / "advanced_constructs.xsd"
+    included_path = tmp_path / "advanced_constructs_included.xsd"
+    kwargs = {
+        "base_path": tmp_path,
+        "encoding": "utf-8",
+        "xmlschema_version": None,
+        "schema_version_mode": None,
+        "use_xmlschema_datetime_default": False,
+        "source_safe_non_finite": False,
+        "cache_dir": tmp_path / "cache",
+    }
+    _clear_xml_schema_data_cache()
+    first = _load_xml_schema_data_from_path(schema_path, **kwargs)
+    assert list((tmp_path / "cache" / "xmlschema").rglob("*.marshal"))
+    assert _load_xml_schema_data_from_path(schema_path, **kwargs) == first
+
+    included_path.write_text(
+        included_path.read_text(encoding="utf-8").replace(
+            "</xs:schema>", '<xs:element name="CacheProbe"/></xs:schema>'
+        ),
+        encoding="utf-8",
+    )
+    assert "CacheProbe" in str(_load_xml_schema_data_from_path(schema_path, **kwargs))
+
+
+@pytest.mark.allow_direct_assert
+def test_xml_schema_converter_parses_shared_includes_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Documents reached through several includes are parsed into a tree only once."""
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    (tmp_path / "common.xsd").write_text(
+        f'<xs:schema {xs}><xs:simpleType name="Code"><xs:restriction base="xs:string"/></xs:simpleType></xs:schema>',
+        encoding="utf-8",
+    )
+    for name in ("first", "second"):
+        (tmp_path / f"{name}.xsd").write_text(
+            f'<xs:schema {xs}><xs:include schemaLocation="common.xsd"/>'
+            f'<xs:complexType name="{name.title()}"><xs:sequence>'
+            '<xs:element name="code" type="Code"/></xs:sequence></xs:complexType></xs:schema>',
+            encoding="utf-8",
+        )
+    main_text = (
+        f'<xs:schema {xs}><xs:include schemaLocation="first.xsd"/><xs:include schemaLocation="second.xsd"/>'
+        '<xs:element name="Root" type="First"/></xs:schema>'
+    )
+    parsed_paths: list[str] = []
+    parse_schema = xmlschema_parser._XMLSchemaConverter._parse_schema
+
+    def recording_parse_schema(self: Any, text: str, source_path: Path) -> Any:
+        parsed_paths.append(source_path.name)
+        return parse_schema(self, text, source_path)
+
+    monkeypatch.setattr(xmlschema_parser._XMLSchemaConverter, "_parse_schema", recording_parse_schema)
+    converter = xmlschema_parser._XMLSchemaConverter(base_path=tmp_path, encoding="utf-8")
+    converted = converter.convert(Source(path=Path("main.xsd"), text=main_text))
+
+    assert sorted(parsed_paths) == ["common.xsd", "first.xsd", "main.xsd", "second.xsd"]
+    assert sorted(cast("dict[str, Any]", converted["definitions"])) == ["Code", "First", "Second"]
+
+
+@pytest.mark.allow_direct_assert
+def test_scan_schema_text_stops_at_first_declaration_without_xsd11_markers() -> None:
+    """Version scans skip the declarations of a document that cannot use XSD 1.1."""
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    head = f'<xs:schema {xs} targetNamespace="urn:a"><xs:annotation/><xs:include schemaLocation="b.xsd"/>'
+
+    assert _scan_schema_text(f'{head}<xs:complexType name="A"/><broken', Path("a.xsd")) == (
+        _SchemaDocumentSummary("urn:a", uses_xsd11=False, schema_locations=("b.xsd",))
+    )
+    with pytest.raises(Error, match=r"Invalid XML Schema document a\.xsd"):
+        _scan_schema_text(
+            f'{head}<xs:complexType name="A"><xs:assert test="true()"/></xs:complexType><broken', Path("a.xsd")
+        )
+
+
+@pytest.mark.allow_direct_assert
+def test_xml_schema_converter_reads_declarations_back_from_records(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Declarations re-read after leaving the cache keep their namespaces and redefinition bases."""
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    (tmp_path / "base.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:base" xmlns:b="urn:base">'
+        '<xs:complexType name="Address"><xs:sequence><xs:element name="street" type="b:Street"/>'
+        "</xs:sequence></xs:complexType>"
+        '<xs:simpleType name="Street"><xs:restriction base="xs:string"><xs:maxLength value="40"/>'
+        "</xs:restriction></xs:simpleType>"
+        '<xs:group name="Extra" xmlns:x="urn:base"><xs:sequence><xs:element name="note" type="x:Street"/>'
+        "</xs:sequence></xs:group></xs:schema>",
+        encoding="utf-8",
+    )
+    main_text = (
+        f'<xs:schema {xs} targetNamespace="urn:base" xmlns:m="urn:base"><xs:redefine schemaLocation="base.xsd">'
+        '<xs:complexType name="Address"><xs:complexContent><xs:extension base="m:Address">'
+        '<xs:sequence><xs:group ref="m:Extra"/></xs:sequence></xs:extension></xs:complexContent>'
+        '</xs:complexType></xs:redefine><xs:element name="Root" type="m:Address"/></xs:schema>'
+    )
+
+    def convert() -> tuple[dict[str, Any], xmlschema_parser._XMLSchemaConverter]:
+        converter = xmlschema_parser._XMLSchemaConverter(base_path=tmp_path, encoding="utf-8")
+        return converter.convert(Source(path=Path("main.xsd"), text=main_text)), converter
+
+    expected, converter = convert()
+    monkeypatch.setattr(xmlschema_declarations, "XSD_DECLARATION_CACHE_SIZE", 1)
+    converted, _ = convert()
+
+    assert converted == expected
+    assert cast("dict[str, Any]", expected["definitions"])["Address"]["allOf"][1]["properties"]["note"] == {
+        "$ref": "#/definitions/Street"
+    }
+    assert not converter._element_namespaces
+
+
 @pytest.mark.parametrize(
     ("byte_order_mark", "xml_encoding"),
     [
@@ -248,3 +248,41 @@ def test_graphql_schema_features() -> None:
             dynamic_ref=True,
         )
     )
+
+
+def test_introspect_schema_matches_graphql_core() -> None:
+    """The direct schema serializer produces graphql-core's own introspection result."""
+    import graphql
+
+    from datamodel_code_generator.parser._graphql_introspection import introspect_schema
+
+    schema = graphql.build_schema('''
+        """Library"""
+        schema { query: Query }
+        directive @cost(weight: Int = 1) repeatable on FIELD_DEFINITION
+        scalar Url @specifiedBy(url: "https://example.com/url")
+        interface Node { id: ID! }
+        type Query implements Node {
+            id: ID!
+            books(first: Int = 10, after: String @deprecated(reason: "use cursor")): [Book!]! @cost
+            legacy: String @deprecated
+        }
+        type Book implements Node { id: ID! link: Url }
+        union SearchResult = Book | Query
+        enum Genre { FICTION POETRY @deprecated }
+        input BookFilter { genres: [Genre!] = [FICTION] }
+    ''')
+
+    assert introspect_schema(schema) == graphql.introspection_from_schema(schema)
+
+
+def test_graphql_field_references_do_not_reindex_models() -> None:
+    """Parsing fields registers references without rebuilding generation facts per field."""
+    source = "\n".join(
+        f"type T{index} {{ next: T{(index + 1) % 30} many: [T{(index + 2) % 30}!]! }}" for index in range(30)
+    )
+    parser = GraphQLParser(source=source)
+    parser.parse_raw()
+
+    assert parser.generation_store.facts_version == 0
+    assert len(parser.references["T0"].children) == 2
@@ -0,0 +1,157 @@
+"""Tests for concurrent read-ahead of multi-file parser inputs."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from datamodel_code_generator.parser import _read_ahead
+from datamodel_code_generator.parser._read_ahead import (
+    PreloadedSource,
+    YamlDecodePool,
+    iter_preloaded_sources,
+    iter_read_ahead,
+)
+from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_schemas(directory: Path, count: int, suffix: str = ".json") -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"model_{index:02d}{suffix}"
+        path.write_text(
+            json.dumps({
+                "title": f"Model{index:02d}",
+                "type": "object",
+                "properties": {"value": {"type": "integer"}},
+            }),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def _parse_directory(directory: Path) -> str:
+    parser = JsonSchemaParser(source=directory)
+    result = parser.parse()
+    if isinstance(result, str):
+        return result
+    return "\n".join(f"{name}\n{module.body}" for name, module in sorted(result.items()))
+
+
+def test_iter_read_ahead_preserves_order() -> None:
+    """Results are yielded in input order even when later items finish first."""
+    release = threading.Event()
+
+    def load(item: int) -> int:
+        if item == 0:
+            release.wait(timeout=5)
+        else:
+            release.set()
+        return item * 2
+
+    assert list(iter_read_ahead(range(100), load, max_workers=4)) == [item * 2 for item in range(100)]
+
+
+def test_iter_read_ahead_cancels_pending_on_early_stop() -> None:
+    """Closing the iterator early does not run every remaining item."""
+    calls: list[int] = []
+
+    def load(item: int) -> int:
+        calls.append(item)
+        return item
+
+    iterator = iter_read_ahead(range(1000), load, max_workers=1)
+    assert next(iterator) == 0
+    iterator.close()
+
+    assert len(calls) < 1000
+
+
+def test_iter_preloaded_sources_captures_errors_in_order(tmp_path: Path) -> None:
+    """Read errors are captured per path and re-raised by the caller in order."""
+    paths = _write_schemas(tmp_path, 3)
+    missing = tmp_path / "missing.json"
+    preloaded = list(iter_preloaded_sources([paths[0], missing, *paths[1:]], "utf-8", as_text=False, decode=True))
+
+    assert [item.error is None for item in preloaded] == [True, False, True, True]
+    assert preloaded[0].raw_data["title"] == "Model00"
+    with pytest.raises(FileNotFoundError):
+        preloaded[1].raise_error()
+
+
+def test_iter_preloaded_sources_text_mode(tmp_path: Path) -> None:
+    """Text mode returns file contents without decoding."""
+    paths = _write_schemas(tmp_path, 2)
+    preloaded = list(iter_preloaded_sources(paths, "utf-8", as_text=True, decode=False))
+
+    assert [item.text for item in preloaded] == [path.read_text(encoding="utf-8") for path in paths]
+    assert all(not item.decoded for item in preloaded)
+
+
+def test_deprecated_yaml_bool_files_are_not_decoded_in_workers(tmp_path: Path) -> None:
+    """Files that would emit deprecated YAML bool warnings are decoded by the parser thread."""
+    path = tmp_path / "schema.yaml"
+    path.write_text("type: object\nadditionalProperties: False\n", encoding="utf-8")
+
+    (preloaded,) = iter_preloaded_sources([path], "utf-8", as_text=False, decode=True)
+
+    assert preloaded == PreloadedSource(resolved_path=path.resolve(), data=path.read_bytes())
+
+
+@pytest.mark.parametrize("count", [2, 12])
+def test_directory_input_matches_serial_loading(count: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Directory inputs generate identical output with and without read-ahead."""
+    _write_schemas(tmp_path / "schemas", count)
+    expected_output = _parse_directory(tmp_path / "schemas")
+
+    monkeypatch.setattr(_read_ahead, "READ_AHEAD_MIN_FILES", 10_000)
+    assert _parse_directory(tmp_path / "schemas") == expected_output
+
+
+def test_directory_input_surfaces_invalid_file(tmp_path: Path) -> None:
+    """A broken file in a read-ahead batch raises the same error as serial loading."""
+    _write_schemas(tmp_path, 6)
+    (tmp_path / "model_03.json").write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(Exception, match="model_03"):
+        _parse_directory(tmp_path)
+
+
+def test_yaml_decode_pool_gating(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The process pool is not started for small batches or multi-threaded callers."""
+    assert YamlDecodePool.create(1) is None
+
+    monkeypatch.setattr(_read_ahead.threading, "active_count", lambda: 2)
+    assert YamlDecodePool.create(10_000) is None
+
+
+@pytest.mark.skipif(not _read_ahead.sys.platform.startswith("linux"), reason="fork start method is Linux-only")
+def test_yaml_decode_pool_decodes_with_marshal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Forced process decoding produces the same data as in-process decoding."""
+    monkeypatch.setattr(_read_ahead, "YAML_PROCESS_POOL_MIN_FILES", 1)
+    monkeypatch.setattr(_read_ahead.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(_read_ahead.threading, "active_count", lambda: 1)
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"schema_{index}.yaml"
+        path.write_text(f"title: Model{index}\ntype: object\nenum: [1, 2.5, null]\n", encoding="utf-8")
+        paths.append(path)
+
+    pool = YamlDecodePool.create(len(paths))
+    assert pool is not None
+    try:
+        assert pool.load_yaml("a: [1, {b: c}]\n") == {"a": [1, {"b": "c"}]}
+    finally:
+        pool.shutdown()
+    assert pool.load_yaml("a: 1\n") == {"a": 1}
+
+    preloaded = list(iter_preloaded_sources(paths, "utf-8", as_text=False, decode=True))
+    assert [item.raw_data["title"] for item in preloaded] == ["Model0", "Model1", "Model2"]
@@ -0,0 +1,14 @@
+"""Tests for the static CLI option table generation."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "build_cli_option_table.py"
+
+
+def test_build_cli_option_table_check_is_up_to_date() -> None:
+    """The generated CLI option table is committed."""
+    subprocess.run([sys.executable, str(SCRIPT), "--check"], check=True)
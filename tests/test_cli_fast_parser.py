@@ -0,0 +1,84 @@
+"""Tests for the table-driven fast command-line parser."""
+
+from __future__ import annotations
+
+from argparse import Namespace
+
+import pytest
+
+from datamodel_code_generator._cli_fast_parser import parse_args_fast
+from datamodel_code_generator._cli_option_table import OPTIONS
+from datamodel_code_generator.arguments import arg_parser
+
+
+def _sample_args(option: str) -> list[str]:
+    _, kind, nargs, _, value_type, choices = OPTIONS[option]
+    if kind in {"store_true", "boolean_optional"}:
+        return [option]
+    value = choices[-1] if choices else {"int": "10", "float": "1.5", "path": "schema.json"}.get(value_type, "value")
+    if nargs == "+":
+        return [option, value, value]
+    return [option, value]
+
+
+def _parse_with_argparse(args: list[str]) -> dict[str, object]:
+    return vars(arg_parser.parse_args(args, namespace=Namespace(no_color=False)))
+
+
+def _parse_fast(args: list[str]) -> dict[str, object] | None:
+    target = Namespace(no_color=False)
+    if not parse_args_fast(args, target):
+        return None
+    return vars(target)
+
+
+@pytest.mark.parametrize("option", sorted(option for option, entry in OPTIONS.items() if entry[4] != "custom"))
+def test_fast_parser_matches_argparse_for_each_option(option: str) -> None:
+    """Every table-supported option parses exactly like argparse."""
+    args = _sample_args(option)
+    assert _parse_fast(args) == _parse_with_argparse(args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--input", "a.yaml", "--output=models.py", "--input-file-type", "openapi"],
+        ["--generate-prompt"],
+        ["--generate-prompt", "question", "--input", "a.yaml"],
+        ["--list-deprecations", "--input", "a.yaml"],
+        ["--input-model", "a:A", "--input-model=b:B"],
+        ["--http-headers", "A: 1", "B: 2", "--use-annotated", "--no-use-annotated"],
+        ["--output", "a.py", "--output", "b.py"],
+        ["--encoding", ""],
+    ],
+)
+def test_fast_parser_matches_argparse_for_combinations(args: list[str]) -> None:
+    """Combined, repeated, and optional-value arguments parse exactly like argparse."""
+    assert _parse_fast(args) == _parse_with_argparse(args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["-h"],
+        ["--inp", "a.yaml"],
+        ["--unknown-option"],
+        ["a.yaml"],
+        ["--input"],
+        ["--input", "--output"],
+        ["--input-file-type", "not-a-type"],
+        ["--use-annotated=yes"],
+        ["--http-timeout", "soon"],
+        ["--dataclass-arguments", '{"frozen": true}'],
+        ["--allow-extra-fields", "--extra-fields", "forbid"],
+        ["--http-headers"],
+        ["--input", "a.yaml", "--", "b.yaml"],
+    ],
+)
+def test_fast_parser_falls_back_to_argparse(args: list[str]) -> None:
+    """Arguments that need argparse semantics or error messages leave the namespace untouched."""
+    target = Namespace(no_color=False)
+
+    assert not parse_args_fast(args, target)
+    assert vars(target) == {"no_color": False}
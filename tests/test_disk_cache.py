@@ -0,0 +1,50 @@
+"""Tests for the persistent content-addressed conversion cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from datamodel_code_generator._disk_cache import CacheKey, DiskCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_cache_key_distinguishes_part_boundaries() -> None:
+    """Parts are length-prefixed and None differs from an empty value."""
+    assert CacheKey("ns").add("ab", "c").hexdigest() != CacheKey("ns").add("a", "bc").hexdigest()
+    assert CacheKey("ns").add(None).hexdigest() != CacheKey("ns").add(b"").hexdigest()
+    assert CacheKey("ns").add("a").hexdigest() != CacheKey("other").add("a").hexdigest()
+    assert CacheKey("ns").add("a", b"b").hexdigest() == CacheKey("ns").add(b"a", "b").hexdigest()
+
+
+def test_disk_cache_round_trip(tmp_path: Path) -> None:
+    """Stored values are returned by later cache instances."""
+    key = CacheKey("ns").add("schema").hexdigest()
+    value = {"definitions": {"Model": {"type": "object", "required": ["a"]}}, "x": [1, 2.5, None, True]}
+    DiskCache(tmp_path, "ns").set(key, value)
+
+    assert DiskCache(tmp_path, "ns").get(key) == value
+    assert DiskCache(tmp_path, "other").get(key) is None
+    assert [path.name for path in (tmp_path / "ns").rglob("*")] == [key[:2], f"{key}.marshal"]
+
+
+def test_disk_cache_skips_unsupported_and_corrupt_entries(tmp_path: Path) -> None:
+    """Values marshal cannot store are skipped and unreadable entries are misses."""
+    cache = DiskCache(tmp_path, "ns")
+    cache.set("aa-unsupported", {"value": object()})
+    assert cache.get("aa-unsupported") is None
+
+    cache.set("bb-corrupt", {"value": 1})
+    (tmp_path / "ns" / "bb" / "bb-corrupt.marshal").write_bytes(b"\xff")
+    assert cache.get("bb-corrupt") is None
+
+
+def test_disk_cache_ignores_unwritable_directory(tmp_path: Path) -> None:
+    """A cache directory that cannot be created does not fail the conversion."""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    cache = DiskCache(blocker, "ns")
+
+    cache.set("key", {"value": 1})
+    assert cache.get("key") is None
@@ -19,6 +19,7 @@ import pytest
 import datamodel_code_generator
 import datamodel_code_generator._builtin_formatter as builtin_formatter
 import datamodel_code_generator._format_types as format_types
+import datamodel_code_generator._ruff_worker as ruff_worker_module
 import datamodel_code_generator.format as format_module
 from tests.conftest import assert_output
 
@@ -2771,3 +2772,133 @@ def test_code_formatter_no_warning_when_formatters_empty(tmp_path: Path, monkeyp
     with warnings.catch_warnings():
         warnings.simplefilter("error")
         CodeFormatter(PythonVersionMin, formatters=[])
+
+
+RUFF_WORKER_SOURCE = """from __future__ import annotations
+import os
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+class Model(BaseModel):
+    values : Optional[List[int]]=None
+    created: datetime
+    label: str = 'café \U0001f600'  # comment
+"""
+
+
+@pytest.mark.parametrize(
+    "formatters",
+    [
+        [Formatter.RUFF_FORMAT],
+        [Formatter.RUFF_CHECK],
+        [Formatter.RUFF_CHECK, Formatter.RUFF_FORMAT],
+    ],
+)
+@pytest.mark.parametrize("use_type_checking_imports", [True, False])
+def test_ruff_worker_matches_ruff_subprocess(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    formatters: list[Formatter],
+    use_type_checking_imports: bool,
+) -> None:
+    """Test the Ruff server worker produces the same output as the Ruff CLI."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.ruff]\ntarget-version = "py310"\n[tool.ruff.lint]\nselect = ["F", "I", "TC", "UP"]\n',
+        encoding="utf-8",
+    )
+    formatter = CodeFormatter(
+        PythonVersion.PY_310,
+        formatters=formatters,
+        use_type_checking_imports=use_type_checking_imports,
+    )
+    expected = formatter.format_code(RUFF_WORKER_SOURCE)
+
+    with format_module.ruff_worker_session(), mock.patch("subprocess.run") as mock_run:
+        assert formatter.format_code(RUFF_WORKER_SOURCE) == expected
+        assert formatter.format_code(RUFF_WORKER_SOURCE) == expected
+
+    mock_run.assert_not_called()
+
+
+def test_ruff_worker_is_reused_and_stopped_with_session(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test one Ruff worker serves every formatter with the same settings until the session ends."""
+    monkeypatch.chdir(tmp_path)
+    first = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_FORMAT])
+    second = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_FORMAT])
+
+    with format_module.ruff_worker_session():
+        assert first.format_code("x=1\n") == "x = 1\n"
+        worker = first._get_ruff_worker()
+        assert worker is not None
+        assert second._get_ruff_worker() is worker
+        assert second.format_code("y=2\n") == "y = 2\n"
+        assert worker.is_running
+
+    assert not worker.is_running
+    assert not ruff_worker_module._WORKERS
+
+
+def test_ruff_worker_restarts_after_server_exit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a crashed Ruff server is restarted transparently."""
+    monkeypatch.chdir(tmp_path)
+    formatter = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_FORMAT], use_ruff_worker=True)
+    try:
+        assert formatter.format_code("x=1\n") == "x = 1\n"
+        worker = formatter._get_ruff_worker()
+        assert worker is not None
+        process = worker._process
+        assert process is not None
+        process.kill()
+        process.wait()
+
+        assert formatter.format_code("y=2\n") == "y = 2\n"
+        assert worker._process is not process
+    finally:
+        ruff_worker_module.shutdown_ruff_workers()
+
+
+def test_ruff_worker_restarts_when_ruff_config_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test editing the Ruff configuration retires the worker started with the old settings."""
+    monkeypatch.chdir(tmp_path)
+    formatter = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_FORMAT])
+    source = "value = ['a', 'b']\n"
+
+    with format_module.ruff_worker_session():
+        assert formatter.format_code(source) == 'value = ["a", "b"]\n'
+        worker = formatter._get_ruff_worker()
+        (tmp_path / "ruff.toml").write_text('[format]\nquote-style = "single"\n', encoding="utf-8")
+        assert formatter.format_code(source) == source
+        assert formatter._get_ruff_worker() is not worker
+        assert worker is not None
+        assert not worker.is_running
+
+
+def test_ruff_worker_syntax_error_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Ruff server formatting errors surface as runtime errors."""
+    monkeypatch.chdir(tmp_path)
+    formatter = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_FORMAT])
+
+    with format_module.ruff_worker_session(), pytest.raises(RuntimeError, match="Ruff server"):
+        formatter.format_code("class :\n")
+
+
+@pytest.mark.parametrize(
+    ("position_encoding", "character"),
+    [("utf-32", 6), ("utf-16", 7), ("utf-8", 9)],
+)
+def test_ruff_worker_apply_text_edits_position_encodings(position_encoding: str, character: int) -> None:
+    """Test LSP text edits are applied using the negotiated position encoding."""
+    edits = [
+        {
+            "range": {"start": {"line": 1, "character": character}, "end": {"line": 1, "character": character}},
+            "newText": "!",
+        },
+        {"range": {"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 1}}, "newText": "y"},
+    ]
+
+    assert (
+        ruff_worker_module.apply_text_edits("x = 1\ns = '\U0001f600a'\n", edits, position_encoding)
+        == "y = 1\ns = '\U0001f600!a'\n"
+    )
@@ -11,13 +11,19 @@ from pathlib import Path
 import pytest
 
 from datamodel_code_generator import (
+    _INPUT_TYPE_SNIFF_CHARS,
     Error,
     InputFileType,
+    _infer_input_type_and_data,
     _is_json_text,
     _is_xml_text,
     _looks_like_csv_text,
+    generate,
     infer_input_type,
 )
+from datamodel_code_generator._input_sniffing import NESTED_VALUE, line_prefix, sniff_root_mapping
+from datamodel_code_generator.parser import jsonschema
+from datamodel_code_generator.parser._xmlschema_detection import xml_root_tag
 
 DATA_PATH: Path = Path(__file__).parent / "data"
 HEAVY_INFERENCE_MODULES = (
@@ -154,6 +160,8 @@ def test_infer_input_type() -> None:  # noqa: PLR0912
         assert_infer_input_type(file, InputFileType.OpenAPI)
     for file in (DATA_PATH / "asyncapi").rglob("*"):
         assert_infer_input_type(file, InputFileType.AsyncAPI)
+    assert_infer_input_type(DATA_PATH / "graphql" / "simple-star-wars-introspection.json", InputFileType.GraphQL)
+    assert infer_input_type('{"__schema": {"types": []}}') == InputFileType.GraphQL
 
     xmlschema_files = list((DATA_PATH / "xmlschema").rglob("*.xsd"))
     assert xmlschema_files, "XML Schema fixtures are required for input type inference tests."
@@ -260,6 +268,129 @@ def test_infer_input_type_fast_path_does_not_import_heavy_modules(text: str, exp
     assert probe["loaded"] == []
 
 
+# Everything after the prefix is malformed, so these only infer if the prefix settles them.
+UNPARSEABLE_TAIL = "\n" + "{[" * _INPUT_TYPE_SNIFF_CHARS
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('\ufeff{"openapi": "3.1.0", "info": {"title": "{not} \\" [closed]"}, "paths": {', InputFileType.OpenAPI),
+        ('{"info": {"version": 1}, "asyncapi": "2.6.0", "channels": ', InputFileType.AsyncAPI),
+        ("%YAML 1.2\n---\n# spec\ninfo:\n  title: x\nopenapi: '3.0.3' # comment\n", InputFileType.OpenAPI),
+        ("'asyncapi': 3.0.0\n", InputFileType.AsyncAPI),
+        ('syntax = "proto3";\npackage demo;\n', InputFileType.Protobuf),
+        ("id,name\n1,taro\n2,jiro\n", InputFileType.CSV),
+    ],
+)
+def test_infer_input_type_decides_from_prefix(text: str, expected: InputFileType) -> None:
+    """Root keys, a Protocol Buffers header, or CSV rows at the start settle the type without a full parse."""
+    assert _infer_input_type_and_data(text + UNPARSEABLE_TAIL) == (expected, None)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "object", "properties": {}}',
+        '"$schema": "http://json-schema.org/draft-07/schema#"\ntype: object\n',
+    ],
+)
+def test_infer_input_type_decides_schema_url_from_whole_root_mapping(text: str) -> None:
+    """A "$schema" URL settles JSON Schema without a full parse once every root key was scanned."""
+    assert _infer_input_type_and_data(text) == (InputFileType.JsonSchema, None)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        json.dumps({
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "x-big": {"padding": "x" * 20_000},
+            "openapi": "3.1.0",
+            "info": {"title": "API", "version": "1"},
+            "paths": {},
+        }),
+        '"$schema": "https://json-schema.org/draft/2020-12/schema"\n'
+        "x-big:\n" + "  padding: x\n" * 2_000 + "openapi: 3.1.0\ninfo:\n  title: API\n  version: '1'\npaths: {}\n",
+    ],
+)
+def test_infer_input_type_schema_url_waits_for_keys_past_prefix(text: str) -> None:
+    """A "$schema" URL does not settle the type while root keys past the prefix are unread."""
+    assert len(text) > _INPUT_TYPE_SNIFF_CHARS
+    assert infer_input_type(text) == InputFileType.OpenAPI
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"openapi": "3.0.0", "data": {"__schema": {"types": []}}}', InputFileType.GraphQL),
+        ('{"type": "object", "properties": {}}', InputFileType.JsonSchema),
+        ('{"type": "record", "name": "Pet", "fields": []}', InputFileType.Avro),
+    ],
+)
+def test_infer_input_type_hands_on_parsed_document(text: str, expected: InputFileType) -> None:
+    """Inputs the prefix cannot settle are parsed once and the document is returned with the type."""
+    assert _infer_input_type_and_data(text) == (expected, json.loads(text))
+
+
+def test_infer_input_type_xml_schema_reads_only_root_element() -> None:
+    """XML Schema detection stops at the root start tag."""
+    text = '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">' + "<broken" * _INPUT_TYPE_SNIFF_CHARS
+
+    assert infer_input_type(text) == InputFileType.XMLSchema
+    assert xml_root_tag("<root") is None
+    assert xml_root_tag("<<root />") is None
+
+
+@pytest.mark.parametrize(
+    ("prefix", "is_json", "expected", "complete"),
+    [
+        ('{"a": [1, {"b": "]"}], "c": null, "d": "x', True, {"a": NESTED_VALUE, "c": None}, False),
+        ('{"a": [1, {"b": "]"', True, {}, False),
+        ('{"a": 1 "b": 2}', True, {"a": 1}, False),
+        ('{1: 2, "a": 1}', True, {}, False),
+        ('{"a" 1}', True, {}, False),
+        ('{"a": 1, "b": {}} ', True, {"a": 1, "b": NESTED_VALUE}, True),
+        ("{}", True, {}, True),
+        ("{", True, {}, False),
+        ("a:\n  b: 1\n- c\nd: 2\n", False, {"a": NESTED_VALUE}, False),
+        ('"a": "#x" # y\nb:\n---\nc: 3\n', False, {"a": "#x", "b": NESTED_VALUE}, False),
+        ("a: 1\nb:\n  c: 2\n", False, {"a": "1", "b": NESTED_VALUE}, True),
+        ("just a scalar\n", False, {}, False),
+    ],
+)
+def test_sniff_root_mapping(prefix: str, is_json: bool, expected: dict[str, object], complete: bool) -> None:
+    """Only complete root entries are reported, and the scan says whether it read the whole mapping."""
+    assert sniff_root_mapping(prefix, is_json=is_json) == (expected, complete)
+
+
+def test_line_prefix_cuts_after_line_break() -> None:
+    """Shortened prefixes end at a line break so YAML and CSV scans never see a partial line."""
+    assert line_prefix("a: 1\nb: 2\n", 100) == "a: 1\nb: 2\n"
+    assert line_prefix("a: 1\nb: 2\n", 7) == "a: 1\n"
+    assert not line_prefix("abcdef", 3)
+
+
+def test_generate_auto_reuses_document_parsed_for_inference(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Auto input parsed to decide its type is not loaded again by the parser."""
+    schema_path = tmp_path / "pet.json"
+    schema_path.write_text(json.dumps({"title": "Pet", "type": "object", "properties": {"id": {"type": "integer"}}}))
+
+    def fail_load_data(_text: str) -> object:
+        msg = "the schema was parsed twice"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(jsonschema, "load_data", fail_load_data)
+
+    output = generate(schema_path, input_file_type=InputFileType.Auto)
+
+    assert isinstance(output, str)
+    assert "class Pet(BaseModel):\n    id: int | None = None" in output
+
+
 def test_public_detection_helpers_keep_parser_module_surface() -> None:
     """Test public detection helpers keep their existing parser module surface."""
     from datamodel_code_generator.parser import avro, xmlschema
@@ -429,6 +429,53 @@ def test_input_model_restores_cwd_package_modules(
         _assert_sys_module_is(helper_name, existing_helper)
 
 
+@pytest.mark.parametrize("cwd_on_sys_path", [False, True])
+def test_input_model_cache_dir_reuses_schema_until_sources_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    cwd_on_sys_path: bool,
+) -> None:
+    """Test --cache-dir skips importing targets until a loaded user file changes or disappears."""
+    helper_name = "_cached_helper_for_input_model"
+    helper = tmp_path / f"{helper_name}.py"
+    helper.write_text(
+        "from pathlib import Path\n\n"
+        "with Path(__file__).with_name('imports.log').open('a', encoding='utf-8') as log:\n"
+        "    log.write('imported\\n')\n",
+        encoding="utf-8",
+    )
+    model_source = "from pydantic import BaseModel\n\n\nclass User(BaseModel):\n    name: str\n    age: int\n"
+    model_file = tmp_path / "_cached_input_model.py"
+    model_file.write_text(f"import {helper_name}\n\n{model_source}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    if cwd_on_sys_path:
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+    def run() -> str:
+        if cwd_on_sys_path:
+            # Imports from a cwd that is already importable stay in sys.modules.
+            for name in (helper_name, "_cached_input_model"):
+                sys.modules.pop(name, None)
+        run_input_model_and_assert(
+            input_model="_cached_input_model:User",
+            output_path=tmp_path / "output.py",
+            expected_file=EXPECTED_INPUT_MODEL_PATH / "pydantic_basemodel.py",
+            extra_args=["--cache-dir", str(tmp_path / "cache")],
+        )
+        return (tmp_path / "imports.log").read_text(encoding="utf-8")
+
+    assert run() == "imported\n"
+    assert run() == "imported\n"
+    helper.write_text(f"{helper.read_text(encoding='utf-8')}# changed\n", encoding="utf-8")
+    assert run() == "imported\nimported\n"
+
+    helper.unlink()
+    model_file.write_text(model_source, encoding="utf-8")
+    assert run() == "imported\nimported\n"
+    for name in (helper_name, "_cached_input_model"):
+        sys.modules.pop(name, None)
+
+
 def test_input_model_preserves_unrelated_concurrent_import(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
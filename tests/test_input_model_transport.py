@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import marshal
 from pathlib import Path
 
 import pytest
@@ -10,14 +11,25 @@ import pytest
 from datamodel_code_generator import Error, InputFileType, generate
 from datamodel_code_generator._input_model_transport import (
     PythonTypeExpressionCollector,
+    dump_loaded_schema,
     externalize_python_type_token,
     is_python_type_token,
+    load_loaded_schema,
 )
 from datamodel_code_generator._python_type_annotation import (
+    PythonTypeBoundName,
+    PythonTypeEllipsis,
+    PythonTypeLiteralValue,
     PythonTypeName,
     PythonTypeOpaqueText,
+    PythonTypeParameterList,
     PythonTypeQualifiedName,
     PythonTypeRuntimeSymbol,
+    PythonTypeStarred,
+    PythonTypeSubscript,
+    PythonTypeTuple,
+    PythonTypeUnion,
+    render_python_type_expr,
 )
 from datamodel_code_generator.input_model import _transport_python_type_expr, load_model_schema
 from datamodel_code_generator.parser.jsonschema import JsonSchemaObject, JsonSchemaParser
@@ -58,6 +70,33 @@ def test_python_type_expression_collector_preserves_identity_and_prunes() -> Non
         loaded.python_type_expressions[opaque_token] = PythonTypeName("Changed")  # type: ignore[index]
 
 
+@pytest.mark.allow_direct_assert
+def test_loaded_schema_round_trips_through_marshal() -> None:
+    """Cached schemas keep every expression node, including tuples and literal values."""
+    collector = PythonTypeExpressionCollector()
+    expression = PythonTypeSubscript(
+        PythonTypeRuntimeSymbol("collections.abc", ("Callable",)),
+        (
+            PythonTypeParameterList((PythonTypeStarred(PythonTypeName("Ts")), PythonTypeEllipsis())),
+            PythonTypeUnion((
+                PythonTypeSubscript(PythonTypeName("Literal"), (PythonTypeLiteralValue(b"x"),)),
+                PythonTypeTuple((PythonTypeLiteralValue(1.5),)),
+                PythonTypeBoundName("Alias", "pkg.types", "Alias"),
+                PythonTypeQualifiedName(("pkg", "Model")),
+                PythonTypeOpaqueText("Forward"),
+            )),
+        ),
+    )
+    token = collector.add(expression)
+    loaded = collector.loaded_schema({"type": "object", "properties": {"value": {"x-python-type": token}}})
+
+    restored = load_loaded_schema(marshal.loads(marshal.dumps(dump_loaded_schema(loaded))))
+
+    assert restored.schema == loaded.schema
+    assert restored.python_type_expressions == {token: expression}
+    assert render_python_type_expr(restored.python_type_expressions[token]) == render_python_type_expr(expression)
+
+
 @pytest.mark.allow_direct_assert
 def test_input_model_transport_normalizes_unqualified_runtime_symbols() -> None:
     """Preserve the historical spelling of runtime symbols without a module."""
@@ -0,0 +1,151 @@
+"""Tests for JSON backend detection and JSON content sniffing for YAML-suffixed inputs."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+import datamodel_code_generator
+from datamodel_code_generator import (
+    InputFileType,
+    _clear_parser_source_data_cache,
+    _parser_source_data_cache,
+    infer_input_type,
+    load_data_from_path,
+    load_json,
+)
+from datamodel_code_generator.util import get_json_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+EDGE_CASE_DOCUMENTS = [
+    '{"a": 123456789012345678901234567890}',
+    '{"a": "\\ud800"}',
+    '{"a": 1e400}',
+    '{"a": 1, "a": 2}',
+    '[1.5, -0, true, null, "\\u00e9"]',
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    """Clear lru_cache and parsed source cache before and after each test."""
+    get_json_backend.cache_clear()
+    _clear_parser_source_data_cache()
+    yield
+    get_json_backend.cache_clear()
+    _clear_parser_source_data_cache()
+
+
+def _fail_yaml(*_args: object, **_kwargs: object) -> None:
+    msg = "JSON-shaped input must not be parsed as YAML"
+    raise AssertionError(msg)
+
+
+class TestGetJsonBackend:
+    """Tests for get_json_backend()."""
+
+    def test_prefers_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When orjson is importable, returns 'orjson'."""
+        monkeypatch.setitem(sys.modules, "orjson", MagicMock())
+        assert get_json_backend() == "orjson"
+
+    def test_msgspec_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When only msgspec is importable, returns 'msgspec'."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", MagicMock())
+        assert get_json_backend() == "msgspec"
+
+    def test_stdlib_without_optional_backends(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When neither optional backend is importable, returns 'json'."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        assert get_json_backend() == "json"
+
+
+class TestLoadJson:
+    """Tests for load_json() with backend switching."""
+
+    @pytest.mark.parametrize("text", EDGE_CASE_DOCUMENTS)
+    def test_msgspec_backend_matches_stdlib(self, text: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The msgspec fast path falls back to the standard library for documents it rejects."""
+        pytest.importorskip("msgspec")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert get_json_backend() == "msgspec"
+        assert load_json(text) == json.loads(text)
+
+    def test_msgspec_backend_accepts_nan_like_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Non-standard NaN literals keep the standard library behavior."""
+        pytest.importorskip("msgspec")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert math.isnan(load_json('{"a": NaN}')["a"])
+
+    def test_orjson_backend_falls_back_to_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Documents rejected by orjson are re-parsed by the standard library."""
+        mock_orjson = MagicMock()
+        mock_orjson.JSONDecodeError = type("JSONDecodeError", (ValueError,), {})
+        mock_orjson.loads.side_effect = mock_orjson.JSONDecodeError
+        monkeypatch.setitem(sys.modules, "orjson", mock_orjson)
+
+        assert load_json('{"a": "\\ud800"}') == {"a": "\ud800"}
+        mock_orjson.loads.assert_called_once()
+
+    def test_orjson_backend_result_is_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Documents accepted by orjson are returned as decoded."""
+        mock_orjson = MagicMock()
+        mock_orjson.JSONDecodeError = type("JSONDecodeError", (ValueError,), {})
+        mock_orjson.loads.return_value = {"decoded": "by-orjson"}
+        monkeypatch.setitem(sys.modules, "orjson", mock_orjson)
+
+        assert load_json('{"a": 1}') == {"decoded": "by-orjson"}
+
+    @pytest.mark.parametrize("backend_modules", [{"orjson": None}, {"orjson": None, "msgspec": None}])
+    def test_invalid_json_raises_stdlib_error(
+        self, backend_modules: dict[str, None], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Invalid documents raise json.JSONDecodeError regardless of backend."""
+        for name, module in backend_modules.items():
+            monkeypatch.setitem(sys.modules, name, module)
+        with pytest.raises(json.JSONDecodeError):
+            load_json('{"a": 1,}')
+
+
+class TestJsonContentSniffing:
+    """JSON-shaped inputs skip the YAML parser regardless of file suffix."""
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".yml", ".txt"])
+    def test_yaml_suffixed_json_uses_json_parser(
+        self, suffix: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """JSON-compatible YAML files are parsed as JSON, both uncached and cached."""
+        schema_path = tmp_path / f"schema{suffix}"
+        schema_path.write_text('\ufeff\n  {"openapi": "3.0.0", "info": {"version": "1.0"}}', encoding="utf-8")
+        expected = datamodel_code_generator.load_yaml(schema_path.read_text(encoding="utf-8"))
+        monkeypatch.setattr(datamodel_code_generator, "load_yaml", _fail_yaml)
+
+        assert load_data_from_path(schema_path, "utf-8") == expected
+        assert load_data_from_path(schema_path, "utf-8") == expected
+        assert [key[-1] for key in _parser_source_data_cache] == ["json"]
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self, tmp_path: Path) -> None:
+        """JSON-shaped text that is not valid JSON is still parsed as YAML."""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text("{type: object, properties: {name: {type: string}}}\n", encoding="utf-8")
+
+        assert load_data_from_path(schema_path, "utf-8") == {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+    def test_infer_input_type_uses_json_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Input type detection parses JSON text without the YAML parser."""
+        monkeypatch.setattr(datamodel_code_generator, "load_yaml", _fail_yaml)
+
+        assert infer_input_type('{"openapi": "3.1.0", "info": {}}') == InputFileType.OpenAPI
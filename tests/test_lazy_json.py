@@ -0,0 +1,119 @@
+"""Tests for memory-mapped, lazily decoded loading of very large JSON inputs."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from datamodel_code_generator import load_yaml
+from datamodel_code_generator._lazy_json import LazyJsonObject, load_lazy_json_from_path
+from datamodel_code_generator.parser.openapi import OpenAPIParser
+
+DOCUMENT = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets", "version": "1.0"},
+    "paths": {"/pets": {"get": {"responses": {"200": {"description": "ok"}}}}},
+    "components": {
+        "schemas": {
+            "Pet": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Big": {"type": "integer", "maximum": 123456789012345678901234567890},
+        }
+    },
+}
+OPENAPI_DATA_PATH = Path(__file__).parent / "data" / "openapi"
+LAZY_PATHS = (("components",), ("components", "*"), ("paths",))
+
+
+@pytest.fixture
+def lazy_document(tmp_path: Path) -> LazyJsonObject:
+    """Return DOCUMENT loaded lazily from a BOM-prefixed file."""
+    path = tmp_path / "spec.json"
+    path.write_bytes(b"\xef\xbb\xbf" + json.dumps(DOCUMENT).encode())
+    document = load_lazy_json_from_path(path, "utf-8", LAZY_PATHS)
+    assert document is not None
+    return document
+
+
+def test_entries_are_decoded_on_first_access(lazy_document: LazyJsonObject) -> None:
+    """Only accessed entries are decoded; listed containers stay lazy."""
+    components = lazy_document["components"]
+    schemas = components["schemas"]
+
+    assert isinstance(components, LazyJsonObject)
+    assert isinstance(schemas, LazyJsonObject)
+    assert all(isinstance(value, msgspec.Raw) for value in dict.values(schemas))
+    assert type(schemas["Pet"]) is dict
+    assert isinstance(dict.get(schemas, "Big"), msgspec.Raw)
+    assert isinstance(dict.get(lazy_document, "paths"), msgspec.Raw)
+
+
+def test_mapping_accessors_match_eager_decoding(lazy_document: LazyJsonObject) -> None:
+    """Every mapping accessor returns the same data as json.loads."""
+    assert lazy_document == DOCUMENT
+    assert dict(lazy_document) == DOCUMENT
+    assert {**lazy_document} == DOCUMENT
+    assert json.loads(json.dumps(lazy_document)) == DOCUMENT
+    assert lazy_document["components"].get("schemas", {}).get("Big") == DOCUMENT["components"]["schemas"]["Big"]
+    assert lazy_document.get("missing") is None
+    assert list(lazy_document["paths"].values()) == list(DOCUMENT["paths"].values())
+    assert (lazy_document | {"extra": 1})["info"] == DOCUMENT["info"]
+    assert ({"extra": 1} | lazy_document)["info"] == DOCUMENT["info"]
+    assert repr(lazy_document) == repr(DOCUMENT)
+
+
+def test_copies_keep_undecoded_spans_shared(lazy_document: LazyJsonObject) -> None:
+    """Deep copies do not decode pending entries, and pickling produces a plain dict."""
+    lazy_document["info"]["title"] = "Changed"
+    clone = copy.deepcopy(lazy_document)
+
+    assert isinstance(dict.get(clone, "components"), msgspec.Raw)
+    clone["info"]["title"] = "Clone"
+    assert lazy_document["info"]["title"] == "Changed"
+    assert pickle.loads(pickle.dumps(lazy_document))["components"] == DOCUMENT["components"]
+
+
+def test_mutating_accessors(lazy_document: LazyJsonObject) -> None:
+    """pop, popitem and setdefault return decoded values."""
+    assert lazy_document.pop("info") == DOCUMENT["info"]
+    assert lazy_document.pop("info", None) is None
+    assert lazy_document.popitem() == ("components", DOCUMENT["components"])
+    assert lazy_document.setdefault("paths") == DOCUMENT["paths"]
+    assert lazy_document.setdefault("new", 1) == 1
+
+
+@pytest.mark.parametrize(
+    ("content", "encoding"),
+    [
+        (b"openapi: 3.0.0\n", "utf-8"),
+        (b'{"a": NaN}', "utf-8"),
+        (b"[1, 2]", "utf-8"),
+        (b'{"a": 1}', "latin-1"),
+    ],
+)
+def test_non_json_object_inputs_are_not_loaded_lazily(content: bytes, encoding: str, tmp_path: Path) -> None:
+    """Inputs msgspec cannot split are left to eager loading."""
+    path = tmp_path / "spec.json"
+    path.write_bytes(content)
+
+    assert load_lazy_json_from_path(path, encoding, LAZY_PATHS) is None
+
+
+def test_openapi_parser_output_matches_eager_loading(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lazily loaded large OpenAPI inputs generate the same models as eager loading."""
+    spec_path = tmp_path / "api.json"
+    spec_path.write_text(
+        json.dumps(load_yaml((OPENAPI_DATA_PATH / "api.yaml").read_text(encoding="utf-8"))), encoding="utf-8"
+    )
+    expected = OpenAPIParser(source=spec_path).parse()
+
+    monkeypatch.setattr(OpenAPIParser, "_lazy_json_min_bytes", 0)
+    parser = OpenAPIParser(source=spec_path)
+    source = parser._source_from_path(spec_path)
+
+    assert isinstance(source.raw_data, LazyJsonObject)
+    assert parser.parse() == expected
@@ -7,9 +7,10 @@ import os
 import shutil
 import stat
 import sys
+import zipfile
 from argparse import Namespace
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, cast
+from typing import TYPE_CHECKING, BinaryIO, NoReturn, cast
 
 import black
 import jsonschema
@@ -35,6 +36,7 @@ from datamodel_code_generator.__main__ import (
 )
 from datamodel_code_generator.arguments import arg_parser
 from tests.conftest import (
+    HttpxGetMock,
     HttpxGetMockFactory,
     MockHttpxResponse,
     assert_directory_content,
@@ -47,6 +49,8 @@ from tests.conftest import (
 
 if TYPE_CHECKING:
     import tempfile
+
+    from pytest_mock import MockerFixture
 from tests.main.conftest import (
     DATA_PATH,
     JSON_SCHEMA_DATA_PATH,
@@ -4265,6 +4269,119 @@ def test_locked_remote_lock_cli_doc(
     )
 
 
+REF_BUNDLE_OPTION_DESCRIPTION = """Serve remote schema fetches from an offline reference bundle.
+
+`--ref-bundle` reads every HTTP(S) document, both a `--url` input and remote `$ref` targets, from a zip archive
+written earlier with `--update-ref-bundle`. Nothing is fetched and no host name is resolved, so generation works in
+hermetic builds without network access. A resource that is not in the bundle is an error. The bundle index uses the
+remote lock format, so bundled bodies are still verified by `--locked`."""
+
+UPDATE_REF_BUNDLE_OPTION_DESCRIPTION = """Write every fetched remote schema document to the reference bundle.
+
+`--update-ref-bundle` fetches remote documents as usual and, after a successful generation, replaces the
+`--ref-bundle` archive with the documents reached during this run. Each body is stored once under its SHA-256 digest
+and indexed by the same request identity and body digest that a remote lock records."""
+
+
+def _write_ref_bundle(mock_httpx_get: HttpxGetMockFactory, output_file: Path, ref_bundle: Path) -> HttpxGetMock:
+    mock_get = mock_httpx_get(
+        MockHttpxResponse(
+            "https://api.example.com/schema.json", JSON_SCHEMA_DATA_PATH / "http_local_ref_path_root.json"
+        ),
+        MockHttpxResponse("https://api.example.com/schemas/pet.json", JSON_SCHEMA_DATA_PATH / "pet_simple.json"),
+    )
+    run_main_url_and_assert(
+        url="https://api.example.com/schema.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_MAIN_KR_PATH / "http_local_ref_path" / "output.py",
+        extra_args=["--allow-remote-refs", "--update-ref-bundle", "--ref-bundle", str(ref_bundle)],
+    )
+    return mock_get
+
+
+@pytest.mark.cli_doc(
+    options=["--update-ref-bundle"],
+    option_description=UPDATE_REF_BUNDLE_OPTION_DESCRIPTION,
+    input_schema="jsonschema/http_local_ref_path_root.json",
+    cli_args=[
+        "--url",
+        "https://api.example.com/schema.json",
+        "--allow-remote-refs",
+        "--update-ref-bundle",
+        "--ref-bundle",
+        "schema-refs.zip",
+    ],
+    golden_output="main_kr/http_local_ref_path/output.py",
+    related_options=["--ref-bundle", "--lockfile", "--update-lock"],
+)
+@freeze_time("2019-07-26")
+@pytest.mark.allow_direct_assert
+def test_update_ref_bundle_cli_doc(mock_httpx_get: HttpxGetMockFactory, output_file: Path, tmp_path: Path) -> None:
+    """Bundle the remote input and its remote reference after generation."""
+    ref_bundle = tmp_path / "schema-refs.zip"
+
+    mock_get = _write_ref_bundle(mock_httpx_get, output_file, ref_bundle)
+
+    assert mock_get.call_count == 2
+    with zipfile.ZipFile(ref_bundle) as archive:
+        assert len(json.loads(archive.read("index.json"))["resources"]) == 2
+
+
+@pytest.mark.cli_doc(
+    options=["--ref-bundle"],
+    option_description=REF_BUNDLE_OPTION_DESCRIPTION,
+    input_schema="jsonschema/http_local_ref_path_root.json",
+    cli_args=["--url", "https://api.example.com/schema.json", "--ref-bundle", "schema-refs.zip"],
+    golden_output="main_kr/http_local_ref_path/output.py",
+    related_options=["--update-ref-bundle", "--http-local-ref-path", "--locked", "--url"],
+)
+@freeze_time("2019-07-26")
+@pytest.mark.allow_direct_assert
+def test_ref_bundle_cli_doc(
+    mock_httpx_get: HttpxGetMockFactory,
+    output_file: Path,
+    tmp_path: Path,
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Generate from a bundled URL and remote reference without network access or DNS."""
+    ref_bundle = tmp_path / "schema-refs.zip"
+    lockfile = tmp_path / "datamodel-codegen.lock"
+    mock_get = _write_ref_bundle(mock_httpx_get, output_file, ref_bundle)
+
+    def fail_dns(*_args: object, **_kwargs: object) -> NoReturn:
+        pytest.fail("a reference bundle must not resolve host names")
+
+    mocker.patch("socket.getaddrinfo", side_effect=fail_dns)
+    for extra_args in (["--update-lock"], ["--locked"]):
+        run_main_url_and_assert(
+            url="https://api.example.com/schema.json",
+            output_path=output_file,
+            input_file_type="jsonschema",
+            assert_func=assert_file_content,
+            expected_file=EXPECTED_MAIN_KR_PATH / "http_local_ref_path" / "output.py",
+            extra_args=["--ref-bundle", str(ref_bundle), "--lockfile", str(lockfile), *extra_args],
+        )
+    assert mock_get.call_count == 2
+    assert len(json.loads(lockfile.read_text(encoding="utf-8"))["resources"]) == 2
+
+    with zipfile.ZipFile(ref_bundle, "w") as archive:
+        archive.writestr("index.json", '{"resources": [], "version": 1}')
+    capsys.readouterr()
+    return_code = main_module.main([
+        "--url",
+        "https://api.example.com/schema.json",
+        "--ref-bundle",
+        str(ref_bundle),
+        "--output",
+        str(output_file),
+    ])
+    assert return_code == Exit.ERROR
+    assert "Remote resource is not in reference bundle" in capsys.readouterr().err
+
+
 @pytest.mark.cli_doc(
     options=["--ignore-pyproject"],
     option_description="""Ignore pyproject.toml configuration file.
@@ -0,0 +1,137 @@
+"""Unit tests for offline remote reference bundles."""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from pathlib import Path
+from typing import NoReturn
+
+import pytest
+
+from datamodel_code_generator.ref_bundle import RefBundleError, RemoteRefBundle
+from datamodel_code_generator.remote_lock import RemoteLockError, RemoteReferenceLock
+
+SCHEMA_URL = "https://schemas.example/schema.json"
+PET_URL = "https://schemas.example/pet.json"
+HEADERS = [("Authorization", "Bearer bundle-secret")]
+
+
+def _write_bundle(path: Path, *responses: tuple[str, bytes]) -> None:
+    updater = RemoteRefBundle.open(path, update=True)
+    for url, body in responses:
+        updater.record_response(url, HEADERS, None, body)
+    updater.commit()
+
+
+@pytest.mark.allow_direct_assert
+def test_ref_bundle_round_trip_serves_recorded_bodies(tmp_path: Path) -> None:
+    """Bundled bodies are served per request identity, stored once and written deterministically."""
+    bundle_path = tmp_path / "refs.zip"
+    _write_bundle(bundle_path, (SCHEMA_URL, b'{"type": "object"}'), (PET_URL, b"{}"), (PET_URL + "?v=2", b"{}"))
+    first_archive = bundle_path.read_bytes()
+    _write_bundle(bundle_path, (PET_URL + "?v=2", b"{}"), (PET_URL, b"{}"), (SCHEMA_URL, b'{"type": "object"}'))
+
+    assert bundle_path.read_bytes() == first_archive
+    with zipfile.ZipFile(bundle_path) as archive:
+        names = archive.namelist()
+        index = json.loads(archive.read("index.json"))
+    assert names[0] == "index.json"
+    assert len(names) == 3
+    assert len(index["resources"]) == 3
+    assert b"bundle-secret" not in first_archive
+
+    bundle = RemoteRefBundle.open(bundle_path, update=False)
+    assert bundle.get_text(SCHEMA_URL, HEADERS, None) == '{"type": "object"}'
+    assert bundle.get_body(PET_URL, list(reversed(HEADERS)), None) == b"{}"
+    assert bundle.get_body(PET_URL + "?v=2", HEADERS, None) == b"{}"
+    bundle.commit()
+    assert bundle_path.read_bytes() == first_archive
+
+
+def test_ref_bundle_index_verifies_as_a_remote_lock(tmp_path: Path) -> None:
+    """The bundle index is a remote lock document, so served bodies pass a lock built from it."""
+    bundle_path = tmp_path / "refs.zip"
+    _write_bundle(bundle_path, (SCHEMA_URL, b"schema"))
+    lockfile = tmp_path / "datamodel-codegen.lock"
+    with zipfile.ZipFile(bundle_path) as archive:
+        lockfile.write_bytes(archive.read("index.json"))
+
+    lock = RemoteReferenceLock.open(lockfile, update=False, locked=True)
+    bundle = RemoteRefBundle.open(bundle_path, update=False, response_observer=lock.record_response)
+    bundle.get_body(SCHEMA_URL, HEADERS, None)
+    bundle.record_response(SCHEMA_URL, HEADERS, None, b"schema")
+
+    with pytest.raises(RemoteLockError, match="different content in one generation"):
+        RemoteRefBundle.open(bundle_path, update=True, response_observer=lock.record_response).record_response(
+            SCHEMA_URL, HEADERS, None, b"changed"
+        )
+
+
+def test_ref_bundle_reports_missing_and_invalid_content(tmp_path: Path) -> None:
+    """Missing bundles and resources, corrupt archives and undecodable bodies fail closed."""
+    bundle_path = tmp_path / "refs.zip"
+    with pytest.raises(RefBundleError, match="Reference bundle not found"):
+        RemoteRefBundle.open(bundle_path, update=False)
+
+    bundle_path.write_bytes(b"not a zip")
+    with pytest.raises(RefBundleError, match="Unable to read reference bundle"):
+        RemoteRefBundle.open(bundle_path, update=False)
+
+    _write_bundle(bundle_path, (SCHEMA_URL, b"\xff"))
+    bundle = RemoteRefBundle.open(bundle_path, update=False)
+    with pytest.raises(RefBundleError, match=r"not in reference bundle .*: https://schemas\.example$"):
+        bundle.get_body(PET_URL, HEADERS, None)
+    with pytest.raises(RefBundleError, match="Unable to decode bundled response"):
+        bundle.get_text(SCHEMA_URL, HEADERS, None)
+
+    with zipfile.ZipFile(bundle_path) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    tampered_path = tmp_path / "tampered.zip"
+    with zipfile.ZipFile(tampered_path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data if name == "index.json" else b"tampered")
+    with pytest.raises(RefBundleError, match="does not match its index"):
+        RemoteRefBundle.open(tampered_path, update=False).get_body(SCHEMA_URL, HEADERS, None)
+
+    with zipfile.ZipFile(tampered_path, "w") as archive:
+        archive.writestr("index.json", members["index.json"])
+    with pytest.raises(RefBundleError, match="Unable to read reference bundle"):
+        RemoteRefBundle.open(tampered_path, update=False).get_body(SCHEMA_URL, HEADERS, None)
+
+    with zipfile.ZipFile(tampered_path, "w") as archive:
+        archive.writestr("index.json", '{"resources": [], "version": 2}')
+    with pytest.raises(RemoteLockError, match="expected version 1"):
+        RemoteRefBundle.open(tampered_path, update=False)
+
+
+def test_ref_bundle_rejects_changing_responses_while_updating(tmp_path: Path) -> None:
+    """One generation cannot bundle two different bodies for the same request identity."""
+    updater = RemoteRefBundle.open(tmp_path / "refs.zip", update=True)
+    updater.record_response(SCHEMA_URL, HEADERS, None, b"first")
+    updater.record_response(SCHEMA_URL, HEADERS, None, b"first")
+    with pytest.raises(RefBundleError, match="different content in one generation"):
+        updater.record_response(SCHEMA_URL, HEADERS, None, b"second")
+
+
+@pytest.mark.allow_direct_assert
+def test_ref_bundle_commit_failure_leaves_no_temporary_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed write reports the bundle path and removes its temporary archive."""
+    bundle_path = tmp_path / "nested" / "refs.zip"
+    updater = RemoteRefBundle.open(bundle_path, update=True)
+    updater.record_response(SCHEMA_URL, HEADERS, None, b"schema")
+
+    def fail_replace(*_args: object) -> NoReturn:
+        msg = "read-only"
+        raise OSError(msg)
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    with pytest.raises(RefBundleError, match="Unable to write reference bundle"):
+        updater.commit()
+    assert list(bundle_path.parent.iterdir()) == []
+
+    blocked_path = tmp_path / "file" / "refs.zip"
+    blocked_path.parent.write_text("", encoding="utf-8")
+    updater = RemoteRefBundle.open(blocked_path, update=True)
+    with pytest.raises(RefBundleError, match="Unable to write reference bundle"):
+        updater.commit()
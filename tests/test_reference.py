@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import importlib
+import os
 import sys
 import types
 from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -21,6 +23,9 @@ from datamodel_code_generator.reference import (
     snake_to_upper_camel,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @pytest.mark.parametrize(
     ("base_path", "target_path", "expected"),
@@ -601,3 +606,56 @@ def test_resolve_ref_local_fragment_without_current_root_falls_back_to_url() ->
     result = resolver.resolve_ref("#/definitions/Foo")
 
     assert result == "https://example.com/schemas/main.json#/definitions/Foo"
+
+
+def test_resolve_ref_memo_is_keyed_on_resolution_context(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated refs are resolved once per context, and a context switch resolves them again."""
+    (tmp_path / "nested").mkdir()
+    resolver = ModelResolver(base_path=tmp_path)
+    resolve_calls: list[str] = []
+    resolve = resolver._resolve_ref
+
+    def counting_resolve(joined_path: str) -> str:
+        resolve_calls.append(joined_path)
+        return resolve(joined_path)
+
+    monkeypatch.setattr(resolver, "_resolve_ref", counting_resolve)
+
+    assert resolver.resolve_ref("pet.json#/Pet") == "pet.json#/Pet"
+    assert resolver.resolve_ref(["pet.json#", "Pet"]) == "pet.json#/Pet"
+    with resolver.current_base_path_context(Path("nested")):
+        assert resolver.resolve_ref("pet.json#/Pet") == "nested/pet.json#/Pet"
+    with resolver.current_root_context(["root.json"]):
+        assert resolver.resolve_ref("#/Pet") == "root.json#/Pet"
+    assert resolver.resolve_ref("#/Pet") == "#/Pet"
+    assert resolve_calls == ["pet.json#/Pet", "pet.json#/Pet", "#/Pet", "#/Pet"]
+
+
+def test_add_id_invalidates_memoized_resolutions() -> None:
+    """A ref resolved through the URL fallback follows an id registered afterwards."""
+    resolver = ModelResolver()
+
+    assert resolver.resolve_ref("https://example.com/pet.json") == "https://example.com/pet.json#"
+    resolver.add_id("https://example.com/pet.json", ["#", "definitions", "Pet"])
+    assert resolver.resolve_ref("https://example.com/pet.json") == "#/definitions/Pet"
+
+
+def test_resolver_file_checks_list_each_directory_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """File checks share one directory listing and recheck names the listing lacks."""
+    (tmp_path / "pet.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "definitions").mkdir()
+    resolver = ModelResolver(base_path=tmp_path)
+    scanned: list[Path] = []
+    scandir = os.scandir
+
+    def counting_scandir(path: Path) -> Iterator[os.DirEntry[str]]:
+        scanned.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+
+    assert resolver._is_file(tmp_path / "pet.json")
+    assert not resolver._is_file(tmp_path / "definitions")
+    assert not resolver._is_file(tmp_path / "missing.json")
+    assert not resolver._is_file(tmp_path / "missing" / "pet.json")
+    assert scanned == [tmp_path, tmp_path / "missing"]
@@ -0,0 +1,144 @@
+"""Tests for streaming schema inference from raw sample data."""
+
+from __future__ import annotations
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from genson import SchemaBuilder
+
+from datamodel_code_generator import _sample_inference
+from datamodel_code_generator._sample_inference import (
+    infer_records_schema,
+    is_json_lines_text,
+    iter_csv_records,
+    iter_json_records,
+    reservoir_sample,
+)
+from datamodel_code_generator.parser import _read_ahead
+
+ARRAY_SAMPLE = [
+    {"id": 1, "score": 12345, "tags": ["a"]},
+    {"id": 2, "score": 1.5, "note": "long " * 10},
+    {"id": 3, "score": None, "nested": {"ok": True, "values": [1, 2, 3]}},
+    [1, "two"],
+    12345678901234567890,
+]
+
+
+def _genson_schema(obj: object) -> dict[str, object]:
+    builder = SchemaBuilder()
+    builder.add_object(obj)
+    return builder.to_schema()
+
+
+def _genson_schema_of_records(records: list[object]) -> dict[str, object]:
+    builder = SchemaBuilder()
+    for record in records:
+        builder.add_object(record)
+    return builder.to_schema()
+
+
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": ")])
+def test_streamed_json_array_matches_whole_document(
+    monkeypatch: pytest.MonkeyPatch, separators: tuple[str, str]
+) -> None:
+    """Array items split across tiny buffer refills infer the same schema as the whole document."""
+    monkeypatch.setattr(_sample_inference, "STREAM_CHUNK_SIZE", 3)
+    text = json.dumps(ARRAY_SAMPLE, separators=separators, indent=2 if separators[0] == ", " else None)
+
+    records, is_array = iter_json_records(io.StringIO(text))
+
+    assert is_array
+    assert infer_records_schema(records, is_array=True) == _genson_schema(ARRAY_SAMPLE)
+    assert infer_records_schema(iter([]), is_array=True) == _genson_schema([])
+
+
+def test_json_values_are_merged_as_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Whitespace-separated JSON values, including trailing numbers, are records of one type."""
+    monkeypatch.setattr(_sample_inference, "STREAM_CHUNK_SIZE", 4)
+    records, is_array = iter_json_records(io.StringIO('{"a": 1}\n{"a": "x", "b": [2]}\n\n7\n8'))
+
+    assert not is_array
+    assert list(records) == [{"a": 1}, {"a": "x", "b": [2]}, 7, 8]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("[1, 2", "Unterminated top-level JSON array"),
+        ("[1 2]", "Expecting ',' delimiter in top-level JSON array"),
+        ("[1] [2]", "Extra data after top-level JSON array"),
+        ("[1,]", "Expecting value"),
+        ('{"a": 1}\n{"a":', "Expecting value"),
+    ],
+)
+def test_invalid_json_streams_raise(text: str, message: str) -> None:
+    """Malformed streams raise while their records are consumed."""
+    records, _ = iter_json_records(io.StringIO(text))
+    with pytest.raises(ValueError, match=message):
+        list(records)
+
+
+def test_csv_records_cover_every_row() -> None:
+    """Every CSV row is a record and cells beyond the header are dropped."""
+    assert list(iter_csv_records(io.StringIO("a,b\n1,2\n3\n4,5,6\n"))) == [
+        {"a": "1", "b": "2"},
+        {"a": "3", "b": None},
+        {"a": "4", "b": "5"},
+    ]
+
+
+def test_reservoir_sample_is_reproducible_and_ordered() -> None:
+    """The sample has the requested size, keeps input order and is stable between runs."""
+    sample = reservoir_sample(range(1000), 10)
+
+    assert len(sample) == 10
+    assert sample == sorted(sample)
+    assert sample == reservoir_sample(range(1000), 10)
+    assert reservoir_sample(range(3), 10) == [0, 1, 2]
+
+
+def test_batched_inference_matches_sequential(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Schemas inferred per batch and merged in order match adding every record in turn."""
+    monkeypatch.setattr(_sample_inference, "INFERENCE_BATCH_RECORDS", 2)
+    monkeypatch.setattr(_sample_inference, "_MAX_PENDING_BATCHES", 2)
+    records = [{"id": index, "value": index if index % 3 else str(index)} for index in range(9)]
+    records.append({"id": 9, "extra": None})
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        batched = infer_records_schema(records, is_array=True, executor=executor)
+
+    assert batched == _genson_schema(records)
+
+
+def test_forked_batches_match_sequential(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Large samples are inferred in forked workers without changing the schema."""
+    monkeypatch.setattr(_read_ahead.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(_sample_inference, "INFERENCE_PROCESS_POOL_MIN_BYTES", 1)
+    monkeypatch.setattr(_sample_inference, "INFERENCE_BATCH_RECORDS", 3)
+    executor = _sample_inference.start_inference_pool(1024, None)
+    if executor is None:  # pragma: no cover
+        pytest.skip("forked worker processes are unavailable")
+    records = [{"id": index, "name": f"n{index}"} if index % 2 else {"id": str(index)} for index in range(10)]
+
+    with executor:
+        assert infer_records_schema(records, is_array=False, executor=executor) == _genson_schema_of_records(records)
+
+
+def test_start_inference_pool_requires_large_unsampled_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Worker processes are skipped for small inputs and small samples."""
+    monkeypatch.setattr(_read_ahead.os, "cpu_count", lambda: 2)
+    assert _sample_inference.start_inference_pool(1024, None) is None
+    assert _sample_inference.start_inference_pool(1 << 40, 10) is None
+
+
+def test_is_json_lines_text() -> None:
+    """Two leading JSON objects or arrays on separate lines are JSON lines."""
+    assert is_json_lines_text('{"a": 1}\n\n{"a": 2}\n{"a"')
+    assert is_json_lines_text("[1]\n[2]")
+    assert not is_json_lines_text('{"a": 1}')
+    assert not is_json_lines_text("1\n2")
+    assert not is_json_lines_text('{"a": 1}\n{"a": ')
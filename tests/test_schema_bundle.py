@@ -0,0 +1,185 @@
+"""Unit tests for bundling multi-file schemas into one document."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import yaml
+
+from datamodel_code_generator import Error, bundle_schema
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, document: dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".yaml":
+        path.write_text(yaml.safe_dump(document), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_internalizes_openapi_refs(tmp_path: Path) -> None:
+    """Component proxies receive their targets, and mapping refs follow the copied schemas."""
+    _write(
+        tmp_path / "schemas" / "pets.yaml",
+        {
+            "Cat": {"type": "object", "properties": {"meow": {"type": "boolean"}}},
+            "Dog": {"type": "object", "properties": {"bark": {"type": "boolean"}}},
+            "Pet": {
+                "oneOf": [{"$ref": "#/Cat"}, {"$ref": "#/Dog"}],
+                "discriminator": {"propertyName": "kind", "mapping": {"cat": "#/Cat", "dog": "Dog"}},
+                "example": {"$ref": "not a reference"},
+            },
+        },
+    )
+    root = _write(
+        tmp_path / "api.yaml",
+        {
+            "openapi": "3.1.0",
+            "info": {"title": "Pets", "version": "1"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "Pet": {"$ref": "schemas/pets.yaml#/Pet"},
+                    "Owner": {
+                        "properties": {
+                            "pet": {"$ref": "#/components/schemas/Pet"},
+                            "home": {"$ref": "https://schemas.example/home.json"},
+                        }
+                    },
+                }
+            },
+        },
+    )
+
+    bundled = bundle_schema(root)
+
+    assert bundled["components"]["schemas"]["Pet"] == {
+        "oneOf": [{"$ref": "#/components/schemas/Cat"}, {"$ref": "#/components/schemas/Dog"}],
+        "discriminator": {"propertyName": "kind", "mapping": {"cat": "#/components/schemas/Cat", "dog": "Dog"}},
+        "example": {"$ref": "not a reference"},
+    }
+    assert bundled["components"]["schemas"]["Owner"]["properties"]["home"] == {
+        "$ref": "https://schemas.example/home.json"
+    }
+    assert sorted(bundled["components"]["schemas"]) == ["Cat", "Dog", "Owner", "Pet"]
+    assert "$defs" not in bundled
+
+
+@pytest.mark.allow_direct_assert
+@pytest.mark.parametrize(
+    ("version", "parameter_ref", "schema_container"),
+    [
+        ({"openapi": "3.0.3"}, "#/components/parameters/Limit", "#/components/schemas"),
+        ({"swagger": "2.0"}, "#/parameters/Limit", "#/definitions"),
+    ],
+)
+def test_bundle_schema_openapi_output_is_valid(
+    tmp_path: Path, version: dict[str, str], parameter_ref: str, schema_container: str
+) -> None:
+    """Bundled OpenAPI and Swagger documents keep targets in sections their specification allows."""
+    openapi_spec_validator = pytest.importorskip("openapi_spec_validator")
+    pet = {"type": "object", "properties": {"name": {"type": "string"}}}
+    if "openapi" in version:
+        limit = {"name": "limit", "in": "query", "schema": {"type": "integer"}}
+        shared: dict[str, Any] = {"components": {"schemas": {"Pet": pet}, "parameters": {"Limit": limit}}}
+        pet_ref, limit_ref = "shared.yaml#/components/schemas/Pet", "shared.yaml#/components/parameters/Limit"
+        response = {"description": "Pet", "content": {"application/json": {"schema": {"$ref": pet_ref}}}}
+    else:
+        limit = {"name": "limit", "in": "query", "type": "integer"}
+        shared = {"definitions": {"Pet": pet}, "parameters": {"Limit": limit}}
+        pet_ref, limit_ref = "shared.yaml#/definitions/Pet", "shared.yaml#/parameters/Limit"
+        response = {"description": "Pet", "schema": {"$ref": pet_ref}}
+    _write(tmp_path / "shared.yaml", shared)
+    root = _write(
+        tmp_path / "api.yaml",
+        {
+            **version,
+            "info": {"title": "Pets", "version": "1"},
+            "paths": {"/pets": {"get": {"parameters": [{"$ref": limit_ref}], "responses": {"200": response}}}},
+        },
+    )
+
+    bundled = bundle_schema(root)
+
+    operation = bundled["paths"]["/pets"]["get"]
+    assert operation["parameters"] == [{"$ref": parameter_ref}]
+    assert f"{schema_container}/Pet" in json.dumps(operation["responses"])
+    openapi_spec_validator.validate(bundled)
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_follows_anchors_root_ids_and_draft_containers(tmp_path: Path) -> None:
+    """Draft-07 roots collect into definitions, and $id URLs map to files next to the root."""
+    _write(tmp_path / "a" / "item.json", {"$defs": {"Item": {"$anchor": "item", "type": "string"}}})
+    _write(tmp_path / "b" / "item.json", {"type": "object", "properties": {"id": {"type": "integer"}}})
+    _write(tmp_path / "keys.json", {"definitions": {"application/json": {"type": "string"}}})
+    root = _write(
+        tmp_path / "root.json",
+        {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "https://schemas.example/root.json",
+            "definitions": {"Item": {"type": "number"}},
+            "properties": {
+                "anchored": {"$ref": "a/item.json#item"},
+                "by_id": {"$ref": "https://schemas.example/b/item.json"},
+                "slash_key": {"$ref": "keys.json#/definitions/application~1json"},
+                "local": {"$ref": "#/definitions/Item"},
+            },
+        },
+    )
+
+    bundled = bundle_schema(root)
+
+    assert bundled["properties"] == {
+        "anchored": {"$ref": "#/definitions/a_item_Item"},
+        "by_id": {"$ref": "#/definitions/item"},
+        "slash_key": {"$ref": "#/definitions/application_json"},
+        "local": {"$ref": "#/definitions/Item"},
+    }
+    assert bundled["definitions"]["a_item_Item"] == {"$anchor": "item", "type": "string"}
+    assert "$defs" not in bundled
+
+
+@pytest.mark.allow_direct_assert
+def test_bundle_schema_copies_shared_and_cyclic_targets_once(tmp_path: Path) -> None:
+    """A target reached from several files and through a cycle is copied under one name."""
+    _write(tmp_path / "node.json", {"properties": {"children": {"items": {"$ref": "node.json"}}}})
+    _write(tmp_path / "tree.json", {"properties": {"root": {"$ref": "node.json"}}})
+    root = _write(
+        tmp_path / "schema.json",
+        {"properties": {"tree": {"$ref": "tree.json"}, "node": {"$ref": "./node.json#"}}},
+    )
+
+    bundled = bundle_schema(root)
+
+    assert bundled == {
+        "properties": {"tree": {"$ref": "#/$defs/tree"}, "node": {"$ref": "#/$defs/node"}},
+        "$defs": {
+            "tree": {"properties": {"root": {"$ref": "#/$defs/node"}}},
+            "node": {"properties": {"children": {"items": {"$ref": "#/$defs/node"}}}},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("documents", "message"),
+    [
+        ({}, "File not found: "),
+        ({"schema.json": []}, "Expected a mapping at the root of "),
+        ({"schema.json": {"$ref": "missing.json"}}, r"\$ref file not found: "),
+        ({"schema.json": {"$ref": "other.json#/$defs/Missing"}, "other.json": {}}, "Unresolved \\$ref target: "),
+    ],
+)
+def test_bundle_schema_reports_invalid_inputs(tmp_path: Path, documents: dict[str, Any], message: str) -> None:
+    """Missing inputs, non-mapping roots and unresolved references raise Error."""
+    for name, document in documents.items():
+        (tmp_path / name).write_text(json.dumps(document), encoding="utf-8")
+    with pytest.raises(Error, match=message):
+        bundle_schema(tmp_path / "schema.json")